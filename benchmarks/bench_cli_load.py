@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Load test the example CLIs against the mock server.
+
+The example CLIs (examples/pets-cli, cloudtruth-gen-cli and github) are generated from their layout
+and spec into a temporary directory, so the current generator and infrastructure code (e.g.
+_requests.py and _display.py) is measured. The commands are run against a local mock server (see
+'oas mock') at each latency and page count:
+* in-process - the command is run many times, re-using the loaded modules
+* subprocess - a new interpreter for each run, which includes the start-up and imports
+
+The cold start (the time for '--help', and the time to import the main module) is reported for each
+CLI. For each command, the p50/p99/mean times, the requests per second and the peak RSS are reported.
+For the in-process runs, the peak RSS is the high-water mark of the benchmark process.
+
+The results are written as JSON (--output), which can be compared with the results of an earlier
+run (--baseline) to catch regressions. The exit code is non-zero when a p50 time is more than the
+--threshold fraction slower than the baseline.
+
+Usage: python benchmarks/bench_cli_load.py [--iterations N] [--subprocess-iterations N]
+    [--latency MS ...] [--pages N ...] [--output FILE] [--baseline FILE] [--threshold FRACTION] [CLI ...]
+"""
+import argparse
+import asyncio
+import importlib
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+from dataclasses import asdict
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+from typing import Iterator
+from typing import Optional
+
+import typer
+
+from openapi_spec_tools.cli_gen.cli import generate_cli
+from openapi_spec_tools.mock import MockConfig
+from openapi_spec_tools.mock import MockServer
+from openapi_spec_tools.mock import layout_file_pagination
+from openapi_spec_tools.utils import open_oas
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+# page size requested by the list commands (and used by the server when not requested)
+PAGE_SIZE = 20
+
+# differences smaller than this are noise, regardless of the threshold
+MIN_REGRESSION_MS = 1.0
+
+COMMON_ARGS = ["--api-key", "bench", "--format", "json"]
+
+
+@dataclass
+class ExampleCli:
+    """Details for generating and running an example CLI."""
+
+    directory: str
+    package: str
+    spec: str
+    # command name to (arguments, paginated)
+    commands: dict[str, tuple[list[str], bool]]
+
+
+CLIS = {
+    "pets": ExampleCli(
+        directory="pets-cli",
+        package="pets_cli",
+        spec="pet.yaml",
+        commands={
+            # the layout only has a page size, so the list is always a single request
+            "list": (["list", "--limit", str(PAGE_SIZE)], False),
+            "show": (["show", "1"], False),
+            "add": (["add", "--id", "1", "--name", "Fido", "--owner", "me"], False),
+        },
+    ),
+    "cloudtruth": ExampleCli(
+        directory="cloudtruth-gen-cli",
+        package="cloudtruth_gen_cli",
+        spec="ct.yaml",
+        commands={
+            "audit list": (["audit", "list", "--page-size", str(PAGE_SIZE)], True),
+            "environment list": (["environment", "list", "--page-size", str(PAGE_SIZE)], True),
+            "environment show": (["environment", "show", "abc"], False),
+        },
+    ),
+    "github": ExampleCli(
+        directory="github",
+        package="github_gen_cli",
+        spec="trimmed.yaml",
+        commands={
+            "users blocks list": (["users", "blocks", "list", "--per-page", str(PAGE_SIZE)], True),
+            "users show-by-name": (["users", "show-by-name", "octocat"], False),
+            "users current": (["users", "current"], False),
+        },
+    ),
+}
+
+
+@dataclass
+class ColdStart:
+    """Start-up times for a CLI."""
+
+    cli: str
+    help_ms: float
+    import_ms: float
+
+
+@dataclass
+class CommandResult:
+    """Timing results for a command at one latency/page count."""
+
+    cli: str
+    command: str
+    mode: str
+    latency_ms: float
+    pages: Optional[int]
+    runs: int
+    failures: int
+    requests: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    requests_per_second: float
+    peak_rss_kb: int
+
+    def key(self) -> str:
+        """Get the key used to compare with the baseline."""
+        return f"{self.cli}/{self.command}/{self.mode}/{self.latency_ms}/{self.pages}"
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Get the (nearest rank) percentile of the values."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def generate(example: ExampleCli, directory: Path) -> None:
+    """Generate the CLI code into the directory (as a package)."""
+    source = EXAMPLES / example.directory
+    with redirect_stdout(io.StringIO()):
+        generate_cli(
+            (source / "layout.yaml").as_posix(),
+            (source / example.spec).as_posix(),
+            example.package,
+            code_dir=(directory / example.package).as_posix(),
+            include_tests=False,
+            log_level="error",
+        )
+
+
+@contextmanager
+def running(server: MockServer) -> Iterator[str]:
+    """Run the mock server in a background thread, and provide the URL."""
+    loop = asyncio.new_event_loop()
+    started = loop.run_until_complete(server.start())
+    port = started.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        started.close()
+        loop.run_until_complete(started.wait_closed())
+        loop.close()
+
+
+def subprocess_env(directory: Path) -> dict[str, str]:
+    """Get the environment for running the generated CLIs as subprocesses."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([directory.as_posix(), env.get("PYTHONPATH", "")]).rstrip(os.pathsep)
+    env["TERMINAL_WIDTH"] = "200"
+    return env
+
+
+def peak_rss_kb() -> int:
+    """Get the peak RSS (in KB) of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # the max RSS is in bytes on macOS, and KB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# Runs the module (like 'python -m'), and reports the peak RSS on stderr. On Linux, the ru_maxrss of
+# a child includes the high-water mark of the (larger) parent process it was forked from, so the
+# VmHWM of the new address space is used instead.
+RUNNER = """
+import atexit, resource, runpy, sys
+
+def report():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    try:
+        with open("/proc/self/status") as status:
+            peak = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        pass
+    sys.stderr.write(f"\\npeak_rss_kb={peak}\\n")
+
+atexit.register(report)
+module = sys.argv.pop(1)
+runpy.run_module(module, run_name="__main__", alter_sys=True)
+"""
+
+
+def run_subprocess(module: str, args: list[str], env: dict[str, str]) -> tuple[float, int, int]:
+    """Run the module as a subprocess, and get the (seconds, exit code, peak RSS in KB)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", RUNNER, module] + args,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    peak = 0
+    for line in proc.stderr.splitlines():
+        if line.startswith("peak_rss_kb="):
+            peak = int(line.split("=")[1])
+    return elapsed, proc.returncode, peak
+
+
+def timed(args: list[str], env: dict[str, str]) -> float:
+    """Run the command, and get the wall time (in seconds)."""
+    start = time.perf_counter()
+    subprocess.run(args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def cold_start(name: str, example: ExampleCli, env: dict[str, str], runs: int) -> ColdStart:
+    """Measure the time for '--help', and for importing the main module."""
+    main = f"{example.package}.main"
+    help_times = [timed([sys.executable, "-m", main, "--help"], env) for _ in range(runs)]
+    code = f"import time; t = time.perf_counter(); import {main}; print(time.perf_counter() - t)"
+    import_times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        import_times.append(float(output.stdout))
+    return ColdStart(name, statistics.median(help_times) * 1000, statistics.median(import_times) * 1000)
+
+
+def summarize(
+    name: str,
+    command: str,
+    mode: str,
+    latency_ms: float,
+    pages: Optional[int],
+    times: list[float],
+    failures: int,
+    requests: int,
+    peak_rss_kb: int,
+) -> CommandResult:
+    """Create the result from the individual run times (in seconds)."""
+    total = sum(times)
+    return CommandResult(
+        cli=name,
+        command=command,
+        mode=mode,
+        latency_ms=latency_ms,
+        pages=pages,
+        runs=len(times),
+        failures=failures,
+        requests=requests,
+        p50_ms=round(statistics.median(times) * 1000, 3),
+        p99_ms=round(percentile(times, 0.99) * 1000, 3),
+        mean_ms=round(total / len(times) * 1000, 3),
+        requests_per_second=round(requests / total, 1) if total else 0.0,
+        peak_rss_kb=peak_rss_kb,
+    )
+
+
+def run_cli(name: str, example: ExampleCli, directory: Path, args: argparse.Namespace) -> tuple[ColdStart, list[Any]]:
+    """Run all the commands for the CLI, and get the results."""
+    source = EXAMPLES / example.directory
+    spec = open_oas((source / example.spec).as_posix())
+    pagination = layout_file_pagination((source / "layout.yaml").as_posix())
+    server = MockServer(spec, MockConfig(page_size=PAGE_SIZE), pagination=pagination)
+    env = subprocess_env(directory)
+    start_times = cold_start(name, example, env, args.subprocess_iterations)
+
+    module = importlib.import_module(f"{example.package}.main")
+    command = typer.main.get_command(module.app)
+
+    results = []
+    with running(server) as url:
+        for latency in args.latency:
+            for label, (cmd_args, paginated) in example.commands.items():
+                for pages in args.pages if paginated else [None]:
+                    server.config.latency = latency / 1000
+                    server.config.total_items = (pages or 1) * PAGE_SIZE
+                    server.routes.clear()
+                    full_args = cmd_args + ["--api-host", url] + COMMON_ARGS
+
+                    # in-process (with one warm-up run)
+                    times = []
+                    failures = 0
+                    before = server.stats.requests
+                    for i in range(args.iterations + 1):
+                        start = time.perf_counter()
+                        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                            code = command.main(full_args, prog_name=name, standalone_mode=False)
+                        elapsed = time.perf_counter() - start
+                        if i == 0:
+                            before = server.stats.requests
+                            continue
+                        times.append(elapsed)
+                        failures += 1 if code else 0
+                    requests = server.stats.requests - before
+                    results.append(
+                        summarize(name, label, "in-process", latency, pages, times, failures, requests, peak_rss_kb())
+                    )
+
+                    # subprocess
+                    times = []
+                    failures = 0
+                    peak = 0
+                    before = server.stats.requests
+                    for _ in range(args.subprocess_iterations):
+                        elapsed, code, rss = run_subprocess(f"{example.package}.main", full_args, env)
+                        times.append(elapsed)
+                        failures += 1 if code else 0
+                        peak = max(peak, rss)
+                    requests = server.stats.requests - before
+                    results.append(
+                        summarize(name, label, "subprocess", latency, pages, times, failures, requests, peak)
+                    )
+
+    return start_times, results
+
+
+def compare(results: list[CommandResult], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Get the descriptions of the results that are slower than the baseline."""
+    previous = {}
+    for item in baseline.get("results", []):
+        old = CommandResult(**item)
+        previous[old.key()] = old
+
+    regressions = []
+    for item in results:
+        old = previous.get(item.key())
+        if old is None:
+            continue
+        delta = item.p50_ms - old.p50_ms
+        if delta > MIN_REGRESSION_MS and item.p50_ms > old.p50_ms * (1 + threshold):
+            regressions.append(f"{item.key()}: p50 {old.p50_ms:.1f}ms -> {item.p50_ms:.1f}ms")
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark, and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("clis", nargs="*", choices=[[]] + list(CLIS), help="CLIs to run (defaults to all)")
+    parser.add_argument("--iterations", type=int, default=20, help="Number of in-process runs per command")
+    parser.add_argument("--subprocess-iterations", type=int, default=3, help="Number of subprocess runs per command")
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.0, 10.0], help="Server latencies (in ms)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5], help="Page counts for the list commands")
+    parser.add_argument("--output", help="File to write the JSON results")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Fraction slower than the baseline to fail")
+    args = parser.parse_args()
+
+    starts = []
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        for name in args.clis or list(CLIS):
+            example = CLIS[name]
+            generate(example, Path(directory))
+            start_times, cli_results = run_cli(name, example, Path(directory), args)
+            starts.append(start_times)
+            results.extend(cli_results)
+        sys.path.remove(directory)
+
+    print(f"{'cli':<12} {'help':>9} {'import':>9}")
+    for item in starts:
+        print(f"{item.cli:<12} {item.help_ms:>7.1f}ms {item.import_ms:>7.1f}ms")
+    print()
+    print(
+        f"{'cli':<12} {'command':<20} {'mode':<11} {'latency':>8} {'pages':>5} {'p50':>9} {'p99':>9} "
+        f"{'req/s':>8} {'rss':>8} {'fail':>4}"
+    )
+    for item in results:
+        print(
+            f"{item.cli:<12} {item.command:<20} {item.mode:<11} {item.latency_ms:>6.0f}ms {item.pages or '':>5} "
+            f"{item.p50_ms:>7.1f}ms {item.p99_ms:>7.1f}ms {item.requests_per_second:>8.1f} "
+            f"{item.peak_rss_kb / 1024:>6.1f}MB {item.failures:>4}"
+        )
+
+    data = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "subprocess_iterations": args.subprocess_iterations,
+        "cold_start": [asdict(item) for item in starts],
+        "results": [asdict(item) for item in results],
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(data, indent=2))
+
+    failed = any(item.failures for item in results)
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        failed = failed or bool(regressions)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
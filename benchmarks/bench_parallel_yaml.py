@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark the parallel (chunked) YAML parsing of a huge spec.
+
+The huge spec is generated by copying the paths and components of a test asset several times
+(with unique names), and the normal yaml.safe_load() is compared with load_yaml().
+
+Usage: python benchmarks/bench_parallel_yaml.py [--copies N] [--workers N] [--repeat N] [FILENAME]
+"""
+import argparse
+import os
+import timeit
+from pathlib import Path
+
+import yaml
+
+from openapi_spec_tools.parallel_yaml import load_yaml
+from openapi_spec_tools.parallel_yaml import split_document
+
+ASSETS = Path(__file__).parent.parent / "tests" / "assets"
+DEFAULT_FILE = "ct.yaml"
+
+
+class NoAliasDumper(yaml.SafeDumper):
+    """Dumper that repeats shared objects instead of using anchors/aliases."""
+
+    def ignore_aliases(self, data) -> bool:
+        """Never use aliases."""
+        return True
+
+
+def huge_spec(filename: str, copies: int) -> str:
+    """Get the text for a spec with the paths and components copied."""
+    with open(filename, encoding="utf-8") as fp:
+        spec = yaml.safe_load(fp)
+
+    paths = spec.get("paths", {})
+    components = spec.get("components", {})
+    spec["paths"] = {f"/copy{i}{path}": data for i in range(copies) for path, data in paths.items()}
+    spec["components"] = {
+        section: {f"{name}Copy{i}": data for i in range(copies) for name, data in items.items()}
+        for section, items in components.items()
+    }
+    return yaml.dump(spec, Dumper=NoAliasDumper, sort_keys=False)
+
+
+def main() -> None:
+    """Run the benchmark, and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("filename", nargs="?", help="OpenAPI spec to copy (defaults to a large test asset)")
+    parser.add_argument("--copies", type=int, default=4, help="Number of copies of the paths and components")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of timing repeats (best is reported)")
+    args = parser.parse_args()
+
+    text = huge_spec(args.filename or (ASSETS / DEFAULT_FILE).as_posix(), args.copies)
+    split = split_document(text.split("\n"))
+    assert split is not None, "generated spec cannot be split"
+    assert yaml.safe_load(text) == load_yaml(text, workers=args.workers, min_size=0)
+
+    normal = min(timeit.repeat(lambda: yaml.safe_load(text), number=1, repeat=args.repeat))
+    parallel = min(
+        timeit.repeat(lambda: load_yaml(text, workers=args.workers, min_size=0), number=1, repeat=args.repeat)
+    )
+    print(f"{'size':>10} {'chunks':>7} {'workers':>7} {'normal':>9} {'parallel':>9} {'speedup':>8}")
+    print(
+        f"{len(text) / 1024 / 1024:>8.1f}MB {len(split[1]):>7} {args.workers:>7} "
+        f"{normal:>8.2f}s {parallel:>8.2f}s {normal / parallel:>7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark the reference extraction on the largest test assets.
+
+Compares the original recursive set-merging walk (find_dict_prop) with the explicit stack walk
+(iter_references) used by model_references(). The raw JSON text scan (scan_json_references) is
+compared with parsing the JSON text and walking the result.
+
+Usage: python benchmarks/bench_references.py [--repeat N] [FILENAME ...]
+"""
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from openapi_spec_tools.types import OasField
+from openapi_spec_tools.utils import find_dict_prop
+from openapi_spec_tools.utils import iter_references
+from openapi_spec_tools.utils import map_models
+from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.utils import scan_json_references
+
+ASSETS = Path(__file__).parent.parent / "tests" / "assets"
+DEFAULT_FILES = ["ct.yaml", "trello_api.yaml", "noa_api.yaml", "mistral_ai.yaml"]
+
+
+def per_model_recursive(models: dict) -> dict:
+    """Get the references for each model using the recursive walk."""
+    return {name: find_dict_prop(body, OasField.REFS) for name, body in models.items()}
+
+
+def per_model_stack(models: dict) -> dict:
+    """Get the references for each model using the stack walk."""
+    return {name: set(iter_references(body)) for name, body in models.items()}
+
+
+def best_time(func, repeat: int) -> float:
+    """Get the best time (in seconds) for running func."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Run the benchmark on each file, and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("filenames", nargs="*", help="OpenAPI specs (defaults to the largest test assets)")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing repeats (best is reported)")
+    args = parser.parse_args()
+
+    filenames = args.filenames or [(ASSETS / f).as_posix() for f in DEFAULT_FILES]
+    print(
+        f"{'file':<20} {'refs':>7} {'recursive':>10} {'stack':>10} {'speedup':>8} {'parse+walk':>10} {'raw-json':>10}"
+    )
+    for filename in filenames:
+        spec = open_oas(filename)
+        models = map_models(spec.get(OasField.COMPONENTS, {}))
+        raw = json.dumps(spec).encode("utf-8")
+
+        assert per_model_recursive(models) == per_model_stack(models)
+        assert set(iter_references(spec)) == {v for v, _ in scan_json_references(raw)}
+
+        recursive = best_time(lambda: per_model_recursive(models), args.repeat)
+        stack = best_time(lambda: per_model_stack(models), args.repeat)
+        parsed = best_time(lambda: set(iter_references(json.loads(raw))), args.repeat)
+        scan = best_time(lambda: scan_json_references(raw), args.repeat)
+        count = len(scan_json_references(raw))
+        print(
+            f"{Path(filename).name:<20} {count:>7} {recursive * 1000:>8.2f}ms {stack * 1000:>8.2f}ms "
+            f"{recursive / stack:>7.2f}x {parsed * 1000:>8.2f}ms {scan * 1000:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
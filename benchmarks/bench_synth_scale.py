@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark the tools on synthetic specs of increasing size.
+
+Each spec (and a CLI layout for it) is generated by the synthesizer ('oas synth'), so the scaling
+of the loading, analysis, validation, linting and CLI generation can be measured well beyond the
+size of the test assets. The CLI generation is the slowest, so it is only run with --generate.
+
+Usage: python benchmarks/bench_synth_scale.py [--scale PATHS:MODELS ...] [--depth N] [--fanout N]
+    [--cycles] [--generate] [--repeat N]
+"""
+import argparse
+import io
+import json
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable
+
+import yaml
+
+from openapi_spec_tools.cli_gen.cli import generate_cli
+from openapi_spec_tools.cli_gen.layout import file_to_tree
+from openapi_spec_tools.complexity import ComplexityCalculator
+from openapi_spec_tools.lint import lint_spec
+from openapi_spec_tools.synth import SynthConfig
+from openapi_spec_tools.synth import synthesize
+from openapi_spec_tools.synth import synthesize_layout
+from openapi_spec_tools.utils import map_operations
+from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.utils import unused_models
+from openapi_spec_tools.validate import validate_spec
+
+DEFAULT_SCALES = ["100:500", "1000:5000", "5000:25000"]
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Get the best time (in seconds) for running func."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark at each scale, and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", nargs="+", default=DEFAULT_SCALES, help="Sizes as PATHS:MODELS")
+    parser.add_argument("--depth", type=int, default=4, help="Number of levels of nested models")
+    parser.add_argument("--fanout", type=int, default=3, help="Number of references to the next level")
+    parser.add_argument("--cycles", action="store_true", help="Include recursive models")
+    parser.add_argument("--generate", action="store_true", help="Include the CLI generation")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timing repeats (best is reported)")
+    args = parser.parse_args()
+
+    columns = ["synth", "load", "ops", "unused", "complexity", "validate", "lint", "layout"]
+    if args.generate:
+        columns.append("generate")
+    print(f"{'paths':>6} {'models':>7} {'size':>8} " + " ".join(f"{c:>10}" for c in columns))
+
+    for scale in args.scale:
+        paths, models = (int(v) for v in scale.split(":"))
+        config = SynthConfig(paths=paths, models=models, depth=args.depth, fanout=args.fanout, cycles=args.cycles)
+        timings = {"synth": best_time(lambda: synthesize(config), 1)}
+        spec = synthesize(config)
+
+        with tempfile.TemporaryDirectory() as directory:
+            spec_file = Path(directory) / "spec.json"
+            layout_file = Path(directory) / "layout.yaml"
+            spec_file.write_text(json.dumps(spec, indent=2))
+            layout_file.write_text(yaml.safe_dump(synthesize_layout(spec), sort_keys=False))
+            size = spec_file.stat().st_size
+
+            timings["load"] = best_time(lambda: open_oas(spec_file.as_posix()), args.repeat)
+            timings["ops"] = best_time(lambda: map_operations(spec["paths"]), args.repeat)
+            timings["unused"] = best_time(lambda: unused_models(spec), args.repeat)
+            timings["complexity"] = best_time(lambda: ComplexityCalculator(spec).operation_complexity(), args.repeat)
+            timings["validate"] = best_time(lambda: validate_spec(spec), args.repeat)
+            timings["lint"] = best_time(lambda: lint_spec(spec), args.repeat)
+            timings["layout"] = best_time(lambda: file_to_tree(layout_file.as_posix()), args.repeat)
+            if args.generate:
+                def _generate() -> None:
+                    with redirect_stdout(io.StringIO()):
+                        generate_cli(
+                            layout_file.as_posix(),
+                            spec_file.as_posix(),
+                            "synth_cli",
+                            code_dir=(Path(directory) / "synth_cli").as_posix(),
+                            include_tests=False,
+                            log_level="critical",
+                        )
+
+                timings["generate"] = best_time(_generate, 1)
+
+        print(
+            f"{paths:>6} {models:>7} {size / 1e6:>6.1f}MB "
+            + " ".join(f"{timings[c] * 1000:>8.1f}ms" for c in columns)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,10 @@
 # This code was generated by the openapi-spec-tools CLI generator, DO NOT EDIT
 #
 from typing import Annotated
+from typing import Any
 from typing import Optional
 
+import click
 import typer
 
 from cloudtruth_gen_cli._display import OutputFormat
@@ -53,6 +55,15 @@ DetailsOption = Annotated[
         help="Display the full details or a summary."
     ),
 ]
+FromFileOption = Annotated[
+    Optional[str],
+    typer.Option(
+        "--from-file",
+        is_eager=True,
+        show_default=False,
+        help="File with the arguments for many requests, one JSON object per line (use '-' for stdin).",
+    ),
+]
 LogLevelOption = Annotated[
     LogLevel,
     typer.Option(
@@ -103,3 +114,18 @@ TreeDisplayOption = Annotated[
         help="Details of the CLI command tree to show."
     ),
 ]
+WorkersOption = Annotated[
+    int,
+    typer.Option(
+        "--workers",
+        min=1,
+        help="Number of concurrent requests when using --from-file.",
+    ),
+]
+
+
+def required_unless_from_file(ctx: typer.Context, param: typer.CallbackParam, value: Any) -> Any:
+    """Require the positional argument, unless the values are provided by --from-file."""
+    if value is None and not ctx.params.get("_from_file") and not ctx.resilient_parsing:
+        raise click.MissingParameter(ctx=ctx, param=param)
+    return value
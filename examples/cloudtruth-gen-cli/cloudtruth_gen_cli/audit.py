@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from cloudtruth_gen_cli import _arguments as _a
+from cloudtruth_gen_cli import _bulk as _b  # noqa: F401
 from cloudtruth_gen_cli import _display as _d  # noqa: F401
 from cloudtruth_gen_cli import _exceptions as _e  # noqa: F401
 from cloudtruth_gen_cli import _logging as _l  # noqa: F401
@@ -28,7 +29,7 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "audit", display, depth)
     return
 
@@ -62,49 +63,59 @@ def audit_list(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     A searchable log of all the actions taken by users and service accounts within the organization.
     '''
     # handler for audit_list: GET /api/v1/audit/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/audit/")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, item_property_name="result", next_property_name="next")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if action is not None:
-        params["action"] = action
-    if earliest is not None:
-        params["earliest"] = earliest
-    if environment_id is not None:
-        params["environment_id"] = environment_id
-    if latest is not None:
-        params["latest"] = latest
-    if object_id is not None:
-        params["object_id"] = object_id
-    if object_type is not None:
-        params["object_type"] = object_type
-    if ordering is not None:
-        params["ordering"] = ordering
-    if page is not None:
-        params["page"] = page
-    if page_size is not None:
-        params["page_size"] = page_size
-    if parameter_id is not None:
-        params["parameter_id"] = parameter_id
-    if project_id is not None:
-        params["project_id"] = project_id
-    if user_id is not None:
-        params["user_id"] = user_id
+
+    def _request(action=action, earliest=earliest, environment_id=environment_id, latest=latest, object_id=object_id, object_type=object_type, ordering=ordering, page=page, page_size=page_size, parameter_id=parameter_id, project_id=project_id, user_id=user_id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/audit/")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, items_property_name="results", next_property_name="next")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if action is not None:
+            params["action"] = action
+        if earliest is not None:
+            params["earliest"] = earliest
+        if environment_id is not None:
+            params["environment_id"] = environment_id
+        if latest is not None:
+            params["latest"] = latest
+        if object_id is not None:
+            params["object_id"] = object_id
+        if object_type is not None:
+            params["object_type"] = object_type
+        if ordering is not None:
+            params["ordering"] = ordering
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if parameter_id is not None:
+            params["parameter_id"] = parameter_id
+        if project_id is not None:
+            params["project_id"] = project_id
+        if user_id is not None:
+            params["user_id"] = user_id
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"action": "action", "earliest": "earliest", "environment_id": "environment_id", "latest": "latest", "object_id": "object_id", "object_type": "object_type", "ordering": "ordering", "page": "page", "page_size": "page_size", "parameter_id": "parameter_id", "project_id": "project_id", "user_id": "user_id"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -114,31 +125,43 @@ def audit_list(
 
 @app.command("show", short_help="Retrieve one record from the audit log.")
 def audit_retrieve(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Retrieve one record from the audit log.
     '''
     # handler for audit_retrieve: GET /api/v1/audit/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/audit", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/audit", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -154,24 +177,34 @@ def audit_summary_retrieve(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Summary information about the organization's audit trail.
     '''
     # handler for audit_summary_retrieve: GET /api/v1/audit/summary/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/audit/summary/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request():
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/audit/summary/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from cloudtruth_gen_cli import _arguments as _a
+from cloudtruth_gen_cli import _bulk as _b  # noqa: F401
 from cloudtruth_gen_cli import _display as _d  # noqa: F401
 from cloudtruth_gen_cli import _exceptions as _e  # noqa: F401
 from cloudtruth_gen_cli import _logging as _l  # noqa: F401
@@ -29,11 +30,32 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "environments", display, depth)
     return
 
 
+def _check_environments_create_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("name")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--name must be a string")
+        elif len(value) > 256:
+            errors.append("--name must be at most 256 characters")
+    value = body.get("description")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--description must be a string")
+    value = body.get("parent")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--parent must be a string")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("create", short_help="")
 def environments_create(
     name: Annotated[str, typer.Option(show_default=False, help="The environment name.")] = None,
@@ -45,29 +67,40 @@ def environments_create(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for environments_create: POST /api/v1/environments/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/environments/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if name is None:
-        missing.append("--name")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["name"] = name
-    if description is not None:
-        body["description"] = description
-    if parent is not None:
-        body["parent"] = parent
+
+    def _request(name=name, description=description, parent=parent):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/environments/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if name is None:
+            missing.append("--name")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["name"] = name
+        if description is not None:
+            body["description"] = description
+        if parent is not None:
+            body["parent"] = parent
+        _check_environments_create_body(body)
+
+        return _r.request("POST", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"name": "name", "description": "description", "parent": "parent"})
+        return
 
     try:
-        data = _r.request("POST", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -77,28 +110,40 @@ def environments_create(
 
 @app.command("delete", short_help="")
 def environments_destroy(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for environments_destroy: DELETE /api/v1/environments/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/environments", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/environments", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("DELETE", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id"})
+        return
 
     try:
-        data = _r.request("DELETE", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -121,34 +166,44 @@ def environments_list(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for environments_list: GET /api/v1/environments/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/environments/")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, item_property_name="result", next_property_name="next")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if description__icontains is not None:
-        params["description__icontains"] = description__icontains
-    if name is not None:
-        params["name"] = name
-    if name__icontains is not None:
-        params["name__icontains"] = name__icontains
-    if ordering is not None:
-        params["ordering"] = ordering
-    if page is not None:
-        params["page"] = page
-    if page_size is not None:
-        params["page_size"] = page_size
+
+    def _request(description__icontains=description__icontains, name=name, name__icontains=name__icontains, ordering=ordering, page=page, page_size=page_size):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/environments/")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, items_property_name="results", next_property_name="next")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if description__icontains is not None:
+            params["description__icontains"] = description__icontains
+        if name is not None:
+            params["name"] = name
+        if name__icontains is not None:
+            params["name__icontains"] = name__icontains
+        if ordering is not None:
+            params["ordering"] = ordering
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"description__icontains": "description__icontains", "name": "name", "name__icontains": "name__icontains", "ordering": "ordering", "page": "page", "page_size": "page_size"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -158,7 +213,7 @@ def environments_list(
 
 @app.command("pushes", short_help="List push operations.")
 def environments_pushes_list(
-    environment_pk: Annotated[str, typer.Argument(show_default=False, help="")],
+    environment_pk: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ENVIRONMENT_PK", callback=_a.required_unless_from_file, help="")] = None,
     ordering: Annotated[Optional[str], typer.Option(show_default=False, help="Which field to use when ordering the results.")] = None,
     page: Annotated[Optional[int], typer.Option(show_default=False, help="A page number within the paginated result set.")] = None,
     page_size: Annotated[Optional[int], typer.Option(show_default=False, help="Number of results to return per page.")] = None,
@@ -169,31 +224,43 @@ def environments_pushes_list(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     The push operations that this environment was involved in.
     '''
     # handler for environments_pushes_list: GET /api/v1/environments/{environment_pk}/pushes/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "pushes/")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, item_property_name="result", next_property_name="next")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if ordering is not None:
-        params["ordering"] = ordering
-    if page is not None:
-        params["page"] = page
-    if page_size is not None:
-        params["page_size"] = page_size
+
+    def _request(environment_pk=environment_pk, ordering=ordering, page=page, page_size=page_size):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "pushes/")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, items_property_name="results", next_property_name="next")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if environment_pk is None:
+            missing.append("ENVIRONMENT_PK")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if ordering is not None:
+            params["ordering"] = ordering
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"environment_pk": "environment_pk", "ordering": "ordering", "page": "page", "page_size": "page_size"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -201,9 +268,34 @@ def environments_pushes_list(
     return
 
 
+def _check_environments_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("name")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--name must be a string")
+        elif len(value) > 256:
+            errors.append("--name must be at most 256 characters")
+    value = body.get("description")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--description must be a string")
+    value = body.get("parent")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--parent must be a string")
+    value = body.get("access_controlled")
+    if value is not None:
+        if not isinstance(value, bool):
+            errors.append("--access-controlled must be a boolean")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("set", short_help="")
 def environments_update(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     name: Annotated[str, typer.Option(show_default=False, help="The environment name.")] = None,
     description: Annotated[Optional[str], typer.Option(show_default=False, help="A description of the environment.  You may find it helpful to document how this environment is used to assist others when they need to maintain software that uses this content.")] = None,
     parent: Annotated[Optional[str], typer.Option(show_default=False, help="Environments can inherit from a single parent environment which provides values for parameters when specific environments do not have a value set.  Every organization has one default environment that cannot be removed.")] = None,
@@ -214,31 +306,44 @@ def environments_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for environments_update: PUT /api/v1/environments/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/environments", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if name is None:
-        missing.append("--name")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["name"] = name
-    if description is not None:
-        body["description"] = description
-    if parent is not None:
-        body["parent"] = parent
-    if access_controlled is not None:
-        body["access_controlled"] = access_controlled
+
+    def _request(id=id, name=name, description=description, parent=parent, access_controlled=access_controlled):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/environments", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if name is None:
+            missing.append("--name")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["name"] = name
+        if description is not None:
+            body["description"] = description
+        if parent is not None:
+            body["parent"] = parent
+        if access_controlled is not None:
+            body["access_controlled"] = access_controlled
+        _check_environments_update_body(body)
+
+        return _r.request("PUT", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id", "name": "name", "description": "description", "parent": "parent", "access_controlled": "access_controlled"})
+        return
 
     try:
-        data = _r.request("PUT", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -248,28 +353,40 @@ def environments_update(
 
 @app.command("show", short_help="")
 def environments_retrieve(
-    id: Annotated[str, typer.Argument(show_default=False, help="A UUID string identifying this environment ledger.")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="A UUID string identifying this environment ledger.")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for environments_retrieve: GET /api/v1/environments/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/environments", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/environments", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -277,9 +394,34 @@ def environments_retrieve(
     return
 
 
+def _check_environments_partial_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("name")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--name must be a string")
+        elif len(value) > 256:
+            errors.append("--name must be at most 256 characters")
+    value = body.get("description")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--description must be a string")
+    value = body.get("parent")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--parent must be a string")
+    value = body.get("access_controlled")
+    if value is not None:
+        if not isinstance(value, bool):
+            errors.append("--access-controlled must be a boolean")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("update", short_help="")
 def environments_partial_update(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     name: Annotated[Optional[str], typer.Option(show_default=False, help="The environment name.")] = None,
     description: Annotated[Optional[str], typer.Option(show_default=False, help="A description of the environment.  You may find it helpful to document how this environment is used to assist others when they need to maintain software that uses this content.")] = None,
     parent: Annotated[Optional[str], typer.Option(show_default=False, help="Environments can inherit from a single parent environment which provides values for parameters when specific environments do not have a value set.  Every organization has one default environment that cannot be removed.")] = None,
@@ -290,30 +432,43 @@ def environments_partial_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for environments_partial_update: PATCH /api/v1/environments/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/environments", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    if name is not None:
-        body["name"] = name
-    if description is not None:
-        body["description"] = description
-    if parent is not None:
-        body["parent"] = parent
-    if access_controlled is not None:
-        body["access_controlled"] = access_controlled
+
+    def _request(id=id, name=name, description=description, parent=parent, access_controlled=access_controlled):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/environments", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        if name is not None:
+            body["name"] = name
+        if description is not None:
+            body["description"] = description
+        if parent is not None:
+            body["parent"] = parent
+        if access_controlled is not None:
+            body["access_controlled"] = access_controlled
+        _check_environments_partial_update_body(body)
+
+        return _r.request("PATCH", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id", "name": "name", "description": "description", "parent": "parent", "access_controlled": "access_controlled"})
+        return
 
     try:
-        data = _r.request("PATCH", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
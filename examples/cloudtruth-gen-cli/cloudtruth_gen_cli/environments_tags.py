@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from cloudtruth_gen_cli import _arguments as _a
+from cloudtruth_gen_cli import _bulk as _b  # noqa: F401
 from cloudtruth_gen_cli import _display as _d  # noqa: F401
 from cloudtruth_gen_cli import _exceptions as _e  # noqa: F401
 from cloudtruth_gen_cli import _logging as _l  # noqa: F401
@@ -28,14 +29,39 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "environments_tags", display, depth)
     return
 
 
+def _check_environments_tags_create_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("name")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--name must be a string")
+        elif len(value) > 64:
+            errors.append("--name must be at most 64 characters")
+    value = body.get("description")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--description must be a string")
+    value = body.get("timestamp")
+    if value is not None:
+        if not isinstance(value, (str, date)):
+            errors.append("--timestamp must be a string or date")
+    value = body.get("immutable")
+    if value is not None:
+        if not isinstance(value, bool):
+            errors.append("--immutable must be a boolean")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("create", short_help="Tags allow you to name stable points for your configuration.")
 def environments_tags_create(
-    environment_pk: Annotated[str, typer.Argument(show_default=False, help="")],
+    environment_pk: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ENVIRONMENT_PK", callback=_a.required_unless_from_file, help="")] = None,
     name: Annotated[str, typer.Option(show_default=False, help="The tag name. Tag names may contain alphanumeric, hyphen, underscore, or period characters. Tag names are case sensitive. The name cannot be modified.")] = None,
     description: Annotated[Optional[str], typer.Option(show_default=False, help="A description of the tag.  You may find it helpful to document how this tag is used to assist others when they need to maintain software that uses this content.")] = None,
     timestamp: Annotated[Optional[datetime], typer.Option(show_default=False, help="The point in time this tag represents. If not specified then the current time will be used.")] = None,
@@ -46,6 +72,8 @@ def environments_tags_create(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Tags allow you to name stable points for your configuration.
@@ -55,28 +83,39 @@ def environments_tags_create(
     '''
     # handler for environments_tags_create: POST /api/v1/environments/{environment_pk}/tags/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if name is None:
-        missing.append("--name")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["name"] = name
-    if description is not None:
-        body["description"] = description
-    if timestamp is not None:
-        body["timestamp"] = timestamp
-    if immutable is not None:
-        body["immutable"] = immutable
+
+    def _request(environment_pk=environment_pk, name=name, description=description, timestamp=timestamp, immutable=immutable):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if environment_pk is None:
+            missing.append("ENVIRONMENT_PK")
+        if name is None:
+            missing.append("--name")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["name"] = name
+        if description is not None:
+            body["description"] = description
+        if timestamp is not None:
+            body["timestamp"] = timestamp
+        if immutable is not None:
+            body["immutable"] = immutable
+        _check_environments_tags_create_body(body)
+
+        return _r.request("POST", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"environment_pk": "environment_pk", "name": "name", "description": "description", "timestamp": "timestamp", "immutable": "immutable"})
+        return
 
     try:
-        data = _r.request("POST", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -86,14 +125,16 @@ def environments_tags_create(
 
 @app.command("delete", short_help="Tags allow you to name stable points for your configuration.")
 def environments_tags_destroy(
-    environment_pk: Annotated[str, typer.Argument(show_default=False, help="")],
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    environment_pk: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ENVIRONMENT_PK", callback=_a.required_unless_from_file, help="")] = None,
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Tags allow you to name stable points for your configuration.
@@ -103,18 +144,30 @@ def environments_tags_destroy(
     '''
     # handler for environments_tags_destroy: DELETE /api/v1/environments/{environment_pk}/tags/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(environment_pk=environment_pk, id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if environment_pk is None:
+            missing.append("ENVIRONMENT_PK")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("DELETE", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"environment_pk": "environment_pk", "id": "id"})
+        return
 
     try:
-        data = _r.request("DELETE", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -124,7 +177,7 @@ def environments_tags_destroy(
 
 @app.command("list", short_help="Tags allow you to name stable points for your configuration.")
 def environments_tags_list(
-    environment_pk: Annotated[str, typer.Argument(show_default=False, help="")],
+    environment_pk: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ENVIRONMENT_PK", callback=_a.required_unless_from_file, help="")] = None,
     description__icontains: Annotated[Optional[str], typer.Option(show_default=False, help="")] = None,
     name: Annotated[Optional[str], typer.Option(show_default=False, help="")] = None,
     name__icontains: Annotated[Optional[str], typer.Option(show_default=False, help="")] = None,
@@ -141,6 +194,8 @@ def environments_tags_list(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Tags allow you to name stable points for your configuration.
@@ -150,37 +205,47 @@ def environments_tags_list(
     '''
     # handler for environments_tags_list: GET /api/v1/environments/{environment_pk}/tags/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags/")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, item_property_name="result", next_property_name="next")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if description__icontains is not None:
-        params["description__icontains"] = description__icontains
-    if name is not None:
-        params["name"] = name
-    if name__icontains is not None:
-        params["name__icontains"] = name__icontains
-    if ordering is not None:
-        params["ordering"] = ordering
-    if page is not None:
-        params["page"] = page
-    if page_size is not None:
-        params["page_size"] = page_size
-    if timestamp is not None:
-        params["timestamp"] = timestamp
-    if timestamp__gte is not None:
-        params["timestamp__gte"] = timestamp__gte
-    if timestamp__lte is not None:
-        params["timestamp__lte"] = timestamp__lte
+
+    def _request(environment_pk=environment_pk, description__icontains=description__icontains, name=name, name__icontains=name__icontains, ordering=ordering, page=page, page_size=page_size, timestamp=timestamp, timestamp__gte=timestamp__gte, timestamp__lte=timestamp__lte):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags/")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, items_property_name="results", next_property_name="next")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if environment_pk is None:
+            missing.append("ENVIRONMENT_PK")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if description__icontains is not None:
+            params["description__icontains"] = description__icontains
+        if name is not None:
+            params["name"] = name
+        if name__icontains is not None:
+            params["name__icontains"] = name__icontains
+        if ordering is not None:
+            params["ordering"] = ordering
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if timestamp is not None:
+            params["timestamp"] = timestamp
+        if timestamp__gte is not None:
+            params["timestamp__gte"] = timestamp__gte
+        if timestamp__lte is not None:
+            params["timestamp__lte"] = timestamp__lte
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"environment_pk": "environment_pk", "description__icontains": "description__icontains", "name": "name", "name__icontains": "name__icontains", "ordering": "ordering", "page": "page", "page_size": "page_size", "timestamp": "timestamp", "timestamp__gte": "timestamp__gte", "timestamp__lte": "timestamp__lte"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -188,10 +253,35 @@ def environments_tags_list(
     return
 
 
+def _check_environments_tags_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("name")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--name must be a string")
+        elif len(value) > 64:
+            errors.append("--name must be at most 64 characters")
+    value = body.get("description")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--description must be a string")
+    value = body.get("timestamp")
+    if value is not None:
+        if not isinstance(value, (str, date)):
+            errors.append("--timestamp must be a string or date")
+    value = body.get("immutable")
+    if value is not None:
+        if not isinstance(value, bool):
+            errors.append("--immutable must be a boolean")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("set", short_help="Tags allow you to name stable points for your configuration.")
 def environments_tags_update(
-    environment_pk: Annotated[str, typer.Argument(show_default=False, help="")],
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    environment_pk: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ENVIRONMENT_PK", callback=_a.required_unless_from_file, help="")] = None,
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     name: Annotated[str, typer.Option(show_default=False, help="The tag name. Tag names may contain alphanumeric, hyphen, underscore, or period characters. Tag names are case sensitive. The name cannot be modified.")] = None,
     description: Annotated[Optional[str], typer.Option(show_default=False, help="A description of the tag.  You may find it helpful to document how this tag is used to assist others when they need to maintain software that uses this content.")] = None,
     timestamp: Annotated[Optional[datetime], typer.Option(show_default=False, help="The point in time this tag represents.  If explicitly set to `null` then the current time will be used.")] = None,
@@ -202,6 +292,8 @@ def environments_tags_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Tags allow you to name stable points for your configuration.
@@ -211,28 +303,41 @@ def environments_tags_update(
     '''
     # handler for environments_tags_update: PUT /api/v1/environments/{environment_pk}/tags/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if name is None:
-        missing.append("--name")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["name"] = name
-    if description is not None:
-        body["description"] = description
-    if timestamp is not None:
-        body["timestamp"] = timestamp
-    if immutable is not None:
-        body["immutable"] = immutable
+
+    def _request(environment_pk=environment_pk, id=id, name=name, description=description, timestamp=timestamp, immutable=immutable):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if environment_pk is None:
+            missing.append("ENVIRONMENT_PK")
+        if id is None:
+            missing.append("ID")
+        if name is None:
+            missing.append("--name")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["name"] = name
+        if description is not None:
+            body["description"] = description
+        if timestamp is not None:
+            body["timestamp"] = timestamp
+        if immutable is not None:
+            body["immutable"] = immutable
+        _check_environments_tags_update_body(body)
+
+        return _r.request("PUT", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"environment_pk": "environment_pk", "id": "id", "name": "name", "description": "description", "timestamp": "timestamp", "immutable": "immutable"})
+        return
 
     try:
-        data = _r.request("PUT", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -242,14 +347,16 @@ def environments_tags_update(
 
 @app.command("show", short_help="Tags allow you to name stable points for your configuration.")
 def environments_tags_retrieve(
-    environment_pk: Annotated[str, typer.Argument(show_default=False, help="")],
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    environment_pk: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ENVIRONMENT_PK", callback=_a.required_unless_from_file, help="")] = None,
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Tags allow you to name stable points for your configuration.
@@ -259,18 +366,30 @@ def environments_tags_retrieve(
     '''
     # handler for environments_tags_retrieve: GET /api/v1/environments/{environment_pk}/tags/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(environment_pk=environment_pk, id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if environment_pk is None:
+            missing.append("ENVIRONMENT_PK")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"environment_pk": "environment_pk", "id": "id"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -278,10 +397,35 @@ def environments_tags_retrieve(
     return
 
 
+def _check_environments_tags_partial_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("name")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--name must be a string")
+        elif len(value) > 64:
+            errors.append("--name must be at most 64 characters")
+    value = body.get("description")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--description must be a string")
+    value = body.get("timestamp")
+    if value is not None:
+        if not isinstance(value, (str, date)):
+            errors.append("--timestamp must be a string or date")
+    value = body.get("immutable")
+    if value is not None:
+        if not isinstance(value, bool):
+            errors.append("--immutable must be a boolean")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("update", short_help="Tags allow you to name stable points for your configuration.")
 def environments_tags_partial_update(
-    environment_pk: Annotated[str, typer.Argument(show_default=False, help="")],
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    environment_pk: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ENVIRONMENT_PK", callback=_a.required_unless_from_file, help="")] = None,
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     name: Annotated[Optional[str], typer.Option(show_default=False, help="The tag name. Tag names may contain alphanumeric, hyphen, underscore, or period characters. Tag names are case sensitive. The name cannot be modified.")] = None,
     description: Annotated[Optional[str], typer.Option(show_default=False, help="A description of the tag.  You may find it helpful to document how this tag is used to assist others when they need to maintain software that uses this content.")] = None,
     timestamp: Annotated[Optional[datetime], typer.Option(show_default=False, help="The point in time this tag represents.  If explicitly set to `null` then the current time will be used.")] = None,
@@ -292,6 +436,8 @@ def environments_tags_partial_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Tags allow you to name stable points for your configuration.
@@ -301,27 +447,40 @@ def environments_tags_partial_update(
     '''
     # handler for environments_tags_partial_update: PATCH /api/v1/environments/{environment_pk}/tags/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    if name is not None:
-        body["name"] = name
-    if description is not None:
-        body["description"] = description
-    if timestamp is not None:
-        body["timestamp"] = timestamp
-    if immutable is not None:
-        body["immutable"] = immutable
+
+    def _request(environment_pk=environment_pk, id=id, name=name, description=description, timestamp=timestamp, immutable=immutable):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/environments", environment_pk, "tags", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if environment_pk is None:
+            missing.append("ENVIRONMENT_PK")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        if name is not None:
+            body["name"] = name
+        if description is not None:
+            body["description"] = description
+        if timestamp is not None:
+            body["timestamp"] = timestamp
+        if immutable is not None:
+            body["immutable"] = immutable
+        _check_environments_tags_partial_update_body(body)
+
+        return _r.request("PATCH", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"environment_pk": "environment_pk", "id": "id", "name": "name", "description": "description", "timestamp": "timestamp", "immutable": "immutable"})
+        return
 
     try:
-        data = _r.request("PATCH", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
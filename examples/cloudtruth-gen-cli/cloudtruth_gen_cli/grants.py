@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from cloudtruth_gen_cli import _arguments as _a
+from cloudtruth_gen_cli import _bulk as _b  # noqa: F401
 from cloudtruth_gen_cli import _display as _d  # noqa: F401
 from cloudtruth_gen_cli import _exceptions as _e  # noqa: F401
 from cloudtruth_gen_cli import _logging as _l  # noqa: F401
@@ -28,7 +29,7 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "grants", display, depth)
     return
 
@@ -40,6 +41,27 @@ class RoleEnum(str, Enum):  # noqa: F811
     VIEWER = "VIEWER"
 
 
+def _check_grants_create_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("principal")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--principal must be a string")
+    value = body.get("scope")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--scope must be a string")
+    value = body.get("role")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--role must be a string")
+        elif value not in ("OWNER", "ADMIN", "CONTRIB", "VIEWER"):
+            errors.append("--role must be one of: OWNER, ADMIN, CONTRIB, VIEWER")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("create", short_help="Grants allow you to enable access control on Environments and Projects.")
 def grants_create(
     principal: Annotated[str, typer.Option(show_default=False, help="The URI of a principal for the grant; this must reference a user or group.")] = None,
@@ -51,6 +73,8 @@ def grants_create(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Grants allow you to enable access control on Environments and Projects.
@@ -61,28 +85,37 @@ def grants_create(
     '''
     # handler for grants_create: POST /api/v1/grants/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/grants/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if principal is None:
-        missing.append("--principal")
-    if scope is None:
-        missing.append("--scope")
-    if role is None:
-        missing.append("--role")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["principal"] = principal
-    body["scope"] = scope
-    body["role"] = role
+
+    def _request(principal=principal, scope=scope, role=role):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/grants/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if principal is None:
+            missing.append("--principal")
+        if scope is None:
+            missing.append("--scope")
+        if role is None:
+            missing.append("--role")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["principal"] = principal
+        body["scope"] = scope
+        body["role"] = role
+        _check_grants_create_body(body)
+
+        return _r.request("POST", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"principal": "principal", "scope": "scope", "role": "role"})
+        return
 
     try:
-        data = _r.request("POST", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -92,13 +125,15 @@ def grants_create(
 
 @app.command("delete", short_help="Grants allow you to enable access control on Environments and Projects.")
 def grants_destroy(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Grants allow you to enable access control on Environments and Projects.
@@ -109,18 +144,28 @@ def grants_destroy(
     '''
     # handler for grants_destroy: DELETE /api/v1/grants/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/grants", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/grants", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("DELETE", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id"})
+        return
 
     try:
-        data = _r.request("DELETE", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -136,6 +181,8 @@ def grants_multi_destroy(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Removes grants matching the query parameters atomically.
@@ -145,18 +192,26 @@ def grants_multi_destroy(
     '''
     # handler for grants_multi_destroy: DELETE /api/v1/grants/multi/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/grants/multi/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request():
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/grants/multi/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("DELETE", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {})
+        return
 
     try:
-        data = _r.request("DELETE", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -186,6 +241,8 @@ def grants_list(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Grants allow you to enable access control on Environments and Projects.
@@ -196,31 +253,39 @@ def grants_list(
     '''
     # handler for grants_list: GET /api/v1/grants/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/grants/")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, item_property_name="result", next_property_name="next")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if ordering is not None:
-        params["ordering"] = ordering
-    if page is not None:
-        params["page"] = page
-    if page_size is not None:
-        params["page_size"] = page_size
-    if principal is not None:
-        params["principal"] = principal
-    if role is not None:
-        params["role"] = role
-    if scope is not None:
-        params["scope"] = scope
+
+    def _request(ordering=ordering, page=page, page_size=page_size, principal=principal, role=role, scope=scope):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/grants/")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, items_property_name="results", next_property_name="next")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if ordering is not None:
+            params["ordering"] = ordering
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if principal is not None:
+            params["principal"] = principal
+        if role is not None:
+            params["role"] = role
+        if scope is not None:
+            params["scope"] = scope
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"ordering": "ordering", "page": "page", "page_size": "page_size", "principal": "principal", "role": "role", "scope": "scope"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -235,9 +300,30 @@ class RoleEnum(str, Enum):  # noqa: F811
     VIEWER = "VIEWER"
 
 
+def _check_grants_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("principal")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--principal must be a string")
+    value = body.get("scope")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--scope must be a string")
+    value = body.get("role")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--role must be a string")
+        elif value not in ("OWNER", "ADMIN", "CONTRIB", "VIEWER"):
+            errors.append("--role must be one of: OWNER, ADMIN, CONTRIB, VIEWER")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("set", short_help="Grants allow you to enable access control on Environments and Projects.")
 def grants_update(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     principal: Annotated[str, typer.Option(show_default=False, help="The URI of a principal for the grant; this must reference a user or group.")] = None,
     scope: Annotated[str, typer.Option(show_default=False, help="The URI of a scope for the grant; this must reference a project or environment.")] = None,
     role: Annotated[RoleEnum, typer.Option(show_default=False, case_sensitive=False)] = None,
@@ -247,6 +333,8 @@ def grants_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Grants allow you to enable access control on Environments and Projects.
@@ -257,28 +345,39 @@ def grants_update(
     '''
     # handler for grants_update: PUT /api/v1/grants/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/grants", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if principal is None:
-        missing.append("--principal")
-    if scope is None:
-        missing.append("--scope")
-    if role is None:
-        missing.append("--role")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["principal"] = principal
-    body["scope"] = scope
-    body["role"] = role
+
+    def _request(id=id, principal=principal, scope=scope, role=role):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/grants", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if principal is None:
+            missing.append("--principal")
+        if scope is None:
+            missing.append("--scope")
+        if role is None:
+            missing.append("--role")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["principal"] = principal
+        body["scope"] = scope
+        body["role"] = role
+        _check_grants_update_body(body)
+
+        return _r.request("PUT", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id", "principal": "principal", "scope": "scope", "role": "role"})
+        return
 
     try:
-        data = _r.request("PUT", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -288,13 +387,15 @@ def grants_update(
 
 @app.command("show", short_help="Grants allow you to enable access control on Environments and Projects.")
 def grants_retrieve(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Grants allow you to enable access control on Environments and Projects.
@@ -305,18 +406,28 @@ def grants_retrieve(
     '''
     # handler for grants_retrieve: GET /api/v1/grants/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/grants", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/grants", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -331,9 +442,30 @@ class RoleEnum(str, Enum):  # noqa: F811
     VIEWER = "VIEWER"
 
 
+def _check_grants_partial_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("principal")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--principal must be a string")
+    value = body.get("scope")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--scope must be a string")
+    value = body.get("role")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--role must be a string")
+        elif value not in ("OWNER", "ADMIN", "CONTRIB", "VIEWER"):
+            errors.append("--role must be one of: OWNER, ADMIN, CONTRIB, VIEWER")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("update", short_help="Grants allow you to enable access control on Environments and Projects.")
 def grants_partial_update(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     principal: Annotated[Optional[str], typer.Option(show_default=False, help="The URI of a principal for the grant; this must reference a user or group.")] = None,
     scope: Annotated[Optional[str], typer.Option(show_default=False, help="The URI of a scope for the grant; this must reference a project or environment.")] = None,
     role: Annotated[Optional[RoleEnum], typer.Option(show_default=False, case_sensitive=False)] = None,
@@ -343,6 +475,8 @@ def grants_partial_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Grants allow you to enable access control on Environments and Projects.
@@ -353,25 +487,36 @@ def grants_partial_update(
     '''
     # handler for grants_partial_update: PATCH /api/v1/grants/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/grants", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    if principal is not None:
-        body["principal"] = principal
-    if scope is not None:
-        body["scope"] = scope
-    if role is not None:
-        body["role"] = role
+
+    def _request(id=id, principal=principal, scope=scope, role=role):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/grants", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        if principal is not None:
+            body["principal"] = principal
+        if scope is not None:
+            body["scope"] = scope
+        if role is not None:
+            body["role"] = role
+        _check_grants_partial_update_body(body)
+
+        return _r.request("PATCH", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id", "principal": "principal", "scope": "scope", "role": "role"})
+        return
 
     try:
-        data = _r.request("PATCH", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from cloudtruth_gen_cli import _arguments as _a
+from cloudtruth_gen_cli import _bulk as _b  # noqa: F401
 from cloudtruth_gen_cli import _display as _d  # noqa: F401
 from cloudtruth_gen_cli import _exceptions as _e  # noqa: F401
 from cloudtruth_gen_cli import _logging as _l  # noqa: F401
@@ -37,7 +38,7 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "main", display, depth)
     return
 
@@ -50,24 +51,34 @@ def backup_snapshot_create(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Get a snapshot of all Projects with parameters
     '''
     # handler for backup_snapshot_create: POST /api/v1/backup/snapshot/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/backup/snapshot/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request():
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/backup/snapshot/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("POST", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {})
+        return
 
     try:
-        data = _r.request("POST", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -90,39 +101,49 @@ def utils_generate_password_create(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Endpoint for accessing utility functions
     '''
     # handler for utils_generate_password_create: POST /api/v1/utils/generate_password/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/utils/generate_password/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if length is None:
-        missing.append("--length")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    params["length"] = length
-    if require_hardware_generation is not None:
-        params["require_hardware_generation"] = require_hardware_generation
-    if require_lowercase is not None:
-        params["require_lowercase"] = require_lowercase
-    if require_numbers is not None:
-        params["require_numbers"] = require_numbers
-    if require_spaces is not None:
-        params["require_spaces"] = require_spaces
-    if require_symbols is not None:
-        params["require_symbols"] = require_symbols
-    if require_uppercase is not None:
-        params["require_uppercase"] = require_uppercase
+
+    def _request(length=length, require_hardware_generation=require_hardware_generation, require_lowercase=require_lowercase, require_numbers=require_numbers, require_spaces=require_spaces, require_symbols=require_symbols, require_uppercase=require_uppercase):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/utils/generate_password/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if length is None:
+            missing.append("--length")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        params["length"] = length
+        if require_hardware_generation is not None:
+            params["require_hardware_generation"] = require_hardware_generation
+        if require_lowercase is not None:
+            params["require_lowercase"] = require_lowercase
+        if require_numbers is not None:
+            params["require_numbers"] = require_numbers
+        if require_spaces is not None:
+            params["require_spaces"] = require_spaces
+        if require_symbols is not None:
+            params["require_symbols"] = require_symbols
+        if require_uppercase is not None:
+            params["require_uppercase"] = require_uppercase
+
+        return _r.request("POST", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"length": "length", "require_hardware_generation": "require_hardware_generation", "require_lowercase": "require_lowercase", "require_numbers": "require_numbers", "require_spaces": "require_spaces", "require_symbols": "require_symbols", "require_uppercase": "require_uppercase"})
+        return
 
     try:
-        data = _r.request("POST", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from cloudtruth_gen_cli import _arguments as _a
+from cloudtruth_gen_cli import _bulk as _b  # noqa: F401
 from cloudtruth_gen_cli import _display as _d  # noqa: F401
 from cloudtruth_gen_cli import _exceptions as _e  # noqa: F401
 from cloudtruth_gen_cli import _logging as _l  # noqa: F401
@@ -28,7 +29,7 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "memberships", display, depth)
     return
 
@@ -40,6 +41,23 @@ class RoleEnum(str, Enum):  # noqa: F811
     VIEWER = "VIEWER"
 
 
+def _check_memberships_create_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("user")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--user must be a string")
+    value = body.get("role")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--role must be a string")
+        elif value not in ("OWNER", "ADMIN", "CONTRIB", "VIEWER"):
+            errors.append("--role must be one of: OWNER, ADMIN, CONTRIB, VIEWER")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("create", short_help="")
 def memberships_create(
     user: Annotated[str, typer.Option(show_default=False, help="The user of the membership.")] = None,
@@ -50,28 +68,39 @@ def memberships_create(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for memberships_create: POST /api/v1/memberships/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/memberships/")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if user is None:
-        missing.append("--user")
-    if role is None:
-        missing.append("--role")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["user"] = user
-    body["role"] = role
+
+    def _request(user=user, role=role):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/memberships/")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if user is None:
+            missing.append("--user")
+        if role is None:
+            missing.append("--role")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["user"] = user
+        body["role"] = role
+        _check_memberships_create_body(body)
+
+        return _r.request("POST", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"user": "user", "role": "role"})
+        return
 
     try:
-        data = _r.request("POST", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -81,28 +110,40 @@ def memberships_create(
 
 @app.command("delete", short_help="")
 def memberships_destroy(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for memberships_destroy: DELETE /api/v1/memberships/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/memberships", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/memberships", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("DELETE", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id"})
+        return
 
     try:
-        data = _r.request("DELETE", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -131,32 +172,42 @@ def memberships_list(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for memberships_list: GET /api/v1/memberships/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/memberships/")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, item_property_name="result", next_property_name="next")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if ordering is not None:
-        params["ordering"] = ordering
-    if page is not None:
-        params["page"] = page
-    if page_size is not None:
-        params["page_size"] = page_size
-    if role is not None:
-        params["role"] = role
-    if user is not None:
-        params["user"] = user
+
+    def _request(ordering=ordering, page=page, page_size=page_size, role=role, user=user):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/memberships/")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="page_size", page_size_value=page_size, page_start_name="page", page_start_value=page, items_property_name="results", next_property_name="next")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if ordering is not None:
+            params["ordering"] = ordering
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if role is not None:
+            params["role"] = role
+        if user is not None:
+            params["user"] = user
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"ordering": "ordering", "page": "page", "page_size": "page_size", "role": "role", "user": "user"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -171,9 +222,30 @@ class RoleEnum(str, Enum):  # noqa: F811
     VIEWER = "VIEWER"
 
 
+def _check_memberships_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("user")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--user must be a string")
+    value = body.get("organization")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--organization must be a string")
+    value = body.get("role")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--role must be a string")
+        elif value not in ("OWNER", "ADMIN", "CONTRIB", "VIEWER"):
+            errors.append("--role must be one of: OWNER, ADMIN, CONTRIB, VIEWER")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("set", short_help="")
 def memberships_update(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     user: Annotated[str, typer.Option(show_default=False, help="The user of the membership.")] = None,
     organization: Annotated[str, typer.Option(show_default=False, help="The organization that the user is a member of.")] = None,
     role: Annotated[RoleEnum, typer.Option(show_default=False, case_sensitive=False)] = None,
@@ -183,31 +255,44 @@ def memberships_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for memberships_update: PUT /api/v1/memberships/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/memberships", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if user is None:
-        missing.append("--user")
-    if organization is None:
-        missing.append("--organization")
-    if role is None:
-        missing.append("--role")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["user"] = user
-    body["organization"] = organization
-    body["role"] = role
+
+    def _request(id=id, user=user, organization=organization, role=role):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/memberships", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if user is None:
+            missing.append("--user")
+        if organization is None:
+            missing.append("--organization")
+        if role is None:
+            missing.append("--role")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["user"] = user
+        body["organization"] = organization
+        body["role"] = role
+        _check_memberships_update_body(body)
+
+        return _r.request("PUT", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id", "user": "user", "organization": "organization", "role": "role"})
+        return
 
     try:
-        data = _r.request("PUT", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -217,28 +302,40 @@ def memberships_update(
 
 @app.command("show", short_help="")
 def memberships_retrieve(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     _api_host: _a.ApiHostOption = "",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for memberships_retrieve: GET /api/v1/memberships/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "api/v1/memberships", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(id=id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "api/v1/memberships", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -253,9 +350,30 @@ class RoleEnum(str, Enum):  # noqa: F811
     VIEWER = "VIEWER"
 
 
+def _check_memberships_partial_update_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("user")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--user must be a string")
+    value = body.get("organization")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--organization must be a string")
+    value = body.get("role")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--role must be a string")
+        elif value not in ("OWNER", "ADMIN", "CONTRIB", "VIEWER"):
+            errors.append("--role must be one of: OWNER, ADMIN, CONTRIB, VIEWER")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("update", short_help="")
 def memberships_partial_update(
-    id: Annotated[str, typer.Argument(show_default=False, help="")],
+    id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="ID", callback=_a.required_unless_from_file, help="")] = None,
     user: Annotated[Optional[str], typer.Option(show_default=False, help="The user of the membership.")] = None,
     organization: Annotated[Optional[str], typer.Option(show_default=False, help="The organization that the user is a member of.")] = None,
     role: Annotated[Optional[RoleEnum], typer.Option(show_default=False, case_sensitive=False)] = None,
@@ -265,28 +383,41 @@ def memberships_partial_update(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     # handler for memberships_partial_update: PATCH /api/v1/memberships/{id}/
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "api/v1/memberships", id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    if user is not None:
-        body["user"] = user
-    if organization is not None:
-        body["organization"] = organization
-    if role is not None:
-        body["role"] = role
+
+    def _request(id=id, user=user, organization=organization, role=role):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "api/v1/memberships", id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        if user is not None:
+            body["user"] = user
+        if organization is not None:
+            body["organization"] = organization
+        if role is not None:
+            body["role"] = role
+        _check_memberships_partial_update_body(body)
+
+        return _r.request("PATCH", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id", "user": "user", "organization": "organization", "role": "role"})
+        return
 
     try:
-        data = _r.request("PATCH", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
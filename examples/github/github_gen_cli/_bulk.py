@@ -0,0 +1,192 @@
+# Copyright 2025
+#
+# This code was generated by the openapi-spec-tools CLI generator, DO NOT EDIT
+#
+"""Implementation for running a single command over many inputs (one JSON object per line).
+
+Each line of the input file contains the arguments for one request, using the parameter names
+from the OpenAPI specification (e.g. "petId") or the CLI variable names (e.g. "pet_id"). The map
+from the specification names to the variable names is provided by the generated command. Values
+from the file take precedence over the values provided on the command line.
+
+The requests are run by a bounded pool of worker threads that share a single requests session,
+so the connections get reused. Binary responses are written to a file per item, named using the
+line number (e.g. "output-3.png").
+"""
+import inspect
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+import requests
+import typer
+
+from github_gen_cli import _requests as _r
+from github_gen_cli._console import console_factory
+
+STDIN = "-"
+
+
+class BulkField:
+    DATA = "data"
+    ERROR = "error"
+    ELAPSED = "elapsed"
+    LINE = "line"
+    STATUS = "status"
+
+
+class BulkStatus:
+    OK = "ok"
+    FAILED = "failed"
+
+
+@dataclass
+class BulkResult:
+    line: int
+    status: str
+    elapsed: float
+    data: Any = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {
+            BulkField.LINE: self.line,
+            BulkField.STATUS: self.status,
+            BulkField.ELAPSED: round(self.elapsed, 3),
+        }
+        if self.error is not None:
+            result[BulkField.ERROR] = self.error
+        else:
+            result[BulkField.DATA] = self.data
+        return result
+
+
+def item_arguments(item: dict[str, Any], arguments: set[str], names: dict[str, str]) -> dict[str, Any]:
+    """Map the item keys onto the function argument names."""
+    if not isinstance(item, dict):
+        raise ValueError(f"expected a JSON object, not {type(item).__name__}")
+
+    kwargs = {}
+    unknown = []
+    for key, value in item.items():
+        name = names.get(key, key)
+        if name in arguments:
+            kwargs[name] = value
+        else:
+            unknown.append(key)
+
+    if unknown:
+        raise ValueError(f"unknown arguments: {', '.join(unknown)}")
+    return kwargs
+
+
+def read_items(filename: str) -> Iterator[tuple[int, str]]:
+    """Yield the (line number, text) for the non-blank lines of the file."""
+    if filename == STDIN:
+        yield from _numbered(sys.stdin)
+        return
+
+    with open(filename, encoding="utf-8") as fp:
+        yield from _numbered(fp)
+
+
+def _numbered(lines: Any) -> Iterator[tuple[int, str]]:
+    for number, text in enumerate(lines, start=1):
+        text = text.strip()
+        if text:
+            yield number, text
+
+
+def run_item(
+    func: Callable[..., Any],
+    line: int,
+    text: str,
+    arguments: set[str],
+    names: dict[str, str],
+) -> BulkResult:
+    """Parse one line, and run the function with the arguments."""
+    start = time.perf_counter()
+    previous = _r.use_output_suffix(f"-{line}")
+    try:
+        kwargs = item_arguments(json.loads(text), arguments, names)
+        data = func(**kwargs)
+        if isinstance(data, Iterator):
+            # consume streamed responses before reporting the result
+            data = list(data)
+    except requests.HTTPError as ex:
+        return BulkResult(line, BulkStatus.FAILED, time.perf_counter() - start, error=str(ex.args[0]))
+    except Exception as ex:
+        return BulkResult(line, BulkStatus.FAILED, time.perf_counter() - start, error=str(ex))
+    finally:
+        _r.use_output_suffix(previous)
+
+    return BulkResult(line, BulkStatus.OK, time.perf_counter() - start, data=data)
+
+
+def run_items(
+    func: Callable[..., Any],
+    filename: str,
+    workers: int,
+    names: dict[str, str],
+) -> Iterator[BulkResult]:
+    """Run the function for each item in the file using the worker pool, and yield results as completed.
+
+    Only a bounded number of items are outstanding at a time, so large files are not read into memory.
+    """
+    arguments = set(inspect.signature(func).parameters)
+    limit = workers * 2
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for line, text in read_items(filename):
+            pending.add(executor.submit(run_item, func, line, text, arguments, names))
+            if len(pending) < limit:
+                continue
+            done = next(as_completed(pending))
+            pending.remove(done)
+            yield done.result()
+
+        for done in as_completed(pending):
+            yield done.result()
+
+
+def bulk_execute(func: Callable[..., Any], filename: str, workers: int, names: dict[str, str]) -> None:
+    """Run the request function over all the items in the file.
+
+    The names map the OpenAPI parameter names to the request function argument names.
+
+    Each result is written to standard output as a JSON line (in completion order), and the
+    throughput summary is written to standard error.
+    """
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=workers))
+    session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=workers))
+    previous = _r.use_session(session)
+
+    total = 0
+    failed = 0
+    start = time.perf_counter()
+    try:
+        for result in run_items(func, filename, workers, names):
+            total += 1
+            if result.status != BulkStatus.OK:
+                failed += 1
+            print(json.dumps(result.to_dict()), flush=True)
+    finally:
+        _r.use_session(previous)
+        session.close()
+    elapsed = time.perf_counter() - start
+
+    rate = total / elapsed if elapsed else 0.0
+    console = console_factory(stderr=True)
+    console.print(
+        f"Processed {total} items ({total - failed} ok, {failed} failed) in {elapsed:.2f}s ({rate:.1f} items/s)"
+    )
+    if failed:
+        raise typer.Exit(1)
@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from github_gen_cli import _arguments as _a
+from github_gen_cli import _bulk as _b  # noqa: F401
 from github_gen_cli import _display as _d  # noqa: F401
 from github_gen_cli import _exceptions as _e  # noqa: F401
 from github_gen_cli import _logging as _l  # noqa: F401
@@ -29,7 +30,7 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "main", display, depth)
     return
 
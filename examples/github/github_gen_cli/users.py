@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from github_gen_cli import _arguments as _a
+from github_gen_cli import _bulk as _b  # noqa: F401
 from github_gen_cli import _display as _d  # noqa: F401
 from github_gen_cli import _exceptions as _e  # noqa: F401
 from github_gen_cli import _logging as _l  # noqa: F401
@@ -29,15 +30,15 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "users", display, depth)
     return
 
 
 @app.command("attestations", short_help="List attestations")
 def users_list_attestations(
-    username: Annotated[str, typer.Argument(show_default=False, help="The handle for the GitHub user account.")],
-    subject_digest: Annotated[str, typer.Argument(show_default=False, help="Subject Digest")],
+    username: Annotated[Optional[str], typer.Argument(show_default=False, metavar="USERNAME", callback=_a.required_unless_from_file, help="The handle for the GitHub user account.")] = None,
+    subject_digest: Annotated[Optional[str], typer.Argument(show_default=False, metavar="SUBJECT_DIGEST", callback=_a.required_unless_from_file, help="Subject Digest")] = None,
     per_page: Annotated[int, typer.Option(help="The number of results per page (max 100). For more information, see \"[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).\"")] = 30,
     before: Annotated[Optional[str], typer.Option(show_default=False, help="A cursor, as given in the [Link header](https://docs.github.com/rest/guides/using-pagination-in-the-rest-api#using-link-headers). If specified, the query only searches for results before this cursor. For more information, see \"[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).\"")] = None,
     after: Annotated[Optional[str], typer.Option(show_default=False, help="A cursor, as given in the [Link header](https://docs.github.com/rest/guides/using-pagination-in-the-rest-api#using-link-headers). If specified, the query only searches for results after this cursor. For more information, see \"[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).\"")] = None,
@@ -49,6 +50,8 @@ def users_list_attestations(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     List a collection of artifact attestations with a given subject digest that are associated with repositories owned by a
@@ -68,27 +71,39 @@ def users_list_attestations(
     '''
     # handler for users/list-attestations: GET /users/{username}/attestations/{subject_digest}
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "users", username, "attestations", subject_digest)
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="per-page", page_size_value=per_page)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if per_page is not None:
-        params["per_page"] = per_page
-    if before is not None:
-        params["before"] = before
-    if after is not None:
-        params["after"] = after
-    if predicate_type is not None:
-        params["predicate_type"] = predicate_type
+
+    def _request(username=username, subject_digest=subject_digest, per_page=per_page, before=before, after=after, predicate_type=predicate_type):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "users", username, "attestations", subject_digest)
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="per_page", page_size_value=per_page)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if username is None:
+            missing.append("USERNAME")
+        if subject_digest is None:
+            missing.append("SUBJECT_DIGEST")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if per_page is not None:
+            params["per_page"] = per_page
+        if before is not None:
+            params["before"] = before
+        if after is not None:
+            params["after"] = after
+        if predicate_type is not None:
+            params["predicate_type"] = predicate_type
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"username": "username", "subject_digest": "subject_digest", "per_page": "per_page", "before": "before", "after": "after", "predicate_type": "predicate_type"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -104,6 +119,8 @@ def users_get_authenticated(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     OAuth app tokens and personal access tokens (classic) need the `user` scope in order for the response to include private
@@ -111,18 +128,26 @@ def users_get_authenticated(
     '''
     # handler for users/get-authenticated: GET /user
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "user")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request():
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "user")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -141,6 +166,8 @@ def users_list(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Lists all users, in the order that they signed up on GitHub. This list includes personal user accounts and organization
@@ -152,23 +179,31 @@ def users_list(
     '''
     # handler for users/list: GET /users
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "users")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="per-page", page_size_value=per_page)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if since is not None:
-        params["since"] = since
-    if per_page is not None:
-        params["per_page"] = per_page
+
+    def _request(since=since, per_page=per_page):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "users")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="per_page", page_size_value=per_page)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if since is not None:
+            params["since"] = since
+        if per_page is not None:
+            params["per_page"] = per_page
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"since": "since", "per_page": "per_page"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -178,13 +213,15 @@ def users_list(
 
 @app.command("show-by-id", short_help="Get a user using their ID")
 def users_get_by_id(
-    account_id: Annotated[int, typer.Argument(show_default=False, help="account_id parameter")],
+    account_id: Annotated[Optional[int], typer.Argument(show_default=False, metavar="ACCOUNT_ID", callback=_a.required_unless_from_file, help="account_id parameter")] = None,
     _api_host: _a.ApiHostOption = "https://api.github.com",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Provides publicly available information about someone with a GitHub account. This method takes their durable user `ID`
@@ -207,18 +244,28 @@ def users_get_by_id(
     '''
     # handler for users/get-by-id: GET /user/{account_id}
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "user", account_id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(account_id=account_id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "user", account_id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if account_id is None:
+            missing.append("ACCOUNT_ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"account_id": "account_id"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -228,13 +275,15 @@ def users_get_by_id(
 
 @app.command("show-by-name", short_help="Get a user")
 def users_get_by_username(
-    username: Annotated[str, typer.Argument(show_default=False, help="The handle for the GitHub user account.")],
+    username: Annotated[Optional[str], typer.Argument(show_default=False, metavar="USERNAME", callback=_a.required_unless_from_file, help="The handle for the GitHub user account.")] = None,
     _api_host: _a.ApiHostOption = "https://api.github.com",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Provides publicly available information about someone with a GitHub account.
@@ -256,18 +305,28 @@ def users_get_by_username(
     '''
     # handler for users/get-by-username: GET /users/{username}
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "users", username)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(username=username):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "users", username)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if username is None:
+            missing.append("USERNAME")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"username": "username"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from github_gen_cli import _arguments as _a
+from github_gen_cli import _bulk as _b  # noqa: F401
 from github_gen_cli import _display as _d  # noqa: F401
 from github_gen_cli import _exceptions as _e  # noqa: F401
 from github_gen_cli import _logging as _l  # noqa: F401
@@ -28,7 +29,7 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "users_blocks", display, depth)
     return
 
@@ -44,29 +45,39 @@ def users_list_blocked_by_authenticated_user(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     List the users you've blocked on your personal account.
     '''
     # handler for users/list-blocked-by-authenticated-user: GET /user/blocks
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "user/blocks")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="per-page", page_size_value=per_page, page_start_name="page", page_start_value=page)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if per_page is not None:
-        params["per_page"] = per_page
-    if page is not None:
-        params["page"] = page
+
+    def _request(per_page=per_page, page=page):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "user/blocks")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="per_page", page_size_value=per_page, page_start_name="page", page_start_value=page)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if per_page is not None:
+            params["per_page"] = per_page
+        if page is not None:
+            params["page"] = page
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"per_page": "per_page", "page": "page"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -14,6 +14,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from pets_cli import _arguments as _a
+from pets_cli import _bulk as _b  # noqa: F401
 from pets_cli import _display as _d  # noqa: F401
 from pets_cli import _exceptions as _e  # noqa: F401
 from pets_cli import _logging as _l  # noqa: F401
@@ -28,11 +29,34 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "main", display, depth)
     return
 
 
+def _check_create_pets_body(body: dict) -> None:
+    """Check the body values against the schema (before sending the request)."""
+    errors = []
+    value = body.get("id")
+    if value is not None:
+        if not isinstance(value, int) or isinstance(value, bool):
+            errors.append("--id must be an integer")
+    value = body.get("name")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--name must be a string")
+    value = body.get("tag")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--tag must be a string")
+    value = body.get("owner")
+    if value is not None:
+        if not isinstance(value, str):
+            errors.append("--owner must be a string")
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+
 @app.command("add", short_help="Create a pet")
 def create_pets(
     id: Annotated[int, typer.Option(show_default=False)] = None,
@@ -45,36 +69,47 @@ def create_pets(
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Create a pet
     '''
     # handler for createPets: POST /pets
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key, content_type="application/json")
-    url = _r.create_url(_api_host, "pets")
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if id is None:
-        missing.append("--id")
-    if name is None:
-        missing.append("--name")
-    if owner is None:
-        missing.append("--owner")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    body = {}
-    body["id"] = id
-    body["name"] = name
-    if tag is not None:
-        body["tag"] = tag
-    body["owner"] = owner
+
+    def _request(id=id, name=name, tag=tag, owner=owner):
+        headers = _r.request_headers(_api_key, content_type="application/json")
+        url = _r.create_url(_api_host, "pets")
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if id is None:
+            missing.append("--id")
+        if name is None:
+            missing.append("--name")
+        if owner is None:
+            missing.append("--owner")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        body = {}
+        body["id"] = id
+        body["name"] = name
+        if tag is not None:
+            body["tag"] = tag
+        body["owner"] = owner
+        _check_create_pets_body(body)
+
+        return _r.request("POST", url, headers=headers, params=params, body=body, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"id": "id", "name": "name", "tag": "tag", "owner": "owner"})
+        return
 
     try:
-        data = _r.request("POST", url, headers=headers, params=params, body=body, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -84,31 +119,43 @@ def create_pets(
 
 @app.command("delete", short_help="Delete a pet")
 def delete_pet_by_id(
-    pet_id: Annotated[str, typer.Argument(show_default=False, help="The id of the pet to retrieve")],
+    pet_id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="PET_ID", callback=_a.required_unless_from_file, help="The id of the pet to retrieve")] = None,
     _api_host: _a.ApiHostOption = "http://petstore.swagger.io/v1",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Delete a pet
     '''
     # handler for deletePetById: DELETE /pets/{petId}
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "pets", pet_id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(pet_id=pet_id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "pets", pet_id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if pet_id is None:
+            missing.append("PET_ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("DELETE", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"petId": "pet_id"})
+        return
 
     try:
-        data = _r.request("DELETE", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -126,27 +173,37 @@ def list_pets(
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
     _max_count: _a.MaxCountOption = None,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     List all pets
     '''
     # handler for listPets: GET /pets
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "pets")
-    page_info = _r.PageParams(max_count=_max_count, page_size_name="limit", page_size_value=limit)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
-
-    params = {}
-    if limit is not None:
-        params["limit"] = limit
+
+    def _request(limit=limit):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "pets")
+        page_info = _r.PageParams(max_count=_max_count, page_size_name="limit", page_size_value=limit)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+        if limit is not None:
+            params["limit"] = limit
+
+        return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"limit": "limit"})
+        return
 
     try:
-        data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -156,31 +213,43 @@ def list_pets(
 
 @app.command("show", short_help="Info for a specific pet")
 def show_pet_by_id(
-    pet_id: Annotated[str, typer.Argument(show_default=False, help="The id of the pet to retrieve")],
+    pet_id: Annotated[Optional[str], typer.Argument(show_default=False, metavar="PET_ID", callback=_a.required_unless_from_file, help="The id of the pet to retrieve")] = None,
     _api_host: _a.ApiHostOption = "http://petstore.swagger.io/v1",
     _api_key: _a.ApiKeyOption = None,
     _api_timeout: _a.ApiTimeoutOption = 5,
     _log_level: _a.LogLevelOption = _a.LogLevel.WARN,
     _out_fmt: _a.OutputFormatOption = _a.OutputFormat.TABLE,
     _out_style: _a.OutputStyleOption = _a.OutputStyle.ALL,
+    _from_file: _a.FromFileOption = None,
+    _workers: _a.WorkersOption = 4,
 ) -> None:
     '''
     Info for a specific pet
     '''
     # handler for showPetById: GET /pets/{petId}
     _l.init_logging(_log_level)
-    headers = _r.request_headers(_api_key)
-    url = _r.create_url(_api_host, "pets", pet_id)
-    missing = []
-    if _api_key is None:
-        missing.append("--api-key")
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {}
+    def _request(pet_id=pet_id):
+        headers = _r.request_headers(_api_key)
+        url = _r.create_url(_api_host, "pets", pet_id)
+        missing = []
+        if _api_key is None:
+            missing.append("--api-key")
+        if pet_id is None:
+            missing.append("PET_ID")
+        if missing:
+            raise _e.MissingRequiredError(missing)
+
+        params = {}
+
+        return _r.request("GET", url, headers=headers, params=params, timeout=_api_timeout)
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {"petId": "pet_id"})
+        return
 
     try:
-        data = _r.request("GET", url, headers=headers, params=params, timemout=_api_timeout)
+        data = _request()
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
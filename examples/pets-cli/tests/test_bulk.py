@@ -0,0 +1,211 @@
+# Copyright 2025
+#
+# This code was generated by the openapi-spec-tools CLI generator, DO NOT EDIT
+#
+import json
+import os
+import threading
+from tempfile import TemporaryDirectory
+from typing import Annotated
+from typing import Optional
+from unittest import mock
+
+import pytest
+import requests
+import typer
+from requests import HTTPError
+from requests import Response
+from typer.testing import CliRunner
+
+from pets_cli import _arguments as _a
+from pets_cli import _requests as _r
+from pets_cli._bulk import BulkStatus
+from pets_cli._bulk import bulk_execute
+from pets_cli._bulk import item_arguments
+from pets_cli._bulk import read_items
+from pets_cli._bulk import run_item
+from pets_cli._bulk import run_items
+
+
+def _write_items(directory: str, lines: list[str]) -> str:
+    filename = os.path.join(directory, "items.ndjson")
+    with open(filename, "w") as fp:
+        fp.write("\n".join(lines) + "\n")
+    return filename
+
+
+NAMES = {"petId": "pet_id", "name": "name", "type": "type_"}
+
+
+def _request(pet_id=None, name=None, type_=None):
+    if pet_id is None:
+        raise ValueError("Missing required parameters, please provide: PET_ID")
+    return {"id": pet_id, "name": name, "type": type_}
+
+
+def test_item_arguments():
+    arguments = {"pet_id", "name", "type_"}
+    assert {"pet_id": 1, "type_": "cat"} == item_arguments({"petId": 1, "type": "cat"}, arguments, NAMES)
+    assert {"pet_id": 2, "name": "fido"} == item_arguments({"pet_id": 2, "name": "fido"}, arguments, NAMES)
+
+    # only the names from the generated command are converted
+    with pytest.raises(ValueError, match="unknown arguments: petId"):
+        item_arguments({"petId": 1}, arguments, {})
+    with pytest.raises(ValueError, match="unknown arguments: color, size"):
+        item_arguments({"name": "fido", "color": "red", "size": 3}, arguments, NAMES)
+    with pytest.raises(ValueError, match="expected a JSON object, not list"):
+        item_arguments([1, 2], arguments, NAMES)
+
+
+def test_read_items():
+    with TemporaryDirectory() as tempdir:
+        filename = _write_items(tempdir, ['{"a": 1}', "", "  ", '{"b": 2}'])
+        assert [(1, '{"a": 1}'), (4, '{"b": 2}')] == list(read_items(filename))
+
+
+def test_run_item():
+    arguments = {"pet_id", "name", "type_"}
+    result = run_item(_request, 3, '{"petId": "abc", "name": "fido"}', arguments, NAMES)
+    assert BulkStatus.OK == result.status
+    assert 3 == result.line
+    assert {"id": "abc", "name": "fido", "type": None} == result.data
+    assert result.error is None
+
+    result = run_item(_request, 4, '{"name": "fido"}', arguments, NAMES)
+    assert BulkStatus.FAILED == result.status
+    assert "PET_ID" in result.error
+    assert "error" in result.to_dict()
+    assert "data" not in result.to_dict()
+
+    result = run_item(_request, 5, '{"name": ', arguments, NAMES)
+    assert BulkStatus.FAILED == result.status
+
+    def _http_error():
+        raise HTTPError("404 Not Found")
+
+    result = run_item(_http_error, 6, '{}', set(), {})
+    assert BulkStatus.FAILED == result.status
+    assert "404 Not Found" == result.error
+
+
+def test_run_items_bounded():
+    lock = threading.Lock()
+    active = 0
+    maximum = 0
+
+    def _counting(pet_id=None):
+        nonlocal active, maximum
+        with lock:
+            active += 1
+            maximum = max(maximum, active)
+        threading.Event().wait(0.01)
+        with lock:
+            active -= 1
+        return pet_id
+
+    with TemporaryDirectory() as tempdir:
+        filename = _write_items(tempdir, [json.dumps({"petId": i}) for i in range(20)])
+        results = list(run_items(_counting, filename, 3, {"petId": "pet_id"}))
+
+    assert 20 == len(results)
+    assert set(range(1, 21)) == {r.line for r in results}
+    assert set(range(20)) == {r.data for r in results}
+    assert maximum <= 3
+
+
+def test_bulk_execute(capsys):
+    with TemporaryDirectory() as tempdir:
+        filename = _write_items(tempdir, ['{"petId": "a"}', '{"pet_id": "b", "name": "fido"}'])
+        bulk_execute(_request, filename, 2, NAMES)
+
+    captured = capsys.readouterr()
+    results = sorted((json.loads(line) for line in captured.out.splitlines()), key=lambda r: r["line"])
+    assert [1, 2] == [r["line"] for r in results]
+    assert all(r["status"] == "ok" for r in results)
+    assert {"id": "b", "name": "fido", "type": None} == results[1]["data"]
+    assert "Processed 2 items (2 ok, 0 failed)" in captured.err
+
+    # make sure the session is only used while processing
+    assert _r._session is None
+
+
+def _binary_response(method, url, **kwargs) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-type"] = "image/png"
+    response._content = url.encode("utf-8")
+    return response
+
+
+def test_bulk_execute_binary(capsys, monkeypatch):
+    def _download(pet_id=None):
+        return _r.request("GET", f"http://pets/{pet_id}/photo")
+
+    with TemporaryDirectory() as tempdir:
+        monkeypatch.chdir(tempdir)
+        filename = _write_items(tempdir, [f'{{"petId": "{i}"}}' for i in range(4)])
+        with mock.patch.object(requests.Session, "request", side_effect=_binary_response):
+            bulk_execute(_download, filename, 4, {"petId": "pet_id"})
+
+        # each item writes its own file
+        for line in range(1, 5):
+            with open(f"output-{line}.png", "rb") as fp:
+                assert f"http://pets/{line - 1}/photo".encode("utf-8") == fp.read()
+        assert not os.path.exists("output.png")
+
+    captured = capsys.readouterr()
+    results = sorted((json.loads(line) for line in captured.out.splitlines()), key=lambda r: r["line"])
+    assert [f"Wrote content to output-{n}.png" for n in range(1, 5)] == [r["data"] for r in results]
+
+    # the suffix is only used while processing the item
+    assert "" == _r.use_output_suffix("")
+
+
+def test_bulk_execute_failures(capsys):
+    with TemporaryDirectory() as tempdir:
+        filename = _write_items(tempdir, ['{"petId": "a"}', '{"name": "fido"}'])
+        with pytest.raises(typer.Exit):
+            bulk_execute(_request, filename, 1, NAMES)
+
+    captured = capsys.readouterr()
+    assert "Processed 2 items (1 ok, 1 failed)" in captured.err
+
+
+def test_bulk_execute_stdin(capsys):
+    with mock.patch("sys.stdin", ['{"petId": "x"}\n']):
+        bulk_execute(_request, "-", 1, NAMES)
+
+    captured = capsys.readouterr()
+    result = json.loads(captured.out)
+    assert {"id": "x", "name": None, "type": None} == result["data"]
+
+
+def test_required_unless_from_file():
+    app = typer.Typer()
+
+    @app.command()
+    def show(
+        pet_id: Annotated[
+            Optional[str],
+            typer.Argument(show_default=False, metavar="PET_ID", callback=_a.required_unless_from_file),
+        ] = None,
+        _from_file: _a.FromFileOption = None,
+    ) -> None:
+        print(f"{pet_id} {_from_file}")
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["--help"])
+    assert 0 == result.exit_code
+    assert "[PET_ID]" not in result.output
+
+    result = runner.invoke(app, [])
+    assert 0 != result.exit_code
+    assert "Missing argument 'PET_ID'" in result.output
+
+    result = runner.invoke(app, ["abc"])
+    assert 0 == result.exit_code
+    assert "abc None" in result.output
+
+    result = runner.invoke(app, ["--from-file", "items.ndjson"])
+    assert 0 == result.exit_code
+    assert "None items.ndjson" in result.output
@@ -495,3 +495,21 @@ def test_display(data, fmt, expected):
 )
 def test_summary(data, properties, expected):
     assert expected == summary(data, properties)
+
+
+def test_display_stream():
+    def _events():
+        yield {"a": 1}
+        yield "partial"
+        yield [1, 2]
+
+    with mock.patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        display(_events(), OutputFormat.JSON, OutputStyle.NONE, indent=None)
+        output = mock_stdout.getvalue()
+        assert '{"a": 1}\npartial\n[1, 2]\n' == output
+
+
+def test_summary_stream():
+    result = summary(iter([{"north": 1, "south": 2}, {"east": 1}]), ["north"])
+    assert not isinstance(result, list)
+    assert [{"north": 1}, {"north": None}] == list(result)
@@ -9,6 +9,7 @@ import pytest
 import typer
 from requests import HTTPError
 
+from pets_cli._exceptions import InvalidBodyError
 from pets_cli._exceptions import MissingRequiredError
 from pets_cli._exceptions import handle_exceptions
 
@@ -33,3 +34,9 @@ def test_missing_required():
     ex = MissingRequiredError(items)
     msg = str(ex)
     assert "Missing required parameters, please provide: abc, 123" == msg
+
+
+def test_invalid_body():
+    ex = InvalidBodyError(["--name must be a string", "--age must be at least 0"])
+    msg = str(ex)
+    assert "Invalid request body: --name must be a string; --age must be at least 0" == msg
@@ -2,15 +2,19 @@
 #
 # This code was generated by the openapi-spec-tools CLI generator, DO NOT EDIT
 #
+import json
 from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
 
 import pytest
+import yaml
 
 from pets_cli._tree import TreeDisplay
 from pets_cli._tree import TreeNode
+from pets_cli._tree import load_tree_data
+from pets_cli._tree import parse_tree
 from pets_cli._tree import tree
 from tests.helpers import to_ascii
 
@@ -192,3 +196,55 @@ def test_show_tree(start, display, depth, expected):
 
         result = mock_stdout.getvalue().replace("\r", "")
         assert to_ascii(expected) == to_ascii(result)
+
+
+@pytest.mark.parametrize(
+    ["start", "display", "depth", "expected"],
+    [
+        pytest.param("main", TreeDisplay.ALL, 10, FULL_DISPLAY, id="full"),
+        pytest.param("main", TreeDisplay.OPERATION, 1, DEPTH_DISPLAY, id="depth"),
+        pytest.param("environments_tags", TreeDisplay.HELP, 10, SUB_DISPLAY, id="sub"),
+    ]
+)
+def test_show_tree_json(start, display, depth, expected):
+    directory = TemporaryDirectory()
+    file = Path(directory.name, "sample.json")
+    file.write_text(json.dumps(yaml.safe_load(SAMPLE_TREE)))
+
+    with (
+        mock.patch('sys.stdout', new_callable=StringIO) as mock_stdout,
+    ):
+        tree(file.as_posix(), identifier=start, display=display, max_depth=depth)
+
+        result = mock_stdout.getvalue().replace("\r", "")
+        assert to_ascii(expected) == to_ascii(result)
+
+
+def test_load_tree_data():
+    directory = TemporaryDirectory()
+    yaml_file = Path(directory.name, "sample.yaml")
+    yaml_file.write_text(SAMPLE_TREE)
+    json_file = Path(directory.name, "sample.json")
+    json_file.write_text(json.dumps(yaml.safe_load(SAMPLE_TREE)))
+
+    assert load_tree_data(yaml_file.as_posix()) == load_tree_data(json_file.as_posix())
+
+
+def test_parse_tree_depth():
+    data = yaml.safe_load(SAMPLE_TREE)
+
+    node = parse_tree("main", "main", data)
+    env = node.children[3]
+    assert "environment*" == env.name
+    assert ["create", "delete", "tags*"] == [c.name for c in env.children]
+    assert ["create"] == [c.name for c in env.children[2].children]
+
+    # sub-commands beyond the max depth are not populated
+    node = parse_tree("main", "main", data, max_depth=1)
+    env = node.children[3]
+    assert ["create", "delete", "tags*"] == [c.name for c in env.children]
+    assert [] == env.children[2].children
+    assert "Manage environment tags" == env.children[2].help
+
+    node = parse_tree("main", "main", data, max_depth=0)
+    assert [] == node.children[3].children
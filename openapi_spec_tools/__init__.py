@@ -1,11 +1,24 @@
 """Implementation for several utilities for analyzing and modifying OpenAPI specifications."""
+from openapi_spec_tools.utils import PathRouter
+from openapi_spec_tools.utils import compact_spec
 from openapi_spec_tools.utils import count_values
+from openapi_spec_tools.utils import create_router
+from openapi_spec_tools.utils import dereference
 from openapi_spec_tools.utils import find_diffs
+from openapi_spec_tools.utils import find_duplicate_models
 from openapi_spec_tools.utils import find_paths
 from openapi_spec_tools.utils import find_references
+from openapi_spec_tools.utils import iter_references
 from openapi_spec_tools.utils import map_operations
+from openapi_spec_tools.utils import name_index
+from openapi_spec_tools.utils import names_containing
 from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.utils import operation_table
+from openapi_spec_tools.utils import remove_duplicate_models
 from openapi_spec_tools.utils import remove_schema_tags
+from openapi_spec_tools.utils import remove_unused_models
+from openapi_spec_tools.utils import scan_json_references
 from openapi_spec_tools.utils import schema_operations_filter
 from openapi_spec_tools.utils import set_nullable_not_required
 from openapi_spec_tools.utils import unroll
+from openapi_spec_tools.utils import unused_models
@@ -0,0 +1,162 @@
+"""Analysis of many OpenAPI specs (e.g. all the service specs in a repository) at once.
+
+The filenames may be files, directories (searched recursively for JSON/YAML files) or glob
+patterns. Each file is parsed and analyzed by a pool of worker processes, and the results are
+rows (dictionaries) that are merged into a single table.
+"""
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from openapi_spec_tools.types import OasField
+from openapi_spec_tools.utils import map_content_types
+from openapi_spec_tools.utils import map_models
+from openapi_spec_tools.utils import names_containing
+from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.utils import operation_table
+
+SPEC_SUFFIXES = {".json", ".yaml", ".yml"}
+GLOB_CHARS = set("*?[")
+# the common methods are always displayed for a single file, and the others (e.g. head) only when used
+COMMON_METHODS = ["get", "put", "patch", "delete", "post"]
+SUMMARY_METHODS = COMMON_METHODS + ["head", "options", "trace"]
+SUMMARY_COLUMNS = ["models", "paths", "operations"] + SUMMARY_METHODS + ["tags"]
+
+
+@dataclass
+class FileResult:
+    """Analysis rows for a single file (or the error that prevented analysis)."""
+
+    filename: str
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def is_pattern(name: str) -> bool:
+    """Check if the name is a glob pattern or directory (rather than a single file)."""
+    return bool(GLOB_CHARS & set(name)) or Path(name).is_dir()
+
+
+def expand_filenames(names: list[str]) -> list[str]:
+    """Expand the directories and glob patterns into a sorted list of unique filenames.
+
+    Directories are searched recursively for JSON and YAML files. Names that are neither a
+    directory nor a pattern are included as-is (so missing files get reported).
+    """
+    result = set()
+    for name in names:
+        if Path(name).is_dir():
+            result.update(
+                str(p) for p in Path(name).rglob("*") if p.suffix.lower() in SPEC_SUFFIXES and p.is_file()
+            )
+        elif GLOB_CHARS & set(name):
+            result.update(p for p in glob.glob(name, recursive=True) if os.path.isfile(p))
+        else:
+            result.add(name)
+    return sorted(result)
+
+
+def summary_rows(spec: dict[str, Any]) -> list[dict[str, Any]]:
+    """Get the counts of models, paths, operations (by method) and tags."""
+    paths = spec.get(OasField.PATHS, {})
+    methods = {m: 0 for m in SUMMARY_METHODS}
+    tags = {}
+    for path_data in paths.values():
+        for method, op_data in path_data.items():
+            if method == OasField.PARAMS or not isinstance(op_data, dict):
+                continue
+            methods[method] = methods.get(method, 0) + 1
+            for tag in op_data.get(OasField.TAGS, []):
+                tags[tag] = tags.get(tag, 0) + 1
+
+    row = {
+        "models": len(map_models(spec.get(OasField.COMPONENTS, {}))),
+        "paths": len(paths),
+        "operations": sum(methods.values()),
+    }
+    row.update(methods)
+    row["tags"] = len(tags)
+    row["tag_counts"] = tags
+    return [row]
+
+
+def operation_rows(spec: dict[str, Any], search: Optional[str] = None) -> list[dict[str, Any]]:
+    """Get a row for each operation (optionally only those with names containing search)."""
+    operations = operation_table(spec.get(OasField.PATHS, {}))
+    names = sorted(names_containing(operations, search) if search else operations.keys())
+    return [{"operation": name} for name in names]
+
+
+def model_rows(spec: dict[str, Any], search: Optional[str] = None) -> list[dict[str, Any]]:
+    """Get a row for each model (optionally only those with names containing search)."""
+    models = map_models(spec.get(OasField.COMPONENTS, {}))
+    names = sorted(names_containing(models, search) if search else models.keys())
+    return [{"model": name} for name in names]
+
+
+def content_type_rows(spec: dict[str, Any], content_type: Optional[str] = None) -> list[dict[str, Any]]:
+    """Get a row for each response content-type and operation."""
+    rows = []
+    for name, operations in map_content_types(spec).items():
+        if content_type and name != content_type:
+            continue
+        rows.extend({"content_type": name, "operation": op_id} for op_id in sorted(operations))
+    return rows
+
+
+def analyze_file(filename: str, analyzer: Callable[..., list[dict[str, Any]]], kwargs: dict[str, Any]) -> FileResult:
+    """Open the file, and run the analyzer."""
+    if not Path(filename).exists():
+        return FileResult(filename, error="failed to find file")
+    try:
+        spec = open_oas(filename)
+        return FileResult(filename, rows=analyzer(spec, **kwargs))
+    except Exception as ex:
+        return FileResult(filename, error=f"unable to parse: {ex}")
+
+
+def _analyze_task(task: tuple[str, Callable[..., list[dict[str, Any]]], dict[str, Any]]) -> FileResult:
+    return analyze_file(*task)
+
+
+def analyze_files(
+    filenames: list[str],
+    analyzer: Callable[..., list[dict[str, Any]]],
+    workers: Optional[int] = None,
+    **kwargs,
+) -> list[FileResult]:
+    """Run the analyzer on each of the files, using a pool of worker processes.
+
+    The analyzer must be a module-level function (so it can be sent to the workers). The
+    results are in the same order as the filenames.
+    """
+    tasks = [(f, analyzer, kwargs) for f in filenames]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return [_analyze_task(t) for t in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+
+def totals(results: list[FileResult]) -> dict[str, Any]:
+    """Get the aggregate totals: counts of files, errors and rows, and the sum of the numeric columns."""
+    result = {
+        "files": len(results),
+        "errors": sum(1 for r in results if r.error),
+        "rows": sum(len(r.rows) for r in results),
+    }
+    sums = {}
+    for item in results:
+        for row in item.rows:
+            for key, value in row.items():
+                if isinstance(value, int) and not isinstance(value, bool):
+                    sums[key] = sums.get(key, 0) + value
+    result.update(sums)
+    return result
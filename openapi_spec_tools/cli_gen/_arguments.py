@@ -1,6 +1,8 @@
 from typing import Annotated
+from typing import Any
 from typing import Optional
 
+import click
 import typer
 
 from openapi_spec_tools.cli_gen._display import OutputFormat
@@ -49,6 +51,15 @@ DetailsOption = Annotated[
         help="Display the full details or a summary."
     ),
 ]
+FromFileOption = Annotated[
+    Optional[str],
+    typer.Option(
+        "--from-file",
+        is_eager=True,
+        show_default=False,
+        help="File with the arguments for many requests, one JSON object per line (use '-' for stdin).",
+    ),
+]
 LogLevelOption = Annotated[
     LogLevel,
     typer.Option(
@@ -99,3 +110,18 @@ TreeDisplayOption = Annotated[
         help="Details of the CLI command tree to show."
     ),
 ]
+WorkersOption = Annotated[
+    int,
+    typer.Option(
+        "--workers",
+        min=1,
+        help="Number of concurrent requests when using --from-file.",
+    ),
+]
+
+
+def required_unless_from_file(ctx: typer.Context, param: typer.CallbackParam, value: Any) -> Any:
+    """Require the positional argument, unless the values are provided by --from-file."""
+    if value is None and not ctx.params.get("_from_file") and not ctx.resilient_parsing:
+        raise click.MissingParameter(ctx=ctx, param=param)
+    return value
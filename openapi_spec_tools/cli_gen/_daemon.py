@@ -0,0 +1,389 @@
+"""Implementation for running the CLI as a local daemon to avoid the interpreter startup costs.
+
+The daemon imports the CLI application once, and handles each request from a Unix socket. The
+client is intentionally limited to the standard library, so it starts quickly. When the daemon is
+not running, the client runs the CLI application in-process.
+
+NOTE: requests are handled one at a time, since each request changes the process environment,
+working directory, and standard streams.
+
+The output is sent to the client (as stdout/stderr messages) while the command runs, so long
+running and streamed commands show progress. Reads from standard input are requested from the
+client, so commands can read piped input (e.g. '--from-file -').
+
+The socket is only accessible to the user running the daemon, and the client only connects to a
+socket owned by the same user.
+"""
+import importlib
+import io
+import json
+import logging
+import os
+import shutil
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+from typing import Any
+from typing import Optional
+from typing import TextIO
+
+ENV_DAEMON_SOCKET = "CLI_DAEMON_SOCKET"
+
+# environment variables the CLI reads (see _arguments.py and _console.py), plus those used by
+# the 'requests' and 'rich' packages -- the rest of the client environment is not sent
+FORWARD_ENV = (
+    "API_HOST",
+    "API_KEY",
+    "API_TIMEOUT",
+    "LOG_LEVEL",
+    "OUTPUT_FORMAT",
+    "OUTPUT_STYLE",
+    "TERMINAL_WIDTH",
+    "COLUMNS",
+    "LINES",
+    "FORCE_COLOR",
+    "NO_COLOR",
+    "TERM",
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "NO_PROXY",
+    "ALL_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "no_proxy",
+    "all_proxy",
+    "REQUESTS_CA_BUNDLE",
+    "CURL_CA_BUNDLE",
+)
+
+# each message is a JSON object preceded by its length
+HEADER = struct.Struct("!I")
+
+
+class DaemonField:
+    ARGV = "argv"
+    CWD = "cwd"
+    ENV = "env"
+    EXIT_CODE = "exit_code"
+    READ = "read"
+    STDERR = "stderr"
+    STDIN = "stdin"
+    STDOUT = "stdout"
+
+
+def socket_path(path: Optional[str] = None) -> str:
+    """Get the socket path from the argument, environment, or a per-user default.
+
+    The default is in the user's runtime directory ($XDG_RUNTIME_DIR), or a per-user directory
+    in the temporary directory.
+    """
+    if path:
+        return path
+
+    env_path = os.environ.get(ENV_DAEMON_SOCKET)
+    if env_path:
+        return env_path
+
+    package = (__package__ or "cli").split(".")[0]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, f"{package}.sock")
+
+    return os.path.join(tempfile.gettempdir(), f"{package}-{os.getuid()}", "daemon.sock")
+
+
+def is_private(path: str) -> bool:
+    """Check the path is owned by the current user, and not accessible to anyone else."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    return info.st_uid == os.getuid() and not stat.S_IMODE(info.st_mode) & 0o077
+
+
+def _create_directory(path: str) -> None:
+    """Create the socket directory (when needed), making sure nobody else has access to it."""
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(directory):
+        os.makedirs(directory, mode=0o700)
+    elif directory.startswith(tempfile.gettempdir() + os.sep) and not is_private(directory):
+        # the per-user default is in a shared directory, so someone else could have created it
+        raise RuntimeError(f"Socket directory {directory} is accessible to other users")
+
+
+def send_message(sock: socket.socket, data: dict[str, Any]) -> None:
+    """Send the data as a length-prefixed JSON message."""
+    payload = json.dumps(data).encode("utf-8")
+    sock.sendall(HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from the socket."""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            raise ConnectionError("Connection closed before message was complete")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_message(sock: socket.socket) -> dict[str, Any]:
+    """Receive a length-prefixed JSON message."""
+    (size,) = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    return json.loads(_recv_exactly(sock, size).decode("utf-8"))
+
+
+class _Channel:
+    """Connection to the client for a single request, shared by the redirected standard streams."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.lock = threading.Lock()
+
+    def send(self, data: dict[str, Any]) -> None:
+        with self.lock:
+            send_message(self.sock, data)
+
+    def read(self, size: Optional[int]) -> str:
+        """Get the client's standard input (a line when size is None)."""
+        with self.lock:
+            send_message(self.sock, {DaemonField.READ: size})
+            return recv_message(self.sock).get(DaemonField.STDIN, "")
+
+
+class _ClientOutput(io.TextIOBase):
+    """Stream that sends each write to the client as it happens."""
+
+    def __init__(self, channel: _Channel, field: str):
+        self.channel = channel
+        self.field = field
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self.channel.send({self.field: text})
+        return len(text)
+
+
+class _ClientInput(io.TextIOBase):
+    """Stream that reads from the client's standard input."""
+
+    def __init__(self, channel: _Channel):
+        self.channel = channel
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        return self.channel.read(-1 if size is None else size)
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        return self.channel.read(None)
+
+
+class _StderrProxy:
+    """Stream that always writes to the current sys.stderr (which gets redirected per request)."""
+
+    def write(self, text: str) -> int:
+        return sys.stderr.write(text)
+
+    def flush(self) -> None:
+        sys.stderr.flush()
+
+
+def run_command(command: Any, argv: list[str], prog_name: Optional[str] = None) -> int:
+    """Run the click command with the arguments, and return the exit code."""
+    try:
+        command.main(args=argv, prog_name=prog_name, standalone_mode=True)
+    except SystemExit as ex:
+        if ex.code is None:
+            return 0
+        if isinstance(ex.code, int):
+            return ex.code
+        print(ex.code, file=sys.stderr)
+        return 1
+
+    return 0
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """Handles one CLI invocation from the client."""
+
+    def handle(self) -> None:
+        try:
+            request = recv_message(self.request)
+        except ConnectionError:
+            # probes (e.g. checking if the daemon is running) close without sending anything
+            return
+
+        channel = _Channel(self.request)
+        argv = request.get(DaemonField.ARGV, [])
+        env = request.get(DaemonField.ENV, {})
+        orig_env = dict(os.environ)
+        orig_cwd = os.getcwd()
+        orig_stdin = sys.stdin
+        error = None
+        try:
+            for name in FORWARD_ENV:
+                os.environ.pop(name, None)
+            os.environ.update({k: v for k, v in env.items() if k in FORWARD_ENV})
+            os.chdir(request.get(DaemonField.CWD, orig_cwd))
+            sys.stdin = _ClientInput(channel)
+            stdout = _ClientOutput(channel, DaemonField.STDOUT)
+            stderr = _ClientOutput(channel, DaemonField.STDERR)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                exit_code = run_command(self.server.command, argv[1:], prog_name=os.path.basename(argv[0]))
+        except Exception as ex:
+            error = ex
+            exit_code = 1
+        finally:
+            sys.stdin = orig_stdin
+            os.environ.clear()
+            os.environ.update(orig_env)
+            os.chdir(orig_cwd)
+
+        try:
+            if error is not None:
+                channel.send({DaemonField.STDERR: f"ERROR: {error}\n"})
+            channel.send({DaemonField.EXIT_CODE: exit_code})
+        except OSError:
+            # the client went away (e.g. interrupted)
+            pass
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server holding the "warm" CLI application."""
+
+    def __init__(self, path: str, command: Any):
+        self.command = command
+        super().__init__(path, _RequestHandler)
+
+    def server_bind(self) -> None:
+        """Bind the socket, so only the current user can connect to it."""
+        orig_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(orig_umask)
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove the socket file, unless there is a daemon listening to it."""
+    if not os.path.exists(path):
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+
+    raise RuntimeError(f"Daemon already running on {path}")
+
+
+def create_server(app_module: str, path: Optional[str] = None) -> DaemonServer:
+    """Import the application, and create the server with a shared requests session."""
+    import requests
+    import typer
+
+    from openapi_spec_tools.cli_gen import _logging as _l
+    from openapi_spec_tools.cli_gen import _requests as _r
+
+    module = importlib.import_module(app_module)
+    command = typer.main.get_command(module.app)
+
+    # keep connections open between requests
+    _r.use_session(requests.Session())
+
+    # log handlers hold onto the stream, so point it to the (redirected) stderr
+    logging.basicConfig(format=_l.LOG_FORMAT, datefmt=_l.LOG_DATE_FMT, stream=_StderrProxy())
+
+    path = socket_path(path)
+    _create_directory(path)
+    _remove_stale_socket(path)
+    return DaemonServer(path, command)
+
+
+def serve(app_module: str, path: Optional[str] = None) -> None:
+    """Run the daemon until interrupted."""
+    server = create_server(app_module, path)
+    print(f"Listening on {server.server_address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(server.server_address)
+
+
+def forward(
+    argv: list[str],
+    path: Optional[str] = None,
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """Run the arguments using the daemon, and return the exit code (or None when no daemon is running).
+
+    The output is written to stdout/stderr as it arrives, and the daemon's reads are served from
+    stdin (the streams default to the standard streams).
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    path = socket_path(path)
+    if not hasattr(socket, "AF_UNIX") or not is_private(path):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return None
+
+        env = {k: v for k, v in os.environ.items() if k in FORWARD_ENV}
+        if stdout.isatty():
+            # let the daemon format the output for this terminal
+            env.setdefault("COLUMNS", str(shutil.get_terminal_size().columns))
+            env.setdefault("FORCE_COLOR", "1")
+        request = {
+            DaemonField.ARGV: argv,
+            DaemonField.ENV: env,
+            DaemonField.CWD: os.getcwd(),
+        }
+        send_message(sock, request)
+        while True:
+            message = recv_message(sock)
+            if DaemonField.EXIT_CODE in message:
+                return message[DaemonField.EXIT_CODE]
+            if DaemonField.READ in message:
+                size = message[DaemonField.READ]
+                data = stdin.readline() if size is None else stdin.read(size)
+                send_message(sock, {DaemonField.STDIN: data})
+            for field, stream in [(DaemonField.STDOUT, stdout), (DaemonField.STDERR, stderr)]:
+                if field in message:
+                    stream.write(message[field])
+                    stream.flush()
+
+
+def client(app_module: str, path: Optional[str] = None) -> None:
+    """Run the CLI using the daemon when available, and fallback to running in-process."""
+    exit_code = forward(sys.argv, path)
+    if exit_code is None:
+        module = importlib.import_module(app_module)
+        module.app()
+        return
+
+    sys.exit(exit_code)
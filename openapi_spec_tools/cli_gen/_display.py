@@ -1,4 +1,5 @@
 """Implementation for displaying data in a user-friendly fashion."""
+from collections.abc import Iterator
 from enum import Enum
 from gettext import gettext
 from typing import Any
@@ -280,6 +281,10 @@ def summary(obj: Any, properties: list[str]) -> Any:
     if obj is None:
         return None
 
+    if isinstance(obj, Iterator):
+        # streamed items get summarized as they arrive
+        return (summary(item, properties) for item in obj)
+
     if isinstance(obj, list):
         # recursively call for each object in list
         return [summary(item, properties) for item in obj]
@@ -293,6 +298,12 @@ def display(obj: Any, fmt: OutputFormat, style: OutputStyle, indent: int = 2) ->
     highlight = style != OutputStyle.NONE
     console = console_factory(no_color=no_color, highlight=highlight)
 
+    if isinstance(obj, Iterator):
+        # streamed responses display each item as it arrives
+        for item in obj:
+            display(item, fmt, style, indent)
+        return
+
     if isinstance(obj, str):
         console.print(_safe(obj))
         return
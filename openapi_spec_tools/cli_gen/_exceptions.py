@@ -12,6 +12,14 @@ class MissingRequiredError(Exception):
         super().__init__(message)
 
 
+class InvalidBodyError(Exception):
+    """Short wrapper to provide feedback about body values that do not match the schema."""
+
+    def __init__(self, errors: list[str]):
+        message = f"Invalid request body: {'; '.join(errors)}"
+        super().__init__(message)
+
+
 def handle_exceptions(ex: Exception) -> None:
     """Process exception and print a more concise error."""
     if isinstance(ex, HTTPError):
@@ -5,11 +5,14 @@ logging, etc.
 """
 import importlib.metadata
 import json
+import threading
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
+from functools import cache
 from typing import Any
+from typing import Iterator
 from typing import Optional
 
 import requests
@@ -58,8 +61,26 @@ EXTENSION_MAP = {
     "application/vnd.mozilla.xul+xml": "xml",
 }
 
+# content types that are consumed incrementally (one item per line/event)
+EVENT_STREAM = "text/event-stream"
+JSON_LINES = {
+    "application/jsonl",
+    "application/x-jsonlines",
+    "application/x-ndjson",
+    "application/stream+json",
+}
+
+# sentinel used by several APIs to indicate the end of an event stream
+EVENTS_DONE = "[DONE]"
+
 logger = logger()
 
+# optional session used to re-use (pooled) connections across requests
+_session: Optional[requests.Session] = None
+
+# per-thread suffix for the names of the files written for binary responses
+_output = threading.local()
+
 
 @dataclass
 class PageParams:
@@ -88,6 +109,33 @@ class PageParams:
     next_property_name: Optional[str] = None
 
 
+def use_session(session: Optional[requests.Session]) -> Optional[requests.Session]:
+    """Use the provided session for subsequent requests (or the default requests API when None).
+
+    A session keeps connections to the server open, which avoids the connection setup cost
+    when many requests are made by the same process. The previous session is returned.
+    """
+    global _session
+    previous = _session
+    _session = session
+    return previous
+
+
+def use_output_suffix(suffix: str) -> str:
+    """Add the suffix to the names of files written by this thread (e.g. "output-3.png").
+
+    This keeps concurrent requests from writing the same file. The previous suffix is returned.
+    """
+    previous = getattr(_output, "suffix", "")
+    _output.suffix = suffix
+    return previous
+
+
+def _requester() -> Any:
+    """Get the object used for sending requests (session or the requests module)."""
+    return _session or requests
+
+
 def create_url(host_or_base_url: str, *args) -> str:
     """Create a URL from the arguements.
 
@@ -104,6 +152,21 @@ def create_url(host_or_base_url: str, *args) -> str:
     return "/".join([host_or_base_url] + parts) + "/"
 
 
+@cache
+def user_agent() -> str:
+    """Get the User-Agent value with the package name and version.
+
+    Looking up the version searches the installed packages, so it is only done once. The version
+    is 'unknown' when the package is not installed (e.g. running from the source directory).
+    """
+    module_name = __name__.rsplit(".", 3)[0]
+    try:
+        module_version = importlib.metadata.version(module_name)
+    except importlib.metadata.PackageNotFoundError:
+        module_version = "unknown"
+    return f"{module_name}/{module_version}"
+
+
 def request_headers(
     api_key: Optional[str] = None,
     content_type: Optional[str] = None,
@@ -113,10 +176,8 @@ def request_headers(
 
     The API Key and content type are optional, but likely desired.
     """
-    module_name = __name__.rsplit(".", 3)[0]
-    module_version = importlib.metadata.version(module_name)
     headers = {
-        "User-Agent": f"{module_name}/{module_version}"
+        "User-Agent": user_agent()
     }
     if kwargs:
         headers.update(**kwargs)
@@ -154,6 +215,96 @@ def _pretty_params(params: Optional[dict[str, Any]]) -> str:
 
     return "?" + "&".join(f"{k}={v}" for k, v in params.items())
 
+
+def _iter_lines(response: requests.Response) -> Iterator[str]:
+    """Yield the decoded lines of the response body as they arrive.
+
+    Unlike requests.Response.iter_lines(), this does not wait for a full chunk of data, and does
+    not produce an extra blank line when a CR-LF is split across chunks. The streaming formats
+    are always UTF-8 (requests defaults text/* content to ISO-8859-1).
+    """
+    encoding = "utf-8"
+    pending = b""
+    for chunk in response.iter_content(chunk_size=None):
+        lines = (pending + chunk).splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith(b"\n") else b""
+        for line in lines:
+            yield line.rstrip(b"\r\n").decode(encoding, errors="ignore")
+    if pending:
+        yield pending.rstrip(b"\r\n").decode(encoding, errors="ignore")
+
+
+def _decode_event(data: str) -> Any:
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        return data
+
+
+def iter_events(response: requests.Response) -> Iterator[Any]:
+    """Yield the data from each server-sent event (SSE) as it arrives.
+
+    The data is JSON decoded when possible. Events with a type other than the default "message"
+    are yielded as a dictionary with the event type and data.
+    """
+    count = 0
+    start = datetime.now()
+    event_type = None
+    data = []
+    try:
+        for line in _iter_lines(response):
+            if line.startswith(":"):
+                # comment (often used as a keep-alive)
+                continue
+
+            if line:
+                name, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if name == "data":
+                    data.append(value)
+                elif name == "event":
+                    event_type = value
+                continue
+
+            # blank line dispatches the event
+            if data:
+                value = "\n".join(data)
+                if value == EVENTS_DONE:
+                    break
+                count += 1
+                item = _decode_event(value)
+                yield item if event_type in (None, "message") else {"event": event_type, "data": item}
+            event_type = None
+            data = []
+    finally:
+        response.close()
+
+    delta = datetime.now() - start
+    logger.info(f"Got {count} events from {response.url} in {delta.total_seconds()}")
+
+
+def iter_json_lines(response: requests.Response) -> Iterator[Any]:
+    """Yield each item from a newline-delimited JSON response as it arrives."""
+    count = 0
+    start = datetime.now()
+    try:
+        for line in _iter_lines(response):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                logger.error(f"Failed to decode line from {response.url}: {line}")
+                continue
+            count += 1
+            yield item
+    finally:
+        response.close()
+
+    delta = datetime.now() - start
+    logger.info(f"Got {count} items from {response.url} in {delta.total_seconds()}")
+
+
 def request(
     method: str,
     url: str,
@@ -163,21 +314,32 @@ def request(
     timeout: Optional[int] = None,
     **kwargs, # allows passing through additional named parameters
 ) -> Any:
-    """Perform the specified REST request."""
+    """Perform the specified REST request.
+
+    The response body is streamed, so event-stream and newline-delimited JSON responses are
+    returned as an iterator that yields each item as it arrives.
+    """
     pretty_url = url + _pretty_params(params)
     logger.debug(f"Requesting {method} {pretty_url}")
+    kwargs.setdefault("stream", True)
     start = datetime.now()
-    response = requests.request(method, url, params=params, headers=headers, json=body, timeout=timeout, **kwargs)
+    response = _requester().request(method, url, params=params, headers=headers, json=body, timeout=timeout, **kwargs)
     delta = datetime.now() - start
     logger.info(f"Got {response.status_code} response from {method} {pretty_url} in {delta.total_seconds()}")
 
     raise_for_error(response)
 
+    content_type = response.headers.get("Content-type", "application/json")
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type == EVENT_STREAM:
+        return iter_events(response)
+    if media_type in JSON_LINES:
+        return iter_json_lines(response)
+
     if not response.content:
         return None
 
     encoding = response.encoding or "utf-8"
-    content_type = response.headers.get("Content-type", "application/json")
     if content_type == "application/json":
         try:
             return response.json()
@@ -198,7 +360,7 @@ def request(
 
     extension = EXTENSION_MAP.get(content_type)
     if extension:
-        filename = f"output.{extension}"
+        filename = f"output{getattr(_output, 'suffix', '')}.{extension}"
         with open(filename, "wb") as fp:
             fp.write(response.content)
         return f"Wrote content to {filename}"
@@ -232,8 +394,15 @@ def depaginate(
     if page_params.page_size_name and page_params.page_size_value is not None:
         _params[page_params.page_size_name] = page_size
 
+    offset = page_params.item_start_value or 0
+    # without a page/offset parameter or next URL, the same page would be requested again
+    can_advance = any([
+        page_params.page_start_name,
+        page_params.item_start_name,
+        page_params.next_header_name,
+        page_params.next_property_name,
+    ])
     if page_params.item_start_name and page_params.item_start_value is not None:
-        offset = page_params.item_start_value
         _params[page_params.item_start_name] = page_params.item_start_value
 
     while _url:
@@ -247,7 +416,7 @@ def depaginate(
 
         logger.debug(f"Requesting {GET} {pretty_url} count={page_count + 1}")
         start = datetime.now()
-        response = requests.get(_url, params=deepcopy(_params), headers=_headers, timeout=timeout)
+        response = _requester().get(_url, params=deepcopy(_params), headers=_headers, timeout=timeout)
         delta = datetime.now() - start
 
         raise_for_error(response)
@@ -273,6 +442,7 @@ def depaginate(
         total_time += delta
         page_count += 1
         item_count += curr_len
+        offset += curr_len
         logger.debug(f"Got {curr_len} items in {delta.total_seconds()}")
 
         if curr_len == 0:
@@ -284,6 +454,8 @@ def depaginate(
         if max_count and item_count >= max_count:
             # reached max items
             break
+        if not can_advance:
+            break
 
     logger.info(f"Got {len(items)} items using {page_count} requests in {total_time.total_seconds()}")
     return items
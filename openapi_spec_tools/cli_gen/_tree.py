@@ -1,4 +1,5 @@
 import dataclasses
+import json
 from enum import Enum
 from typing import Optional
 
@@ -61,15 +62,28 @@ class TreeNode:
         return None
 
 
-def parse_tree(identifier: str, command: str, data: dict[str, dict]) -> Optional[TreeNode]:
-    """Parse the specified file into a tree."""
+def parse_tree(
+    identifier: str,
+    command: str,
+    data: dict[str, dict],
+    max_depth: Optional[int] = None,
+) -> Optional[TreeNode]:
+    """Parse the specified file into a tree.
+
+    Only the sub-commands below the identifier are parsed. When the max_depth is provided, the
+    sub-commands beyond that depth are not materialized.
+    """
     item = data.get(identifier)
     children = []
+    if max_depth is not None and max_depth < 0:
+        return TreeNode(name=command + '*', help=item.get(TreeField.DESCRIPTION), children=children)
+
+    sub_depth = None if max_depth is None else max_depth - 1
     for operation in item.get(TreeField.OPERATIONS, []):
         child_name = operation.get(TreeField.NAME)
         sub_command = operation.get(TreeField.SUB_CMD)
         if sub_command:
-            child = parse_tree(sub_command, child_name, data)
+            child = parse_tree(sub_command, child_name, data, sub_depth)
             children.append(child)
         else:
             children.append(
@@ -90,6 +104,18 @@ def parse_tree(identifier: str, command: str, data: dict[str, dict]) -> Optional
     )
 
 
+def load_tree_data(filename: str) -> dict[str, dict]:
+    """Load the tree data keyed by identifier.
+
+    The precompiled JSON version is much faster to load than the YAML version, so it is
+    preferred by the generated code.
+    """
+    with open(filename, "r", encoding="utf-8", newline="\n") as fp:
+        if filename.endswith(".json"):
+            return json.load(fp)
+        return yaml.safe_load(fp)
+
+
 def create_node_table(node: TreeNode) -> Table:
     """Create the "inner" table for an individual node."""
     table = Table(
@@ -159,11 +185,10 @@ def create_tree_table(node: TreeNode, display: TreeDisplay, max_depth: int) -> T
 
 def tree(filename: str, identifier: str, display: TreeDisplay, max_depth: int) -> None:
     """Print the tree table for the specified command."""
-    with open(filename, "r", encoding="utf-8", newline="\n") as fp:
-        data = yaml.safe_load(fp)
+    data = load_tree_data(filename)
 
     # parse into the tree format
-    node = parse_tree(identifier, identifier, data)
+    node = parse_tree(identifier, identifier, data, max_depth)
     table = create_tree_table(node, display, max_depth)
 
     panel = Panel(table, border_style="dim", title="Command Tree", title_align="left")
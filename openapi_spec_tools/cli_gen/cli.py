@@ -25,6 +25,7 @@ from openapi_spec_tools.cli_gen.generate import check_for_missing
 from openapi_spec_tools.cli_gen.generate import copy_infrastructure
 from openapi_spec_tools.cli_gen.generate import copy_tests
 from openapi_spec_tools.cli_gen.generate import find_unreferenced
+from openapi_spec_tools.cli_gen.generate import generate_daemon_client
 from openapi_spec_tools.cli_gen.generate import generate_node
 from openapi_spec_tools.cli_gen.generate import generate_tree_file
 from openapi_spec_tools.cli_gen.generate import generate_tree_node
@@ -46,6 +47,7 @@ from openapi_spec_tools.utils import remove_property
 from openapi_spec_tools.utils import remove_schema_tags
 from openapi_spec_tools.utils import schema_operations_filter
 from openapi_spec_tools.utils import set_nullable_not_required
+from openapi_spec_tools.validate import validate_spec
 
 SEP = "\n    "
 
@@ -306,6 +308,14 @@ def generate_cli(
         typer.Option(show_default=False, help="File name containing copyright message (for non-default)"),
     ] = None,
     include_tests: Annotated[bool, typer.Option("--tests/--no-tests", help="Include tests in generated coode")] = True,
+    include_daemon: Annotated[
+        bool,
+        typer.Option("--daemon/--no-daemon", help="Include daemon client/server to avoid startup costs"),
+    ] = False,
+    validate: Annotated[
+        bool,
+        typer.Option("--validate/--no-validate", help="Check the OpenAPI spec structure before generating"),
+    ] = False,
     start: StartPointOption = DEFAULT_START,
     log_level: LogLevelOption = "info",
 ) -> None:
@@ -313,6 +323,11 @@ def generate_cli(
 
     Use either `--project-dir` to set both relative code and test directories, or
     set the paths specifically using `--code-dir` and `--test-dir`.
+
+    Use `--daemon` to generate the `_client` module with `client` and `daemon` entry points. The
+    daemon keeps the CLI loaded, and the client forwards to it (or runs in-process without a daemon).
+
+    Use `--validate` to stop when the OpenAPI spec does not have a valid OAS 3.0/3.1 structure.
     """
     init_logging(log_level, GENERATOR_LOG_CLASS)
 
@@ -335,6 +350,17 @@ def generate_cli(
 
     commands = layout_tree_with_error_handling(layout_file, start=start)
     oas = open_oas_with_error_handling(openapi_file)
+    if validate:
+        starttime = datetime.now()
+        violations = validate_spec(oas)
+        delta = datetime.now() - starttime
+        logger(GENERATOR_LOG_CLASS).info(f"Validating {openapi_file} took {delta.total_seconds()} seconds")
+        if violations:
+            typer.echo(
+                f"Invalid OpenAPI spec {openapi_file}:{SEP}" +
+                SEP.join(f"{v.pointer}: {v.message}" for v in violations)
+            )
+            raise typer.Exit(1)
 
     if copyright_file:
         text = Path(copyright_file).read_text()
@@ -354,10 +380,12 @@ def generate_cli(
         pass
 
     # copy over the basic infrastructure
-    copy_infrastructure(code_dir, package_name)
+    copy_infrastructure(code_dir, package_name, include_daemon)
 
     generator = Generator(package_name, oas)
     generate_node(generator, commands, code_dir)
+    if include_daemon:
+        generate_daemon_client(generator, commands, code_dir)
 
     # create the tree
     generate_tree_file(generator, commands, code_dir)
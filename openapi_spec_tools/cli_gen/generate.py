@@ -12,11 +12,12 @@ from openapi_spec_tools.cli_gen.generator import Generator
 from openapi_spec_tools.cli_gen.layout_types import LayoutNode
 from openapi_spec_tools.cli_gen.utils import to_snake_case
 from openapi_spec_tools.types import OasField
-from openapi_spec_tools.utils import map_operations
+from openapi_spec_tools.utils import operation_table
 
 # Maps the source to destination (currently all the same).
 INFRASTRUCTURE_FILES = {
     "_arguments.py": "_arguments.py",
+    "_bulk.py": "_bulk.py",
     "_console.py": "_console.py",
     "_display.py": "_display.py",
     "_exceptions.py": "_exceptions.py",
@@ -25,8 +26,14 @@ INFRASTRUCTURE_FILES = {
     "_tree.py": "_tree.py",
 }
 
+# Only copied when generating the daemon client/server
+DAEMON_FILES = {
+    "_daemon.py": "_daemon.py",
+}
+
 TEST_FILES = {
     "helpers.py": "helpers.py",
+    "test_bulk.py": "test_bulk.py",
     "test_console.py": "test_console.py",
     "test_display.py": "test_display.py",
     "test_exceptions.py": "test_exceptions.py",
@@ -82,6 +89,24 @@ def generate_node(generator: Generator, node: LayoutNode, directory: str) -> Non
         generate_node(generator, command, directory)
 
 
+def generate_daemon_client(generator: Generator, node: LayoutNode, directory: str) -> None:
+    """Create the client module that forwards to the daemon (when running)."""
+    logger.info("Generating daemon client module")
+    text = generator.shebang()
+    text += copyright()
+    text += generator.daemon_client(node)
+    text += """
+
+if __name__ == "__main__":
+    client()
+"""
+
+    filename = os.path.join(directory, "_client.py")
+    with open(filename, "w", encoding="utf-8", newline="\n") as fp:
+        fp.write(text)
+    os.chmod(filename, 0o755)
+
+
 def generate_tree_node(generator: Generator, node: LayoutNode) -> TreeNode:
     """Generate a TreeNode hierarchy for the specified node."""
     data = generator.tree_data(node)
@@ -111,12 +136,17 @@ def generate_tree_node(generator: Generator, node: LayoutNode) -> TreeNode:
 
 
 def generate_tree_file(generator: Generator, node: LayoutNode, directory: str) -> None:
-    """Create the YAML file."""
+    """Create the YAML file, and the precompiled JSON file used by the generated code."""
     filename = os.path.join(directory, "tree.yaml")
     with open(filename, "w", encoding="utf-8", newline="\n") as fp:
         fp.write(copyright())
         fp.write(generator.get_tree_yaml(node))
 
+    # NOTE: JSON does not allow comments, so no copyright
+    filename = os.path.join(directory, "tree.json")
+    with open(filename, "w", encoding="utf-8", newline="\n") as fp:
+        fp.write(generator.get_tree_json(node))
+
 
 def check_for_missing(node: LayoutNode, oas: dict[str, Any]) -> dict[str, list[str]]:
     """Look for operations in node (and children) that are NOT in the OpenAPI spec."""
@@ -131,7 +161,7 @@ def check_for_missing(node: LayoutNode, oas: dict[str, Any]) -> dict[str, list[s
         return {node.identifier: current}
 
 
-    operations = map_operations(oas.get(OasField.PATHS, {}))
+    operations = operation_table(oas.get(OasField.PATHS, {}))
     missing = _check_missing(node, operations)
 
     # recursively do the same for sub-commands
@@ -153,7 +183,7 @@ def find_unreferenced(node: LayoutNode, oas: dict[str, Any]) -> dict[str, Any]:
         return current
 
     referenced = _find_operations(node)
-    ops = map_operations(oas.get(OasField.PATHS))
+    ops = operation_table(oas.get(OasField.PATHS, {}))
     unreferenced = {
         op_id: op_data
         for op_id, op_data in ops.items()
@@ -177,14 +207,17 @@ def copy_and_update(src_filename: str, dst_filename: str, replacements: dict[str
             dst_fp.write(line)
 
 
-def copy_infrastructure(dst_dir: str, package_name: str):
-    """Iterate over the INFRASTRUCTURE_FILES, and copies from local to dst."""
+def copy_infrastructure(dst_dir: str, package_name: str, include_daemon: bool = False):
+    """Iterate over the INFRASTRUCTURE_FILES (and DAEMON_FILES when requested), and copies from local to dst."""
     spath = Path(__file__).parent
     dpath = Path(dst_dir)
     replacements = {
         __package__: package_name,
     }
-    for src, dst in INFRASTRUCTURE_FILES.items():
+    files = dict(INFRASTRUCTURE_FILES)
+    if include_daemon:
+        files.update(DAEMON_FILES)
+    for src, dst in files.items():
         sfile = spath / src
         dfile = dpath / dst
         copy_and_update(sfile.as_posix(), dfile.as_posix(), replacements)
@@ -1,4 +1,5 @@
 """Declares the Generator class that is used for most of the CLi generation capability."""
+import json
 import textwrap
 from copy import deepcopy
 from typing import Any
@@ -19,7 +20,7 @@ from openapi_spec_tools.cli_gen.utils import to_snake_case
 from openapi_spec_tools.types import ContentType
 from openapi_spec_tools.types import OasField
 from openapi_spec_tools.utils import NULL_TYPES
-from openapi_spec_tools.utils import map_operations
+from openapi_spec_tools.utils import operation_table
 
 NL = "\n"
 SEP1 = "\n    "
@@ -72,7 +73,7 @@ class Generator:
     def __init__(self, package_name: str, oas: dict[str, Any]):
         """Initialize with the OpenAPI spec and other data for generating multiple modules."""
         self.package_name = package_name
-        self.operations = map_operations(oas.get(OasField.PATHS, {}))
+        self.operations = operation_table(oas.get(OasField.PATHS, {}))
         self.components = oas.get(OasField.COMPONENTS, {})
         self.default_host = ""
         servers = oas.get(OasField.SERVERS)
@@ -102,6 +103,7 @@ from typing import Optional  # noqa: F401
 import typer
 
 from {self.package_name} import _arguments as _a
+from {self.package_name} import _bulk as _b  # noqa: F401
 from {self.package_name} import _display as _d  # noqa: F401
 from {self.package_name} import _exceptions as _e  # noqa: F401
 from {self.package_name} import _logging as _l  # noqa: F401
@@ -137,6 +139,24 @@ if __name__ == "__main__":
     app()
 """
 
+    def daemon_client(self, node: LayoutNode) -> str:
+        """Get the text for the module with the daemon client/server entry points."""
+        return f"""
+from {self.package_name} import _daemon as _dm
+
+APP_MODULE = "{self.package_name}.{to_snake_case(node.identifier)}"
+
+
+def client() -> None:
+    \"\"\"Run the CLI using the daemon (when running), otherwise run in-process.\"\"\"
+    _dm.client(APP_MODULE)
+
+
+def daemon() -> None:
+    \"\"\"Run the daemon that handles the client requests.\"\"\"
+    _dm.serve(APP_MODULE)
+"""
+
     def op_short_help(self, operation: dict[str, Any]) -> str:
         """Get the short help for the operation."""
         summary = operation.get(OasField.SUMMARY)
@@ -315,8 +335,11 @@ if __name__ == "__main__":
 
         return ""
 
-    def model_settable_properties(self, model: dict[str, Any]) -> dict[str, Any]:
-        """Expand the model into a dictionary of properties."""
+    def model_settable_properties(self, model: dict[str, Any], parents: tuple[str, ...] = ()) -> dict[str, Any]:
+        """Expand the model into a dictionary of properties.
+
+        The parents are the references being expanded, so recursive references are skipped.
+        """
         properties = {}
 
         # start with the base-classes in allOf
@@ -332,9 +355,12 @@ if __name__ == "__main__":
             if not submodel:
                 self.logger.warning(f"Failed to find {short_refname} model")
                 continue
+            if reference in parents:
+                self.logger.warning(f"Ignoring recursive {short_refname} base model")
+                continue
 
             required_sub = submodel.get(OasField.REQUIRED, [])
-            sub_properties = self.model_settable_properties(submodel)
+            sub_properties = self.model_settable_properties(submodel, parents + (reference,) if reference else parents)
             for sub_name, sub_data in sub_properties.items():
                 # NOTE: no "name mangling" since using inheritance
                 updated = deepcopy(sub_data)
@@ -372,6 +398,9 @@ if __name__ == "__main__":
             if not submodel:
                 self.logger.warning(f"Failed to find {short_refname} model")
                 continue
+            if reference in parents:
+                self.logger.warning(f"Ignoring {prop_name} -- recursive reference to {short_refname}")
+                continue
 
             collection_type = self.model_collection_type(submodel)
             if collection_type:
@@ -390,7 +419,7 @@ if __name__ == "__main__":
                 submodel.update(item_model)
 
             required_sub = submodel.get(OasField.REQUIRED, [])
-            sub_properties = self.model_settable_properties(submodel)
+            sub_properties = self.model_settable_properties(submodel, parents + (reference,) if reference else parents)
             if not sub_properties:
                 updated = deepcopy(submodel)
                 if short_refname:
@@ -422,7 +451,7 @@ if __name__ == "__main__":
         ref = schema.get(OasField.REFS)
         if ref:
             schema = self.get_model(ref)
-        return self.model_settable_properties(schema)
+        return self.model_settable_properties(schema, (ref,) if ref else ())
 
     def short_reference_name(self, full_name: str) -> str:
         """Transform the '#/components/schemas/Xxx' to 'Xxx'."""
@@ -459,6 +488,8 @@ if __name__ == "__main__":
             args.append('_details: _a.DetailsOption = False')
         if command.pagination:
             args.append('_max_count: _a.MaxCountOption = None')
+        args.append('_from_file: _a.FromFileOption = None')
+        args.append('_workers: _a.WorkersOption = 4')
         return args
 
     def schema_to_type(self, schema: str, fmt: Optional[str]) -> Optional[str]:
@@ -590,9 +621,13 @@ if __name__ == "__main__":
         if collection:
             arg_type = f"{collection}[{arg_type}]"
         if allow_required and required and schema_default is None:
+            # NOTE: positional arguments are only optional when the values are provided by --from-file
             typer_type = 'typer.Argument'
             typer_args.append('show_default=False')
-            arg_default = ""
+            typer_args.append(f'metavar="{var_name.upper()}"')
+            typer_args.append('callback=_a.required_unless_from_file')
+            arg_type = f"Optional[{arg_type}]"
+            arg_default = " = None"
         else:
             typer_type = 'typer.Option'
             if param_name.lower() in RESERVED:
@@ -815,12 +850,153 @@ if __name__ == "__main__":
 
         return SEP1 + SEP1.join(lines)
 
-    def op_check_missing(self, query_params: list[dict[str, Any]], body_params: dict[str, Any]) -> str:
+    def literal(self, value: Any) -> str:
+        """Get the Python literal for a (JSON) value."""
+        if isinstance(value, str):
+            return json.dumps(value)
+        return repr(value)
+
+    def prop_checks(self, option: str, prop_data: dict[str, Any], name: str = "value") -> list[tuple[str, str]]:
+        """Get the (condition, message) checks of a single value against the schema.
+
+        The checks are in order, so each condition can assume the value passed the previous ones
+        (e.g. the length is only checked on a string).
+        """
+        checks = []
+        oas_type = self.simplify_type(prop_data.get(OasField.TYPE))
+        if oas_type == "string":
+            fmt = prop_data.get(OasField.FORMAT)
+            if fmt in ("date", "date-time"):
+                checks.append((f"not isinstance({name}, (str, date))", f"{option} must be a string or date"))
+            else:
+                checks.append((f"not isinstance({name}, str)", f"{option} must be a string"))
+        elif oas_type == "integer":
+            checks.append((
+                f"not isinstance({name}, int) or isinstance({name}, bool)",
+                f"{option} must be an integer",
+            ))
+        elif oas_type in ("number", "numeric"):
+            checks.append((
+                f"not isinstance({name}, (int, float)) or isinstance({name}, bool)",
+                f"{option} must be a number",
+            ))
+        elif oas_type == "boolean":
+            checks.append((f"not isinstance({name}, bool)", f"{option} must be a boolean"))
+
+        values = prop_data.get(OasField.ENUM)
+        if values:
+            if (self.schema_to_pytype(prop_data) or "str") == "str":
+                # same values as the enum declaration
+                values = [str(v) for v in values]
+            literals = ", ".join(self.literal(v) for v in values)
+            if len(values) == 1:
+                literals += ","
+            checks.append((f"{name} not in ({literals})", f"{option} must be one of: {', '.join(map(str, values))}"))
+
+        minimum = prop_data.get(OasField.MIN.value)
+        maximum = prop_data.get(OasField.MAX.value)
+        exclusive_min = prop_data.get("exclusiveMinimum")
+        exclusive_max = prop_data.get("exclusiveMaximum")
+        if isinstance(exclusive_min, bool):
+            # OAS 3.0 uses a flag, and OAS 3.1 uses the value
+            exclusive_min = minimum if exclusive_min else None
+            minimum = None if exclusive_min is not None else minimum
+        if isinstance(exclusive_max, bool):
+            exclusive_max = maximum if exclusive_max else None
+            maximum = None if exclusive_max is not None else maximum
+        if oas_type in ("integer", "number", "numeric"):
+            if minimum is not None:
+                checks.append((f"{name} < {minimum!r}", f"{option} must be at least {minimum}"))
+            if exclusive_min is not None:
+                checks.append((f"{name} <= {exclusive_min!r}", f"{option} must be greater than {exclusive_min}"))
+            if maximum is not None:
+                checks.append((f"{name} > {maximum!r}", f"{option} must be at most {maximum}"))
+            if exclusive_max is not None:
+                checks.append((f"{name} >= {exclusive_max!r}", f"{option} must be less than {exclusive_max}"))
+
+        min_length = prop_data.get("minLength")
+        max_length = prop_data.get("maxLength")
+        if oas_type == "string" and not values:
+            if min_length is not None:
+                checks.append((
+                    f"len({name}) < {min_length!r}",
+                    f"{option} must be at least {min_length} characters",
+                ))
+            if max_length is not None:
+                checks.append((
+                    f"len({name}) > {max_length!r}",
+                    f"{option} must be at most {max_length} characters",
+                ))
+
+        return checks
+
+    def op_body_validator(self, func_name: str, body_params: dict[str, Any]) -> str:
+        """Create the function that checks the body values, before sending the request.
+
+        The checks (types, enums, ranges, lengths) are generated as straight-line code for each
+        property, so checking a body takes microseconds. Returns an empty string when there is nothing
+        to check.
+        """
+        lines = []
+        for prop_name, prop_data in body_params.items():
+            option = self.option_name(prop_name)
+            if prop_data.get(OasField.X_COLLECT) != "array":
+                checks = self.prop_checks(option, prop_data)
+            else:
+                checks = [("not isinstance(value, (list, tuple))", f"{option} must be a list")]
+                for key, op, desc in [("minItems", "<", "at least"), ("maxItems", ">", "at most")]:
+                    limit = prop_data.get(key)
+                    if limit is not None:
+                        checks.append((f"len(value) {op} {limit!r}", f"{option} must have {desc} {limit} items"))
+                item_checks = self.prop_checks(f"{option} items", prop_data, "item")
+                checks.extend((f"any({cond} for item in value)", msg) for cond, msg in item_checks)
+            if not checks:
+                continue
+
+            # NOTE: missing required values are reported before the body is formed
+            lines.append(f"value = body.get({quoted(prop_name)})")
+            lines.append("if value is not None:")
+            keyword = "if"
+            for cond, msg in checks:
+                lines.append(f"    {keyword} {cond}:")
+                lines.append(f"        errors.append({self.literal(msg)})")
+                keyword = "elif"
+
+        if not lines:
+            return ""
+
+        return f"""
+def {self.body_validator_name(func_name)}(body: dict) -> None:
+    \"\"\"Check the body values against the schema (before sending the request).\"\"\"
+    errors = []
+    {SEP1.join(lines)}
+    if errors:
+        raise _e.InvalidBodyError(errors)
+
+"""
+
+    def body_validator_name(self, func_name: str) -> str:
+        """Get the name of the function that checks the body for the command function."""
+        return f"_check_{func_name}_body"
+
+    def op_check_missing(
+        self,
+        query_params: list[dict[str, Any]],
+        body_params: dict[str, Any],
+        path_params: Optional[list[dict[str, Any]]] = None,
+    ) -> str:
         """Check for missing required parameters."""
         lines = ["[]"]
         lines.append("if _api_key is None:")
         lines.append('    missing.append("--api-key")')
 
+        for param in path_params or []:
+            schema = param.get(OasField.SCHEMA, {})
+            if param.get(OasField.REQUIRED, False) and schema.get(OasField.DEFAULT) is None:
+                var_name = self.variable_name(param.get(OasField.NAME))
+                lines.append(f'if {var_name} is None:')
+                lines.append(f'    missing.append("{var_name.upper()}")')
+
         for param in query_params:
             if param.get(OasField.REQUIRED, False):
                 var_name = self.variable_name(param.get(OasField.NAME))
@@ -837,6 +1013,41 @@ if __name__ == "__main__":
 
         return SEP1.join(lines)
 
+    def op_request_arguments(
+        self,
+        path_params: list[dict[str, Any]],
+        query_params: list[dict[str, Any]],
+        body_params: dict[str, Any],
+    ) -> str:
+        """Get the arguments for the request function, defaulting to the command-line values.
+
+        These are the values that can be provided for each item when using --from-file.
+        """
+        names = self.op_request_names(path_params, query_params, body_params)
+        return ", ".join(f"{n}={n}" for n in dict.fromkeys(names.values()))
+
+    def op_request_names(
+        self,
+        path_params: list[dict[str, Any]],
+        query_params: list[dict[str, Any]],
+        body_params: dict[str, Any],
+    ) -> dict[str, str]:
+        """Get the map of the parameter names (from the OAS) to the request function argument names."""
+        names = [p.get(OasField.NAME) for p in path_params + query_params]
+        names.extend(body_params.keys())
+        return {n: self.variable_name(n) for n in names}
+
+    def op_bulk_names(
+        self,
+        path_params: list[dict[str, Any]],
+        query_params: list[dict[str, Any]],
+        body_params: dict[str, Any],
+    ) -> str:
+        """Get the parameter name map used to convert the --from-file items into request function arguments."""
+        names = self.op_request_names(path_params, query_params, body_params)
+        items = [f"{quoted(k)}: {quoted(v)}" for k, v in names.items()]
+        return "{" + ", ".join(items) + "}"
+
     def summary_display(self, node: LayoutNode) -> str:
         """Add the call to summarize the return value when there are summary fields."""
         if not node.summary_fields:
@@ -863,7 +1074,7 @@ if __name__ == "__main__":
             args["item_start_name"] = quoted(names.item_start)
             args["item_start_value"] = self.variable_name(names.item_start)
         if names.items_property:
-            args["item_property_name"] = quoted(names.items_property)
+            args["items_property_name"] = quoted(names.items_property)
         if names.next_header:
             args["next_header_name"] = quoted(names.next_header)
         if names.next_property:
@@ -961,7 +1172,7 @@ if __name__ == "__main__":
         ])
         if body_params:
             req_args.append("body=body")
-        req_args.append("timemout=_api_timeout")
+        req_args.append("timeout=_api_timeout")
 
         deprecation_warning = ""
         deprecated = op.get(OasField.DEPRECATED, False)
@@ -976,6 +1187,8 @@ if __name__ == "__main__":
             deprecation_warning = SEP1 + f'_l.logger().warning("{message}")'
 
         func_name = self.function_name(node.identifier)
+        body_validator = self.op_body_validator(func_name, body_params)
+        body_check = f"{SEP1}{self.body_validator_name(func_name)}(body)" if body_validator else ""
         func_args = []
         func_args.extend(self.op_path_arguments(path_params))
         func_args.extend(self.op_query_arguments(query_params))
@@ -986,22 +1199,34 @@ if __name__ == "__main__":
         command_args.append(f'short_help="{self.op_short_help(op)}"')
         self.logger.debug(f"{func_name}({len(path_params)} path, {len(query_params)} query, {len(body_params)} body)")
 
+        # the request is a nested function, so it can be run for each item with --from-file
+        request_body = f"""\
+    headers = _r.request_headers(_api_key{self.op_content_header(op)})
+    url = _r.create_url({self.op_url_params(path)}){self.pagination_creation(node)}
+    missing = {self.op_check_missing(query_params, body_params, path_params)}
+    if missing:
+        raise _e.MissingRequiredError(missing)
+
+    params = {self.op_param_formation(query_params)}{self.op_body_formation(body_params)}{body_check}
+
+    return _r.{req_func}({', '.join(req_args)})"""
+
         return f"""
-{self.enum_definitions(path_params, query_params, body_params)}
+{self.enum_definitions(path_params, query_params, body_params)}{body_validator}
 @app.command({', '.join(command_args)})
 def {func_name}({args_str}) -> None:
     {self.op_long_help(op)}# handler for {node.identifier}: {method} {path}
     _l.init_logging(_log_level){deprecation_warning}
-    headers = _r.request_headers(_api_key{self.op_content_header(op)})
-    url = _r.create_url({self.op_url_params(path)}){self.pagination_creation(node)}
-    missing = {self.op_check_missing(query_params, body_params)}
-    if missing:
-        _e.handle_exceptions(_e.MissingRequiredError(missing))
 
-    params = {self.op_param_formation(query_params)}{self.op_body_formation(body_params)}
+    def _request({self.op_request_arguments(path_params, query_params, body_params)}):
+{textwrap.indent(request_body, "    ")}
+
+    if _from_file:
+        _b.bulk_execute(_request, _from_file, _workers, {self.op_bulk_names(path_params, query_params, body_params)})
+        return
 
     try:
-        data = _r.{req_func}({', '.join(req_args)}){self.summary_display(node)}
+        data = _request(){self.summary_display(node)}
         _d.display(data, _out_fmt, _out_style)
     except Exception as ex:
         _e.handle_exceptions(ex)
@@ -1048,6 +1273,14 @@ def {func_name}({args_str}) -> None:
         data = self.get_tree_map(node)
         return yaml.dump(data, indent=2, sort_keys=True)
 
+    def get_tree_json(self, node: LayoutNode) -> str:
+        """Get the compact JSON text for the node (including children).
+
+        This is the same data as the YAML version, but is much faster to load when displaying commands.
+        """
+        data = self.get_tree_map(node)
+        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
     def tree_function(self, node: LayoutNode) -> str:
         """Generate the function to show subcommands."""
         return f"""
@@ -1056,7 +1289,7 @@ def show_commands(
     display: _a.TreeDisplayOption = _a.TreeDisplay.HELP,
     depth: _a.MaxDepthOption = 5,
 ) -> None:
-    path = Path(__file__).parent / "tree.yaml"
+    path = Path(__file__).parent / "tree.json"
     _t.tree(path.as_posix(), "{node.identifier}", display, depth)
     return
 """
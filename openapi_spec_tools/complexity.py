@@ -0,0 +1,143 @@
+"""Calculates the size of operations and models, as if all the references were expanded.
+
+Fully expanding the references is exponential for deeply re-used models, so the sizes are
+calculated using dynamic programming over the reference graph: each referenced model is measured
+once (after the models it references), and the result is re-used everywhere it is referenced.
+Models that are part of a reference cycle (or that reference one) have an unbounded expansion.
+"""
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from openapi_spec_tools.resolver import resolve_pointer
+from openapi_spec_tools.types import OasField
+from openapi_spec_tools.utils import cyclic_references
+from openapi_spec_tools.utils import iter_references
+from openapi_spec_tools.utils import map_models
+from openapi_spec_tools.utils import operation_table
+from openapi_spec_tools.utils import post_order
+from openapi_spec_tools.utils import reference_graph
+from openapi_spec_tools.utils import short_ref
+
+
+@dataclass(frozen=True)
+class Complexity:
+    """Measurements of an object with all the references expanded.
+
+    The nodes and depth are None when the expansion is unbounded (due to a reference cycle).
+    """
+
+    nodes: Optional[int]
+    depth: Optional[int]
+    fan_out: int
+    unbounded: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the dictionary for JSON export."""
+        return asdict(self)
+
+
+# used for references that cannot be resolved (or are external)
+_LEAF = Complexity(nodes=1, depth=0, fan_out=0)
+
+
+def _measure_tree(obj: Any, lookup: Callable[[str], Complexity]) -> tuple[int, int, bool]:
+    """Get the (nodes, depth, unbounded) for the object, using lookup() for the references."""
+    if isinstance(obj, dict):
+        ref = obj.get(OasField.REFS.value)
+        if isinstance(ref, str):
+            target = lookup(ref)
+            if target.unbounded:
+                return 0, 0, True
+            # sibling properties (e.g. description) are counted along with the referenced object
+            nodes, depth, unbounded = target.nodes, target.depth, False
+            for key, value in obj.items():
+                if key != OasField.REFS.value:
+                    n, d, u = _measure_tree(value, lookup)
+                    nodes += n
+                    depth = max(depth, d + 1)
+                    unbounded = unbounded or u
+            return nodes, depth, unbounded
+        values = obj.values()
+    elif isinstance(obj, list):
+        values = obj
+    else:
+        return 1, 0, False
+
+    nodes = 1
+    depth = 0
+    unbounded = False
+    for value in values:
+        n, d, u = _measure_tree(value, lookup)
+        nodes += n
+        depth = max(depth, d + 1)
+        unbounded = unbounded or u
+    return nodes, depth, unbounded
+
+
+def _measure(obj: Any, references: set[str], lookup: Callable[[str], Complexity]) -> Complexity:
+    """Measure the object, where references are the (direct) references found in it."""
+    nodes, depth, unbounded = _measure_tree(obj, lookup)
+    if unbounded:
+        return Complexity(nodes=None, depth=None, fan_out=len(references), unbounded=True)
+    return Complexity(nodes=nodes, depth=depth, fan_out=len(references))
+
+
+class ComplexityCalculator:
+    """Measures the operations and models in the spec, as if the references were expanded."""
+
+    def __init__(self, spec: dict[str, Any]):
+        """Initialize with the spec, and measure all the models."""
+        self.spec = spec
+        self.graph = reference_graph(spec)
+        self.cyclic = cyclic_references(self.graph)
+        self.models: dict[str, Complexity] = {}
+
+        # the referenced models are measured before the models that reference them
+        for ref in post_order(self.graph):
+            self.models[ref] = self._measure_ref(ref)
+
+        # models that are not referenced (everything they reference is already measured)
+        prefix = f"#/{OasField.COMPONENTS.value}/"
+        self.model_refs = {}
+        for name, model in map_models(spec.get(OasField.COMPONENTS, {})).items():
+            ref = self.model_refs[name] = prefix + name
+            if ref not in self.models:
+                self.models[ref] = _measure(model, set(iter_references(model)), self._lookup)
+
+    def _lookup(self, ref: str) -> Complexity:
+        return self.models.get(ref) or _LEAF
+
+    def _measure_ref(self, ref: str) -> Complexity:
+        references = self.graph.get(ref, set())
+        if ref in self.cyclic:
+            return Complexity(nodes=None, depth=None, fan_out=len(references), unbounded=True)
+        if not ref.startswith("#"):
+            return _LEAF
+        try:
+            target = resolve_pointer(self.spec, ref[1:])
+        except ValueError:
+            return _LEAF
+        return _measure(target, references, self._lookup)
+
+    def model_complexity(self) -> dict[str, Complexity]:
+        """Get the complexity for each model (using the short name, e.g. "schemas/Pet")."""
+        return {name: self.models[ref] for name, ref in self.model_refs.items()}
+
+    def operation_complexity(self) -> dict[str, Complexity]:
+        """Get the complexity of each operation (including the path parameters)."""
+        result = {}
+        for op_id, record in operation_table(self.spec.get(OasField.PATHS, {})).items():
+            if not op_id:
+                continue
+            obj = {"operation": record.data, "parameters": record.path_params or []}
+            references = {short_ref(ref) for ref in iter_references(obj)}
+            result[op_id] = _measure(obj, references, self._lookup)
+        return result
+
+
+def sort_complexity(items: dict[str, Complexity]) -> list[tuple[str, Complexity]]:
+    """Sort the items with the largest first (unbounded, then by nodes, depth and name)."""
+    return sorted(items.items(), key=lambda x: (not x[1].unbounded, -(x[1].nodes or 0), -(x[1].depth or 0), x[0]))
@@ -0,0 +1,195 @@
+"""Utilities for determining which operations are used, based on HTTP access logs.
+
+Log lines are matched against the path templates using the PathRouter. Both the common/combined
+log formats (e.g. Apache, nginx) and JSON lines are supported, and files may be gzip compressed.
+Large files are split into chunks that are processed in parallel.
+"""
+import gzip
+import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Iterator
+from typing import Optional
+
+from openapi_spec_tools.utils import PathRouter
+
+# size of the file chunks given to each worker process
+CHUNK_SIZE = 64 * 1024 * 1024
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# matches the request portion of common/combined log formats: "GET /path HTTP/1.1"
+REQUEST_PATTERN = re.compile(r'"([A-Za-z]+) (\S+)(?: [^"]*)?"')
+
+# field names used for JSON log lines (checked in order)
+JSON_METHOD_FIELDS = ["method", "request_method", "httpMethod", "http_method", "verb"]
+JSON_URL_FIELDS = ["path", "url", "uri", "request_uri", "requestUri", "request_path"]
+JSON_REQUEST_FIELDS = ["request"]
+
+
+@dataclass
+class CoverageCounts:
+    """Counts from processing log lines."""
+
+    lines: int = 0
+    unparsed: int = 0
+    unmatched: int = 0
+    operations: Counter = field(default_factory=Counter)
+
+    @property
+    def matched(self) -> int:
+        """Get the number of lines that matched an operation."""
+        return sum(self.operations.values())
+
+    def update(self, other: "CoverageCounts") -> None:
+        """Add the counts from other into this object."""
+        self.lines += other.lines
+        self.unparsed += other.unparsed
+        self.unmatched += other.unmatched
+        self.operations.update(other.operations)
+
+
+def _json_value(data: dict[str, Any], names: list[str]) -> Optional[str]:
+    for name in names:
+        value = data.get(name)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def parse_log_line(line: str) -> Optional[tuple[str, str]]:
+    """Get the (method, URL) from a common/combined or JSON log line."""
+    line = line.strip()
+    if line.startswith("{"):
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        # some formats nest the request details (e.g. {"request": {"method": ..., "uri": ...}})
+        nested = data.get("request") or data.get("httpRequest")
+        if isinstance(nested, dict):
+            data = nested
+
+        method = _json_value(data, JSON_METHOD_FIELDS)
+        url = _json_value(data, JSON_URL_FIELDS)
+        if method and url:
+            return method.upper(), url
+
+        request_line = _json_value(data, JSON_REQUEST_FIELDS)
+        if not request_line:
+            return None
+        line = f'"{request_line}"'
+
+    found = REQUEST_PATTERN.search(line)
+    if not found:
+        return None
+    return found.group(1).upper(), found.group(2)
+
+
+def _is_gzip(filename: str) -> bool:
+    with open(filename, "rb") as fp:
+        return fp.read(2) == GZIP_MAGIC
+
+
+def file_chunks(filename: str, chunk_size: int = CHUNK_SIZE) -> list[tuple[str, int, Optional[int]]]:
+    """Split the file into (filename, start, end) work items.
+
+    Compressed files cannot be split, so they are a single work item.
+    """
+    if _is_gzip(filename):
+        return [(filename, 0, None)]
+
+    size = os.path.getsize(filename)
+    if size <= chunk_size:
+        return [(filename, 0, None)]
+
+    return [(filename, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def read_lines(filename: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """Yield the lines that start within the [start, end) byte range of the file."""
+    if end is None and _is_gzip(filename):
+        with gzip.open(filename, "rb") as fp:
+            yield from fp
+        return
+
+    with open(filename, "rb") as fp:
+        position = start
+        if start:
+            # the line containing the byte before start belongs to the previous chunk
+            fp.seek(start - 1)
+            position += len(fp.readline()) - 1
+        for line in fp:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            yield line
+
+
+def count_lines(router: PathRouter, lines: Iterator[bytes]) -> CoverageCounts:
+    """Match each log line to an operation, and count them."""
+    counts = CoverageCounts()
+    operations = counts.operations
+    for raw in lines:
+        if raw.isspace():
+            continue
+        counts.lines += 1
+        request = parse_log_line(raw.decode("utf-8", errors="replace"))
+        if not request:
+            counts.unparsed += 1
+            continue
+
+        op_id = router.lookup(*request)
+        if op_id:
+            operations[op_id] += 1
+        else:
+            counts.unmatched += 1
+
+    return counts
+
+
+# router for the worker processes (set once per process by the pool initializer)
+_worker_router: Optional[PathRouter] = None
+
+
+def _init_worker(router: PathRouter) -> None:
+    global _worker_router
+    _worker_router = router
+
+
+def _count_chunk(chunk: tuple[str, int, Optional[int]]) -> CoverageCounts:
+    return count_lines(_worker_router, read_lines(*chunk))
+
+
+def count_operations(
+    router: PathRouter,
+    filenames: list[str],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> CoverageCounts:
+    """Count the operations used in the log files.
+
+    The files are split into chunks that are processed using a pool of worker processes. When
+    there is only one worker (or one chunk) the processing is done in this process.
+    """
+    chunks = [c for f in filenames for c in file_chunks(f, chunk_size)]
+    total = CoverageCounts()
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        for chunk in chunks:
+            total.update(count_lines(router, read_lines(*chunk)))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(router,)) as executor:
+        for counts in executor.map(_count_chunk, chunks):
+            total.update(counts)
+
+    return total
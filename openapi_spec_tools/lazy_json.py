@@ -0,0 +1,154 @@
+"""Lazy loading of JSON specs, where only the top-level sections that are accessed get decoded.
+
+Many commands only need one section (e.g. 'info'), so decoding a huge JSON spec is wasted effort.
+The file is memory-mapped, and the offsets of the top-level sections are found by scanning the raw
+bytes for the top-level keys. JSON strings cannot contain (raw) line breaks, so in a pretty-printed
+document (e.g. json.dump(..., indent=2)) the top-level keys are the lines with the indentation of
+the first key. Each section is decoded when it is first accessed, and checked to end where the next
+section starts.
+
+Documents that are not pretty-printed (e.g. minified), or where the check fails, are decoded in
+full (so the result is always the same as json.load()).
+
+The memory-mapped file is released by close() (or when used as a context manager), after which only
+the sections that were already decoded are available.
+"""
+import json
+import mmap
+import re
+from collections.abc import Iterator
+from collections.abc import Mapping
+from typing import Any
+from typing import Optional
+
+# references to other files (i.e. not starting with "#")
+_EXTERNAL_REF = re.compile(rb'"\$ref"\s*:\s*"(?!#)')
+_DOCUMENT_START = re.compile(rb"\s*\{([ \t]*\r?\n)+(?P<indent>[ \t]+)\"")
+_DECODER = json.JSONDecoder()
+
+
+class LazyJsonDocument(Mapping):
+    """Read-only mapping of the top-level sections of a JSON document, decoded on first access."""
+
+    def __init__(self, filename: str):
+        """Memory-map the file, and find the offsets of the top-level sections."""
+        self.filename = filename
+        with open(filename, "rb") as fp:
+            try:
+                self._data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                self._data = b""
+        self._values: dict[str, Any] = {}
+        self._full: Optional[dict[str, Any]] = None
+        try:
+            self._offsets = self._scan() or {}
+            if not self._offsets:
+                self._decode_all()
+        except Exception:
+            self._release()
+            raise
+
+    def _scan(self) -> Optional[dict[str, tuple[int, int]]]:
+        """Get the (start, end) offsets of each top-level value, or None when not pretty-printed."""
+        data = self._data
+        start = _DOCUMENT_START.match(data)
+        # the closing brace of the document must be on a line of its own
+        close = data.rfind(b"}")
+        if not start or close < 1 or data[close + 1:].strip() or data[close - 1:close] != b"\n":
+            return None
+        end = close - 2 if data[close - 2:close - 1] == b"\r" else close - 1
+
+        indent = start.group("indent")
+        begin = start.start("indent") - 1
+        outdented = re.compile(rb"\n[ \t]{0,%d}[^ \t\r\n]" % (len(indent) - 1))
+        if outdented.search(data, begin, end):
+            # not consistently indented, so the top-level keys cannot be found by the indentation
+            return None
+
+        key_line = re.compile(rb"\n" + re.escape(indent) + rb'"((?:[^"\\\r\n]|\\.)*)"[ \t]*:')
+        offsets = {}
+        previous = None
+        for match in key_line.finditer(data, begin, end):
+            key = json.loads(b'"' + match.group(1) + b'"')
+            if key in offsets:
+                # duplicate keys mean the lines are not all top-level
+                return None
+            if previous is not None:
+                offsets[previous] = (offsets[previous][0], match.start())
+            offsets[key] = (match.end(), end)
+            previous = key
+        return offsets
+
+    def _decode_all(self) -> None:
+        self._full = json.loads(self._data[:])
+        self._values = {}
+        self._release()
+
+    def _decode(self, key: str) -> Any:
+        start, end = self._offsets[key]
+        text = self._data[start:end].decode("utf-8").strip()
+        try:
+            value, index = _DECODER.raw_decode(text)
+        except json.JSONDecodeError:
+            value, index = None, 0
+        if text[index:].strip() not in ("", ","):
+            # the value does not end where the next section starts
+            self._decode_all()
+            return self._full[key]
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the (decoded) top-level section."""
+        if self._full is not None:
+            return self._full[key]
+        if key not in self._values:
+            if key not in self._offsets:
+                raise KeyError(key)
+            value = self._decode(key)
+            if self._full is not None:
+                return value
+            self._values[key] = value
+        return self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check for the top-level section (without decoding it)."""
+        return key in (self._full if self._full is not None else self._offsets)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the top-level keys (in document order)."""
+        return iter(self._full if self._full is not None else self._offsets)
+
+    def __len__(self) -> int:
+        """Get the number of top-level sections."""
+        return len(self._full if self._full is not None else self._offsets)
+
+    @property
+    def decoded(self) -> set[str]:
+        """Get the top-level sections that have been decoded."""
+        return set(self._full if self._full is not None else self._values)
+
+    def has_external_refs(self) -> bool:
+        """Check if the document references other files (without decoding it)."""
+        if self._full is not None:
+            return _EXTERNAL_REF.search(json.dumps(self._full).encode("utf-8")) is not None
+        return _EXTERNAL_REF.search(self._data) is not None
+
+    def _release(self) -> None:
+        data, self._data = self._data, b""
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+    def close(self) -> None:
+        """Release the memory-mapped file, keeping only the sections that have been decoded."""
+        if self._full is None:
+            self._offsets = {k: v for k, v in self._offsets.items() if k in self._values}
+        self._release()
+
+    def __enter__(self) -> "LazyJsonDocument":
+        """Use the document, and close it when done."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the document."""
+        self.close()
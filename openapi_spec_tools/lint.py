@@ -0,0 +1,529 @@
+"""Rule-based linting of OpenAPI specs, where all the rules run in a single traversal.
+
+Each rule subscribes to the kinds of nodes it checks (operations, parameters, schemas and
+properties). The spec is walked once, and each node is handed to the rules subscribed to its
+kind, so adding rules does not add walks over the (possibly huge) spec. The time spent in each
+rule is measured, so slow rules can be found. Many files are linted by a pool of worker processes.
+"""
+import os
+import re
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from typing import Optional
+
+from openapi_spec_tools.types import OasField
+from openapi_spec_tools.utils import open_oas
+
+HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+# sub-schemas that are walked (along with the properties)
+_SCHEMA_LISTS = [OasField.ALL_OF.value, OasField.ANY_OF.value, OasField.ONE_OF.value, "prefixItems"]
+_SCHEMA_VALUES = [OasField.ITEMS.value, "additionalProperties", "not"]
+
+# component sections with the objects that get walked
+_COMPONENT_SECTIONS = ["schemas", "parameters", "requestBodies", "responses"]
+
+# parameters in a path template (e.g. "/pets/{petId}")
+_PATH_TEMPLATE = re.compile(r"{([^{}]+)}")
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+
+
+class NodeKind(str, Enum):
+    """Kinds of nodes that rules subscribe to."""
+
+    OPERATION = "operation"
+    PARAMETER = "parameter"
+    SCHEMA = "schema"
+    PROPERTY = "property"
+
+
+class Severity(str, Enum):
+    """Severity of a finding (the values are the SARIF levels)."""
+
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "note"
+
+
+@dataclass(frozen=True)
+class Node:
+    """Object in the spec handed to the rules.
+
+    The name is the operationId, parameter name, or property name. For properties, the parent is
+    the schema containing the property (e.g. for checking the 'required' list). For operations, the
+    path is the path template (None for webhooks), and the params are the path-level and operation
+    parameters (with local references resolved).
+    """
+
+    kind: NodeKind
+    pointer: str
+    value: dict[str, Any]
+    name: Optional[str] = None
+    parent: Optional[dict[str, Any]] = None
+    path: Optional[str] = None
+    params: tuple[dict[str, Any], ...] = ()
+
+
+@dataclass(frozen=True)
+class Finding:
+    """Problem found by a rule, where the pointer is the JSON pointer location in the spec."""
+
+    rule: str
+    severity: Severity
+    pointer: str
+    message: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the dictionary for JSON export."""
+        return {"rule": self.rule, "severity": self.severity.value, "pointer": self.pointer, "message": self.message}
+
+
+@dataclass
+class RuleStats:
+    """Time spent in a rule (in seconds), with the number of nodes checked and problems found."""
+
+    rule: str
+    calls: int = 0
+    seconds: float = 0.0
+    findings: int = 0
+
+
+@dataclass
+class LintResult:
+    """Findings and rule statistics for a single file (or the error that prevented linting)."""
+
+    filename: str
+    findings: list[Finding] = field(default_factory=list)
+    stats: list[RuleStats] = field(default_factory=list)
+    nodes: dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the dictionary for JSON export."""
+        if self.error:
+            return {"filename": self.filename, "error": self.error}
+        return {
+            "filename": self.filename,
+            "findings": [f.to_dict() for f in self.findings],
+            "stats": [asdict(s) for s in self.stats],
+            "nodes": self.nodes,
+        }
+
+
+def escape_pointer(name: str) -> str:
+    """Escape the name for use in a JSON pointer."""
+    return str(name).replace("~", "~0").replace("/", "~1")
+
+
+def unescape_pointer(name: str) -> str:
+    """Get the name from the (escaped) JSON pointer segment."""
+    return name.replace("~1", "/").replace("~0", "~")
+
+
+class Rule(ABC):
+    """Base class for the lint rules.
+
+    A new rule instance is created for each spec, so rules can keep state across nodes (e.g. the
+    operationIds seen so far).
+    """
+
+    name: str = ""
+    description: str = ""
+    severity: Severity = Severity.WARNING
+    kinds: tuple[NodeKind, ...] = ()
+
+    @abstractmethod
+    def check(self, node: Node) -> Iterable[Finding]:
+        """Get the problems with the node."""
+
+    def finding(self, pointer: str, message: str) -> Finding:
+        """Create a finding for this rule."""
+        return Finding(rule=self.name, severity=self.severity, pointer=pointer, message=message)
+
+
+class MissingOperationId(Rule):
+    """Operations need an operationId to get a (stable) name in generated code."""
+
+    name = "missing-operation-id"
+    description = "Operations should have an operationId"
+    severity = Severity.WARNING
+    kinds = (NodeKind.OPERATION,)
+
+    def check(self, node: Node) -> Iterator[Finding]:
+        """Report operations without an operationId."""
+        if not node.name:
+            yield self.finding(node.pointer, "operation has no operationId")
+
+
+class DuplicateOperationId(Rule):
+    """The operationId must be unique across the spec."""
+
+    name = "duplicate-operation-id"
+    description = "The operationId must be unique"
+    severity = Severity.ERROR
+    kinds = (NodeKind.OPERATION,)
+
+    def __init__(self):
+        """Initialize the operationIds seen (with the first location)."""
+        self.seen: dict[str, str] = {}
+
+    def check(self, node: Node) -> Iterator[Finding]:
+        """Report the second (and later) operations using an operationId."""
+        if not node.name:
+            return
+        first = self.seen.setdefault(node.name, node.pointer)
+        if first != node.pointer:
+            yield self.finding(node.pointer, f"operationId '{node.name}' is also used by {first}")
+
+
+class UndocumentedResponse(Rule):
+    """Operations need responses, and each response needs a description."""
+
+    name = "undocumented-response"
+    description = "Operations should document their responses"
+    severity = Severity.WARNING
+    kinds = (NodeKind.OPERATION,)
+
+    def check(self, node: Node) -> Iterator[Finding]:
+        """Report operations without responses, and responses without a description."""
+        responses = node.value.get(OasField.RESPONSES.value)
+        if not isinstance(responses, dict) or not responses:
+            yield self.finding(node.pointer, "operation has no responses")
+            return
+        for code, response in responses.items():
+            if isinstance(response, dict) and OasField.REFS.value not in response:
+                if not response.get(OasField.DESCRIPTION.value):
+                    pointer = f"{node.pointer}/{OasField.RESPONSES.value}/{escape_pointer(code)}"
+                    yield self.finding(pointer, f"response {code} has no description")
+
+
+class InvalidParameter(Rule):
+    """Parameters need a schema (or content), and path parameters must be required."""
+
+    name = "invalid-parameter"
+    description = "Parameters need a schema, and path parameters must be required"
+    severity = Severity.ERROR
+    kinds = (NodeKind.PARAMETER,)
+
+    def check(self, node: Node) -> Iterator[Finding]:
+        """Report parameters without a schema, and optional path parameters."""
+        value = node.value
+        if OasField.SCHEMA.value not in value and OasField.CONTENT.value not in value:
+            yield self.finding(node.pointer, f"parameter '{node.name}' has no schema")
+        if value.get(OasField.IN.value) == "path" and value.get(OasField.REQUIRED.value) is not True:
+            yield self.finding(node.pointer, f"path parameter '{node.name}' is not required")
+
+
+class UndeclaredPathParameter(Rule):
+    """Each parameter in the path template (e.g. "{petId}") needs a path parameter definition."""
+
+    name = "undeclared-path-parameter"
+    description = "Path template parameters must be declared"
+    severity = Severity.ERROR
+    kinds = (NodeKind.OPERATION,)
+
+    def check(self, node: Node) -> Iterator[Finding]:
+        """Report the path template parameters without a matching path parameter."""
+        if not node.path:
+            return
+        declared = {
+            p.get(OasField.NAME.value) for p in node.params if p.get(OasField.IN.value) == "path"
+        }
+        for name in _PATH_TEMPLATE.findall(node.path):
+            if name not in declared:
+                yield self.finding(node.pointer, f"path parameter '{name}' is not declared")
+
+
+class NullableRequired(Rule):
+    """Required properties that are nullable confuse clients (see set_nullable_not_required())."""
+
+    name = "nullable-required"
+    description = "Nullable properties should not be required"
+    severity = Severity.WARNING
+    kinds = (NodeKind.PROPERTY,)
+
+    def check(self, node: Node) -> Iterator[Finding]:
+        """Report properties that are both nullable and required."""
+        value = node.value
+        types = value.get(OasField.TYPE.value)
+        nullable = value.get(OasField.NULLABLE.value) is True or (isinstance(types, list) and "null" in types)
+        required = node.parent.get(OasField.REQUIRED.value) if node.parent else None
+        if nullable and isinstance(required, list) and node.name in required:
+            yield self.finding(node.pointer, f"property '{node.name}' is nullable and required")
+
+
+RULES: dict[str, type[Rule]] = {
+    rule.name: rule
+    for rule in [
+        MissingOperationId,
+        DuplicateOperationId,
+        UndocumentedResponse,
+        InvalidParameter,
+        UndeclaredPathParameter,
+        NullableRequired,
+    ]
+}
+
+
+class Linter:
+    """Runs the rules over a spec in a single traversal."""
+
+    def __init__(self, rules: list[Rule]):
+        """Subscribe the rules to the kinds of nodes they check."""
+        self.rules = rules
+        self.dispatch: dict[NodeKind, list[Rule]] = {kind: [] for kind in NodeKind}
+        for rule in rules:
+            for kind in rule.kinds:
+                self.dispatch[kind].append(rule)
+        self.stats = {rule.name: RuleStats(rule.name) for rule in rules}
+        self.nodes = {kind.value: 0 for kind in NodeKind}
+        self.findings: list[Finding] = []
+        self.shared_params: dict[str, Any] = {}
+
+    def _visit(self, node: Node) -> None:
+        self.nodes[node.kind.value] += 1
+        for rule in self.dispatch[node.kind]:
+            stats = self.stats[rule.name]
+            start = time.perf_counter()
+            found = list(rule.check(node))
+            stats.seconds += time.perf_counter() - start
+            stats.calls += 1
+            stats.findings += len(found)
+            self.findings.extend(found)
+
+    def _schema(self, pointer: str, schema: Any) -> None:
+        """Walk the schema (and sub-schemas), without following references."""
+        stack = [(pointer, schema)]
+        while stack:
+            location, item = stack.pop()
+            if not isinstance(item, dict) or OasField.REFS.value in item:
+                continue
+            self._visit(Node(NodeKind.SCHEMA, location, item))
+            properties = item.get(OasField.PROPS.value)
+            children = []
+            if isinstance(properties, dict):
+                for name, prop in properties.items():
+                    child = f"{location}/{OasField.PROPS.value}/{escape_pointer(name)}"
+                    if isinstance(prop, dict):
+                        self._visit(Node(NodeKind.PROPERTY, child, prop, name=name, parent=item))
+                    children.append((child, prop))
+            for key in _SCHEMA_VALUES:
+                if isinstance(item.get(key), dict):
+                    children.append((f"{location}/{key}", item[key]))
+            for key in _SCHEMA_LISTS:
+                if isinstance(item.get(key), list):
+                    children.extend((f"{location}/{key}/{i}", sub) for i, sub in enumerate(item[key]))
+            # reversed, so the sub-schemas are visited in document order
+            stack.extend(reversed(children))
+
+    def _content(self, pointer: str, obj: Any) -> None:
+        """Walk the schemas of the media types (of a request body, response or parameter)."""
+        if not isinstance(obj, dict) or OasField.REFS.value in obj:
+            return
+        content = obj.get(OasField.CONTENT.value)
+        if isinstance(content, dict):
+            for media_type, media in content.items():
+                if isinstance(media, dict):
+                    location = f"{pointer}/{OasField.CONTENT.value}/{escape_pointer(media_type)}"
+                    self._schema(f"{location}/{OasField.SCHEMA.value}", media.get(OasField.SCHEMA.value))
+
+    def _parameter(self, pointer: str, param: Any) -> None:
+        if not isinstance(param, dict) or OasField.REFS.value in param:
+            return
+        self._visit(Node(NodeKind.PARAMETER, pointer, param, name=param.get(OasField.NAME.value)))
+        self._schema(f"{pointer}/{OasField.SCHEMA.value}", param.get(OasField.SCHEMA.value))
+        self._content(pointer, param)
+
+    def _parameters(self, pointer: str, params: Any) -> None:
+        if isinstance(params, list):
+            for index, param in enumerate(params):
+                self._parameter(f"{pointer}/{OasField.PARAMS.value}/{index}", param)
+
+    def _resolved_params(self, *param_lists: Any) -> tuple[dict[str, Any], ...]:
+        """Get the parameters (from any of the lists), with references to the components resolved."""
+        prefix = f"#/{OasField.COMPONENTS.value}/{OasField.PARAMS.value}/"
+        result = []
+        for params in param_lists:
+            for param in params if isinstance(params, list) else []:
+                ref = param.get(OasField.REFS.value) if isinstance(param, dict) else None
+                if isinstance(ref, str) and ref.startswith(prefix):
+                    param = self.shared_params.get(unescape_pointer(ref[len(prefix):]))
+                if isinstance(param, dict):
+                    result.append(param)
+        return tuple(result)
+
+    def _operation(
+        self, pointer: str, operation: dict[str, Any], path: Optional[str] = None, path_params: Any = None,
+    ) -> None:
+        self._visit(Node(
+            NodeKind.OPERATION,
+            pointer,
+            operation,
+            name=operation.get(OasField.OP_ID.value),
+            path=path,
+            params=self._resolved_params(path_params, operation.get(OasField.PARAMS.value)),
+        ))
+        self._parameters(pointer, operation.get(OasField.PARAMS.value))
+        self._content(f"{pointer}/{OasField.REQ_BODY.value}", operation.get(OasField.REQ_BODY.value))
+        responses = operation.get(OasField.RESPONSES.value)
+        if isinstance(responses, dict):
+            for code, response in responses.items():
+                self._content(f"{pointer}/{OasField.RESPONSES.value}/{escape_pointer(code)}", response)
+
+    def run(self, spec: dict[str, Any]) -> list[Finding]:
+        """Walk the spec once, handing each node to the subscribed rules."""
+        components = spec.get(OasField.COMPONENTS.value)
+        components = components if isinstance(components, dict) else {}
+        shared_params = components.get(OasField.PARAMS.value)
+        self.shared_params = shared_params if isinstance(shared_params, dict) else {}
+        for section in [OasField.PATHS.value, OasField.WEBHOOKS.value]:
+            paths = spec.get(section)
+            if not isinstance(paths, dict):
+                continue
+            for path, path_item in paths.items():
+                if not isinstance(path_item, dict):
+                    continue
+                location = f"/{section}/{escape_pointer(path)}"
+                path_params = path_item.get(OasField.PARAMS.value)
+                self._parameters(location, path_params)
+                template = path if section == OasField.PATHS.value else None
+                for method, operation in path_item.items():
+                    if method in HTTP_METHODS and isinstance(operation, dict):
+                        self._operation(f"{location}/{method}", operation, template, path_params)
+
+        for section in _COMPONENT_SECTIONS:
+            items = components.get(section)
+            if not isinstance(items, dict):
+                continue
+            for name, item in items.items():
+                location = f"/{OasField.COMPONENTS.value}/{section}/{escape_pointer(name)}"
+                if section == "schemas":
+                    self._schema(location, item)
+                elif section == "parameters":
+                    self._parameter(location, item)
+                else:
+                    self._content(location, item)
+        return self.findings
+
+
+def create_rules(names: Optional[list[str]] = None) -> list[Rule]:
+    """Create the named rules (or all the rules when no names are provided)."""
+    unknown = set(names or []) - set(RULES)
+    if unknown:
+        raise ValueError(f"unknown rule(s): {', '.join(sorted(unknown))}")
+    return [rule() for name, rule in RULES.items() if not names or name in names]
+
+
+def lint_spec(spec: dict[str, Any], names: Optional[list[str]] = None) -> Linter:
+    """Run the rules over the spec, and get the linter (with the findings and statistics)."""
+    linter = Linter(create_rules(names))
+    linter.run(spec)
+    return linter
+
+
+def lint_file(filename: str, names: Optional[list[str]] = None) -> LintResult:
+    """Open the file, and run the rules."""
+    if not Path(filename).exists():
+        return LintResult(filename, error="failed to find file")
+    try:
+        spec = open_oas(filename)
+    except Exception as ex:
+        return LintResult(filename, error=f"unable to parse: {ex}")
+    if not isinstance(spec, dict):
+        return LintResult(filename, error="not an OpenAPI spec")
+
+    linter = lint_spec(spec, names)
+    return LintResult(filename, findings=linter.findings, stats=list(linter.stats.values()), nodes=linter.nodes)
+
+
+def _lint_task(task: tuple[str, Optional[list[str]]]) -> LintResult:
+    return lint_file(*task)
+
+
+def lint_files(
+    filenames: list[str],
+    names: Optional[list[str]] = None,
+    workers: Optional[int] = None,
+) -> list[LintResult]:
+    """Lint each of the files, using a pool of worker processes (results are in the same order)."""
+    tasks = [(f, names) for f in filenames]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return [_lint_task(t) for t in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_lint_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+
+def total_stats(results: list[LintResult]) -> list[RuleStats]:
+    """Get the statistics for each rule, totaled across the files (slowest first)."""
+    totals: dict[str, RuleStats] = {}
+    for result in results:
+        for item in result.stats:
+            total = totals.setdefault(item.rule, RuleStats(item.rule))
+            total.calls += item.calls
+            total.seconds += item.seconds
+            total.findings += item.findings
+    return sorted(totals.values(), key=lambda x: (-x.seconds, x.rule))
+
+
+def to_sarif(results: list[LintResult], names: Optional[list[str]] = None) -> dict[str, Any]:
+    """Get the SARIF log for the results (e.g. for uploading to code scanning tools).
+
+    The location of each finding is the file, and the JSON pointer as the logical location.
+    """
+    rules = [RULES[name] for name in RULES if not names or name in names]
+    index = {rule.name: i for i, rule in enumerate(rules)}
+    sarif_results = []
+    notifications = []
+    for result in results:
+        if result.error:
+            notifications.append({
+                "level": "error",
+                "message": {"text": f"{result.filename}: {result.error}"},
+            })
+        for item in result.findings:
+            sarif_results.append({
+                "ruleId": item.rule,
+                "ruleIndex": index[item.rule],
+                "level": item.severity.value,
+                "message": {"text": item.message},
+                "locations": [{
+                    "physicalLocation": {"artifactLocation": {"uri": Path(result.filename).as_posix()}},
+                    "logicalLocations": [{"fullyQualifiedName": item.pointer, "kind": "object"}],
+                }],
+            })
+
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": SARIF_VERSION,
+        "runs": [{
+            "tool": {
+                "driver": {
+                    "name": "oas lint",
+                    "rules": [
+                        {
+                            "id": rule.name,
+                            "shortDescription": {"text": rule.description},
+                            "defaultConfiguration": {"level": rule.severity.value},
+                        }
+                        for rule in rules
+                    ],
+                },
+            },
+            "invocations": [{"executionSuccessful": not notifications, "toolExecutionNotifications": notifications}],
+            "results": sarif_results,
+        }],
+    }
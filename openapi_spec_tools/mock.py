@@ -0,0 +1,503 @@
+"""Mock HTTP server that responds to the operations in an OpenAPI spec.
+
+The requests are routed to the operations using the PathRouter, and the responses are synthesized
+from the response schemas. The example for each schema (and each operation response) is generated
+once, and re-used for all the following requests. The server is built on asyncio, so a single thread
+serves many concurrent (keep-alive) connections.
+
+This is intended for testing and benchmarking clients (e.g. the generated CLIs) without a real
+service, so it supports adding latency, injecting errors, and the pagination styles supported by
+the generated CLIs.
+"""
+import asyncio
+import json
+import random
+from dataclasses import dataclass
+from dataclasses import field
+from enum import Enum
+from http import HTTPStatus
+from typing import Any
+from typing import Callable
+from typing import Optional
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+from openapi_spec_tools.cli_gen.layout import file_to_tree
+from openapi_spec_tools.cli_gen.layout_types import LayoutNode
+from openapi_spec_tools.cli_gen.layout_types import PaginationNames
+from openapi_spec_tools.types import OasField
+from openapi_spec_tools.utils import NULL_TYPES
+from openapi_spec_tools.utils import PathRouter
+from openapi_spec_tools.utils import map_operations
+
+JSON_CONTENT = "application/json"
+
+# query parameter used in the next URLs, when the pagination has no page/offset parameter
+CURSOR_PARAM = "cursor"
+
+# maximum depth of the generated examples (deeper objects/arrays are left empty)
+MAX_DEPTH = 8
+
+STRING_FORMATS = {
+    "date": "2025-01-01",
+    "date-time": "2025-01-01T00:00:00Z",
+    "time": "00:00:00",
+    "uuid": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    "email": "user@example.com",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+    "hostname": "example.com",
+    "ipv4": "192.0.2.1",
+    "ipv6": "2001:db8::1",
+    "byte": "ZXhhbXBsZQ==",
+    "password": "********",
+}
+
+
+class PageStyle(str, Enum):
+    """Pagination styles, which match the ways the generated CLIs get the next page."""
+
+    PAGE = "page"
+    OFFSET = "offset"
+    NEXT_HEADER = "next-header"
+    NEXT_PROPERTY = "next-property"
+
+
+# parameter names used for the pagination styles, when not specified by a layout file
+DEFAULT_PAGINATION = {
+    PageStyle.PAGE: PaginationNames(page_size="page_size", page_start="page"),
+    PageStyle.OFFSET: PaginationNames(page_size="limit", item_start="offset"),
+    PageStyle.NEXT_HEADER: PaginationNames(page_size="page_size", next_header="X-Next"),
+    PageStyle.NEXT_PROPERTY: PaginationNames(page_size="page_size", items_property="results", next_property="next"),
+}
+
+
+@dataclass
+class MockConfig:
+    """Settings for the mock server behavior."""
+
+    # seconds added to each response, and the maximum random amount added to that
+    latency: float = 0.0
+    jitter: float = 0.0
+
+    # fraction (0.0 to 1.0) of the requests that get an error response
+    error_rate: float = 0.0
+    error_status: int = HTTPStatus.INTERNAL_SERVER_ERROR.value
+
+    # number of items in each paginated list, and the page size when not requested
+    total_items: int = 100
+    page_size: int = 20
+
+    # seed for the latency jitter and error injection (for repeatable runs)
+    seed: Optional[int] = None
+
+
+@dataclass
+class MockResponse:
+    """Response for a single request."""
+
+    status: int
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    op_id: Optional[str] = None
+
+    def json(self) -> Any:
+        """Get the decoded body (mostly for testing)."""
+        return json.loads(self.body) if self.body else None
+
+    def encode(self, keep_alive: bool = True) -> bytes:
+        """Get the HTTP/1.1 response bytes."""
+        try:
+            reason = HTTPStatus(self.status).phrase
+        except ValueError:
+            reason = "Unknown"
+        lines = [f"HTTP/1.1 {self.status} {reason}"]
+        headers = dict(self.headers)
+        headers["Content-Length"] = str(len(self.body))
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        lines.extend(f"{k}: {v}" for k, v in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + self.body
+
+
+@dataclass
+class MockStats:
+    """Counts of the requests served."""
+
+    requests: int = 0
+    errors: int = 0
+    unmatched: int = 0
+    operations: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Route:
+    """Pre-computed response for an operation."""
+
+    status: int
+    content_type: Optional[str]
+    body: bytes = b""
+
+    # paginated responses are assembled for each request
+    pagination: Optional[PaginationNames] = None
+    items: Optional[list[Any]] = None
+    template: Optional[dict[str, Any]] = None
+
+
+def error_body(message: str) -> bytes:
+    """Get the JSON body used for error responses."""
+    return json.dumps({"detail": message}).encode()
+
+
+class ExampleGenerator:
+    """Synthesizes example values from schemas.
+
+    Explicit values from the schema (e.g. 'example', 'default', 'enum') are used when available,
+    and otherwise a value is created based on the type. The result for each schema object (and each
+    reference) is memoized, so each schema is only processed once. References that are part of a
+    cycle are left out when they are re-entered.
+    """
+
+    def __init__(self, spec: dict[str, Any]):
+        """Initialize with the spec used to resolve the references."""
+        self.spec = spec
+        self.refs: dict[str, Any] = {}
+        self.schemas: dict[int, tuple[Any, Any]] = {}
+
+    def resolve(self, ref: str) -> Any:
+        """Get the object referenced by the (local) reference."""
+        value = self.spec
+        for key in ref.lstrip("#/").split("/"):
+            key = key.replace("~1", "/").replace("~0", "~")
+            if not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+        return value
+
+    def example(self, schema: Any) -> Any:
+        """Get an example value for the schema."""
+        return self._example(schema, (), 0)
+
+    def _example(self, schema: Any, active: tuple[str, ...], depth: int) -> Any:
+        if not isinstance(schema, dict) or depth > MAX_DEPTH:
+            return None
+
+        ref = schema.get(OasField.REFS)
+        if isinstance(ref, str):
+            if ref in self.refs:
+                return self.refs[ref]
+            if ref in active:
+                return None
+            value = self._example(self.resolve(ref), active + (ref,), depth)
+            self.refs[ref] = value
+            return value
+
+        # the schema is kept with the value, so the id is not re-used while cached
+        cached = self.schemas.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        value = self._generate(schema, active, depth)
+        self.schemas[id(schema)] = (schema, value)
+        return value
+
+    def _generate(self, schema: dict[str, Any], active: tuple[str, ...], depth: int) -> Any:
+        for name in ("example", "default", "const"):
+            if name in schema:
+                return schema[name]
+        examples = schema.get("examples")
+        if isinstance(examples, list) and examples:
+            return examples[0]
+        values = schema.get(OasField.ENUM)
+        if values:
+            return values[0]
+
+        all_of = schema.get(OasField.ALL_OF)
+        if all_of:
+            merged = {}
+            for item in all_of:
+                value = self._example(item, active, depth)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+        for name in (OasField.ONE_OF, OasField.ANY_OF):
+            choices = schema.get(name)
+            if choices:
+                return self._example(choices[0], active, depth)
+
+        schema_type = schema.get(OasField.TYPE)
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t not in NULL_TYPES), None)
+        if schema_type is None:
+            if OasField.PROPS in schema or "additionalProperties" in schema:
+                schema_type = "object"
+            elif OasField.ITEMS in schema:
+                schema_type = "array"
+
+        if schema_type == "object":
+            result = {}
+            for name, prop in (schema.get(OasField.PROPS) or {}).items():
+                if isinstance(prop, dict) and prop.get("writeOnly"):
+                    continue
+                result[name] = self._example(prop, active, depth + 1)
+            additional = schema.get("additionalProperties")
+            if not result and isinstance(additional, dict):
+                result["key"] = self._example(additional, active, depth + 1)
+            return result
+        if schema_type == "array":
+            item = self._example(schema.get(OasField.ITEMS), active, depth + 1)
+            if item is None:
+                return []
+            return [item] * max(schema.get("minItems") or 1, 1)
+        if schema_type == "string":
+            value = STRING_FORMATS.get(schema.get(OasField.FORMAT), "string")
+            min_length = schema.get("minLength") or 0
+            return value.ljust(min_length, "x")
+        if schema_type in ("integer", "number"):
+            value = schema.get(OasField.MIN, 1)
+            exclusive = schema.get("exclusiveMinimum")
+            if exclusive is True:
+                value += 1
+            elif isinstance(exclusive, (int, float)) and not isinstance(exclusive, bool):
+                value = exclusive + 1
+            return value if schema_type == "integer" else float(value)
+        if schema_type == "boolean":
+            return True
+        return None
+
+
+def layout_pagination(layout: LayoutNode) -> dict[str, PaginationNames]:
+    """Get the pagination for each operation (by operationId) from the CLI layout."""
+    result = {}
+    for child in layout.children:
+        if child.children:
+            result.update(layout_pagination(child))
+        elif child.pagination:
+            result[child.identifier] = child.pagination
+    return result
+
+
+def layout_file_pagination(filename: str) -> dict[str, PaginationNames]:
+    """Get the pagination for each operation (by operationId) from the CLI layout file."""
+    return layout_pagination(file_to_tree(filename))
+
+
+class MockServer:
+    """Serves responses for the operations in an OpenAPI spec."""
+
+    def __init__(
+        self,
+        spec: dict[str, Any],
+        config: Optional[MockConfig] = None,
+        pagination: Optional[dict[str, PaginationNames]] = None,
+        page_style: Optional[PageStyle] = None,
+    ):
+        """Initialize the router from the spec operations.
+
+        The pagination maps the operationId to the pagination parameters (e.g. from the CLI layout
+        file). The page_style is used for the other GET operations that respond with a list.
+        """
+        self.spec = spec
+        self.config = config or MockConfig()
+        self.pagination = pagination or {}
+        self.default_pagination = DEFAULT_PAGINATION.get(page_style) if page_style else None
+        self.examples = ExampleGenerator(spec)
+        self.random = random.Random(self.config.seed)
+        self.stats = MockStats()
+        self.routes: dict[str, _Route] = {}
+
+        base_paths = [urlsplit(s.get(OasField.URL, "")).path for s in spec.get(OasField.SERVERS) or []]
+        self.router = PathRouter(base_paths)
+        self.operations = map_operations(spec.get(OasField.PATHS) or {})
+        for op_id, op_data in self.operations.items():
+            if op_id:
+                self.router.add(op_data[OasField.X_PATH], op_data[OasField.X_METHOD], op_id)
+
+    def response_content(self, operation: dict[str, Any]) -> tuple[int, Optional[str], Any]:
+        """Get the (status, content-type, example) of the successful response for the operation."""
+        responses = operation.get(OasField.RESPONSES) or {}
+        # the codes may be integers (when parsed from YAML) or strings
+        success = sorted((c for c in responses if str(c).startswith("2")), key=str)
+        code = success[0] if success else OasField.DEFAULT.value
+        status = int(code) if str(code).isdigit() else HTTPStatus.OK.value
+        response = responses.get(code) or {}
+        if OasField.REFS in response:
+            response = self.examples.resolve(response[OasField.REFS]) or {}
+
+        content = response.get(OasField.CONTENT) or {}
+        if not content:
+            return status, None, None
+        content_type = JSON_CONTENT if JSON_CONTENT in content else next(iter(content))
+        media = content[content_type] or {}
+        if "example" in media:
+            return status, content_type, media["example"]
+        for item in (media.get("examples") or {}).values():
+            if isinstance(item, dict) and "value" in item:
+                return status, content_type, item["value"]
+        return status, content_type, self.examples.example(media.get(OasField.SCHEMA))
+
+    def route(self, op_id: str) -> _Route:
+        """Get the (memoized) response details for the operation."""
+        route = self.routes.get(op_id)
+        if route is not None:
+            return route
+
+        operation = self.operations[op_id]
+        status, content_type, example = self.response_content(operation)
+        route = _Route(status=status, content_type=content_type)
+        names = self.pagination.get(op_id)
+        if names is None and operation[OasField.X_METHOD] == "get" and isinstance(example, list):
+            names = self.default_pagination
+
+        if names and names.items_property:
+            if isinstance(example, dict) and isinstance(example.get(names.items_property), list):
+                route.template = example
+                route.items = example[names.items_property]
+            elif isinstance(example, list):
+                route.template = {}
+                route.items = example
+        elif names and isinstance(example, list) and not names.next_property:
+            route.items = example
+
+        if route.items is not None:
+            # use the first item as the template for the rest
+            route.pagination = names
+            route.items = route.items[:1] * self.config.total_items if route.items else []
+            route.content_type = JSON_CONTENT
+        elif content_type is None or example is None:
+            route.body = b""
+        elif "json" in content_type:
+            route.body = json.dumps(example).encode()
+        else:
+            route.body = str(example).encode()
+
+        self.routes[op_id] = route
+        return route
+
+    def page(self, route: _Route, host: str, path: str, query: list[tuple[str, str]]) -> MockResponse:
+        """Get the response with a page of items, and the location of the next page."""
+        names = route.pagination
+        params = dict(query)
+
+        def int_param(name: Optional[str], default: int) -> int:
+            try:
+                return max(int(params[name]), 0) if name in params else default
+            except ValueError:
+                return default
+
+        size = int_param(names.page_size, self.config.page_size) or len(route.items)
+        if names.page_start:
+            start = int_param(names.page_start, 0) * size
+        elif names.item_start:
+            start = int_param(names.item_start, 0)
+        else:
+            start = int_param(CURSOR_PARAM, 0)
+        end = start + size
+        items = route.items[start:end]
+
+        headers = {"Content-Type": JSON_CONTENT}
+        next_url = None
+        if end < len(route.items):
+            if names.page_start:
+                params[names.page_start] = str(int_param(names.page_start, 0) + 1)
+            elif names.item_start:
+                params[names.item_start] = str(end)
+            else:
+                params[CURSOR_PARAM] = str(end)
+            next_url = f"http://{host}{path}?{urlencode(params)}"
+            if names.next_header:
+                headers[names.next_header] = next_url
+
+        if route.template is None:
+            data = items
+        else:
+            data = dict(route.template)
+            data[names.items_property] = items
+            if names.next_property:
+                data[names.next_property] = next_url
+        return MockResponse(route.status, json.dumps(data).encode(), headers)
+
+    def response(self, method: str, target: str, host: str = "localhost") -> MockResponse:
+        """Get the response for the request (without the latency)."""
+        self.stats.requests += 1
+        parts = urlsplit(target)
+        found = self.router.match(parts.path)
+        if found is None:
+            self.stats.unmatched += 1
+            return MockResponse(HTTPStatus.NOT_FOUND.value, error_body(f"No path matches {parts.path}"))
+        op_id = found.operation(method)
+        if op_id is None:
+            self.stats.unmatched += 1
+            return MockResponse(HTTPStatus.METHOD_NOT_ALLOWED.value, error_body(f"{method} is not supported"))
+
+        self.stats.operations[op_id] = self.stats.operations.get(op_id, 0) + 1
+        if self.config.error_rate and self.random.random() < self.config.error_rate:
+            self.stats.errors += 1
+            return MockResponse(self.config.error_status, error_body("Injected error"), op_id=op_id)
+
+        route = self.route(op_id)
+        if route.pagination is not None:
+            result = self.page(route, host, parts.path, parse_qsl(parts.query))
+        else:
+            headers = {"Content-Type": route.content_type} if route.body else {}
+            result = MockResponse(route.status, route.body, headers)
+        result.op_id = op_id
+        return result
+
+    def delay(self) -> float:
+        """Get the number of seconds to wait before responding."""
+        if not self.config.jitter:
+            return self.config.latency
+        return self.config.latency + self.random.uniform(0, self.config.jitter)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the HTTP/1.1 requests from a connection until it is closed."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    writer.write(MockResponse(HTTPStatus.BAD_REQUEST.value).encode(keep_alive=False))
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                response = self.response(method.upper(), target, headers.get("host", "localhost"))
+                delay = self.delay()
+                if delay:
+                    await asyncio.sleep(delay)
+                writer.write(response.encode(keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Start serving on the host/port (port 0 picks a free port)."""
+        return await asyncio.start_server(self.handle, host, port, backlog=1024)
+
+
+async def serve(mock: MockServer, host: str, port: int, started: Optional[Callable[[str], None]] = None) -> None:
+    """Run the mock server until cancelled, calling started() with the base URL once listening."""
+    server = await mock.start(host, port)
+    address = server.sockets[0].getsockname()
+    if started:
+        started(f"http://{address[0]}:{address[1]}")
+    async with server:
+        await server.serve_forever()
@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """Implement the 'oas' CLI with options for analyzing and modifying OpenAPI specs."""
+import asyncio
+import csv
+import json
 import os
+import sys
 from copy import deepcopy
+from dataclasses import asdict
 from enum import Enum
 from pathlib import Path
 from typing import Annotated
@@ -14,9 +19,46 @@ from rich.console import Console
 
 from openapi_spec_tools._typer import OasFilenameArgument
 from openapi_spec_tools._typer import error_out
+from openapi_spec_tools.batch import COMMON_METHODS
+from openapi_spec_tools.batch import SUMMARY_COLUMNS
+from openapi_spec_tools.batch import FileResult
+from openapi_spec_tools.batch import analyze_files
+from openapi_spec_tools.batch import content_type_rows
+from openapi_spec_tools.batch import expand_filenames
+from openapi_spec_tools.batch import is_pattern
+from openapi_spec_tools.batch import model_rows
+from openapi_spec_tools.batch import operation_rows
+from openapi_spec_tools.batch import summary_rows
+from openapi_spec_tools.batch import totals
+from openapi_spec_tools.complexity import Complexity
+from openapi_spec_tools.complexity import ComplexityCalculator
+from openapi_spec_tools.complexity import sort_complexity
+from openapi_spec_tools.coverage import count_operations
+from openapi_spec_tools.lazy_json import LazyJsonDocument
+from openapi_spec_tools.lint import RULES
+from openapi_spec_tools.lint import LintResult
+from openapi_spec_tools.lint import Severity
+from openapi_spec_tools.lint import lint_files
+from openapi_spec_tools.lint import to_sarif
+from openapi_spec_tools.lint import total_stats
+from openapi_spec_tools.mock import MockConfig
+from openapi_spec_tools.mock import MockServer
+from openapi_spec_tools.mock import PageStyle
+from openapi_spec_tools.mock import layout_file_pagination
+from openapi_spec_tools.mock import serve
+from openapi_spec_tools.stats import SizeStat
+from openapi_spec_tools.stats import load_with_timings
+from openapi_spec_tools.stats import spec_stats
+from openapi_spec_tools.synth import SUPPORTED_VERSIONS
+from openapi_spec_tools.synth import SynthConfig
+from openapi_spec_tools.synth import synthesize
+from openapi_spec_tools.synth import synthesize_layout
 from openapi_spec_tools.types import OasField
 from openapi_spec_tools.utils import count_values
+from openapi_spec_tools.utils import create_router
+from openapi_spec_tools.utils import dereference
 from openapi_spec_tools.utils import find_diffs
+from openapi_spec_tools.utils import find_duplicate_models
 from openapi_spec_tools.utils import find_paths
 from openapi_spec_tools.utils import find_references
 from openapi_spec_tools.utils import map_content_types
@@ -26,16 +68,27 @@ from openapi_spec_tools.utils import model_filter
 from openapi_spec_tools.utils import model_full_name
 from openapi_spec_tools.utils import model_references
 from openapi_spec_tools.utils import models_referenced_by
+from openapi_spec_tools.utils import names_containing
 from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.utils import operation_table
+from openapi_spec_tools.utils import remove_duplicate_models
 from openapi_spec_tools.utils import remove_property
 from openapi_spec_tools.utils import remove_schema_tags
+from openapi_spec_tools.utils import remove_unused_models
 from openapi_spec_tools.utils import schema_operations_filter
 from openapi_spec_tools.utils import set_nullable_not_required
 from openapi_spec_tools.utils import unmap_models
 from openapi_spec_tools.utils import unroll
+from openapi_spec_tools.utils import unused_models
+from openapi_spec_tools.validate import DEFAULT_MAX_ERRORS
+from openapi_spec_tools.validate import oas_version
+from openapi_spec_tools.validate import validate_spec
 
 INDENT = "    "
 
+# use the (much faster) C implementation when available
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def short_filename(long: str) -> str:
     """Shorten the filename to just the name portion."""
@@ -79,13 +132,20 @@ def remove_dict_prefix(map: dict[str, Any]) -> dict[str, Any]:
     return {k.replace(prefix, ""): v for k, v in map.items()}
 
 
-def open_oas_with_error_handling(filename: str) -> Any:
+def open_oas_with_error_handling(filename: str, sections: Optional[list[str]] = None) -> Any:
     """Perform error handling around opening an OpenAPI spec.
 
-    Avoids the standard Typer error handling that is quite verbose.
+    Avoids the standard Typer error handling that is quite verbose. When the sections are provided,
+    only those top-level sections of a JSON spec get decoded (the others are not available).
     """
     try:
-        return open_oas(filename)
+        spec = open_oas(filename, lazy=bool(sections))
+        if isinstance(spec, LazyJsonDocument):
+            # only the requested sections are needed, so the file can be released once they are decoded
+            with spec:
+                for name in sections:
+                    spec.get(name)
+        return spec
     except FileNotFoundError:
         message = f"failed to find {filename}"
     except Exception as ex:
@@ -96,6 +156,101 @@ def open_oas_with_error_handling(filename: str) -> Any:
     raise typer.Exit(1)
 
 
+class OutputFormat(str, Enum):
+    """Formats for displaying tabular results."""
+
+    TEXT = "text"
+    CSV = "csv"
+    JSON = "json"
+
+
+class LintFormat(str, Enum):
+    """Formats for displaying the lint results."""
+
+    TEXT = "text"
+    JSON = "json"
+    SARIF = "sarif"
+
+
+# Arguments/options for the commands that analyze many files (files, directories or glob patterns)
+MoreFilenamesArgument = Annotated[
+    Optional[list[str]],
+    typer.Argument(show_default=False, help="More files, directories or glob patterns (for analyzing many specs)"),
+]
+WorkersOption = Annotated[Optional[int], typer.Option(min=1, help="Number of worker processes [default: CPUs]")]
+FormatOption = Annotated[
+    OutputFormat,
+    typer.Option("--format", case_sensitive=False, help="Output format (text for single file is the classic display)"),
+]
+
+
+def batch_filenames(filename: str, more: Optional[list[str]], output_format: OutputFormat) -> Optional[list[str]]:
+    """Get the files to analyze as a batch, or None when displaying a single file the classic way."""
+    names = [filename] + (more or [])
+    if len(names) == 1 and not is_pattern(filename) and output_format == OutputFormat.TEXT:
+        return None
+
+    filenames = expand_filenames(names)
+    if not filenames:
+        error_out(f"failed to find any files matching {', '.join(names)}")
+    return filenames
+
+
+def _cell(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def batch_output(
+    results: list[FileResult],
+    columns: list[str],
+    output_format: OutputFormat,
+    noun: str,
+    total_row: bool = False,
+) -> None:
+    """Display the merged results with a row per file (or item), and the aggregate totals.
+
+    Files that could not be analyzed are reported at the end, and result in a non-zero exit code.
+    """
+    summary = totals(results)
+    errors = [r for r in results if r.error]
+    if output_format == OutputFormat.JSON:
+        data = {
+            "files": [
+                {"filename": r.filename, "error": r.error} if r.error else {"filename": r.filename, "rows": r.rows}
+                for r in results
+            ],
+            "totals": summary,
+        }
+        print(json.dumps(data, indent=len(INDENT)))
+    elif output_format == OutputFormat.CSV:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(["filename"] + columns)
+        for item in results:
+            for row in item.rows:
+                writer.writerow([item.filename] + [row.get(c) for c in columns])
+        if total_row:
+            writer.writerow(["total"] + [summary.get(c) for c in columns])
+    else:
+        console = console_factory()
+        headers = ["File"] + [c.replace("_", " ").title() for c in columns]
+        rows = [[item.filename] + [_cell(row.get(c)) for c in columns] for item in results for row in item.rows]
+        if total_row:
+            rows.append([f"Total ({summary['files']} files)"] + [_cell(summary.get(c)) for c in columns])
+        widths = [max(len(x) for x in column) for column in zip(headers, *rows)]
+        numeric = [False] + [total_row for _ in columns]
+        for row in [headers] + rows:
+            cells = [f"{v:>{w}}" if n else f"{v:{w}}" for v, w, n in zip(row, widths, numeric)]
+            console.print(f"{INDENT}{'  '.join(cells).rstrip()}", highlight=False, soft_wrap=True)
+        if not total_row:
+            console.print(f"Found {summary['rows']} {noun} in {summary['files']} files")
+
+    if errors:
+        console = Console(file=sys.stderr) if output_format != OutputFormat.TEXT else console_factory()
+        for item in errors:
+            console.print(f"[red]ERROR:[/red] {item.filename}: {item.error}")
+        raise typer.Exit(1)
+
+
 #################################################
 # Top-level stuff
 app = typer.Typer(
@@ -110,7 +265,7 @@ app = typer.Typer(
 def info(
     filename: OasFilenameArgument,
 ) -> None:
-    spec = open_oas_with_error_handling(filename)
+    spec = open_oas_with_error_handling(filename, sections=["info"])
 
     info = spec.get("info", {})
     console = console_factory()
@@ -121,39 +276,31 @@ def info(
 @app.command("summary", short_help="Display summary of OAS data")
 def summary(
     filename: OasFilenameArgument,
+    more_filenames: MoreFilenamesArgument = None,
+    workers: WorkersOption = None,
+    output_format: FormatOption = OutputFormat.TEXT,
 ) -> None:
-    spec = open_oas_with_error_handling(filename)
-    method_count = {
-        'get': 0,
-        'put': 0,
-        'patch': 0,
-        'delete': 0,
-        'post': 0,
-    }
-    path_count = 0
-    model_count = len(map_models(spec.get(OasField.COMPONENTS, {})))
-    tag_count = {}
-
-    for path_data in spec.get(OasField.PATHS, {}).values():
-        path_count += 1
-        for method, operation in path_data.items():
-            if method == OasField.PARAMS:
-                continue
+    filenames = batch_filenames(filename, more_filenames, output_format)
+    if filenames:
+        results = analyze_files(filenames, summary_rows, workers)
+        batch_output(results, SUMMARY_COLUMNS, output_format, "specs", total_row=True)
+        return
 
-            method_count[method] += 1
-            for tag in operation.get(OasField.TAGS, []):
-                orig = tag_count.get(tag, 0)
-                tag_count[tag] = orig + 1
+    spec = open_oas_with_error_handling(filename)
+    counts = summary_rows(spec)[0]
+    tag_counts = counts.pop("tag_counts")
+    methods = {k: v for k, v in counts.items() if k not in ("models", "paths", "operations", "tags")}
+    methods = {k: v for k, v in methods.items() if v or k in COMMON_METHODS}
 
     console = console_factory()
     console.print(f"OpenAPI spec ({short_filename(filename)}):")
-    console.print(f"{INDENT}Models: {model_count}")
-    console.print(f"{INDENT}Paths: {path_count}")
-    console.print(f"{INDENT}Operation methods ({sum(method_count.values())}):")
-    for k, v in method_count.items():
+    console.print(f"{INDENT}Models: {counts['models']}")
+    console.print(f"{INDENT}Paths: {counts['paths']}")
+    console.print(f"{INDENT}Operation methods ({counts['operations']}):")
+    for k, v in methods.items():
         console.print(f"{INDENT * 2}{k}: {v}")
-    console.print(f"{INDENT}Tags ({len(tag_count)}) with operation counts:")
-    for k, v in tag_count.items():
+    console.print(f"{INDENT}Tags ({counts['tags']}) with operation counts:")
+    for k, v in tag_counts.items():
         console.print(f"{INDENT * 2}{k}: {v}")
 
     return
@@ -200,6 +347,14 @@ def update(
         typer.Option(help="Remove 'nullable' properties from required list"),
     ] = False,
     remove_all_tags: Annotated[bool, typer.Option(help="Remove all tags")] = False,
+    dedupe_models: Annotated[
+        bool,
+        typer.Option(help="Merge identical models, and update the references"),
+    ] = False,
+    prune_unused: Annotated[
+        bool,
+        typer.Option(help="Remove models that are not used by any operation"),
+    ] = False,
     remove_operations: Annotated[
         Optional[list[str]],
         typer.Option("--remove-op", show_default=False, help="List of operations to remove"),
@@ -242,11 +397,25 @@ def update(
     if allowed_operations:
         updated = schema_operations_filter(updated, allow=set(allowed_operations))
 
+    duplicates = {}
+    if dedupe_models:
+        models = map_models(updated.get(OasField.COMPONENTS, {}))
+        duplicates = find_duplicate_models(models)
+        saved = sum(len(json.dumps(models[name], default=str)) for name in duplicates)
+        updated = remove_duplicate_models(updated, duplicates)
+
+    if prune_unused:
+        updated = remove_unused_models(updated)
+
     if updated_filename:
         with open(updated_filename, "w", encoding="utf-8", newline="\n") as fp:
             yaml.dump(updated, fp, indent=indent)
 
     console = console_factory()
+    if duplicates and display_option in (DisplayOption.SUMMARY, DisplayOption.DIFF):
+        kept = len(set(duplicates.values()))
+        console.print(f"Merged {len(duplicates)} duplicate models into {kept} models (saved {saved} bytes)")
+
     diffs = find_diffs(old_spec, updated)
     if display_option == DisplayOption.NONE:
         pass
@@ -263,6 +432,301 @@ def update(
     return
 
 
+def write_spec(spec: dict[str, Any], filename: Optional[str], indent: int) -> None:
+    """Write the spec to the file (or standard output).
+
+    The output is streamed, rather than building a (potentially huge) string. Files ending with
+    'json' are written as JSON, and everything else is YAML.
+    """
+    def _write(fp: Any) -> None:
+        if filename and filename.endswith("json"):
+            json.dump(spec, fp, indent=indent)
+            fp.write("\n")
+        else:
+            yaml.dump(spec, fp, Dumper=YamlDumper, indent=indent, sort_keys=False)
+
+    if not filename:
+        _write(sys.stdout)
+        return
+
+    with open(filename, "w", encoding="utf-8", newline="\n") as fp:
+        _write(fp)
+
+
+@app.command("bundle", short_help="Combine a multi-file OpenAPI spec into a single file")
+def bundle(
+    filename: OasFilenameArgument,
+    output: Annotated[
+        Optional[str],
+        typer.Option("--output", "-o", show_default=False, help="Output filename (default is standard output)"),
+    ] = None,
+    dereference_refs: Annotated[
+        bool,
+        typer.Option("--dereference", help="Replace references with the referenced objects"),
+    ] = False,
+    max_size: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-inline-size",
+            min=1,
+            show_default=False,
+            help="Keep references to objects with more than this many nodes (when dereferencing)",
+        ),
+    ] = None,
+    indent: Annotated[
+        int,
+        typer.Option(min=1, max=10, help="Number of characters to indent"),
+    ] = len(INDENT),
+) -> None:
+    spec = open_oas_with_error_handling(filename)
+    if dereference_refs:
+        # shared objects are written once (as YAML anchors), and cyclic references are kept
+        spec = dereference(spec, max_size=max_size)
+
+    write_spec(spec, output, indent)
+
+
+def _lint_totals(results: list[LintResult]) -> dict[str, int]:
+    totals = {"files": len(results), "file_errors": sum(1 for r in results if r.error), "findings": 0}
+    totals.update({severity.name.lower(): 0 for severity in Severity})
+    for result in results:
+        totals["findings"] += len(result.findings)
+        for item in result.findings:
+            totals[item.severity.name.lower()] += 1
+    return totals
+
+
+@app.command("lint", short_help="Check the OpenAPI spec(s) using the lint rules")
+def lint(
+    filename: OasFilenameArgument,
+    more_filenames: MoreFilenamesArgument = None,
+    rules: Annotated[
+        Optional[list[str]],
+        typer.Option("--rule", show_default=False, help=f"Only run the specified rule(s): {', '.join(RULES)}"),
+    ] = None,
+    show_stats: Annotated[bool, typer.Option("--stats", help="Show the time spent in each rule")] = False,
+    output_format: Annotated[
+        LintFormat,
+        typer.Option("--format", case_sensitive=False, help="Output format"),
+    ] = LintFormat.TEXT,
+    workers: WorkersOption = None,
+) -> None:
+    unknown = sorted(set(rules or []) - set(RULES))
+    if unknown:
+        error_out(f"unknown rule(s) {', '.join(unknown)} -- choose from {', '.join(RULES)}")
+    names = [filename] + (more_filenames or [])
+    filenames = expand_filenames(names)
+    if not filenames:
+        error_out(f"failed to find any files matching {', '.join(names)}")
+
+    results = lint_files(filenames, rules, workers)
+    summary = _lint_totals(results)
+    stats = total_stats(results)
+    failed = summary["file_errors"] > 0 or summary["error"] > 0
+
+    if output_format == LintFormat.SARIF:
+        print(json.dumps(to_sarif(results, rules), indent=len(INDENT)))
+    elif output_format == LintFormat.JSON:
+        data = {
+            "files": [r.to_dict() for r in results],
+            "stats": [asdict(s) for s in stats],
+            "totals": summary,
+        }
+        print(json.dumps(data, indent=len(INDENT)))
+    else:
+        console = console_factory()
+        for result in results:
+            if result.error:
+                console.print(f"[red]ERROR:[/red] {result.filename}: {result.error}")
+                continue
+            if not result.findings:
+                continue
+            console.print(f"{result.filename}:", highlight=False, soft_wrap=True)
+            for item in result.findings:
+                console.print(
+                    f"{INDENT}{item.severity.value:7}  {item.pointer}  {item.message} [{item.rule}]",
+                    highlight=False,
+                    markup=False,
+                    soft_wrap=True,
+                )
+        labels = ["errors", "warnings", "info"]
+        counts = ", ".join(f"{summary[s.name.lower()]} {label}" for s, label in zip(Severity, labels))
+        message = f"Found {summary['findings']} problems ({counts}) in {summary['files']} files"
+        if summary["file_errors"]:
+            message += f", {summary['file_errors']} files could not be checked"
+        console.print(message)
+        if show_stats:
+            nodes = {}
+            for result in results:
+                for kind, count in result.nodes.items():
+                    nodes[kind] = nodes.get(kind, 0) + count
+            console.print("Nodes: " + ", ".join(f"{count} {kind}" for kind, count in nodes.items()))
+            width = max([len("Rule")] + [len(s.rule) for s in stats])
+            console.print(f"{INDENT}{'Rule':{width}}  {'Calls':>8}  {'Seconds':>9}  {'Findings':>8}")
+            for item in stats:
+                console.print(
+                    f"{INDENT}{item.rule:{width}}  {item.calls:>8}  {item.seconds:>9.4f}  {item.findings:>8}"
+                )
+
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command("validate", short_help="Check the OpenAPI spec structure (OAS 3.0/3.1)")
+def validate(
+    filename: OasFilenameArgument,
+    max_errors: Annotated[
+        int,
+        typer.Option("--max-errors", min=1, help="Stop after finding this many problems"),
+    ] = DEFAULT_MAX_ERRORS,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option("--format", case_sensitive=False, help="Output format"),
+    ] = OutputFormat.TEXT,
+) -> None:
+    spec = open_oas_with_error_handling(filename)
+    violations = validate_spec(spec, max_errors=max_errors)
+    version = oas_version(spec)
+
+    if output_format == OutputFormat.JSON:
+        data = {"filename": filename, "version": version, "problems": [v.to_dict() for v in violations]}
+        print(json.dumps(data, indent=len(INDENT)))
+    elif output_format == OutputFormat.CSV:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(["pointer", "message"])
+        for item in violations:
+            writer.writerow([item.pointer, item.message])
+    else:
+        console = console_factory()
+        name = short_filename(filename)
+        if not violations:
+            console.print(f"{name} is a valid OpenAPI {version} spec", highlight=False)
+        else:
+            limit = " (stopped at the maximum)" if len(violations) >= max_errors else ""
+            console.print(f"Found {len(violations)} problems in {name}{limit}:", highlight=False)
+            for item in violations:
+                console.print(f"{INDENT}{item.pointer}: {item.message}", highlight=False, markup=False, soft_wrap=True)
+
+    if violations:
+        raise typer.Exit(1)
+
+
+@app.command("mock", short_help="Serve mock responses for the operations in the OpenAPI spec")
+def mock(
+    filename: OasFilenameArgument,
+    host: Annotated[str, typer.Option(help="Address to listen on")] = "127.0.0.1",
+    port: Annotated[int, typer.Option(help="Port to listen on (0 picks a free port)")] = 8080,
+    layout: Annotated[
+        Optional[str],
+        typer.Option(show_default=False, help="CLI layout file with the pagination for the operations"),
+    ] = None,
+    page_style: Annotated[
+        Optional[PageStyle],
+        typer.Option(show_default=False, help="Pagination for the other GET operations that return lists"),
+    ] = None,
+    page_size: Annotated[int, typer.Option(min=1, help="Items per page, when not requested")] = 20,
+    items: Annotated[int, typer.Option(min=0, help="Number of items in each paginated list")] = 100,
+    latency: Annotated[float, typer.Option(min=0.0, help="Milliseconds to wait before each response")] = 0.0,
+    jitter: Annotated[float, typer.Option(min=0.0, help="Maximum random milliseconds added to the latency")] = 0.0,
+    error_rate: Annotated[
+        float,
+        typer.Option(min=0.0, max=1.0, help="Fraction of the requests that get an error response"),
+    ] = 0.0,
+    error_status: Annotated[int, typer.Option(help="HTTP status code for the injected errors")] = 500,
+    seed: Annotated[Optional[int], typer.Option(show_default=False, help="Seed for repeatable jitter/errors")] = None,
+) -> None:
+    spec = open_oas_with_error_handling(filename)
+    pagination = None
+    if layout:
+        try:
+            pagination = layout_file_pagination(layout)
+        except Exception as ex:
+            error_out(f"failed to load layout {layout}: {ex}")
+
+    config = MockConfig(
+        latency=latency / 1000,
+        jitter=jitter / 1000,
+        error_rate=error_rate,
+        error_status=error_status,
+        total_items=items,
+        page_size=page_size,
+        seed=seed,
+    )
+    server = MockServer(spec, config, pagination=pagination, page_style=page_style)
+    console = console_factory()
+
+    def started(url: str) -> None:
+        console.print(f"Serving {len(server.operations)} operations from {short_filename(filename)} at {url}")
+
+    try:
+        asyncio.run(serve(server, host, port, started))
+    except KeyboardInterrupt:
+        pass
+    except OSError as ex:
+        error_out(f"unable to listen on {host}:{port}: {ex}")
+
+    stats = server.stats
+    console.print(f"Served {stats.requests} requests ({stats.errors} injected errors, {stats.unmatched} unmatched)")
+
+
+@app.command("synth", short_help="Generate a synthetic OpenAPI spec (for testing at scale)")
+def synth(
+    paths: Annotated[int, typer.Option(min=1, help="Number of paths")] = 100,
+    models: Annotated[int, typer.Option(min=1, help="Number of models (component schemas)")] = 200,
+    depth: Annotated[int, typer.Option(min=1, help="Number of levels of nested models")] = 3,
+    fanout: Annotated[int, typer.Option(min=0, help="Number of references from each model to the next level")] = 3,
+    cycles: Annotated[bool, typer.Option("--cycles/--no-cycles", help="Include recursive models")] = False,
+    tags: Annotated[
+        Optional[int],
+        typer.Option(min=1, show_default=False, help="Number of tags (default is one per 25 paths)"),
+    ] = None,
+    seed: Annotated[int, typer.Option(help="Seed for the random choices (same seed gives the same spec)")] = 0,
+    version: Annotated[
+        str,
+        typer.Option("--openapi-version", help=f"OpenAPI version: {', '.join(SUPPORTED_VERSIONS)}"),
+    ] = SUPPORTED_VERSIONS[0],
+    output: Annotated[
+        Optional[str],
+        typer.Option("--output", "-o", show_default=False, help="Output filename (default is standard output)"),
+    ] = None,
+    layout: Annotated[
+        Optional[str],
+        typer.Option(show_default=False, help="Also write a CLI layout file (for cli-gen)"),
+    ] = None,
+    indent: Annotated[
+        int,
+        typer.Option(min=1, max=10, help="Number of characters to indent"),
+    ] = len(INDENT),
+) -> None:
+    config = SynthConfig(
+        paths=paths,
+        models=models,
+        depth=depth,
+        fanout=fanout,
+        cycles=cycles,
+        tags=tags,
+        seed=seed,
+        version=version,
+    )
+    try:
+        spec = synthesize(config)
+    except ValueError as ex:
+        error_out(str(ex))
+
+    write_spec(spec, output, indent)
+    if layout:
+        with open(layout, "w", encoding="utf-8", newline="\n") as fp:
+            yaml.dump(synthesize_layout(spec), fp, Dumper=YamlDumper, indent=indent, sort_keys=False)
+
+    if output:
+        operations = map_operations(spec.get(OasField.PATHS, {}))
+        console = console_factory()
+        console.print(
+            f"Wrote {len(spec[OasField.PATHS])} paths, {len(operations)} operations and "
+            f"{len(spec[OasField.COMPONENTS][OasField.SCHEMAS])} models to {output}"
+        )
+
+
 ##########################################
 # Analyze
 analyze_typer = typer.Typer(no_args_is_help=True, short_help="Tools for analyzing an OAS file")
@@ -282,14 +746,20 @@ def operation_list(
         Optional[str],
         typer.Option("--contains", help="Search for this value in the operation names"),
     ] = None,
+    workers: WorkersOption = None,
+    output_format: FormatOption = OutputFormat.TEXT,
+    more_filenames: MoreFilenamesArgument = None,
 ) -> None:
+    filenames = batch_filenames(filename, more_filenames, output_format)
+    if filenames:
+        results = analyze_files(filenames, operation_rows, workers, search=search)
+        batch_output(results, ["operation"], output_format, "operations")
+        return
+
     spec = open_oas_with_error_handling(filename)
 
-    operations = map_operations(spec.get(OasField.PATHS, {}))
-    names = sorted(operations.keys())
-    if search:
-        needle = search.lower()
-        names = [_ for _ in names if needle in _.lower()]
+    operations = operation_table(spec.get(OasField.PATHS, {}))
+    names = sorted(names_containing(operations, search) if search else operations.keys())
 
     console = console_factory()
     match_info = f" matching '{search}'" if search else ""
@@ -356,6 +826,51 @@ def operation_models(
     return
 
 
+def _complexity_rows(console: Console, title: str, items: list[tuple[str, Complexity]]) -> None:
+    """Print a table of the complexity items."""
+    console.print(title)
+    width = max(len(name) for name, _ in items)
+    console.print(f"{INDENT}{'Name':{width}}  {'Nodes':>9}  {'Depth':>9}  {'Fan-out':>7}")
+    for name, value in items:
+        nodes = "unbounded" if value.unbounded else value.nodes
+        depth = "unbounded" if value.unbounded else value.depth
+        console.print(f"{INDENT}{name:{width}}  {nodes:>9}  {depth:>9}  {value.fan_out:>7}")
+
+
+@op_typer.command(name="complexity", short_help="Show the operations with the largest expanded schemas")
+def operation_complexity(
+    filename: OasFilenameArgument,
+    max_size: Annotated[
+        int,
+        typer.Option("--top", min=0, help="Maximum number of operations (and models) to show, 0 for all"),
+    ] = 10,
+    include_models: Annotated[bool, typer.Option("--models", help="Include the model complexity")] = False,
+    as_json: Annotated[bool, typer.Option("--json", help="Display the results as JSON")] = False,
+) -> None:
+    spec = open_oas_with_error_handling(filename)
+
+    calculator = ComplexityCalculator(spec)
+    results = {"operations": sort_complexity(calculator.operation_complexity())}
+    if include_models:
+        results["models"] = sort_complexity(calculator.model_complexity())
+    if max_size:
+        results = {k: v[:max_size] for k, v in results.items()}
+
+    if as_json:
+        data = {k: {name: value.to_dict() for name, value in v} for k, v in results.items()}
+        print(json.dumps(data, indent=len(INDENT)))
+        return
+
+    console = console_factory()
+    for kind, items in results.items():
+        if not items:
+            console.print(f"No {kind} found")
+            continue
+        _complexity_rows(console, f"Largest {len(items)} {kind} (with references expanded):", items)
+
+    return
+
+
 ##########################################
 # Paths
 path_typer = typer.Typer(no_args_is_help=True, short_help="Inspect things related to paths")
@@ -374,7 +889,7 @@ def paths_list(
     search: PathSearchOption = None,
     include_subpaths: PathSubpathOption = False,
 ) -> None:
-    spec = open_oas_with_error_handling(filename)
+    spec = open_oas_with_error_handling(filename, sections=[OasField.PATHS])
 
     paths = find_paths(spec.get(OasField.PATHS, {}), search, include_subpaths)
     names = sorted(paths.keys())
@@ -451,6 +966,37 @@ def paths_operations(
     return
 
 
+@path_typer.command(name="match", short_help="Find the path and operations that handle the URL")
+def paths_match(
+    filename: OasFilenameArgument,
+    url: Annotated[str, typer.Argument(show_default=False, help="URL (or path) to match, e.g. /v1/pets/123")],
+    method: Annotated[Optional[str], typer.Option(show_default=False, help="Only show this method operation")] = None,
+) -> None:
+    spec = open_oas_with_error_handling(filename)
+
+    router = create_router(spec)
+    found = router.match(url)
+    if not found:
+        error_out(f"no path matches {url}")
+
+    operations = found.operations
+    if method:
+        op_id = found.operation(method)
+        if not op_id:
+            error_out(f"no {method.upper()} operation for {found.path}")
+        operations = {method.lower(): op_id}
+
+    result = {
+        found.path: {
+            "parameters": found.params,
+            "operations": operations,
+        }
+    }
+    console = console_factory()
+    console.print(yaml.dump(result, indent=len(INDENT), sort_keys=False))
+    return
+
+
 ##########################################
 # Models
 models_typer = typer.Typer(no_args_is_help=True, short_help="Inspect things related to models")
@@ -463,14 +1009,20 @@ def models_list(
         Optional[str],
         typer.Option("--contains", help="Search for this value in the model names"),
     ] = None,
+    workers: WorkersOption = None,
+    output_format: FormatOption = OutputFormat.TEXT,
+    more_filenames: MoreFilenamesArgument = None,
 ) -> None:
+    filenames = batch_filenames(filename, more_filenames, output_format)
+    if filenames:
+        results = analyze_files(filenames, model_rows, workers, search=search)
+        batch_output(results, ["model"], output_format, "models")
+        return
+
     spec = open_oas_with_error_handling(filename)
 
     models = map_models(spec.get(OasField.COMPONENTS, {}))
-    names = sorted(models.keys())
-    if search:
-        needle = search.lower()
-        names = [_ for _ in names if needle in _.lower()]
+    names = sorted(names_containing(models, search) if search else models.keys())
 
     console = console_factory()
     match_info = f" matching '{search}'" if search else ""
@@ -596,6 +1148,24 @@ def models_operations(
     return
 
 
+@models_typer.command(name="unused", short_help="List models that are not used by any operation")
+def models_unused(
+    filename: OasFilenameArgument,
+) -> None:
+    spec = open_oas_with_error_handling(filename)
+
+    names = sorted(unused_models(spec))
+    console = console_factory()
+    if not names:
+        console.print("No unused models found")
+    else:
+        console.print(f"Found {len(names)} unused models:")
+        for n in remove_list_prefix(names):
+            console.print(f"{INDENT}{n}")
+
+    return
+
+
 ##########################################
 # Tags
 tag_typer = typer.Typer(no_args_is_help=True, short_help="Inspect things related to tags")
@@ -606,7 +1176,7 @@ def tags_list(
     filename: OasFilenameArgument,
     search: Annotated[Optional[str], typer.Option("--contains", help="Search for this value in the tag names")] = None,
 ) -> None:
-    spec = open_oas_with_error_handling(filename)
+    spec = open_oas_with_error_handling(filename, sections=[OasField.PATHS])
 
     # NOTE: not all OAS's include a "tags" section, so walk the operations
 
@@ -619,10 +1189,7 @@ def tags_list(
             for t in operation.get(OasField.TAGS):
                 tags.add(t)
 
-    names = sorted(tags)
-    if search:
-        needle = search.lower()
-        names = [_ for _ in names if needle in _.lower()]
+    names = sorted(names_containing(tags, search) if search else tags)
 
     console = console_factory()
     match_info = f" matching '{search}'" if search else ""
@@ -641,7 +1208,7 @@ def tags_show(
     filename: OasFilenameArgument,
     tag_name: Annotated[str, typer.Argument(help="Name of the tag to show")],
 ) -> None:
-    spec = open_oas_with_error_handling(filename)
+    spec = open_oas_with_error_handling(filename, sections=[OasField.PATHS])
 
     operations = {}
     for path, path_data in spec.get(OasField.PATHS, {}).items():
@@ -676,9 +1243,21 @@ analyze_typer.add_typer(content_typer, name="content")
 @content_typer.command("list", short_help="List operations by response content-type")
 def content_type_list(
     filename: OasFilenameArgument,
-    max_size: Annotated[int, typer.Option(help="Maximum number of operations to show")] = 10,
+    max_size: Annotated[
+        int,
+        typer.Option(help="Maximum number of operations to show (ignored for many files)"),
+    ] = 10,
     content_type: Annotated[Optional[str], typer.Option(help="Only display for specified content type")] = None,
+    workers: WorkersOption = None,
+    output_format: FormatOption = OutputFormat.TEXT,
+    more_filenames: MoreFilenamesArgument = None,
 ) -> None:
+    filenames = batch_filenames(filename, more_filenames, output_format)
+    if filenames:
+        results = analyze_files(filenames, content_type_rows, workers, content_type=content_type)
+        batch_output(results, ["content_type", "operation"], output_format, "operations")
+        return
+
     spec = open_oas_with_error_handling(filename)
     content = map_content_types(spec)
 
@@ -699,5 +1278,117 @@ def content_type_list(
             console.print(f"    + {len(operations) - max_size} more")
 
 
+##########################################
+# Coverage
+@analyze_typer.command("coverage", short_help="Count operations used in HTTP access logs")
+def coverage(
+    filename: OasFilenameArgument,
+    log_files: Annotated[
+        list[str],
+        typer.Argument(show_default=False, help="Access logs (common/combined or JSON lines, may be gzip'd)"),
+    ],
+    max_size: Annotated[int, typer.Option("--top", help="Maximum number of hottest operations to show")] = 10,
+    workers: Annotated[Optional[int], typer.Option(min=1, help="Number of worker processes [default: CPUs]")] = None,
+) -> None:
+    spec = open_oas_with_error_handling(filename)
+    for log_file in log_files:
+        if not Path(log_file).exists():
+            error_out(f"failed to find {log_file}")
+
+    router = create_router(spec)
+    counts = count_operations(router, log_files, workers)
+    all_ops = {r.op_id for r in operation_table(spec.get(OasField.PATHS, {})).values() if r.op_id}
+    unused = sorted(all_ops - set(counts.operations.keys()))
+
+    console = console_factory()
+    console.print(
+        f"Processed {counts.lines} lines: {counts.matched} matched, {counts.unmatched} unmatched, "
+        f"{counts.unparsed} unparsed"
+    )
+    hottest = counts.operations.most_common(max_size)
+    if hottest:
+        width = max(len(op_id) for op_id, _ in hottest)
+        console.print(f"Hottest {len(hottest)} of {len(counts.operations)} used operations:")
+        for op_id, count in hottest:
+            console.print(f"{INDENT}{op_id:{width}}  {count}")
+    if unused:
+        console.print(f"Unused {len(unused)} of {len(all_ops)} operations:")
+        for op_id in unused:
+            console.print(f"{INDENT}{op_id}")
+    else:
+        console.print(f"All {len(all_ops)} operations used")
+
+
+def _size_rows(console: Console, title: str, items: list[SizeStat]) -> None:
+    """Print a table of the size items."""
+    console.print(title)
+    width = max(len(item.name) for item in items)
+    console.print(f"{INDENT}{'Name':{width}}  {'Bytes':>9}  {'Nodes':>7}")
+    for item in items:
+        console.print(f"{INDENT}{item.name:{width}}  {item.bytes:>9}  {item.nodes:>7}")
+
+
+@analyze_typer.command("stats", short_help="Show the size of the paths, tags and components, and the load time")
+def stats(
+    filename: OasFilenameArgument,
+    max_size: Annotated[
+        int,
+        typer.Option("--top", min=0, help="Maximum number of items to show in each section, 0 for all"),
+    ] = 10,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option("--format", case_sensitive=False, help="Output format"),
+    ] = OutputFormat.TEXT,
+    parallel: Annotated[
+        bool,
+        typer.Option("--parallel-parse", help="Parse huge YAML specs in chunks using worker processes"),
+    ] = False,
+) -> None:
+    if not Path(filename).exists():
+        error_out(f"failed to find {filename}")
+    try:
+        spec, timings = load_with_timings(filename, parallel=parallel)
+    except Exception as ex:
+        error_out(f"unable to parse {filename}: {ex}")
+
+    result = spec_stats(spec)
+    sections = {
+        "paths": result.paths,
+        "tags": result.tags,
+        "components": result.components,
+        "descriptions": result.descriptions,
+    }
+    counts = {k: len(v) for k, v in sections.items()}
+    if max_size:
+        sections = {k: v[:max_size] for k, v in sections.items()}
+
+    if output_format == OutputFormat.JSON:
+        data = {"filename": filename, "timings": timings.to_dict(), "total": asdict(result.total)}
+        data.update({k: [asdict(item) for item in v] for k, v in sections.items()})
+        print(json.dumps(data, indent=len(INDENT)))
+        return
+
+    if output_format == OutputFormat.CSV:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(["section", "name", "bytes", "nodes", "seconds"])
+        for name, seconds in timings.to_dict().items():
+            writer.writerow(["timing", name, "", "", f"{seconds:.6f}"])
+        writer.writerow(["total", filename, result.total.bytes, result.total.nodes, ""])
+        for section, items in sections.items():
+            for item in items:
+                writer.writerow([section, item.name, item.bytes, item.nodes, ""])
+        return
+
+    console = console_factory()
+    console.print(f"Loaded {short_filename(filename)} in {timings.total:.3f}s:")
+    for name, seconds in timings.to_dict().items():
+        if name != "total":
+            console.print(f"{INDENT}{name}: {seconds:.3f}s")
+    console.print(f"Total size: {result.total.bytes} bytes, {result.total.nodes} nodes")
+    for section, items in sections.items():
+        if items:
+            _size_rows(console, f"Largest {len(items)} of {counts[section]} {section}:", items)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,301 @@
+"""Parallel parsing of huge YAML specs.
+
+Nearly all of a large spec is the entries of 'paths' and the sections of 'components' (e.g. the
+'schemas'). The text is split at the boundaries of those entries (found by the indentation), the
+chunks are parsed by a pool of worker processes, and the results are re-assembled into the same
+dictionary that a normal parse would produce.
+
+Splitting is only safe when each entry can be parsed on its own. The document is parsed normally
+(in a single process) when it uses anchors/aliases (which may cross the chunk boundaries), flow
+style collections spanning lines, multiple documents/directives, tabs, or any indentation that
+does not fit the expected layout.
+"""
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+
+import yaml
+
+from openapi_spec_tools.types import OasField
+
+# smaller documents are parsed normally, since the pool start-up costs more than it saves
+PARALLEL_MIN_SIZE = 1024 * 1024
+
+# smallest chunk (in characters) sent to a worker
+MIN_CHUNK_SIZE = 64 * 1024
+
+# top-level sections that get split, and the depth of the entries (e.g. components/schemas/Pet)
+SPLIT_SECTIONS = {OasField.PATHS.value: 1, OasField.COMPONENTS.value: 2}
+
+_QUOTED = re.compile(r""""(?:[^"\\]|\\.)*"|'(?:[^']|'')*'(?!')""")
+_COMMENT = re.compile(r"(?:^|\s)#.*$")
+# anchors, aliases and flow collections start a value (e.g. after "key: " or "- "), not in the middle of text
+_BLOCK_VALUE_START = r"(?:^\s*(?:-\s+)*|:\s+)"
+_VALUE_START = r"(?:^\s*(?:-\s+)*|:\s+|[\[{,]\s*)"
+_ANCHOR_OR_ALIAS = re.compile(_VALUE_START + r"(?:!\S*\s+)?[&*][^\s\]},]")
+_FLOW_START = re.compile(_BLOCK_VALUE_START + r"[\[{]")
+_OPEN_QUOTE = re.compile(_VALUE_START + r"""(["'])""")
+_QUOTE_END = {'"': re.compile(r'(?:[^"\\]|\\.)*"'), "'": re.compile(r"(?:[^']|'')*'(?!')")}
+_BLOCK_SCALAR = re.compile(r"(?:^|[\s:-])[|>][0-9+-]*$")
+_MAPPING_KEY = re.compile(r"""^(?:"(?:[^"\\]|\\.)*"|'(?:[^']|'')*'|[^\s\-?:,\[\]{}#&*!|>'"%@`][^#]*?)\s*:(?:\s|$)""")
+_KEY_ONLY = re.compile(r"""^(?:"(?:[^"\\]|\\.)*"|'(?:[^']|'')*'|[^\s\-?:,\[\]{}#&*!|>'"%@`][^#]*?)\s*:\s*(?:#.*)?$""")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """Lines [start, end) of the document containing mapping entries at the given indentation.
+
+    The parent is the list of keys where the entries belong (e.g. ["components", "schemas"]).
+    """
+
+    parent: tuple[str, ...]
+    start: int
+    end: int
+    indent: int
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _is_content(line: str) -> bool:
+    """Check if the line has content (is not blank or a comment)."""
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith("#")
+
+
+def _key_name(line: str) -> str:
+    """Get the (unquoted) key name from a "key:" line."""
+    return next(iter(yaml.safe_load(_COMMENT.sub("", line).strip())))
+
+
+def _key_indent(line: str) -> int:
+    """Get the indentation of the key on the line (e.g. 2 for "- description: |")."""
+    return len(line) - len(line.lstrip(" -"))
+
+
+def is_splittable(lines: list[str]) -> bool:
+    """Check that the document does not use YAML features that make splitting unsafe.
+
+    This is conservative: text (outside of block scalars and quoted strings) that looks like an
+    anchor/alias or an unterminated flow collection means the document is parsed normally.
+    """
+    block_indent = None
+    quote = None
+    quote_indent = 0
+    first = True
+    for line in lines:
+        if quote:
+            # the continuation lines of a quoted string must be more indented than its key
+            if line.strip() and _indent(line) <= quote_indent:
+                return False
+            end = _QUOTE_END[quote].match(line)
+            if not end:
+                continue
+            quote = None
+            text = line[end.end():]
+        else:
+            if block_indent is not None:
+                if not line.strip() or _indent(line) > block_indent:
+                    continue
+                block_indent = None
+            if "\t" in line[:_indent(line) + 1]:
+                return False
+            if line.startswith(("---", "...", "%")) and not (first and line.rstrip() == "---"):
+                return False
+            if _is_content(line):
+                first = False
+            text = line
+
+        text = _QUOTED.sub("_", text)
+        opened = _OPEN_QUOTE.search(text)
+        if opened:
+            quote = opened.group(1)
+            quote_indent = _key_indent(line)
+            text = text[:opened.start(1)]
+        text = _COMMENT.sub("", text).rstrip()
+        if _ANCHOR_OR_ALIAS.search(text):
+            return False
+        flow = _FLOW_START.search(text)
+        if flow:
+            flow_text = text[flow.end() - 1:]
+            if flow_text.count("[") + flow_text.count("{") != flow_text.count("]") + flow_text.count("}"):
+                return False
+        if not quote and _BLOCK_SCALAR.search(text):
+            # the content lines are more indented than the key
+            block_indent = _key_indent(line)
+    return quote is None
+
+
+def _entry_chunks(lines: list[str], start: int, end: int, parent: tuple[str, ...], depth: int) -> Optional[list[Chunk]]:
+    """Get the chunks for the entries in lines [start, end), or None when the layout is unexpected.
+
+    With depth > 1, each entry is a section header (e.g. "schemas:") and its entries are split.
+    """
+    content = [i for i in range(start, end) if _is_content(lines[i])]
+    if not content:
+        return []
+
+    indent = _indent(lines[content[0]])
+    entries = []
+    for i in content:
+        line_indent = _indent(lines[i])
+        if line_indent < indent:
+            return None
+        if line_indent == indent:
+            if not _MAPPING_KEY.match(lines[i][indent:]):
+                return None
+            entries.append(i)
+    entries.append(end)
+
+    if depth == 1:
+        return [Chunk(parent, entries[0], end, indent)]
+
+    result = []
+    for header, next_header in zip(entries, entries[1:]):
+        text = lines[header][indent:]
+        body = [i for i in range(header + 1, next_header) if _is_content(lines[i])]
+        if not body or not _KEY_ONLY.match(text):
+            # empty or inline sections are kept whole
+            result.append(Chunk(parent, header, next_header, indent))
+            continue
+        inner = _entry_chunks(lines, header + 1, next_header, parent + (_key_name(text),), depth - 1)
+        if inner is None:
+            return None
+        # the header line creates the section (so the order of the sections is preserved)
+        result.append(Chunk(parent, header, header + 1, indent))
+        result.extend(inner)
+    return result
+
+
+def split_document(lines: list[str]) -> Optional[tuple[list[str], list[Chunk]]]:
+    """Split the document into the skeleton lines and the chunks of the 'paths' and 'components'.
+
+    The skeleton is the document with the bodies of the split sections removed. None is returned
+    when the document cannot be split safely.
+    """
+    if not is_splittable(lines):
+        return None
+
+    # top-level sequences (e.g. "servers") may have the items in the first column
+    top = [
+        i for i, line in enumerate(lines)
+        if _is_content(line) and _indent(line) == 0 and not line.startswith("-")
+    ]
+    if not top or not all(_MAPPING_KEY.match(lines[i]) for i in top):
+        return None
+
+    skeleton = []
+    chunks = []
+    last = 0
+    for header, next_header in zip(top, top[1:] + [len(lines)]):
+        key = _key_name(lines[header]) if _KEY_ONLY.match(lines[header]) else None
+        depth = SPLIT_SECTIONS.get(key)
+        if not depth:
+            continue
+        section = _entry_chunks(lines, header + 1, next_header, (key,), depth)
+        if section is None:
+            return None
+        if section:
+            skeleton.extend(lines[last:header + 1])
+            chunks.extend(section)
+            last = next_header
+    skeleton.extend(lines[last:])
+    return skeleton, chunks
+
+
+def _chunk_text(lines: list[str], chunk: Chunk) -> str:
+    """Get the text of the chunk with the indentation removed.
+
+    Each line keeps the line break that followed it in the document (which matters for the
+    chomping of block scalars). Lines with less indentation are blank lines and comments.
+    """
+    prefix = " " * chunk.indent
+    text = "".join(
+        (line[chunk.indent:] if line.startswith(prefix) else line.lstrip()) + "\n"
+        for line in lines[chunk.start:chunk.end]
+    )
+    return text if chunk.end < len(lines) else text[:-1]
+
+
+def _parse_text(text: str) -> Any:
+    return yaml.safe_load(text)
+
+
+def _group_chunks(lines: list[str], chunks: list[Chunk], size: int) -> list[list[Chunk]]:
+    """Group consecutive chunks with the same parent, so each group has about size characters.
+
+    The large chunks (i.e. all the paths) are divided at the entry boundaries.
+    """
+    pieces = []
+    for chunk in chunks:
+        start = chunk.start
+        length = 0
+        for i in range(chunk.start, chunk.end):
+            if i > start and length >= size and _indent(lines[i]) == chunk.indent and _is_content(lines[i]):
+                pieces.append(Chunk(chunk.parent, start, i, chunk.indent))
+                start = i
+                length = 0
+            length += len(lines[i]) + 1
+        pieces.append(Chunk(chunk.parent, start, chunk.end, chunk.indent))
+
+    groups = []
+    length = size
+    for piece in pieces:
+        piece_len = sum(len(lines[i]) + 1 for i in range(piece.start, piece.end))
+        if length >= size or piece.parent != groups[-1][-1].parent or piece.indent != groups[-1][-1].indent:
+            groups.append([])
+            length = 0
+        groups[-1].append(piece)
+        length += piece_len
+    return groups
+
+
+def load_yaml(text: str, workers: Optional[int] = None, min_size: int = PARALLEL_MIN_SIZE) -> Any:
+    """Parse the YAML text, using a pool of worker processes for large specs.
+
+    The result is the same as yaml.safe_load(). Documents that are smaller than min_size, or that
+    cannot be split safely, are parsed normally.
+    """
+    workers = workers or os.cpu_count() or 1
+    if len(text) < min_size or workers <= 1:
+        return _parse_text(text)
+
+    lines = text.split("\n")
+    split = split_document(lines)
+    if split is None or not split[1]:
+        return _parse_text(text)
+
+    skeleton, chunks = split
+    groups = _group_chunks(lines, chunks, max(MIN_CHUNK_SIZE, len(text) // (workers * 4)))
+    texts = ["\n".join(skeleton)] + ["".join(_chunk_text(lines, c) for c in group) for group in groups]
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(texts))) as executor:
+            results = list(executor.map(_parse_text, texts))
+    except yaml.YAMLError:
+        results = []
+
+    if not results or not all(isinstance(r, dict) for r in results):
+        # something unexpected in the chunks, so let the normal parse report any errors
+        return _parse_text(text)
+
+    result = results[0]
+
+    for group, parsed in zip(groups, results[1:]):
+        parent = group[0].parent
+        node = result
+        for key in parent:
+            if node.get(key) is None:
+                node[key] = {}
+            node = node[key]
+        node.update(parsed)
+    return result
+
+
+def load_yaml_file(filename: str, workers: Optional[int] = None, min_size: int = PARALLEL_MIN_SIZE) -> Any:
+    """Parse the YAML file, using a pool of worker processes for large specs."""
+    with open(filename, "r", encoding="utf-8", newline="\n") as fp:
+        return load_yaml(fp.read(), workers=workers, min_size=min_size)
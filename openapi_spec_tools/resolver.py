@@ -0,0 +1,308 @@
+"""Resolution of external references (e.g. "./schemas/Pet.yaml#/Pet") for multi-file specs.
+
+Rather than teaching every consumer about other files, the external references are "internalized":
+the referenced objects are copied into the 'components' of the main document, and the references
+are rewritten to local references (e.g. "#/components/schemas/Pet"). After that, the reference
+graph, analysis commands, and CLI generation work as they would for a single file spec.
+
+Each referenced file is parsed at most once, and when many files are referenced at the same time
+they are parsed in parallel. Resolved JSON pointers are cached, so repeated references are cheap.
+
+References to remote documents (e.g. "https://example.com/schemas/Pet.yaml#/Pet") are not fetched, and
+are left untouched.
+"""
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+from typing import Optional
+from urllib.parse import unquote
+
+import yaml
+
+from openapi_spec_tools.parallel_yaml import load_yaml
+from openapi_spec_tools.types import OasField
+
+# when more files than this need loading at once, they are parsed using a process pool
+PARALLEL_THRESHOLD = 8
+
+# default component section for references found below each property
+SECTION_HINTS = {
+    "additionalProperties": "schemas",
+    "allOf": "schemas",
+    "anyOf": "schemas",
+    "callbacks": "callbacks",
+    "examples": "examples",
+    "headers": "headers",
+    "items": "schemas",
+    "links": "links",
+    "not": "schemas",
+    "oneOf": "schemas",
+    "parameters": "parameters",
+    "paths": "pathItems",
+    "properties": "schemas",
+    "requestBodies": "requestBodies",
+    "requestBody": "requestBodies",
+    "responses": "responses",
+    "schema": "schemas",
+    "schemas": "schemas",
+    "securitySchemes": "securitySchemes",
+}
+
+# properties where the keys are names (e.g. a property named "items" is not a schema keyword)
+NAME_MAPS = {
+    "callbacks",
+    "examples",
+    "headers",
+    "links",
+    "parameters",
+    "paths",
+    "properties",
+    "requestBodies",
+    "responses",
+    "schemas",
+    "securitySchemes",
+}
+
+# sections that are inlined, since there is no component for them (in OpenAPI 3.0)
+INLINE_SECTIONS = {"pathItems"}
+
+# references with a URL scheme (e.g. "https://") are to remote documents
+REMOTE_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://")
+
+
+def load_document(filename: str, parallel: bool = False) -> Any:
+    """Parse the JSON or YAML file.
+
+    When parallel is set, huge YAML files are split and parsed using a pool of worker processes.
+    """
+    with open(filename, "r", encoding="utf-8", newline="\n") as fp:
+        if filename.endswith('json'):
+            return json.load(fp)
+        if parallel:
+            return load_yaml(fp.read())
+        return yaml.safe_load(fp)
+
+
+def is_remote(ref: str) -> bool:
+    """Check if the reference is to a remote document (a URL)."""
+    return bool(REMOTE_PATTERN.match(ref))
+
+
+def is_external(ref: str) -> bool:
+    """Check if the reference is to another local document."""
+    return not ref.startswith("#") and not is_remote(ref)
+
+
+def split_reference(ref: str, base_filename: str) -> tuple[str, str]:
+    """Split the reference into the (absolute filename, JSON pointer).
+
+    The filename is relative to the file containing the reference (the base). Remote locations
+    are returned unchanged.
+    """
+    location, _, pointer = ref.partition("#")
+    if is_remote(location):
+        filename = location
+    elif location:
+        filename = os.path.normpath(os.path.join(os.path.dirname(base_filename), unquote(location)))
+    else:
+        filename = base_filename
+    return filename, unquote(pointer)
+
+
+def pointer_parts(pointer: str) -> list[str]:
+    """Get the unescaped parts of the JSON pointer."""
+    return [p.replace("~1", "/").replace("~0", "~") for p in pointer.split("/") if p]
+
+
+def resolve_pointer(document: Any, pointer: str) -> Any:
+    """Get the value at the JSON pointer location in the document."""
+    value = document
+    for part in pointer_parts(pointer):
+        if isinstance(value, list):
+            value = value[int(part)]
+        elif isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
+            raise ValueError(f"unable to find '{part}' in '{pointer}'")
+    return value
+
+
+class RefResolver:
+    """Loads referenced documents, and resolves references with caching.
+
+    Documents are loaded lazily (when referenced), and are only parsed once.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """Initialize with the (optional) maximum number of parsing processes."""
+        self.workers = workers
+        self.documents: dict[str, Any] = {}
+        self.pointers: dict[tuple[str, str], Any] = {}
+
+    def add_document(self, filename: str, document: Any) -> None:
+        """Add an already parsed document."""
+        self.documents[os.path.abspath(filename)] = document
+
+    def load(self, filenames: list[str]) -> None:
+        """Load any of the files that have not already been loaded.
+
+        When there are many files, they are parsed in parallel.
+        """
+        missing = sorted({os.path.abspath(f) for f in filenames} - set(self.documents))
+        for filename in missing:
+            if not Path(filename).exists():
+                raise ValueError(f"failed to find referenced file {filename}")
+
+        if len(missing) <= PARALLEL_THRESHOLD or self.workers == 1:
+            for filename in missing:
+                self.documents[filename] = load_document(filename)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for filename, document in zip(missing, executor.map(load_document, missing)):
+                self.documents[filename] = document
+
+    def document(self, filename: str) -> Any:
+        """Get the document (loading it when needed)."""
+        filename = os.path.abspath(filename)
+        if filename not in self.documents:
+            self.load([filename])
+        return self.documents[filename]
+
+    def resolve(self, filename: str, pointer: str) -> Any:
+        """Get the value at the pointer in the file."""
+        key = (os.path.abspath(filename), pointer)
+        if key not in self.pointers:
+            try:
+                self.pointers[key] = resolve_pointer(self.document(filename), pointer)
+            except ValueError as ex:
+                raise ValueError(f"{ex} of {filename}") from ex
+        return self.pointers[key]
+
+
+def _local_location(filename: str, pointer: str, section: str) -> tuple[str, str]:
+    """Get the (section, name) for the referenced object in the main document."""
+    parts = pointer_parts(pointer)
+    if len(parts) == 3 and parts[0] == OasField.COMPONENTS.value:
+        return parts[1], parts[2]
+    if parts:
+        return section, parts[-1]
+    return section, Path(filename).stem
+
+
+def _escape(name: str) -> str:
+    return name.replace("~", "~0").replace("/", "~1")
+
+
+class _Internalizer:
+    """Copies externally referenced objects into the main document components."""
+
+    def __init__(self, spec: dict[str, Any], filename: str, resolver: RefResolver):
+        self.spec = spec
+        self.filename = os.path.abspath(filename)
+        self.resolver = resolver
+        self.local_refs: dict[tuple[str, str], str] = {}
+        self.components = spec.setdefault(OasField.COMPONENTS.value, {})
+
+    def _local_name(self, section: str, name: str) -> str:
+        """Get a name that is not already used in the section."""
+        existing = self.components.get(section, {})
+        candidate = name
+        index = 1
+        while candidate in existing:
+            candidate = f"{name}_{index}"
+            index += 1
+        return candidate
+
+    def _find_refs(self, obj: Any, base: str, section: str) -> list[tuple[dict[str, Any], str, str]]:
+        """Get the (holder, base filename, section) for the references that need rewriting."""
+        found = []
+        stack = [(obj, section, False)]
+        while stack:
+            item, hint, names = stack.pop()
+            if isinstance(item, list):
+                stack.extend((v, hint, False) for v in item if isinstance(v, (dict, list)))
+                continue
+
+            ref = item.get(OasField.REFS.value)
+            if isinstance(ref, str) and not is_remote(ref) and (is_external(ref) or base != self.filename):
+                found.append((item, base, hint))
+            for key, value in item.items():
+                if isinstance(value, (dict, list)):
+                    child_hint = hint if names else SECTION_HINTS.get(key, hint)
+                    stack.append((value, child_hint, not names and key in NAME_MAPS))
+        return found
+
+    def _rewrite(self, holder: dict[str, Any], base: str, section: str, pending: list) -> None:
+        """Rewrite the reference in holder, copying the target into the components as needed."""
+        filename, pointer = split_reference(holder[OasField.REFS.value], base)
+        if filename == self.filename:
+            holder[OasField.REFS.value] = "#" + pointer
+            return
+
+        target = self.resolver.resolve(filename, pointer)
+        location_section, name = _local_location(filename, pointer, section)
+        if location_section in INLINE_SECTIONS:
+            value = deepcopy(target)
+            del holder[OasField.REFS.value]
+            holder.update(value)
+            pending.extend(self._find_refs(holder, filename, location_section))
+            return
+
+        key = (filename, pointer)
+        local_ref = self.local_refs.get(key)
+        if local_ref is None:
+            name = self._local_name(location_section, name)
+            local_ref = f"#/{OasField.COMPONENTS.value}/{location_section}/{_escape(name)}"
+            self.local_refs[key] = local_ref
+            value = deepcopy(target)
+            self.components.setdefault(location_section, {})[name] = value
+            pending.extend(self._find_refs(value, filename, location_section))
+        holder[OasField.REFS.value] = local_ref
+
+    def run(self) -> None:
+        pending = self._find_refs(self.spec, self.filename, "schemas")
+        while pending:
+            # load all the files referenced at this level at once (allows parallel parsing)
+            files = [split_reference(h[OasField.REFS.value], b)[0] for h, b, _ in pending]
+            self.resolver.load([f for f in files if f != self.filename])
+
+            current, pending = pending, []
+            for holder, base, section in current:
+                self._rewrite(holder, base, section, pending)
+
+        if not self.components:
+            del self.spec[OasField.COMPONENTS.value]
+
+
+def has_external_refs(spec: Any) -> bool:
+    """Check if there are any references to other documents."""
+    stack = [spec]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            ref = item.get(OasField.REFS.value)
+            if isinstance(ref, str) and is_external(ref):
+                return True
+            stack.extend(v for v in item.values() if isinstance(v, (dict, list)))
+        elif isinstance(item, list):
+            stack.extend(v for v in item if isinstance(v, (dict, list)))
+    return False
+
+
+def internalize_refs(spec: dict[str, Any], filename: str, resolver: Optional[RefResolver] = None) -> dict[str, Any]:
+    """Copy the externally referenced objects into the spec components, and make the references local.
+
+    The spec is modified in place (and returned for convenience).
+    """
+    if not has_external_refs(spec):
+        return spec
+
+    resolver = resolver or RefResolver()
+    resolver.add_document(filename, spec)
+    _Internalizer(spec, filename, resolver).run()
+    return spec
@@ -0,0 +1,169 @@
+"""Statistics about the size of an OpenAPI spec, and how long it takes to load.
+
+The sizes are the compact JSON serialization (in bytes) and the number of nodes (dictionaries,
+lists and values) for each path, tag, and component. Along with the load timings (read, parse,
+resolve, and index), these help find what makes a spec slow to process.
+"""
+import json
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+import yaml
+
+from openapi_spec_tools.parallel_yaml import load_yaml
+from openapi_spec_tools.resolver import internalize_refs
+from openapi_spec_tools.types import OasField
+from openapi_spec_tools.utils import map_models
+from openapi_spec_tools.utils import model_references
+from openapi_spec_tools.utils import operation_table
+
+
+@dataclass
+class LoadTimings:
+    """Time (in seconds) for each stage of loading the spec."""
+
+    read: float = 0.0
+    parse: float = 0.0
+    resolve: float = 0.0
+    index: float = 0.0
+
+    @property
+    def total(self) -> float:
+        """Get the total time."""
+        return self.read + self.parse + self.resolve + self.index
+
+    def to_dict(self) -> dict[str, float]:
+        """Get the dictionary (including the total)."""
+        result = asdict(self)
+        result["total"] = self.total
+        return result
+
+
+@dataclass(frozen=True)
+class SizeStat:
+    """Size of one item (e.g. path) in the spec."""
+
+    name: str
+    bytes: int
+    nodes: int
+
+
+@dataclass
+class SpecStats:
+    """Sizes for the different sections of the spec."""
+
+    total: SizeStat
+    paths: list[SizeStat] = field(default_factory=list)
+    tags: list[SizeStat] = field(default_factory=list)
+    components: list[SizeStat] = field(default_factory=list)
+    descriptions: list[SizeStat] = field(default_factory=list)
+
+
+def count_nodes(obj: Any) -> int:
+    """Count the dictionaries, lists and values in the object."""
+    count = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        count += 1
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return count
+
+
+def serialized_size(obj: Any) -> int:
+    """Get the number of bytes in the compact JSON serialization."""
+    return len(json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def size_stat(name: str, obj: Any) -> SizeStat:
+    """Get the size of the object."""
+    return SizeStat(name=name, bytes=serialized_size(obj), nodes=count_nodes(obj))
+
+
+def load_with_timings(filename: str, parallel: bool = False) -> tuple[Any, LoadTimings]:
+    """Load the spec (like open_oas()), and time each of the stages.
+
+    The index stage builds the tables used by the analysis commands (operations, models and
+    references). When parallel is set, huge YAML specs are parsed by a pool of workers.
+    """
+    timings = LoadTimings()
+    start = time.perf_counter()
+    with open(filename, "r", encoding="utf-8", newline="\n") as fp:
+        text = fp.read()
+    timings.read = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if filename.endswith("json"):
+        spec = json.loads(text)
+    else:
+        spec = load_yaml(text) if parallel else yaml.safe_load(text)
+    timings.parse = time.perf_counter() - start
+
+    if isinstance(spec, dict):
+        start = time.perf_counter()
+        spec = internalize_refs(spec, filename)
+        timings.resolve = time.perf_counter() - start
+
+        start = time.perf_counter()
+        operation_table(spec.get(OasField.PATHS, {}))
+        models = map_models(spec.get(OasField.COMPONENTS, {}))
+        model_references(models)
+        timings.index = time.perf_counter() - start
+
+    return spec, timings
+
+
+def _descriptions(spec: Any) -> list[SizeStat]:
+    """Get the size of each description, where the name is the JSON pointer location."""
+    result = []
+    stack = [("", spec)]
+    while stack:
+        location, item = stack.pop()
+        if isinstance(item, dict):
+            for key, value in item.items():
+                child = f"{location}/{str(key).replace('~', '~0').replace('/', '~1')}"
+                if key == OasField.DESCRIPTION and isinstance(value, str):
+                    result.append(SizeStat(name=child, bytes=len(value.encode("utf-8")), nodes=1))
+                elif isinstance(value, (dict, list)):
+                    stack.append((child, value))
+        elif isinstance(item, list):
+            stack.extend((f"{location}/{index}", value) for index, value in enumerate(item))
+    return result
+
+
+def _largest(items: list[SizeStat]) -> list[SizeStat]:
+    return sorted(items, key=lambda x: (-x.bytes, -x.nodes, x.name))
+
+
+def spec_stats(spec: dict[str, Any]) -> SpecStats:
+    """Get the sizes of the paths, tags, components, and descriptions (largest first).
+
+    The tag sizes are the total of the operations with that tag.
+    """
+    paths = spec.get(OasField.PATHS, {})
+    tags: dict[str, list[int]] = {}
+    for path_data in paths.values():
+        for method, op_data in path_data.items():
+            if method == OasField.PARAMS or not isinstance(op_data, dict):
+                continue
+            size = size_stat(method, op_data)
+            for tag in op_data.get(OasField.TAGS, None) or []:
+                total = tags.setdefault(tag, [0, 0])
+                total[0] += size.bytes
+                total[1] += size.nodes
+
+    return SpecStats(
+        total=size_stat("total", spec),
+        paths=_largest([size_stat(path, data) for path, data in paths.items()]),
+        tags=_largest([SizeStat(name=tag, bytes=b, nodes=n) for tag, (b, n) in tags.items()]),
+        components=_largest([
+            size_stat(name, data) for name, data in map_models(spec.get(OasField.COMPONENTS, {})).items()
+        ]),
+        descriptions=_largest(_descriptions(spec)),
+    )
@@ -0,0 +1,447 @@
+"""Synthetic OpenAPI specs for testing (and benchmarking) the tools at scale.
+
+The specs are generated from a seed, so the same arguments always produce the same spec. They have
+the shape of a large service API:
+* the models are in levels (up to the depth), and each model references models from the next level
+  using properties, arrays, allOf (inheritance), oneOf and nullable references
+* optionally, models reference themselves (e.g. a tree of children) or the model that references
+  them (a parent), like the recursive models in real APIs
+* the paths are REST resources (optionally nested), grouped by tags, with shared parameters and
+  paginated list operations
+A CLI layout (for cli-gen) can be created for the spec, with a sub-command for each tag.
+"""
+import random
+import re
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+
+from openapi_spec_tools.cli_gen.layout_types import LayoutField
+from openapi_spec_tools.cli_gen.layout_types import PaginationField
+from openapi_spec_tools.types import OasField
+
+SCHEMA_PREFIX = "#/components/schemas/"
+PAGE_PARAM = "#/components/parameters/Page"
+PAGE_SIZE_PARAM = "#/components/parameters/PageSize"
+ERROR_RESPONSE = "#/components/responses/Error"
+
+NOUNS = [
+    "Account", "Address", "Alert", "Application", "Artifact", "Audit", "Backup", "Bucket", "Build", "Certificate",
+    "Channel", "Cluster", "Comment", "Contact", "Credential", "Dashboard", "Deployment", "Device", "Domain", "Event",
+    "Export", "Feature", "Folder", "Gateway", "Group", "Image", "Incident", "Integration", "Invoice", "Job",
+    "Key", "Label", "License", "Listener", "Member", "Metric", "Monitor", "Network", "Node", "Order",
+    "Organization", "Payment", "Pipeline", "Policy", "Project", "Quota", "Region", "Release", "Report", "Repository",
+    "Role", "Route", "Rule", "Schedule", "Secret", "Service", "Session", "Snapshot", "Subscription", "Task",
+    "Team", "Template", "Tenant", "Ticket", "Token", "Trigger", "User", "Volume", "Webhook", "Workspace",
+]
+SUFFIXES = ["", "Detail", "Summary", "Config", "Status", "Spec", "Setting", "Record"]
+
+TAGS = [
+    "admin", "billing", "compute", "identity", "integrations", "monitoring", "networking", "projects", "security",
+    "storage", "support", "workflows",
+]
+
+# property name, and a factory for its (fresh) schema
+SCALARS = [
+    ("name", lambda: {"type": "string", "minLength": 1, "maxLength": 256}),
+    ("description", lambda: {"type": "string", "maxLength": 4096}),
+    ("status", lambda: {"type": "string", "enum": ["active", "pending", "disabled", "deleted"]}),
+    ("created_at", lambda: {"type": "string", "format": "date-time", "readOnly": True}),
+    ("updated_at", lambda: {"type": "string", "format": "date-time", "readOnly": True}),
+    ("enabled", lambda: {"type": "boolean", "default": True}),
+    ("count", lambda: {"type": "integer", "format": "int32", "minimum": 0}),
+    ("priority", lambda: {"type": "integer", "minimum": 1, "maximum": 5}),
+    ("size", lambda: {"type": "number", "format": "double", "minimum": 0}),
+    ("url", lambda: {"type": "string", "format": "uri"}),
+    ("email", lambda: {"type": "string", "format": "email"}),
+    ("owner_id", lambda: {"type": "string", "format": "uuid"}),
+    ("region", lambda: {"type": "string", "pattern": "^[a-z]{2}-[a-z]+-[0-9]$"}),
+    ("version", lambda: {"type": "string", "example": "1.0.0"}),
+    ("labels", lambda: {"type": "object", "additionalProperties": {"type": "string"}}),
+    ("aliases", lambda: {"type": "array", "items": {"type": "string"}, "maxItems": 10}),
+]
+
+# query parameters for filtering lists (by properties that most models have)
+FILTERS = [
+    ("search", {"type": "string"}, "A search term"),
+    ("ordering", {"type": "string", "enum": ["name", "-name", "created_at", "-created_at"]}, "Field for sorting"),
+    ("status", {"type": "string", "enum": ["active", "pending", "disabled", "deleted"]}, "Status to filter"),
+    ("created_after", {"type": "string", "format": "date-time"}, "Only items created after this time"),
+]
+
+SUPPORTED_VERSIONS = ["3.0.3", "3.1.0"]
+
+
+@dataclass
+class SynthConfig:
+    """Settings for the size and shape of the synthetic spec."""
+
+    paths: int = 100
+    models: int = 200
+    # number of levels of models (the top level is used by the paths)
+    depth: int = 3
+    # number of references from each model to the models in the next level
+    fanout: int = 3
+    # when set, some models reference themselves or their parent model
+    cycles: bool = False
+    # number of tags (defaults to one per 25 paths)
+    tags: Optional[int] = None
+    seed: int = 0
+    version: str = SUPPORTED_VERSIONS[0]
+
+
+def model_names(count: int) -> list[str]:
+    """Get the unique model names."""
+    names = []
+    variants = len(NOUNS) * len(SUFFIXES)
+    for index in range(count):
+        noun = NOUNS[index % len(NOUNS)]
+        suffix = SUFFIXES[(index // len(NOUNS)) % len(SUFFIXES)]
+        repeat = index // variants
+        names.append(f"{noun}{suffix}{repeat or ''}")
+    return names
+
+
+def snake_case(name: str) -> str:
+    """Convert the (camel case) model name to snake case."""
+    return re.sub(r"(?<=[a-z0-9])([A-Z0-9])", r"_\1", name).lower()
+
+
+def article(words: str) -> str:
+    """Get the words with the indefinite article."""
+    return f"{'an' if words[0] in 'aeiou' else 'a'} {words}"
+
+
+def plural(name: str) -> str:
+    """Get the plural of the (snake case) name."""
+    if name.endswith(("s", "x", "ch", "sh")):
+        return name + "es"
+    if name.endswith("y") and not name.endswith(("ay", "ey", "oy")):
+        return name[:-1] + "ies"
+    return name + "s"
+
+
+class SpecSynthesizer:
+    """Generates the synthetic spec for the configuration."""
+
+    def __init__(self, config: SynthConfig):
+        """Initialize the random generator, and split the models into levels."""
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.names = model_names(config.models)
+        # the levels have (nearly) equal sizes
+        depth = max(1, min(config.depth, config.models))
+        self.levels = [self.names[level * config.models // depth:(level + 1) * config.models // depth]
+                       for level in range(depth)]
+        self.level_of = {name: index for index, level in enumerate(self.levels) for name in level}
+        # the first model that references each model (for the back references)
+        self.owners: dict[str, str] = {}
+        self.tag_names = self.create_tag_names()
+
+    def create_tag_names(self) -> list[str]:
+        """Get the unique tag names."""
+        count = self.config.tags or max(1, self.config.paths // 25)
+        return [f"{TAGS[i % len(TAGS)]}{i // len(TAGS) or ''}" for i in range(count)]
+
+    def ref(self, name: str) -> dict[str, Any]:
+        """Create a reference to the model."""
+        return {OasField.REFS.value: f"{SCHEMA_PREFIX}{name}"}
+
+    def nullable(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Make the schema nullable, using the style of the OpenAPI version."""
+        if OasField.REFS in schema:
+            if self.config.version.startswith("3.0"):
+                return {"allOf": [schema], "nullable": True}
+            return {"oneOf": [schema, {"type": "null"}]}
+        if self.config.version.startswith("3.0"):
+            schema["nullable"] = True
+        else:
+            schema["type"] = [schema["type"], "null"]
+        return schema
+
+    def scalar_properties(self) -> dict[str, Any]:
+        """Create the id, and a random selection of the scalar properties."""
+        properties = {"id": {"type": "string", "format": "uuid", "readOnly": True}}
+        for name, factory in self.random.sample(SCALARS, self.random.randint(3, 8)):
+            schema = factory()
+            if self.random.random() < 0.1:
+                schema = self.nullable(schema)
+            properties[name] = schema
+        return properties
+
+    def model(self, name: str) -> dict[str, Any]:
+        """Create the model schema."""
+        level = self.level_of[name]
+        properties = self.scalar_properties()
+        # the id and the first of the other properties are required
+        required = list(properties)[:2]
+        schema = {
+            "type": "object",
+            "description": article(snake_case(name).replace("_", " ")).capitalize(),
+            "required": sorted(required),
+            "properties": properties,
+        }
+
+        base = None
+        if level + 1 < len(self.levels):
+            children = self.levels[level + 1]
+            chosen = self.random.sample(children, min(self.config.fanout, len(children)))
+            for child in chosen:
+                key = snake_case(child)
+                kind = self.random.random()
+                if base is None and kind < 0.15:
+                    base = child
+                    continue
+                self.owners.setdefault(child, name)
+                if kind < 0.5:
+                    properties[key] = self.ref(child)
+                elif kind < 0.75:
+                    properties[plural(key)] = {"type": "array", "items": self.ref(child)}
+                elif kind < 0.9:
+                    other = self.random.choice(children)
+                    properties[f"{key}_choice"] = {"oneOf": [self.ref(child), self.ref(other)]}
+                else:
+                    properties[key] = self.nullable(self.ref(child))
+
+        if self.config.cycles:
+            if self.random.random() < 0.2:
+                properties["children"] = {"type": "array", "items": self.ref(name)}
+            owner = self.owners.get(name)
+            if owner and self.random.random() < 0.3:
+                # like most back references, this is set by the server
+                properties["parent"] = self.nullable(self.ref(owner))
+                properties["parent"]["readOnly"] = True
+
+        if base:
+            return {"allOf": [self.ref(base), schema]}
+        return schema
+
+    def components(self) -> dict[str, Any]:
+        """Create the components, with the models and the shared parameters/responses."""
+        parameters = {
+            "Page": {
+                "name": "page",
+                "in": "query",
+                "description": "A page number within the paginated result set",
+                "schema": {"type": "integer", "minimum": 1},
+            },
+            "PageSize": {
+                "name": "page_size",
+                "in": "query",
+                "description": "Number of results to return per page",
+                "schema": {"type": "integer", "minimum": 1, "maximum": 1000},
+            },
+        }
+        error = {
+            "type": "object",
+            "required": ["detail"],
+            "properties": {"detail": {"type": "string"}, "code": {"type": "integer"}},
+        }
+        return {
+            "schemas": {name: self.model(name) for name in self.names},
+            "parameters": parameters,
+            "responses": {
+                "Error": {
+                    "description": "The request failed",
+                    "content": {"application/json": {"schema": error}},
+                },
+            },
+            "securitySchemes": {"ApiKeyAuth": {"type": "http", "scheme": "bearer"}},
+        }
+
+    def response(self, description: str, schema: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """Create the responses for an operation."""
+        success = {"description": description}
+        if schema is not None:
+            success["content"] = {"application/json": {"schema": schema}}
+        return {"200" if schema is not None else "204": success, "default": {OasField.REFS.value: ERROR_RESPONSE}}
+
+    def list_schema(self, model: str) -> dict[str, Any]:
+        """Create the (paginated) list response schema."""
+        return {
+            "type": "object",
+            "required": ["count", "results"],
+            "properties": {
+                "count": {"type": "integer"},
+                "next": self.nullable({"type": "string", "format": "uri"}),
+                "previous": self.nullable({"type": "string", "format": "uri"}),
+                "results": {"type": "array", "items": self.ref(model)},
+            },
+        }
+
+    def body(self, model: str) -> dict[str, Any]:
+        """Create the request body."""
+        return {"required": True, "content": {"application/json": {"schema": self.ref(model)}}}
+
+    def resource(
+        self, noun: str, model: str, tag: str, parent_params: Optional[list[dict[str, Any]]] = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Create the collection and item path items for the resource.
+
+        The parent_params are the path parameters of the parent item (for nested resources).
+        """
+        words = noun.replace("_", " ")
+        plural_noun = plural(noun)
+        collection = {}
+        if parent_params:
+            collection["parameters"] = deepcopy(parent_params)
+        collection["get"] = {
+            "operationId": f"{plural_noun}_list",
+            "summary": f"List the {plural(words)}",
+            "tags": [tag],
+            "parameters": [
+                {OasField.REFS.value: PAGE_PARAM},
+                {OasField.REFS.value: PAGE_SIZE_PARAM},
+            ] + [
+                {"name": name, "in": "query", "description": description, "schema": deepcopy(schema)}
+                for name, schema, description in self.random.sample(FILTERS, self.random.randint(0, 2))
+            ],
+            "responses": self.response(f"A page of {plural(words)}", self.list_schema(model)),
+        }
+        if self.random.random() < 0.6:
+            collection["post"] = {
+                "operationId": f"{plural_noun}_create",
+                "summary": f"Create {article(words)}",
+                "tags": [tag],
+                "requestBody": self.body(model),
+                "responses": self.response(f"The new {words}", self.ref(model)),
+            }
+
+        item = {
+            "parameters": deepcopy(parent_params or []) + [
+                {
+                    "name": f"{noun}_id",
+                    "in": "path",
+                    "required": True,
+                    "description": f"The {words} identifier",
+                    "schema": {"type": "string", "format": "uuid"},
+                },
+            ],
+            "get": {
+                "operationId": f"{plural_noun}_retrieve",
+                "summary": f"Get {article(words)}",
+                "tags": [tag],
+                "responses": self.response(f"The {words}", self.ref(model)),
+            },
+        }
+        for method, action, summary in [("put", "update", "Update"), ("patch", "partial_update", "Modify")]:
+            if self.random.random() < 0.5:
+                item[method] = {
+                    "operationId": f"{plural_noun}_{action}",
+                    "summary": f"{summary} {article(words)}",
+                    "tags": [tag],
+                    "requestBody": self.body(model),
+                    "responses": self.response(f"The updated {words}", self.ref(model)),
+                }
+        if self.random.random() < 0.6:
+            item["delete"] = {
+                "operationId": f"{plural_noun}_destroy",
+                "summary": f"Delete {article(words)}",
+                "tags": [tag],
+                "responses": self.response("Deleted", None),
+            }
+        return collection, item
+
+    def paths(self) -> dict[str, Any]:
+        """Create the paths, with a collection and item path for each resource."""
+        paths = {}
+        top = self.levels[0]
+        previous_item = None
+        previous_params: list[dict[str, Any]] = []
+        index = 0
+        while len(paths) < self.config.paths:
+            model = top[index % len(top)]
+            repeat = index // len(top)
+            noun = snake_case(model) + (f"_{repeat}" if repeat else "")
+            tag = self.tag_names[index % len(self.tag_names)]
+            # some resources are nested under the previous resource
+            if previous_item and self.random.random() < 0.25:
+                base = previous_item
+                parent_params = previous_params
+            else:
+                base = f"/api/v1/{tag}"
+                parent_params = []
+            collection_path = f"{base}/{plural(noun).replace('_', '-')}"
+            item_path = f"{collection_path}/{{{noun}_id}}"
+
+            collection, item = self.resource(noun, model, tag, parent_params)
+            paths[collection_path] = collection
+            if len(paths) < self.config.paths:
+                paths[item_path] = item
+            nested = base == previous_item
+            previous_item = item_path if not nested else None
+            previous_params = item["parameters"] if not nested else []
+            index += 1
+        return paths
+
+    def spec(self) -> dict[str, Any]:
+        """Create the whole spec."""
+        components = self.components()
+        paths = self.paths()
+        return {
+            "openapi": self.config.version,
+            "info": {
+                "title": "Synthetic API",
+                "description": (
+                    f"Generated with seed={self.config.seed}, paths={self.config.paths}, models={self.config.models}, "
+                    f"depth={self.config.depth}, fanout={self.config.fanout}, cycles={self.config.cycles}"
+                ),
+                "version": "1.0.0",
+            },
+            "servers": [{"url": "https://api.example.com"}],
+            "security": [{"ApiKeyAuth": []}],
+            "tags": [{"name": tag, "description": f"Operations for {tag}"} for tag in self.tag_names],
+            "paths": paths,
+            "components": components,
+        }
+
+
+def synthesize(config: SynthConfig) -> dict[str, Any]:
+    """Create a synthetic spec with the configured size and shape."""
+    if config.version not in SUPPORTED_VERSIONS:
+        raise ValueError(f"unsupported OpenAPI version {config.version} -- choose from {', '.join(SUPPORTED_VERSIONS)}")
+    if config.paths < 1 or config.models < 1 or config.depth < 1 or config.fanout < 0:
+        raise ValueError("paths, models and depth must be positive, and fanout cannot be negative")
+    return SpecSynthesizer(config).spec()
+
+
+def synthesize_layout(spec: dict[str, Any]) -> dict[str, Any]:
+    """Create a CLI layout for the (synthetic) spec, with a sub-command for each tag.
+
+    The command names are the operation identifiers (in kebab case), and the list operations use
+    the page/page_size pagination.
+    """
+    subcommands: dict[str, list[dict[str, Any]]] = {}
+    for path_item in spec.get(OasField.PATHS, {}).values():
+        for method, operation in path_item.items():
+            if not isinstance(operation, dict) or OasField.OP_ID not in operation:
+                continue
+            tag = (operation.get(OasField.TAGS) or ["default"])[0]
+            op_id = operation[OasField.OP_ID]
+            item = {LayoutField.NAME.value: op_id.replace("_", "-"), LayoutField.OP_ID.value: op_id}
+            refs = {p.get(OasField.REFS) for p in operation.get(OasField.PARAMS, [])}
+            if PAGE_PARAM in refs:
+                item[LayoutField.PAGINATION.value] = {
+                    PaginationField.PAGE_START.value: "page",
+                    PaginationField.PAGE_SIZE.value: "page_size",
+                    PaginationField.NEXT_PROP.value: "next",
+                    PaginationField.ITEM_PROP.value: "results",
+                }
+            subcommands.setdefault(tag, []).append(item)
+
+    title = spec.get("info", {}).get("title", "API")
+    layout = {
+        "main": {
+            LayoutField.DESCRIPTION.value: f"Manage the {title}",
+            LayoutField.OPERATIONS.value: [
+                {LayoutField.NAME.value: tag, LayoutField.SUB_ID.value: tag} for tag in sorted(subcommands)
+            ],
+        },
+    }
+    for tag in sorted(subcommands):
+        layout[tag] = {
+            LayoutField.DESCRIPTION.value: f"Manage {tag}",
+            LayoutField.OPERATIONS.value: sorted(subcommands[tag], key=lambda x: x[LayoutField.NAME]),
+        }
+    return layout
@@ -12,10 +12,12 @@ class OasField(str, Enum):
     DEFAULT = "default"
     DEPRECATED = "deprecated"
     DESCRIPTION = "description"
+    DISCRIMINATOR = "discriminator"
     ENUM = "enum"
     FORMAT = "format"
     IN = "in"
     ITEMS = "items"
+    MAPPING = "mapping"
     MAX = "maximum"
     MIN = "minimum"
     NAME = "name"
@@ -32,11 +34,14 @@ class OasField(str, Enum):
     RESPONSES = "responses"
     SCHEMA = "schema"
     SCHEMAS = "schemas"
+    SECURITY = "security"
+    SECURITY_SCHEMES = "securitySchemes"
     SERVERS = "servers"
     SUMMARY = "summary"
     TAGS = "tags"
     TYPE = "type"
     URL = "url"
+    WEBHOOKS = "webhooks"
 
     X_DEPRECATED = "x-deprecated"
     X_COLLECT = "x-collection"
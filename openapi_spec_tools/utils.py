@@ -1,29 +1,63 @@
 """Utilties for analyzing and manipulating OpenAPI specifications."""
+import hashlib
 import json
+import re
+import sys
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
 from copy import deepcopy
+from dataclasses import dataclass
 from itertools import zip_longest
 from pathlib import Path
 from typing import Any
 from typing import Optional
 from typing import Union
-
-import yaml
-
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+from openapi_spec_tools.lazy_json import LazyJsonDocument
+from openapi_spec_tools.resolver import internalize_refs
+from openapi_spec_tools.resolver import load_document
+from openapi_spec_tools.resolver import pointer_parts
+from openapi_spec_tools.resolver import resolve_pointer
 from openapi_spec_tools.types import OasField
 
 NULL_TYPES = {'null', '"null"', "'null'"}
 
 
-def open_oas(filename: str) -> Any:
-    """Open the specified filename, and return the dictionary."""
+def open_oas(
+    filename: str,
+    resolve_refs: bool = True,
+    parallel: bool = False,
+    lazy: bool = False,
+    compact: bool = False,
+) -> Any:
+    """Open the specified filename, and return the dictionary.
+
+    When resolve_refs is set, objects referenced from other files are copied into the components,
+    so the references are all local. When parallel is set, huge YAML specs are parsed in chunks by
+    a pool of worker processes. When lazy is set, a JSON spec is returned as a read-only mapping
+    that only decodes the top-level sections that are accessed (unless it references other files).
+    When compact is set, the spec is compacted for read-only analysis (see compact_spec()).
+    """
     path = Path(filename)
     if not path.exists():
         raise FileNotFoundError(filename)
 
-    with open(filename, "r", encoding="utf-8", newline="\n") as fp:
-        if filename.endswith('json'):
-            return json.load(fp)
-        return yaml.safe_load(fp)
+    if lazy and filename.endswith("json"):
+        document = LazyJsonDocument(filename)
+        if not resolve_refs or not document.has_external_refs():
+            return document
+        document.close()
+
+    spec = load_document(filename, parallel=parallel)
+    if resolve_refs and isinstance(spec, dict):
+        spec = internalize_refs(spec, filename)
+    if compact:
+        spec = compact_spec(spec)
+    return spec
 
 
 def unroll(full_set: dict[str, set[str]], items: set[str]) -> set[str]:
@@ -47,13 +81,16 @@ def unroll(full_set: dict[str, set[str]], items: set[str]) -> set[str]:
 
        result = {b, c, d, e}
 
-    """
-    result = deepcopy(items)
+    Cyclic references (e.g. a model that refers back to its parent) are handled.
 
-    for i in items:
-        sub = full_set.get(i)
+    """
+    result = set(items)
+    pending = list(items)
+    while pending:
+        sub = full_set.get(pending.pop())
         if sub:
-            result.update(unroll(full_set, sub))
+            pending.extend(sub - result)
+            result.update(sub)
 
     return result
 
@@ -191,14 +228,111 @@ def short_ref(full_name: str) -> str:
     return '/'.join(values)
 
 
+def iter_references(obj: Any, prop_name: str = OasField.REFS.value) -> Iterator[str]:
+    """Yield the string values of all the 'prop_name' properties found anywhere in 'obj'.
+
+    This uses an explicit stack (instead of recursion), and does not create any intermediate
+    sets, so it is suitable for walking large specs. Values may be yielded more than once.
+
+    NOTE: the nested containers are expected to be plain dict/list objects (as produced by the
+          JSON/YAML loaders), but the top-level 'obj' may be any Mapping (e.g. OperationRecord).
+    """
+    containers = (dict, list)
+    stack = [obj]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        item = pop()
+        if type(item) is dict or isinstance(item, Mapping):
+            ref = item.get(prop_name)
+            if type(ref) is str:
+                yield ref
+            for value in item.values():
+                if type(value) in containers:
+                    push(value)
+        elif type(item) is list:
+            for value in item:
+                if type(value) in containers:
+                    push(value)
+
+
+def _iter_property(obj: Any, prop_name: str) -> Iterator[Any]:
+    """Yield the values of all the 'prop_name' properties found anywhere in 'obj'."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Mapping):
+            if prop_name in item:
+                yield item[prop_name]
+            stack.extend(v for v in item.values() if isinstance(v, (dict, list)))
+        elif isinstance(item, list):
+            stack.extend(v for v in item if isinstance(v, (dict, list)))
+
+
+def iter_mapping_references(obj: Any) -> Iterator[str]:
+    """Yield the references in the 'discriminator.mapping' values found anywhere in 'obj'.
+
+    The mapping values are either references, or schema names (which are converted to references).
+    """
+    for discriminator in _iter_property(obj, OasField.DISCRIMINATOR.value):
+        mapping = discriminator.get(OasField.MAPPING) if isinstance(discriminator, dict) else None
+        if not isinstance(mapping, dict):
+            continue
+        for value in mapping.values():
+            if isinstance(value, str):
+                yield value if "/" in value or "#" in value else _full_ref(f"{OasField.SCHEMAS.value}/{value}")
+
+
+def _json_string_end(data: bytes, start: int) -> int:
+    """Get the index of the closing quote for the JSON string that starts at 'start'."""
+    index = start + 1
+    while True:
+        index = data.index(b'"', index)
+        backslashes = 0
+        while data[index - 1 - backslashes] == 0x5C:  # backslash
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return index
+        index += 1
+
+
+def scan_json_references(data: bytes, prop_name: str = OasField.REFS.value) -> list[tuple[str, int]]:
+    """Get the (value, byte offset) of every 'prop_name' string in the raw JSON text.
+
+    This avoids parsing the JSON document. The offset is the position of the opening quote of
+    the value, which is useful for reporting locations in the original file. Keys are only
+    recognized outside of strings, since a quote inside a JSON string is always escaped.
+    """
+    key = b'"' + prop_name.encode("utf-8") + b'"'
+    whitespace = b" \t\r\n"
+    result = []
+    index = data.find(key)
+    while index >= 0:
+        position = index + len(key)
+        if index == 0 or data[index - 1] != 0x5C:
+            while position < len(data) and data[position] in whitespace:
+                position += 1
+            if data[position:position + 1] == b":":
+                position += 1
+                while position < len(data) and data[position] in whitespace:
+                    position += 1
+                if data[position:position + 1] == b'"':
+                    end = _json_string_end(data, position)
+                    raw = data[position:end + 1]
+                    value = json.loads(raw) if b"\\" in raw else raw[1:-1].decode("utf-8")
+                    result.append((value, position))
+                    position = end + 1
+        index = data.find(key, position)
+
+    return result
+
+
 def find_references(obj: dict[str, Any]) -> set[str]:
     """Walk the 'obj' dictionary to find all the reference values (e.g. "$ref")."""
-    refs = find_dict_prop(obj, OasField.REFS)
-    return set([short_ref(_) for _ in refs])
+    return {short_ref(_) for _ in iter_references(obj)}
 
 
-
-def model_references(models: dict[str, Any]) -> set[str]:
+def model_references(models: dict[str, Any]) -> dict[str, set[str]]:
     """Create a complete map of model names to their references."""
     return {name: find_references(body) for name, body in models.items()}
 
@@ -242,9 +376,8 @@ def unmap_models(models: dict[str, Any]) -> dict[str, Any]:
     # re-organize models into sub-sections
     components = {}
     for full_name, model_def in models.items():
-        parts = full_name.split('/')
-        comp_name = parts[0]
-        model_name = parts[1]
+        # only split on the first '/', since the model name may include more
+        comp_name, _, model_name = full_name.partition('/')
         temp = components.get(comp_name, {})
         temp[model_name] = model_def
         components[comp_name] = temp
@@ -252,18 +385,423 @@ def unmap_models(models: dict[str, Any]) -> dict[str, Any]:
     return components
 
 
+def used_models(schema: dict[str, Any]) -> set[str]:
+    """Get the names (as in map_models()) of the components reachable from the operations.
+
+    This is a single pass over the reference graph starting from the paths (and webhooks), so each
+    component is only walked once and cycles are handled. All component sections are included
+    (e.g. parameters, responses, requestBodies), and security schemes are used when named by a
+    security requirement (globally, or in a path or webhook operation). The 'discriminator.mapping'
+    values are followed like references.
+    """
+    components = schema.get(OasField.COMPONENTS, {})
+    models = map_models(components)
+    prefix = f"#/{OasField.COMPONENTS.value}/"
+
+    roots = [schema.get(OasField.PATHS, {}), schema.get(OasField.WEBHOOKS, {})]
+    pending = [ref for root in roots for ref in iter_references(root)]
+    pending.extend(ref for root in roots for ref in iter_mapping_references(root))
+    requirements = list(schema.get(OasField.SECURITY, None) or [])
+    for root in roots:
+        for path_data in root.values():
+            for op_data in path_data.values():
+                if isinstance(op_data, dict):
+                    requirements.extend(op_data.get(OasField.SECURITY, None) or [])
+    pending.extend(_full_ref(f"{OasField.SECURITY_SCHEMES.value}/{name}") for item in requirements for name in item)
+
+    used = set()
+    while pending:
+        ref = pending.pop()
+        if not ref.startswith(prefix):
+            continue
+        # the reference may point inside the component, and the names are escaped (e.g. "~1" for "/")
+        parts = pointer_parts(ref[len(prefix):])
+        if len(parts) < 2:
+            continue
+        name = f"{parts[0]}/{parts[1]}"
+        if name in used or name not in models:
+            continue
+        used.add(name)
+        pending.extend(iter_references(models[name]))
+        pending.extend(iter_mapping_references(models[name]))
+
+    return used
+
+
+def unused_models(schema: dict[str, Any]) -> set[str]:
+    """Get the names (as in map_models()) of the components that are not used by any operation."""
+    models = map_models(schema.get(OasField.COMPONENTS, {}))
+    return models.keys() - used_models(schema)
+
+
+def remove_unused_models(schema: dict[str, Any]) -> dict[str, Any]:
+    """Remove the components that are not used by any operation."""
+    result = deepcopy(schema)
+    unused = unused_models(result)
+    if not unused:
+        return result
+
+    models = map_models(result.get(OasField.COMPONENTS, {}))
+    result[OasField.COMPONENTS.value] = unmap_models({k: v for k, v in models.items() if k not in unused})
+    return result
+
+
+def reference_graph(spec: dict[str, Any]) -> dict[str, set[str]]:
+    """Create a map of each (local) reference to the references found in the referenced object.
+
+    Only references reachable from the spec are included, and each target is only walked once.
+    """
+    graph = {}
+    pending = set(iter_references(spec))
+    while pending:
+        ref = pending.pop()
+        if not ref.startswith("#"):
+            graph[ref] = set()
+            continue
+        try:
+            found = set(iter_references(resolve_pointer(spec, ref[1:])))
+        except ValueError:
+            # dangling reference
+            found = set()
+        graph[ref] = found
+        pending.update(found - graph.keys())
+
+    return graph
+
+
+def cyclic_references(graph: dict[str, set[str]]) -> set[str]:
+    """Get the references that are part of a cycle (e.g. a model that includes itself).
+
+    Uses an iterative version of Tarjan's strongly connected components algorithm, so it is
+    linear in the size of the graph.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    result: set[str] = set()
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph.get(root, ())))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.get(child, ()))))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
+
+                component = []
+                while True:
+                    item = stack.pop()
+                    on_stack.discard(item)
+                    component.append(item)
+                    if item == node:
+                        break
+                if len(component) > 1 or node in graph.get(node, ()):
+                    result.update(component)
+
+    return result
+
+
+def post_order(graph: dict[str, set[str]]) -> list[str]:
+    """Get the graph nodes ordered so each node comes after the nodes it refers to (ignoring cycles)."""
+    order = []
+    visited = set()
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    work.append((child, iter(graph.get(child, ()))))
+                    break
+            else:
+                work.pop()
+                order.append(node)
+
+    return order
+
+
+def dereference(spec: dict[str, Any], max_size: Optional[int] = None) -> dict[str, Any]:
+    """Create a copy of the spec with the local references replaced by the referenced objects.
+
+    Each reference is only resolved once, and the same object is used everywhere it is referenced,
+    so the result does not grow exponentially with deeply re-used models (and YAML output uses
+    anchors/aliases for the shared objects).
+
+    References that are part of a cycle cannot be inlined, so they are kept. When max_size is
+    provided, references to objects with more than max_size nodes (when fully expanded) are kept.
+    """
+    graph = reference_graph(spec)
+    keep = cyclic_references(graph)
+    resolved: dict[str, tuple[Any, int]] = {}
+    # allows the referenced objects (e.g. component definitions) to also use the shared value
+    targets: dict[int, str] = {}
+
+    def _inline(obj: Any) -> tuple[Any, int]:
+        """Get the (copy with references inlined, expanded size)."""
+        ref = targets.get(id(obj))
+        if ref and resolved.get(ref, (None,))[0] is not None:
+            return resolved[ref]
+        if isinstance(obj, list):
+            items = [_inline(v) for v in obj]
+            return [v for v, _ in items], 1 + sum(n for _, n in items)
+        if not isinstance(obj, dict):
+            return obj, 1
+
+        ref = obj.get(OasField.REFS.value)
+        if isinstance(ref, str) and ref.startswith("#") and ref not in keep:
+            value, size = _resolve(ref)
+            if value is not None:
+                if len(obj) == 1:
+                    return value, size
+                # sibling properties (e.g. description) override the referenced values
+                others = {k: _inline(v) for k, v in obj.items() if k != OasField.REFS.value}
+                merged = dict(value)
+                merged.update({k: v for k, (v, _) in others.items()})
+                return merged, size + sum(n for _, n in others.values())
+
+        items = {k: _inline(v) for k, v in obj.items()}
+        return {k: v for k, (v, _) in items.items()}, 1 + sum(n for _, n in items.values())
+
+    def _resolve(ref: str) -> tuple[Any, int]:
+        """Get the (shared) inlined value for the reference, or None when it is kept."""
+        if ref not in resolved:
+            try:
+                target = resolve_pointer(spec, ref[1:])
+                value, size = _inline(target)
+                targets[id(target)] = ref
+            except ValueError:
+                value, size = None, 1
+            if max_size is not None and size > max_size:
+                value = None
+            resolved[ref] = (value, size)
+        return resolved[ref]
+
+    # resolving the most deeply referenced objects first avoids deep recursion
+    for ref in post_order(graph):
+        if ref.startswith("#") and ref not in keep:
+            _resolve(ref)
+
+    return _inline(spec)[0]
+
+
+# longer strings (e.g. descriptions) are rarely repeated, so they are not interned
+MAX_INTERN_LENGTH = 64
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def compact_spec(spec: Any, freeze: bool = True) -> Any:
+    """Create a copy of the spec that uses less memory, for read-only analysis of large specs.
+
+    The keys and short string values (e.g. "type", "string", "$ref") are interned, so each is a
+    single object rather than one per node. When freeze is set, lists of scalars (e.g. 'required'
+    and 'enum' values) become tuples, and equal tuples are shared. Objects that are shared in the
+    spec (e.g. from dereference()) are still shared in the copy.
+    """
+    copies: dict[int, Any] = {}
+    leaves: dict[tuple, tuple] = {}
+
+    def _compact(obj: Any) -> Any:
+        if isinstance(obj, str):
+            return sys.intern(obj) if len(obj) <= MAX_INTERN_LENGTH else obj
+        if not isinstance(obj, (dict, list)):
+            return obj
+
+        copy = copies.get(id(obj))
+        if copy is None:
+            if isinstance(obj, dict):
+                copy = {sys.intern(k) if isinstance(k, str) else k: _compact(v) for k, v in obj.items()}
+            elif freeze and all(isinstance(v, _SCALARS) for v in obj):
+                items = tuple(_compact(v) for v in obj)
+                # the types are part of the key, since 1 == 1.0 == True
+                copy = leaves.setdefault((items, tuple(type(v) for v in items)), items)
+            else:
+                copy = [_compact(v) for v in obj]
+            copies[id(obj)] = copy
+        return copy
+
+    return _compact(spec)
+
+
+class NameIndex:
+    """Index of (slash-delimited) names for finding names by short name or substring.
+
+    Short names (the part after the last slash) map directly to the full names. Substring
+    searches are case-insensitive, and use a trigram index to only check the names that contain
+    all the trigrams of the search value.
+    """
+
+    __slots__ = ("names", "_lower", "_short", "_trigrams")
+
+    def __init__(self, names: Iterable[str]):
+        """Build the index for the names."""
+        self.names = list(names)
+        self._lower = [n.lower() for n in self.names]
+        self._short: dict[str, list[str]] = {}
+        self._trigrams: dict[str, list[int]] = {}
+        for index, name in enumerate(self.names):
+            self._short.setdefault(name.split("/")[-1], []).append(name)
+            lower = self._lower[index]
+            for start in range(len(lower) - 2):
+                postings = self._trigrams.setdefault(lower[start:start + 3], [])
+                if not postings or postings[-1] != index:
+                    postings.append(index)
+
+    def full_names(self, short_name: str) -> list[str]:
+        """Get the full names that end with the short name."""
+        return list(self._short.get(short_name, []))
+
+    def contains(self, search: str) -> list[str]:
+        """Get the names containing the search value (case-insensitive), in the original order."""
+        needle = search.lower()
+        if len(needle) < 3:
+            return [n for n, lower in zip(self.names, self._lower) if needle in lower]
+
+        postings = []
+        for start in range(len(needle) - 2):
+            found = self._trigrams.get(needle[start:start + 3])
+            if not found:
+                return []
+            postings.append(found)
+
+        # intersect starting with the shortest list
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for found in postings[1:]:
+            candidates.intersection_update(found)
+            if not candidates:
+                return []
+
+        return [self.names[i] for i in sorted(candidates) if needle in self._lower[i]]
+
+
+def name_index(names: Collection[str]) -> NameIndex:
+    """Get the NameIndex for the names (or the keys of a dictionary).
+
+    Building the index costs more than a single scan, so it only pays off when the caller holds
+    onto it for many searches (use names_containing() for a one-off search).
+    """
+    return NameIndex(names)
+
+
+def names_containing(names: Iterable[str], search: str) -> list[str]:
+    """Get the names containing the search value (case-insensitive), in the original order."""
+    needle = search.lower()
+    return [n for n in names if needle in n.lower()]
+
+
 def model_full_name(models: dict[str, Any], name: str) -> Optional[str]:
     """Search for a model matching the specified name. The name may be a partial name."""
     if name in models:
         return name
 
-    matches = [k for k in models.keys() if name == k.split('/')[-1]]
+    matches = [n for n in models if n.rsplit("/", 1)[-1] == name]
     if len(matches) == 1:
         return matches[0]
 
     return None
 
 
+_X_FIELDS = (OasField.X_PATH.value, OasField.X_PATH_PARAMS.value, OasField.X_METHOD.value)
+
+
+class OperationRecord(Mapping):
+    """Read-only view of an operation along with the path it belongs to.
+
+    The operation data is referenced (not copied), and the 'x-path', 'x-path-params' and
+    'x-method' values are served from slots. This allows the record to be used anywhere the
+    'map_operations()' dictionaries are read.
+    """
+
+    __slots__ = ("path", "method", "path_params", "data")
+
+    def __init__(self, path: str, method: str, path_params: Optional[list[Any]], data: dict[str, Any]):
+        """Initialize with the path details and the original operation data."""
+        self.path = path
+        self.method = method
+        self.path_params = path_params
+        self.data = data
+
+    @property
+    def op_id(self) -> Optional[str]:
+        """Get the operationId."""
+        return self.data.get(OasField.OP_ID)
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value for key, where the 'x-' path values come from the record."""
+        if key == OasField.X_PATH:
+            return self.path
+        if key == OasField.X_PATH_PARAMS:
+            return self.path_params
+        if key == OasField.X_METHOD:
+            return self.method
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the operation keys, followed by the 'x-' path keys."""
+        for key in self.data:
+            if key not in _X_FIELDS:
+                yield key
+        yield from _X_FIELDS
+
+    def __len__(self) -> int:
+        """Get the number of keys."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Get a short representation of the record."""
+        return f"OperationRecord({self.op_id!r}, {self.method!r}, {self.path!r})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get a shallow copy of the operation with the 'x-' path values added."""
+        result = dict(self.data)
+        result[OasField.X_PATH.value] = self.path
+        result[OasField.X_PATH_PARAMS.value] = self.path_params
+        result[OasField.X_METHOD.value] = self.method
+        return result
+
+
+def operation_table(paths: dict[str, Any]) -> dict[str, OperationRecord]:
+    """Create map of operationId to OperationRecord, without copying any of the operation data.
+
+    The table is built in a single pass over the 'paths', so callers that need it repeatedly
+    should hold onto it.
+    """
+    table = {}
+    for path, path_data in paths.items():
+        path_params = path_data.get(OasField.PARAMS)
+        for method, op_data in path_data.items():
+            if method == OasField.PARAMS or not isinstance(op_data, dict):
+                continue
+            record = OperationRecord(path, method, path_params, op_data)
+            table[record.op_id] = record
+
+    return table
+
+
 def map_operations(paths: dict[str, Any]) -> dict[str, Any]:
     """Create map of operationId to path data.
 
@@ -271,7 +809,9 @@ def map_operations(paths: dict[str, Any]) -> dict[str, Any]:
     as the key. It puts the path, path paramters, and method into the individual items
     of the new dictionary.
 
-    The resulting map is useful for dealing with operations (e.g. filtering).
+    The resulting map is useful for dealing with operations (e.g. filtering). Each item is a
+    shallow copy of the operation, so the nested data is shared with the 'paths' input. Use
+    'operation_table()' when read-only access is sufficient.
 
     Example:
     =======
@@ -315,18 +855,7 @@ def map_operations(paths: dict[str, Any]) -> dict[str, Any]:
     }
 
     """
-    result = {}
-    for path, path_data in paths.items():
-        local_path = deepcopy(path_data)
-        path_params = local_path.pop(OasField.PARAMS, None)
-        for method, op_data in local_path.items():
-            op_id = op_data.get(OasField.OP_ID)
-            op_data[OasField.X_PATH.value] = path
-            op_data[OasField.X_PATH_PARAMS.value] = path_params
-            op_data[OasField.X_METHOD.value] = method
-            result[op_id] = op_data
-
-    return result
+    return {op_id: record.as_dict() for op_id, record in operation_table(paths).items()}
 
 
 def find_paths(paths: dict[str, Any], search: Optional[str] = None, sub_paths: bool = False) -> dict[str, Any]:
@@ -348,6 +877,152 @@ def find_paths(paths: dict[str, Any], search: Optional[str] = None, sub_paths: b
     return result
 
 
+_PARAM_PATTERN = re.compile(r"{([^}]+)}")
+HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+
+@dataclass(frozen=True)
+class PathMatch:
+    """Result of matching a URL path against the path templates."""
+
+    path: str
+    params: dict[str, str]
+    operations: dict[str, Optional[str]]
+
+    def operation(self, method: str) -> Optional[str]:
+        """Get the operationId for the method (if any)."""
+        return self.operations.get(method.lower())
+
+
+class _RouteNode:
+    """Trie node for a single path segment."""
+
+    __slots__ = ("literals", "patterns", "wildcard", "path", "operations")
+
+    def __init__(self):
+        self.literals: dict[str, _RouteNode] = {}
+        self.patterns: dict[str, tuple[re.Pattern, _RouteNode]] = {}
+        self.wildcard: Optional[_RouteNode] = None
+        self.path: Optional[str] = None
+        self.operations: dict[str, Optional[str]] = {}
+
+
+def _segments(path: str) -> list[str]:
+    return [s for s in path.split("/") if s]
+
+
+def _segment_regex(segment: str) -> re.Pattern:
+    """Convert a segment with embedded parameters (e.g. "{name}.json") to a regex."""
+    parts = _PARAM_PATTERN.split(segment)
+    regex = "".join(re.escape(p) if i % 2 == 0 else "([^/]+?)" for i, p in enumerate(parts))
+    return re.compile(regex + "$")
+
+
+class PathRouter:
+    """Maps concrete URL paths to the path templates (and operations) from the 'paths' section.
+
+    The templates are compiled into a trie keyed by the literal segments, with the parameter
+    segments as wildcards. The lookup cost depends on the number of URL segments, not the number
+    of paths. Literal segments take precedence over parameters, so "/pets/mine" matches before
+    "/pets/{petId}".
+    """
+
+    def __init__(self, base_paths: Optional[list[str]] = None):
+        """Initialize with (optional) base paths that get removed from the URLs (e.g. "/v1")."""
+        self.root = _RouteNode()
+        # longest first, so the most specific base path gets removed
+        prefixes = {"/".join(_segments(b)) for b in base_paths or [] if "{" not in b}
+        self.base_paths = sorted([p for p in prefixes if p], key=len, reverse=True)
+
+    def add(self, path: str, method: str, op_id: Optional[str]) -> None:
+        """Add an operation for the path template."""
+        node = self.root
+        for segment in _segments(path):
+            if "{" not in segment:
+                node = node.literals.setdefault(segment, _RouteNode())
+            elif _PARAM_PATTERN.fullmatch(segment):
+                if node.wildcard is None:
+                    node.wildcard = _RouteNode()
+                node = node.wildcard
+            else:
+                if segment not in node.patterns:
+                    node.patterns[segment] = (_segment_regex(segment), _RouteNode())
+                node = node.patterns[segment][1]
+        node.path = path
+        node.operations[method.lower()] = op_id
+
+    def _find(self, node: _RouteNode, segments: list[str], index: int) -> Optional[_RouteNode]:
+        if index == len(segments):
+            return node if node.path is not None else None
+
+        segment = segments[index]
+        child = node.literals.get(segment)
+        if child is not None:
+            found = self._find(child, segments, index + 1)
+            if found is not None:
+                return found
+
+        for regex, child in node.patterns.values():
+            if regex.match(segment):
+                found = self._find(child, segments, index + 1)
+                if found is not None:
+                    return found
+
+        if node.wildcard is not None:
+            return self._find(node.wildcard, segments, index + 1)
+
+        return None
+
+    def match(self, url: str) -> Optional[PathMatch]:
+        """Find the path template matching the URL (which may include the host and query)."""
+        url_path = urlsplit(url).path if "://" in url else url.split("?")[0].split("#")[0]
+        segments = _segments(url_path)
+        candidates = [segments]
+        joined = "/".join(segments)
+        for base in self.base_paths:
+            if joined == base or joined.startswith(base + "/"):
+                candidates.append(segments[base.count("/") + 1:])
+
+        for candidate in candidates:
+            node = self._find(self.root, candidate, 0)
+            if node is not None:
+                params = _path_parameters(node.path, candidate)
+                return PathMatch(node.path, params, dict(node.operations))
+
+        return None
+
+    def lookup(self, method: str, url: str) -> Optional[str]:
+        """Get the operationId for the method and URL."""
+        found = self.match(url)
+        return found.operation(method) if found else None
+
+
+def _path_parameters(template: str, segments: list[str]) -> dict[str, str]:
+    """Get the path parameter values from the URL segments matching the template."""
+    params = {}
+    for pattern, value in zip(_segments(template), segments):
+        names = _PARAM_PATTERN.findall(pattern)
+        if not names:
+            continue
+        values = _segment_regex(pattern).match(value).groups()
+        params.update({n: unquote(v) for n, v in zip(names, values)})
+    return params
+
+
+def create_router(spec: dict[str, Any]) -> PathRouter:
+    """Create a PathRouter for the operations in the OpenAPI spec.
+
+    The paths from the 'servers' URLs are used as base paths, so URLs including them also match.
+    """
+    base_paths = [urlsplit(s.get(OasField.URL, "")).path for s in spec.get(OasField.SERVERS) or []]
+    router = PathRouter(base_paths)
+    for path, path_data in (spec.get(OasField.PATHS) or {}).items():
+        for method, op_data in path_data.items():
+            if method.lower() in HTTP_METHODS and isinstance(op_data, dict):
+                router.add(path, method, op_data.get(OasField.OP_ID))
+    return router
+
+
 def remove_schema_tags(schema: dict[str, Any]) -> dict[str, Any]:
     """Remove all 'tags' from the output schema.
 
@@ -582,3 +1257,104 @@ def remove_property(schema: dict[str, Any], prop_name: str) -> dict[str, Any]:
         result = temp
 
     return result
+
+
+def _full_ref(model_name: str) -> str:
+    """Get the reference for the model name from map_models() (e.g. "schemas/Pet")."""
+    section, _, name = model_name.partition("/")
+    return f"#/{OasField.COMPONENTS.value}/{section}/{name.replace('~', '~0').replace('/', '~1')}"
+
+
+def rename_references(obj: Any, renames: dict[str, str]) -> int:
+    """Replace the reference values found in 'renames' (in place), and return the number replaced."""
+    count = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            ref = item.get(OasField.REFS.value)
+            if isinstance(ref, str) and ref in renames:
+                item[OasField.REFS.value] = renames[ref]
+                count += 1
+            stack.extend(v for v in item.values() if isinstance(v, (dict, list)))
+        elif isinstance(item, list):
+            stack.extend(v for v in item if isinstance(v, (dict, list)))
+    return count
+
+
+def _model_digest(model: Any, renames: dict[str, str]) -> bytes:
+    """Get a hash of the canonical (sorted keys, compact) JSON for the model."""
+    if renames:
+        model = deepcopy(model)
+        rename_references(model, renames)
+    text = json.dumps(model, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=20).digest()
+
+
+def find_duplicate_models(models: dict[str, Any]) -> dict[str, str]:
+    """Find the models that are identical to another model in the same section.
+
+    The 'models' are from map_models(), and the result maps each duplicate model name to the
+    name of the (first) identical model that replaces it.
+
+    Models that only differ by references to duplicate models (e.g. both contain a list of
+    identical models) are also duplicates, so the hashing is repeated with the duplicate
+    references replaced until no more are found. Each round is linear in the size of the models.
+    """
+    duplicates: dict[str, str] = {}
+    renames: dict[str, str] = {}
+    candidates = list(models.keys())
+    digests = {name: _model_digest(models[name], renames) for name in candidates}
+    referrers: dict[str, set[str]] = {}
+    for name in candidates:
+        for ref in iter_references(models[name]):
+            referrers.setdefault(ref, set()).add(name)
+    while True:
+        found = {}
+        first: dict[tuple[str, bytes], str] = {}
+        for name in candidates:
+            key = (name.split("/", 1)[0], digests[name])
+            original = first.setdefault(key, name)
+            if original != name:
+                found[name] = original
+
+        if not found:
+            break
+
+        duplicates.update(found)
+        new_renames = {_full_ref(k): _full_ref(v) for k, v in found.items()}
+        renames.update(new_renames)
+        candidates = [name for name in candidates if name not in found]
+
+        # only the models that refer to the new duplicates need to be hashed again
+        changed = {name for ref in new_renames for name in referrers.get(ref, ())}
+        for name in changed.difference(duplicates):
+            digests[name] = _model_digest(models[name], renames)
+
+    # resolve chains (e.g. C -> B in a later round, when B -> A in an earlier one)
+    for name, original in duplicates.items():
+        while original in duplicates:
+            original = duplicates[original]
+        duplicates[name] = original
+
+    return duplicates
+
+
+def remove_duplicate_models(schema: dict[str, Any], duplicates: Optional[dict[str, str]] = None) -> dict[str, Any]:
+    """Remove the duplicate models, and update the references to use the remaining model.
+
+    When not provided, the 'duplicates' are determined by find_duplicate_models().
+    """
+    result = deepcopy(schema)
+    models = map_models(result.get(OasField.COMPONENTS, {}))
+    if duplicates is None:
+        duplicates = find_duplicate_models(models)
+    if not duplicates:
+        return result
+
+    for name in duplicates:
+        models.pop(name, None)
+    result[OasField.COMPONENTS.value] = unmap_models(models)
+    rename_references(result, {_full_ref(k): _full_ref(v) for k, v in duplicates.items()})
+
+    return result
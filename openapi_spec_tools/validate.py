@@ -0,0 +1,647 @@
+"""Structural validation of OpenAPI 3.0/3.1 documents.
+
+The structure of each version is described by a table of definitions (objects with their fields,
+maps, lists, and primitive types). The definitions are compiled once (per version) into a tree of
+Python closures, where each closure checks one kind of node and calls the closures for its
+children. Validating a spec is just calling the closure for the root, so nothing is interpreted per
+node (unlike generic JSON-schema validators walking the meta-schema).
+
+The problems are reported with the JSON pointer location. Local references ("#/...") are checked
+to resolve, since those are the most common problem in hand-edited specs.
+"""
+import re
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from functools import cache
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from openapi_spec_tools.resolver import resolve_pointer
+
+# stop after this many problems (a broken spec may have thousands)
+DEFAULT_MAX_ERRORS = 100
+
+SUPPORTED_VERSIONS = ["3.0", "3.1"]
+
+
+@dataclass(frozen=True)
+class Violation:
+    """Structural problem, where the pointer is the JSON pointer location in the spec."""
+
+    pointer: str
+    message: str
+
+    def to_dict(self) -> dict[str, str]:
+        """Get the dictionary for JSON export."""
+        return {"pointer": self.pointer, "message": self.message}
+
+
+#################################################
+# Definitions "language"
+@dataclass
+class Obj:
+    """Object with known fields, where the patterns and additional specify the other keys.
+
+    Other keys are not allowed when additional is None. Specification extensions (x-...) are
+    allowed when extensions is set.
+    """
+
+    fields: dict[str, Any]
+    required: tuple[str, ...] = ()
+    patterns: dict[str, Any] = field(default_factory=dict)
+    additional: Any = None
+    extensions: bool = True
+
+
+@dataclass(frozen=True)
+class MapOf:
+    """Object where all the values have the same definition (and the keys match the pattern)."""
+
+    value: Any
+    key_pattern: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ListOf:
+    """List of items with the same definition."""
+
+    item: Any
+
+
+@dataclass(frozen=True)
+class RefOr:
+    """Reference object, or the definition."""
+
+    value: Any
+
+
+@dataclass(frozen=True)
+class OneOf:
+    """Fixed set of values."""
+
+    values: tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class ByType:
+    """Definition selected by the JSON type of the value (e.g. {"boolean": ..., "object": ...})."""
+
+    choices: tuple[tuple[str, Any], ...]
+
+
+# primitive types, and the Python types used for them
+_PRIMITIVES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+    "object": (dict,),
+    "array": (list,),
+}
+
+_JSON_TYPES = {dict: "object", list: "array", str: "string", bool: "boolean", int: "integer", float: "number"}
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else _JSON_TYPES.get(type(value), type(value).__name__)
+
+
+def _escape(key: Any) -> str:
+    key = str(key)
+    return key.replace("~", "~0").replace("/", "~1") if "~" in key or "/" in key else key
+
+
+#################################################
+# OpenAPI 3.0 definitions
+_COMPONENT_NAME = r"^[a-zA-Z0-9\.\-_]+$"
+_METHODS = ["get", "put", "post", "delete", "options", "head", "patch", "trace"]
+_SCHEMA_TYPES = ("array", "boolean", "integer", "number", "object", "string")
+
+_PARAMETER_FIELDS = {
+    "description": "string",
+    "required": "boolean",
+    "deprecated": "boolean",
+    "allowEmptyValue": "boolean",
+    "style": "string",
+    "explode": "boolean",
+    "allowReserved": "boolean",
+    "schema": RefOr("Schema"),
+    "example": "any",
+    "examples": MapOf(RefOr("Example")),
+    "content": MapOf("MediaType"),
+}
+
+_SCHEMA_FIELDS = {
+    "title": "string",
+    "multipleOf": "number",
+    "maximum": "number",
+    "exclusiveMaximum": "boolean",
+    "minimum": "number",
+    "exclusiveMinimum": "boolean",
+    "maxLength": "integer",
+    "minLength": "integer",
+    "pattern": "string",
+    "maxItems": "integer",
+    "minItems": "integer",
+    "uniqueItems": "boolean",
+    "maxProperties": "integer",
+    "minProperties": "integer",
+    "required": ListOf("string"),
+    "enum": "array",
+    "type": OneOf(_SCHEMA_TYPES),
+    "allOf": ListOf(RefOr("Schema")),
+    "oneOf": ListOf(RefOr("Schema")),
+    "anyOf": ListOf(RefOr("Schema")),
+    "not": RefOr("Schema"),
+    "items": RefOr("Schema"),
+    "properties": MapOf(RefOr("Schema")),
+    "additionalProperties": ByType((("boolean", "boolean"), ("object", RefOr("Schema")))),
+    "description": "string",
+    "format": "string",
+    "default": "any",
+    "nullable": "boolean",
+    "discriminator": "Discriminator",
+    "readOnly": "boolean",
+    "writeOnly": "boolean",
+    "xml": "XML",
+    "externalDocs": "ExternalDocs",
+    "example": "any",
+    "deprecated": "boolean",
+}
+
+OAS30_DEFINITIONS: dict[str, Any] = {
+    "OpenAPI": Obj(
+        {
+            "openapi": "string",
+            "info": "Info",
+            "servers": ListOf("Server"),
+            "paths": "Paths",
+            "components": "Components",
+            "security": ListOf("SecurityRequirement"),
+            "tags": ListOf("Tag"),
+            "externalDocs": "ExternalDocs",
+        },
+        required=("openapi", "info", "paths"),
+    ),
+    "Info": Obj(
+        {
+            "title": "string",
+            "description": "string",
+            "termsOfService": "string",
+            "contact": "Contact",
+            "license": "License",
+            "version": "string",
+        },
+        required=("title", "version"),
+    ),
+    "Contact": Obj({"name": "string", "url": "string", "email": "string"}),
+    "License": Obj({"name": "string", "url": "string"}, required=("name",)),
+    "Server": Obj(
+        {"url": "string", "description": "string", "variables": MapOf("ServerVariable")},
+        required=("url",),
+    ),
+    "ServerVariable": Obj(
+        {"enum": ListOf("string"), "default": "string", "description": "string"},
+        required=("default",),
+    ),
+    "Components": Obj({
+        "schemas": MapOf(RefOr("Schema"), _COMPONENT_NAME),
+        "responses": MapOf(RefOr("Response"), _COMPONENT_NAME),
+        "parameters": MapOf(RefOr("Parameter"), _COMPONENT_NAME),
+        "examples": MapOf(RefOr("Example"), _COMPONENT_NAME),
+        "requestBodies": MapOf(RefOr("RequestBody"), _COMPONENT_NAME),
+        "headers": MapOf(RefOr("Header"), _COMPONENT_NAME),
+        "securitySchemes": MapOf(RefOr("SecurityScheme"), _COMPONENT_NAME),
+        "links": MapOf(RefOr("Link"), _COMPONENT_NAME),
+        "callbacks": MapOf(RefOr("Callback"), _COMPONENT_NAME),
+    }),
+    "Paths": Obj({}, patterns={"^/": "PathItem"}),
+    "PathItem": Obj(
+        {
+            "$ref": "ref",
+            "summary": "string",
+            "description": "string",
+            "servers": ListOf("Server"),
+            "parameters": ListOf(RefOr("Parameter")),
+        } | {method: "Operation" for method in _METHODS},
+    ),
+    "Operation": Obj(
+        {
+            "tags": ListOf("string"),
+            "summary": "string",
+            "description": "string",
+            "externalDocs": "ExternalDocs",
+            "operationId": "string",
+            "parameters": ListOf(RefOr("Parameter")),
+            "requestBody": RefOr("RequestBody"),
+            "responses": "Responses",
+            "callbacks": MapOf(RefOr("Callback")),
+            "deprecated": "boolean",
+            "security": ListOf("SecurityRequirement"),
+            "servers": ListOf("Server"),
+        },
+        required=("responses",),
+    ),
+    "ExternalDocs": Obj({"description": "string", "url": "string"}, required=("url",)),
+    "Parameter": Obj(
+        {"name": "string", "in": OneOf(("query", "header", "path", "cookie"))} | _PARAMETER_FIELDS,
+        required=("name", "in"),
+    ),
+    "RequestBody": Obj(
+        {"description": "string", "content": MapOf("MediaType"), "required": "boolean"},
+        required=("content",),
+    ),
+    "MediaType": Obj({
+        "schema": RefOr("Schema"),
+        "example": "any",
+        "examples": MapOf(RefOr("Example")),
+        "encoding": MapOf("Encoding"),
+    }),
+    "Encoding": Obj({
+        "contentType": "string",
+        "headers": MapOf(RefOr("Header")),
+        "style": "string",
+        "explode": "boolean",
+        "allowReserved": "boolean",
+    }),
+    "Responses": Obj({"default": RefOr("Response")}, patterns={r"^[1-5](?:[0-9]{2}|XX)$": RefOr("Response")}),
+    "Response": Obj(
+        {
+            "description": "string",
+            "headers": MapOf(RefOr("Header")),
+            "content": MapOf("MediaType"),
+            "links": MapOf(RefOr("Link")),
+        },
+        required=("description",),
+    ),
+    "Callback": Obj({}, additional="PathItem"),
+    "Example": Obj({"summary": "string", "description": "string", "value": "any", "externalValue": "string"}),
+    "Link": Obj({
+        "operationRef": "string",
+        "operationId": "string",
+        "parameters": MapOf("any"),
+        "requestBody": "any",
+        "description": "string",
+        "server": "Server",
+    }),
+    "Header": Obj(_PARAMETER_FIELDS),
+    "Tag": Obj({"name": "string", "description": "string", "externalDocs": "ExternalDocs"}, required=("name",)),
+    "Schema": Obj(_SCHEMA_FIELDS),
+    "Discriminator": Obj({"propertyName": "string", "mapping": MapOf("string")}, required=("propertyName",)),
+    "XML": Obj({
+        "name": "string",
+        "namespace": "string",
+        "prefix": "string",
+        "attribute": "boolean",
+        "wrapped": "boolean",
+    }),
+    "SecurityScheme": Obj(
+        {
+            "type": OneOf(("apiKey", "http", "oauth2", "openIdConnect")),
+            "description": "string",
+            "name": "string",
+            "in": OneOf(("query", "header", "cookie")),
+            "scheme": "string",
+            "bearerFormat": "string",
+            "flows": "OAuthFlows",
+            "openIdConnectUrl": "string",
+        },
+        required=("type",),
+    ),
+    "OAuthFlows": Obj({
+        "implicit": "OAuthFlow",
+        "password": "OAuthFlow",
+        "clientCredentials": "OAuthFlow",
+        "authorizationCode": "OAuthFlow",
+    }),
+    "OAuthFlow": Obj(
+        {"authorizationUrl": "string", "tokenUrl": "string", "refreshUrl": "string", "scopes": MapOf("string")},
+        required=("scopes",),
+    ),
+    "SecurityRequirement": MapOf(ListOf("string")),
+}
+
+
+#################################################
+# OpenAPI 3.1 definitions (differences from 3.0)
+def _extend(obj: Obj, fields: Optional[dict[str, Any]] = None, **changes) -> Obj:
+    return replace(obj, fields=obj.fields | (fields or {}), **changes)
+
+
+_SCHEMA_31 = _extend(
+    OAS30_DEFINITIONS["Schema"],
+    {
+        # JSON Schema 2020-12 keywords
+        "$ref": "ref",
+        "$id": "string",
+        "$schema": "string",
+        "$anchor": "string",
+        "$dynamicRef": "string",
+        "$dynamicAnchor": "string",
+        "$defs": MapOf("Schema"),
+        "$comment": "string",
+        "exclusiveMaximum": "number",
+        "exclusiveMinimum": "number",
+        "type": ByType((
+            ("string", OneOf(_SCHEMA_TYPES + ("null",))),
+            ("array", ListOf(OneOf(_SCHEMA_TYPES + ("null",)))),
+        )),
+        "allOf": ListOf("Schema"),
+        "oneOf": ListOf("Schema"),
+        "anyOf": ListOf("Schema"),
+        "not": "Schema",
+        "if": "Schema",
+        "then": "Schema",
+        "else": "Schema",
+        "items": "Schema",
+        "prefixItems": ListOf("Schema"),
+        "contains": "Schema",
+        "properties": MapOf("Schema"),
+        "patternProperties": MapOf("Schema"),
+        "additionalProperties": "Schema",
+        "propertyNames": "Schema",
+        "unevaluatedItems": "Schema",
+        "unevaluatedProperties": "Schema",
+        "dependentSchemas": MapOf("Schema"),
+        "const": "any",
+        "examples": "array",
+        "contentMediaType": "string",
+        "contentEncoding": "string",
+        "contentSchema": "Schema",
+    },
+    # other keywords (from other vocabularies) are allowed
+    additional="any",
+)
+_SCHEMA_31.fields.pop("nullable")
+
+OAS31_DEFINITIONS: dict[str, Any] = OAS30_DEFINITIONS | {
+    "OpenAPI": _extend(
+        OAS30_DEFINITIONS["OpenAPI"],
+        {"jsonSchemaDialect": "string", "webhooks": MapOf(RefOr("PathItem"))},
+        required=("openapi", "info"),
+    ),
+    "Info": _extend(OAS30_DEFINITIONS["Info"], {"summary": "string"}),
+    "License": _extend(OAS30_DEFINITIONS["License"], {"identifier": "string"}),
+    "Components": _extend(
+        OAS30_DEFINITIONS["Components"],
+        {"schemas": MapOf("Schema", _COMPONENT_NAME), "pathItems": MapOf(RefOr("PathItem"), _COMPONENT_NAME)},
+    ),
+    "Operation": _extend(OAS30_DEFINITIONS["Operation"], required=()),
+    "Parameter": _extend(OAS30_DEFINITIONS["Parameter"], {"schema": "Schema"}),
+    "Header": _extend(OAS30_DEFINITIONS["Header"], {"schema": "Schema"}),
+    "MediaType": _extend(OAS30_DEFINITIONS["MediaType"], {"schema": "Schema"}),
+    "SecurityScheme": _extend(
+        OAS30_DEFINITIONS["SecurityScheme"],
+        {"type": OneOf(("apiKey", "http", "mutualTLS", "oauth2", "openIdConnect"))},
+    ),
+    # boolean schemas are allowed
+    "Schema": ByType((("boolean", "boolean"), ("object", "SchemaObject"))),
+    "SchemaObject": _SCHEMA_31,
+}
+
+
+#################################################
+# Compiler
+class _TooManyErrors(Exception):
+    pass
+
+
+class _Context:
+    """State for validating one spec."""
+
+    def __init__(self, root: Any, max_errors: int):
+        self.root = root
+        self.max_errors = max_errors
+        self.violations: list[Violation] = []
+        self.refs: dict[str, bool] = {}
+
+    def error(self, pointer: str, message: str) -> None:
+        self.violations.append(Violation(pointer or "/", message))
+        if len(self.violations) >= self.max_errors:
+            raise _TooManyErrors()
+
+    def check_ref(self, ref: str, pointer: str) -> None:
+        if not ref.startswith("#"):
+            # references to other files are resolved when the spec is opened
+            return
+        found = self.refs.get(ref)
+        if found is None:
+            try:
+                resolve_pointer(self.root, ref[1:])
+                found = True
+            except (ValueError, IndexError):
+                found = False
+            self.refs[ref] = found
+        if not found:
+            self.error(pointer, f"unable to resolve reference {ref}")
+
+
+Check = Callable[[Any, str, _Context], None]
+
+
+def _no_check(value: Any, pointer: str, ctx: _Context) -> None:
+    return
+
+
+class _Compiler:
+    """Compiles the definitions into closures (each named definition is compiled once)."""
+
+    def __init__(self, definitions: dict[str, Any]):
+        self.definitions = definitions
+        self.compiled: dict[str, Check] = {}
+
+    def named(self, name: str) -> Check:
+        check = self.compiled.get(name)
+        if check is None:
+            # the placeholder allows recursive definitions (e.g. schemas with properties)
+            target: list[Check] = []
+
+            def check(value: Any, pointer: str, ctx: _Context) -> None:
+                target[0](value, pointer, ctx)
+
+            self.compiled[name] = check
+            target.append(self.compile(self.definitions[name]))
+            # callers compiled after this get the real closure directly
+            self.compiled[name] = target[0]
+        return check
+
+    def compile(self, definition: Any) -> Check:
+        if isinstance(definition, str):
+            if definition == "any":
+                return _no_check
+            if definition == "ref":
+                return self._ref()
+            if definition in _PRIMITIVES:
+                return self._primitive(definition)
+            return self.named(definition)
+        if isinstance(definition, Obj):
+            return self._object(definition)
+        if isinstance(definition, MapOf):
+            return self._map(definition)
+        if isinstance(definition, ListOf):
+            return self._list(definition)
+        if isinstance(definition, RefOr):
+            return self._ref_or(definition)
+        if isinstance(definition, OneOf):
+            return self._one_of(definition)
+        if isinstance(definition, ByType):
+            return self._by_type(definition)
+        raise ValueError(f"unknown definition {definition!r}")
+
+    def _primitive(self, name: str) -> Check:
+        types = _PRIMITIVES[name]
+        # bool is a sub-class of int
+        exclude_bool = name in ("integer", "number")
+
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            if not isinstance(value, types) or (exclude_bool and isinstance(value, bool)):
+                ctx.error(pointer, f"expected {name}, found {_type_name(value)}")
+
+        return check
+
+    def _ref(self) -> Check:
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            if not isinstance(value, str):
+                ctx.error(pointer, f"expected string, found {_type_name(value)}")
+            else:
+                ctx.check_ref(value, pointer)
+
+        return check
+
+    def _object(self, definition: Obj) -> Check:
+        fields = {name: self.compile(value) for name, value in definition.fields.items()}
+        required = definition.required
+        patterns = [(re.compile(p).match, self.compile(v)) for p, v in definition.patterns.items()]
+        additional = None if definition.additional is None else self.compile(definition.additional)
+        extensions = definition.extensions
+
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            if not isinstance(value, dict):
+                ctx.error(pointer, f"expected object, found {_type_name(value)}")
+                return
+            for name in required:
+                if name not in value:
+                    ctx.error(pointer, f"missing required field '{name}'")
+            for key, item in value.items():
+                child = fields.get(key)
+                if child is None:
+                    text = str(key)
+                    if extensions and text.startswith("x-"):
+                        continue
+                    for match, pattern_check in patterns:
+                        if match(text):
+                            child = pattern_check
+                            break
+                    else:
+                        child = additional
+                    if child is None:
+                        ctx.error(f"{pointer}/{_escape(key)}", f"unexpected field '{key}'")
+                        continue
+                child(item, f"{pointer}/{_escape(key)}", ctx)
+
+        return check
+
+    def _map(self, definition: MapOf) -> Check:
+        value_check = self.compile(definition.value)
+        key_match = re.compile(definition.key_pattern).match if definition.key_pattern else None
+
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            if not isinstance(value, dict):
+                ctx.error(pointer, f"expected object, found {_type_name(value)}")
+                return
+            for key, item in value.items():
+                child = f"{pointer}/{_escape(key)}"
+                if key_match and not key_match(str(key)):
+                    ctx.error(child, f"invalid name '{key}'")
+                value_check(item, child, ctx)
+
+        return check
+
+    def _list(self, definition: ListOf) -> Check:
+        item_check = self.compile(definition.item)
+
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            if not isinstance(value, list):
+                ctx.error(pointer, f"expected array, found {_type_name(value)}")
+                return
+            for index, item in enumerate(value):
+                item_check(item, f"{pointer}/{index}", ctx)
+
+        return check
+
+    def _ref_or(self, definition: RefOr) -> Check:
+        value_check = self.compile(definition.value)
+        ref_check = self._ref()
+
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            if isinstance(value, dict) and "$ref" in value:
+                # other fields of a reference object are ignored
+                ref_check(value["$ref"], f"{pointer}/$ref", ctx)
+            else:
+                value_check(value, pointer, ctx)
+
+        return check
+
+    def _one_of(self, definition: OneOf) -> Check:
+        values = set(definition.values)
+        expected = ", ".join(str(v) for v in definition.values)
+
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            if not isinstance(value, (str, int, float, bool)):
+                ctx.error(pointer, f"expected one of: {expected}, found {_type_name(value)}")
+            elif value not in values:
+                ctx.error(pointer, f"'{value}' is not one of: {expected}")
+
+        return check
+
+    def _by_type(self, definition: ByType) -> Check:
+        choices = [(_PRIMITIVES[name], self.compile(value)) for name, value in definition.choices]
+        expected = " or ".join(name for name, _ in definition.choices)
+
+        def check(value: Any, pointer: str, ctx: _Context) -> None:
+            for types, choice in choices:
+                if isinstance(value, types):
+                    choice(value, pointer, ctx)
+                    return
+            ctx.error(pointer, f"expected {expected}, found {_type_name(value)}")
+
+        return check
+
+
+@cache
+def compiled_validator(version: str) -> Check:
+    """Get the (compiled) validator for the OpenAPI version (e.g. "3.0")."""
+    definitions = {"3.0": OAS30_DEFINITIONS, "3.1": OAS31_DEFINITIONS}[version]
+    return _Compiler(definitions).named("OpenAPI")
+
+
+def oas_version(spec: Any) -> Optional[str]:
+    """Get the major.minor version of the OpenAPI spec (e.g. "3.0"), or None when unsupported."""
+    value = spec.get("openapi") if isinstance(spec, dict) else None
+    match = re.match(r"^(\d+\.\d+)\.\d+", value) if isinstance(value, str) else None
+    if match and match.group(1) in SUPPORTED_VERSIONS:
+        return match.group(1)
+    return None
+
+
+def validate_spec(spec: Any, max_errors: int = DEFAULT_MAX_ERRORS) -> list[Violation]:
+    """Check the spec against the OpenAPI structure (for its version).
+
+    Returns the problems found (up to max_errors), in document order.
+    """
+    if not isinstance(spec, dict):
+        return [Violation("/", f"expected object, found {_type_name(spec)}")]
+    version = oas_version(spec)
+    if version is None:
+        found = spec.get("openapi", spec.get("swagger"))
+        message = "missing required field 'openapi'" if found is None else f"unsupported version '{found}'"
+        return [Violation("/openapi" if found is not None else "/", message)]
+
+    ctx = _Context(spec, max(max_errors, 1))
+    try:
+        compiled_validator(version)(spec, "", ctx)
+    except _TooManyErrors:
+        pass
+    return ctx.violations
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import sys
 from pathlib import Path
 
 import typer
@@ -43,5 +44,12 @@ _max_count={_max_count}
 """)
 
 
+@app.command("echo", help="Echo the lines from standard input")
+def echo_lines():
+    print("ready", flush=True)
+    for line in sys.stdin:
+        print(f"echo: {line.strip()}")
+
+
 if __name__ == "__main__":
     app()
@@ -432,6 +432,7 @@ def test_cli_generate_success(code_dir, test_dir, include_tests, expected_code,
     expected = {
         "__init__.py",
         "_arguments.py",
+        "_bulk.py",
         "_console.py",
         "_display.py",
         "_exceptions.py",
@@ -439,6 +440,7 @@ def test_cli_generate_success(code_dir, test_dir, include_tests, expected_code,
         "_requests.py",
         "_tree.py",
         "main.py",
+        "tree.json",
         "tree.yaml",
     }
     assert filenames == expected
@@ -450,6 +452,7 @@ def test_cli_generate_success(code_dir, test_dir, include_tests, expected_code,
         filenames = set(i.name for i in path.iterdir())
         expected = {
             "helpers.py",
+            "test_bulk.py",
             "test_console.py",
             "test_display.py",
             "test_exceptions.py",
@@ -490,6 +493,7 @@ def test_cli_generate_success_copyright(copyright_fixture):
 
     filenames = {
         "_arguments.py",
+        "_bulk.py",
         "_console.py",
         "_display.py",
         "_exceptions.py",
@@ -507,6 +511,7 @@ def test_cli_generate_success_copyright(copyright_fixture):
 
     filenames = {
         "helpers.py",
+        "test_bulk.py",
         "test_console.py",
         "test_display.py",
         "test_exceptions.py",
@@ -586,6 +591,35 @@ Commands with missing operations:
         assert message == mock_stdout.getvalue()
 
 
+def test_cli_generate_validate():
+    layout_file = asset_filename("layout_pets.yaml")
+    pkg_name = "my_cli_pkg"
+    directory = TemporaryDirectory()
+    message = """\
+Invalid OpenAPI spec {}:
+    /paths/~1version~1/get/responses/default/content/application~1json: expected object, found null
+    /paths/~1version~1/get/responses/default/content/schema/type: unexpected field 'type'
+    /paths/~1version~1/get/responses/default/content/schema/properties: unexpected field 'properties'
+"""
+
+    oas_file = asset_filename("pet3.yaml")
+    with (
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+    ):
+        with pytest.raises(typer.Exit) as context:
+            generate_cli(layout_file, oas_file, pkg_name, directory.name, validate=True)
+        ex = context.value
+        assert ex.exit_code == 1
+        assert message.format(oas_file) == mock_stdout.getvalue()
+    assert not (Path(directory.name) / pkg_name).exists()
+
+    with (
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+    ):
+        generate_cli(layout_file, asset_filename("pet2.yaml"), pkg_name, directory.name, validate=True)
+        assert "Generated files\n" == mock_stdout.getvalue()
+
+
 def test_cli_check_failure():
     layout_file = asset_filename("layout_pets2.yaml")
     oas_file = asset_filename("pet.yaml")
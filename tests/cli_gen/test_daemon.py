@@ -0,0 +1,165 @@
+import os
+import threading
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import pytest
+import requests
+
+from openapi_spec_tools.cli_gen import _arguments
+from openapi_spec_tools.cli_gen import _requests
+from openapi_spec_tools.cli_gen._daemon import ENV_DAEMON_SOCKET
+from openapi_spec_tools.cli_gen._daemon import FORWARD_ENV
+from openapi_spec_tools.cli_gen._daemon import DaemonField
+from openapi_spec_tools.cli_gen._daemon import client
+from openapi_spec_tools.cli_gen._daemon import create_server
+from openapi_spec_tools.cli_gen._daemon import forward
+from openapi_spec_tools.cli_gen._daemon import is_private
+from openapi_spec_tools.cli_gen._daemon import send_message
+from openapi_spec_tools.cli_gen._daemon import socket_path
+from tests.helpers import StringIo
+
+APP_MODULE = "tests.assets.arg_test"
+
+
+@pytest.fixture
+def daemon_fixture():
+    directory = TemporaryDirectory()
+    path = Path(directory.name, "test.sock").as_posix()
+    server = create_server(APP_MODULE, path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    _requests.use_session(None)
+
+
+def test_socket_path():
+    assert "foo.sock" == socket_path("foo.sock")
+    with mock.patch.dict(os.environ, {ENV_DAEMON_SOCKET: "/tmp/bar.sock"}):
+        assert "/tmp/bar.sock" == socket_path()
+    with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": "/run/user/1234"}, clear=True):
+        assert "/run/user/1234/openapi_spec_tools.sock" == socket_path()
+    with mock.patch.dict(os.environ, {}, clear=True):
+        path = socket_path()
+    assert path.endswith(f"openapi_spec_tools-{os.getuid()}/daemon.sock")
+
+
+def test_forward_env():
+    names = [getattr(_arguments, n) for n in dir(_arguments) if n.startswith("ENV_")]
+    assert names
+    assert set(names) <= set(FORWARD_ENV)
+
+
+def test_socket_private(daemon_fixture):
+    assert is_private(daemon_fixture)
+    assert 0o600 == os.stat(daemon_fixture).st_mode & 0o777
+
+    # the client does not connect to a socket others can use
+    os.chmod(daemon_fixture, 0o666)
+    assert not is_private(daemon_fixture)
+    assert forward(["prog", "get"], daemon_fixture) is None
+
+    with mock.patch("os.getuid", return_value=os.getuid() + 1):
+        assert not is_private(daemon_fixture)
+
+
+def test_create_server_shared_directory():
+    with TemporaryDirectory() as directory:
+        os.chmod(directory, 0o777)
+        with pytest.raises(RuntimeError, match="accessible to other users"):
+            create_server(APP_MODULE, Path(directory, "test.sock").as_posix())
+
+        # directory gets created with private access
+        path = Path(directory, "sub", "test.sock").as_posix()
+        server = create_server(APP_MODULE, path)
+        server.server_close()
+        assert 0o700 == os.stat(os.path.dirname(path)).st_mode & 0o777
+    _requests.use_session(None)
+
+
+def test_forward_no_daemon():
+    directory = TemporaryDirectory()
+    path = Path(directory.name, "missing.sock").as_posix()
+    assert forward(["prog", "get"], path) is None
+
+
+def test_forward_success(daemon_fixture):
+    assert isinstance(_requests._session, requests.Session)
+
+    with (
+        mock.patch.dict(os.environ, {"API_KEY": "from-env", "SECRET_TOKEN": "private"}),
+        mock.patch("openapi_spec_tools.cli_gen._daemon.send_message", wraps=send_message) as mock_send,
+    ):
+        stdout = StringIo()
+        exit_code = forward(["prog", "get", "--api-host", "http://daemon.test"], daemon_fixture, stdout=stdout)
+    assert 0 == exit_code
+    assert "_api_host=http://daemon.test" in stdout.getvalue()
+    assert "_api_key=from-env" in stdout.getvalue()
+    # only the variables used by the CLI are sent
+    env = mock_send.call_args_list[0].args[1][DaemonField.ENV]
+    assert "from-env" == env["API_KEY"]
+    assert "SECRET_TOKEN" not in env
+    # environment is restored after handling request
+    assert "API_KEY" not in os.environ
+
+    # run again to make sure state does not carry over
+    stdout = StringIo()
+    assert 0 == forward(["prog", "get"], daemon_fixture, stdout=stdout)
+    assert "_api_host=http://acme.com" in stdout.getvalue()
+    assert "_api_key=None" in stdout.getvalue()
+
+
+def test_forward_error(daemon_fixture):
+    stderr = StringIo()
+    assert 2 == forward(["prog", "get", "--bogus"], daemon_fixture, stderr=stderr)
+    assert "No such option" in stderr.getvalue()
+
+
+def test_forward_streams(daemon_fixture):
+    stdout = StringIo()
+
+    class Input:
+        lines = ["a\n", "b\n", ""]
+
+        def readline(self):
+            # the output is sent while the command is running
+            assert "ready\n" == stdout.getvalue()[:6]
+            return self.lines.pop(0)
+
+    assert 0 == forward(["prog", "echo"], daemon_fixture, stdin=Input(), stdout=stdout)
+    assert "ready\necho: a\necho: b\n" == stdout.getvalue()
+
+
+def test_client_daemon(daemon_fixture):
+    with (
+        mock.patch("sys.argv", ["prog", "get", "--api-key", "daemon-key"]),
+        mock.patch("sys.stdout", new_callable=StringIo) as mock_stdout,
+        pytest.raises(SystemExit) as err,
+    ):
+        client(APP_MODULE, daemon_fixture)
+
+    assert 0 == err.value.code
+    assert "_api_key=daemon-key" in mock_stdout.getvalue()
+
+
+def test_client_fallback():
+    directory = TemporaryDirectory()
+    path = Path(directory.name, "missing.sock").as_posix()
+    with (
+        mock.patch("sys.argv", ["prog", "get", "--api-key", "local-key"]),
+        mock.patch("sys.stdout", new_callable=StringIo) as mock_stdout,
+        pytest.raises(SystemExit) as err,
+    ):
+        client(APP_MODULE, path)
+
+    assert 0 == err.value.code
+    assert "_api_key=local-key" in mock_stdout.getvalue()
+
+
+def test_create_server_running(daemon_fixture):
+    with pytest.raises(RuntimeError, match="already running"):
+        create_server(APP_MODULE, daemon_fixture)
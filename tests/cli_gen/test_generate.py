@@ -4,6 +4,7 @@ from tempfile import TemporaryDirectory
 
 import pytest
 
+from openapi_spec_tools.cli_gen._tree import load_tree_data
 from openapi_spec_tools.cli_gen.generate import DEFAULT_COPYRIGHT
 from openapi_spec_tools.cli_gen.generate import check_for_missing
 from openapi_spec_tools.cli_gen.generate import copy_and_update
@@ -11,7 +12,9 @@ from openapi_spec_tools.cli_gen.generate import copy_infrastructure
 from openapi_spec_tools.cli_gen.generate import copy_tests
 from openapi_spec_tools.cli_gen.generate import copyright
 from openapi_spec_tools.cli_gen.generate import find_unreferenced
+from openapi_spec_tools.cli_gen.generate import generate_daemon_client
 from openapi_spec_tools.cli_gen.generate import generate_node
+from openapi_spec_tools.cli_gen.generate import generate_tree_file
 from openapi_spec_tools.cli_gen.generate import generate_tree_node
 from openapi_spec_tools.cli_gen.generate import set_copyright
 from openapi_spec_tools.cli_gen.generator import Generator
@@ -187,6 +190,20 @@ def test_generate_tree_node(oas_filename, layout_filename, expected):
     assert expected == names
 
 
+def test_generate_tree_file(copyright_fixture):
+    oas = open_oas(asset_filename("pets_and_vets.yaml"))
+    layout = file_to_tree(asset_filename("layout_pets2.yaml"))
+    generator = Generator("cli", oas)
+    directory = TemporaryDirectory()
+    generate_tree_file(generator, layout, directory.name)
+
+    yaml_text = Path(directory.name, "tree.yaml").read_text()
+    assert yaml_text.startswith(DEFAULT_COPYRIGHT)
+    json_data = load_tree_data(Path(directory.name, "tree.json").as_posix())
+    assert load_tree_data(Path(directory.name, "tree.yaml").as_posix()) == json_data
+    assert {"main", "owners", "pets", "veterinarians"}.issubset(json_data.keys())
+
+
 @pytest.mark.parametrize(
     ["layout_asset", "oas_asset", "expected"],
     [
@@ -278,6 +295,7 @@ def test_copy_infrastructure():
     filenames = set(i.name for i in dst_path.iterdir())
     expected = {
         "_arguments.py",
+        "_bulk.py",
         "_console.py",
         "_display.py",
         "_exceptions.py",
@@ -287,6 +305,35 @@ def test_copy_infrastructure():
     }
     assert filenames == expected
 
+
+def test_copy_infrastructure_daemon():
+    tempdir = TemporaryDirectory()
+    dst_path = Path(tempdir.name)
+    package = "another.package"
+
+    copy_infrastructure(dst_path.as_posix(), package, include_daemon=True)
+
+    filenames = set(i.name for i in dst_path.iterdir())
+    assert "_daemon.py" in filenames
+    text = (dst_path / "_daemon.py").read_text()
+    assert "from another.package import _requests as _r" in text
+    assert "openapi_spec_tools" not in text
+
+
+def test_generate_daemon_client(copyright_fixture):
+    oas = open_oas(asset_filename("pet2.yaml"))
+    layout = file_to_tree(asset_filename("layout_pets.yaml"))
+    generator = Generator("cli_package", oas)
+    directory = TemporaryDirectory()
+    generate_daemon_client(generator, layout, directory.name)
+
+    text = Path(directory.name, "_client.py").read_text()
+    assert text.startswith("#!/usr/bin/env python3")
+    assert "from cli_package import _daemon as _dm" in text
+    assert 'APP_MODULE = "cli_package.main"' in text
+    assert "def client() -> None:" in text
+    assert "def daemon() -> None:" in text
+
 def test_copy_tests():
     tempdir = TemporaryDirectory()
     dst_path = Path(tempdir.name)
@@ -297,6 +344,7 @@ def test_copy_tests():
     filenames = set(i.name for i in dst_path.iterdir())
     expected = {
         "helpers.py",
+        "test_bulk.py",
         "test_console.py",
         "test_display.py",
         "test_exceptions.py",
@@ -1,6 +1,9 @@
+import json
+from datetime import date
 from pathlib import Path
 
 import pytest
+import yaml
 
 from openapi_spec_tools.cli_gen.generator import Generator
 from openapi_spec_tools.cli_gen.layout import file_to_tree
@@ -35,6 +38,7 @@ def test_standard_imports():
     text = uut.standard_imports()
     assert "import typer" in text
     assert "from typing import Annotated" in text
+    assert "from cli_package import _bulk as _b" in text
 
 
 def test_subcommand_imports():
@@ -433,6 +437,94 @@ def test_op_body_formation():
     assert 'body["format"] = format_' in text
 
 
+def test_op_body_validator():
+    oas = open_oas(asset_filename("misc.yaml"))
+    operations = map_operations(oas.get(OasField.PATHS))
+    op = operations.get("testPathParams")
+    uut = Generator("cli_package", oas)
+    body_params = uut.op_body_settable_properties(op)
+    text = uut.op_body_validator("test_path_params", body_params)
+    assert "def _check_test_path_params_body(body: dict) -> None:" in text
+    assert 'value = body.get("anotherValue")' in text
+    assert 'errors.append("--another-value must be a string")' in text
+    assert 'elif value not in ("1", "2", "4", "8"):' in text  # same values as the enum declaration
+    assert 'elif any(not isinstance(item, bool) for item in value):' in text
+    assert "not isinstance(value, int) or isinstance(value, bool)" in text
+    assert 'body.get("bogus")' not in text  # no checks for unknown types
+    assert "raise _e.InvalidBodyError(errors)" in text
+
+    # nothing to check
+    assert "" == uut.op_body_validator("foo", {})
+    assert "" == uut.op_body_validator("foo", {"bogus": {TYPE: "imaginary"}})
+
+
+def test_op_body_validator_checks():
+    body_params = {
+        "name": {TYPE: "string", REQUIRED: True, "minLength": 2, "maxLength": 4},
+        "age": {TYPE: "integer", "minimum": 0, "exclusiveMaximum": 100},
+        "weight": {TYPE: ["number", "null"], "minimum": 0, "exclusiveMinimum": True},
+        "color": {TYPE: "string", ENUM: ["red", "blue"]},
+        "born": {TYPE: "string", FORMAT: "date"},
+        "tags": {TYPE: "string", COLLECT: "array", "maxItems": 2, "maxLength": 3},
+        "good": {TYPE: "boolean"},
+    }
+    uut = Generator("cli_package", {})
+    text = uut.op_body_validator("create", body_params)
+
+    class InvalidBodyError(Exception):
+        pass
+
+    class _e:
+        pass
+
+    _e.InvalidBodyError = InvalidBodyError
+    namespace = {"_e": _e, "date": date}
+    exec(text, namespace)
+    check = namespace["_check_create_body"]
+
+    # valid, and missing values are not checked
+    check({"name": "abc", "age": 0, "weight": 1.5, "color": "red", "born": date.today(), "tags": ["a"], "good": True})
+    check({"name": "abc", "born": "2025-01-01", "weight": 2})
+    check({})
+
+    with pytest.raises(InvalidBodyError) as err:
+        check({
+            "name": "a",
+            "age": 100,
+            "weight": 0,
+            "color": "green",
+            "born": 1,
+            "tags": ["a", "bogus"],
+            "good": "yes",
+        })
+    assert [
+        "--name must be at least 2 characters",
+        "--age must be less than 100",
+        "--weight must be greater than 0",
+        "--color must be one of: red, blue",
+        "--born must be a string or date",
+        "--tags items must be at most 3 characters",
+        "--good must be a boolean",
+    ] == err.value.args[0]
+
+    with pytest.raises(InvalidBodyError) as err:
+        check({"name": 1, "age": True, "weight": "heavy", "tags": ["a", "b", "c"]})
+    assert [
+        "--name must be a string",
+        "--age must be an integer",
+        "--weight must be a number",
+        "--tags must have at most 2 items",
+    ] == err.value.args[0]
+
+    with pytest.raises(InvalidBodyError) as err:
+        check({"name": "abcde", "age": -1, "tags": "a"})
+    assert [
+        "--name must be at most 4 characters",
+        "--age must be at least 0",
+        "--tags must be a list",
+    ] == err.value.args[0]
+
+
 def test_op_path_arguments():
     oas = open_oas(asset_filename("misc.yaml"))
     operations = map_operations(oas.get(OasField.PATHS))
@@ -450,7 +542,11 @@ def test_op_path_arguments():
         'birthday: Annotated[Optional[datetime], typer.Option(show_default=False, help="When is the party?")] = None'
         in text
     )
-    assert 'must_have: Annotated[str, typer.Argument(show_default=False, help="")]' in text
+    assert (
+        'must_have: Annotated[Optional[str], typer.Argument(show_default=False, metavar="MUST_HAVE", '
+        'callback=_a.required_unless_from_file, help="")] = None'
+        in text
+    )
     assert 'your_boat: Annotated[float, typer.Option(help="Pi is always good")] = 3.14159' in text
     assert 'foobar: Annotated[Optional[Any], typer.Option(show_default=False, hidden=True, help="")] = None' in text
 
@@ -1019,6 +1115,33 @@ def test_model_settable_properties(model_name, expected):
     assert expected == properties
 
 
+def test_model_settable_properties_recursive():
+    oas = {
+        "components": {
+            "schemas": {
+                "Node": {
+                    "allOf": [{"$ref": "#/components/schemas/Node"}],
+                    "properties": {
+                        "name": {"type": "string"},
+                        "parent": {"$ref": "#/components/schemas/Node"},
+                        "owner": {"$ref": "#/components/schemas/Owner"},
+                    },
+                },
+                "Owner": {
+                    "properties": {
+                        "email": {"type": "string"},
+                        "node": {"$ref": "#/components/schemas/Node"},
+                    },
+                },
+            },
+        },
+    }
+    uut = Generator("cli_package", oas)
+    op = {"requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Node"}}}}}
+    properties = uut.op_body_settable_properties(op)
+    assert ["name", "owner.email"] == list(properties)
+
+
 def test_op_body_arguments():
     oas = open_oas(asset_filename("misc.yaml"))
     operations = map_operations(oas.get(OasField.PATHS))
@@ -1088,7 +1211,7 @@ def test_op_body_arguments():
         ),
         pytest.param(
             PaginationNames(items_property="northSouth"),
-            'page_info = _r.PageParams(max_count=_max_count, item_property_name="northSouth")',
+            'page_info = _r.PageParams(max_count=_max_count, items_property_name="northSouth")',
             id="items_property",
         ),
         pytest.param(
@@ -1130,6 +1253,8 @@ def test_op_infra_arguments(command, has_details):
     assert "_log_level: _a.LogLevelOption" in text
     assert "_out_fmt: _a.OutputFormatOption" in text
     assert "_out_style: _a.OutputStyleOption" in text
+    assert "_from_file: _a.FromFileOption" in text
+    assert "_workers: _a.WorkersOption" in text
     details_option = '_details: _a.DetailsOption'
     if has_details:
         assert details_option in text
@@ -1148,7 +1273,17 @@ def test_op_check_missing():
     query_params = uut.op_params(op, "query")
     body_params = uut.op_body_settable_properties(op)
 
+    path_params = uut.op_params(op, "path")
+
     text = uut.op_check_missing(query_params, body_params)
+    assert 'missing.append("MUST_HAVE")' not in text
+
+    text = uut.op_check_missing(query_params, body_params, path_params)
+
+    # path parameters
+    assert 'if must_have is None:' in text
+    assert 'missing.append("MUST_HAVE")' in text
+    assert 'if num_feet is None' not in text  # only required
 
     # infra
     assert 'if _api_key is None:' in text
@@ -1165,6 +1300,24 @@ def test_op_check_missing():
     assert 'missing.append("--tag")' not in text  # only required
 
 
+def test_op_request_arguments():
+    oas = open_oas(asset_filename("misc.yaml"))
+    operations = map_operations(oas.get(OasField.PATHS))
+    op = operations.get("testPathParams")
+    uut = Generator("cli_package", oas)
+    path_params = uut.op_params(op, "path")
+    query_params = uut.op_params(op, "query")
+    body_params = uut.op_body_settable_properties(op)
+
+    text = uut.op_request_arguments(path_params, query_params, body_params)
+    assert text.startswith("num_feet=num_feet, ")
+    assert "must_have=must_have" in text
+    assert "another_qparam=another_qparam" in text
+    assert "name=name" in text
+
+    assert "" == uut.op_request_arguments([], [], {})
+
+
 def test_summary_display():
     uut = Generator("foo", {})
 
@@ -1202,7 +1355,7 @@ def test_function_definition_item():
     assert 'headers = _r.request_headers(_api_key, content_type="application/json")' in text
     assert 'url = _r.create_url(_api_host, "pets")' in text
     assert 'params = {}' in text
-    assert 'data = _r.request("POST", url, headers=headers, params=params, body=body, timemout=_api_timeout)' in text
+    assert 'return _r.request("POST", url, headers=headers, params=params, body=body, timeout=_api_timeout)' in text
     assert '_d.display(data, _out_fmt, _out_style)' in text
     assert '_e.handle_exceptions(ex)' in text
     assert 'data = _d.summary(data, "name")'
@@ -1210,7 +1363,15 @@ def test_function_definition_item():
     # make sure the missing parameter checks are present
     assert 'missing.append("--api-key")'
     assert 'missing.append("--name")'
-    assert ' _e.handle_exceptions(_e.MissingRequiredError(missing))' in text
+    assert ' raise _e.MissingRequiredError(missing)' in text
+
+    # check the bulk execution
+    assert 'def _request(id=id, name=name, tag=tag, owner=owner):' in text
+    assert "_from_file: _a.FromFileOption = None" in text
+    assert "_workers: _a.WorkersOption = 4" in text
+    names = '{"id": "id", "name": "name", "tag": "tag", "owner": "owner"}'
+    assert f"_b.bulk_execute(_request, _from_file, _workers, {names})" in text
+    assert "data = _request()" in text
 
 
 def test_function_definition_bad_body():
@@ -1241,14 +1402,14 @@ def test_function_definition_bad_body():
     assert 'headers = _r.request_headers(_api_key, content_type="application/json")' in text
     assert 'url = _r.create_url(_api_host, "sna/foo")' in text
     assert 'params = {}' in text
-    assert 'data = _r.request("POST", url, headers=headers, params=params, timemout=_api_timeout)' in text
+    assert 'return _r.request("POST", url, headers=headers, params=params, timeout=_api_timeout)' in text
     assert '_d.display(data, _out_fmt, _out_style)' in text
     assert '_e.handle_exceptions(ex)' in text
 
     # make sure the missing parameter checks are present
     assert 'missing.append("--api-key")'
     assert 'missing.append("--name")'
-    assert ' _e.handle_exceptions(_e.MissingRequiredError(missing))' in text
+    assert ' raise _e.MissingRequiredError(missing)' in text
 
 
 def test_function_definition_paged():
@@ -1273,7 +1434,7 @@ def test_function_definition_paged():
 
     # double check a few important body differences
     assert 'page_info = _r.PageParams(max_count=_max_count, page_size_name="limit", page_size_value=limit)' in text
-    assert 'data = _r.depaginate(page_info, url, headers=headers, params=params, timemout=_api_timeout)' in text
+    assert 'return _r.depaginate(page_info, url, headers=headers, params=params, timeout=_api_timeout)' in text
 
 
 def test_function_deprecated():
@@ -1403,6 +1564,23 @@ def test_tree_yaml(oas_filename, layout_filename, tree_filename):
     assert expected == uut.get_tree_yaml(node)
 
 
+@pytest.mark.parametrize(
+    ["oas_filename", "layout_filename", "tree_filename"],
+    [
+        pytest.param("pet2.yaml", "layout_pets.yaml", "tree_pets.yaml", id="simple"),
+        pytest.param("ct.yaml", "layout_cloudtruth.yaml", "tree_cloudtruth.yaml", id="nested"),
+    ]
+)
+def test_tree_json(oas_filename, layout_filename, tree_filename):
+    oas = open_oas(asset_filename(oas_filename))
+    uut = Generator("cli", oas)
+    node = file_to_tree(asset_filename(layout_filename))
+    expected = yaml.safe_load(Path(asset_filename(tree_filename)).read_text())
+    text = uut.get_tree_json(node)
+    assert "\n" not in text
+    assert expected == json.loads(text)
+
+
 def test_tree_function():
     node = LayoutNode("bar", "foo_bar")
     uut = Generator("cli", {})
@@ -1412,4 +1590,5 @@ def test_tree_function():
     assert 'def show_commands' in text
     assert 'display: _a.TreeDisplayOption = _a.TreeDisplay.HELP' in text
     assert 'depth: _a.MaxDepthOption = 5' in text
+    assert 'path = Path(__file__).parent / "tree.json"' in text
     assert '_t.tree(path.as_posix(), "foo_bar", display, depth)' in text
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from openapi_spec_tools.cli_gen.layout import check_pagination_definitions
@@ -15,8 +17,12 @@ from openapi_spec_tools.cli_gen.layout import subcommand_order
 from openapi_spec_tools.cli_gen.layout import subcommand_references
 from openapi_spec_tools.cli_gen.layout_types import LayoutNode
 from openapi_spec_tools.cli_gen.layout_types import PaginationNames
+from openapi_spec_tools.utils import map_operations
+from openapi_spec_tools.utils import open_oas
 from tests.helpers import asset_filename
 
+EXAMPLES = Path(__file__).parent.parent.parent / "examples"
+
 OPS = "operations"
 DESC = "description"
 NAME = "name"
@@ -518,3 +524,47 @@ def test_file_to_tree() -> None:
 def test_node_find(search_args, expected) -> None:
     tree = file_to_tree(asset_filename("layout_pets2.yaml"))
     assert expected == tree.find(*search_args)
+
+
+def _resolve(spec: dict, item: dict) -> dict:
+    ref = item.get("$ref")
+    if not ref:
+        return item
+    for key in ref.removeprefix("#/").split("/"):
+        spec = spec[key]
+    return spec
+
+
+def _paginated(node: LayoutNode) -> list[LayoutNode]:
+    items = [node] if node.pagination else []
+    for child in node.children:
+        items.extend(_paginated(child))
+    return items
+
+
+@pytest.mark.parametrize(
+    ["directory", "spec_name"],
+    [
+        pytest.param("cloudtruth-gen-cli", "ct.yaml", id="cloudtruth"),
+        pytest.param("github", "trimmed.yaml", id="github"),
+        pytest.param("pets-cli", "pet.yaml", id="pets"),
+    ],
+)
+def test_example_pagination_names(directory, spec_name) -> None:
+    spec = open_oas((EXAMPLES / directory / spec_name).as_posix())
+    operations = map_operations(spec["paths"])
+    tree = file_to_tree((EXAMPLES / directory / "layout.yaml").as_posix())
+    nodes = _paginated(tree)
+    assert nodes
+
+    for node in nodes:
+        op = operations[node.identifier]
+        params = (op.get("x-path-params") or []) + (op.get("parameters") or [])
+        names = {_resolve(spec, p)["name"] for p in params}
+        names_used = {node.pagination.page_size, node.pagination.page_start, node.pagination.item_start} - {None}
+        assert names_used <= names, node.identifier
+
+        if node.pagination.items_property:
+            response = _resolve(spec, op["responses"]["200"])
+            schema = _resolve(spec, response["content"]["application/json"]["schema"])
+            assert node.pagination.items_property in schema["properties"], node.identifier
@@ -12,12 +12,17 @@ from requests import Request
 from requests import Response
 
 from openapi_spec_tools.cli_gen._requests import PageParams
+from openapi_spec_tools.cli_gen._requests import _iter_lines
 from openapi_spec_tools.cli_gen._requests import _pretty_params
 from openapi_spec_tools.cli_gen._requests import create_url
 from openapi_spec_tools.cli_gen._requests import depaginate
+from openapi_spec_tools.cli_gen._requests import iter_events
+from openapi_spec_tools.cli_gen._requests import iter_json_lines
 from openapi_spec_tools.cli_gen._requests import raise_for_error
 from openapi_spec_tools.cli_gen._requests import request
 from openapi_spec_tools.cli_gen._requests import request_headers
+from openapi_spec_tools.cli_gen._requests import use_session
+from openapi_spec_tools.cli_gen._requests import user_agent
 
 APP_JSON = "application/json"
 APP_YAML = "application/yaml"
@@ -78,6 +83,20 @@ def test_request_headers(api_key, content_type, kwargs, expected) -> None:
     assert expected == request_headers(api_key, content_type, **kwargs)
 
 
+def test_user_agent() -> None:
+    unknown = VER.split("/")[0] + "/unknown"
+    user_agent.cache_clear()
+    with mock.patch("importlib.metadata.version") as mock_version:
+        mock_version.side_effect = importlib.metadata.PackageNotFoundError("none")
+        assert unknown == user_agent()
+        # cached
+        assert unknown == user_agent()
+        assert 1 == mock_version.call_count
+
+    user_agent.cache_clear()
+    assert VER == user_agent()
+
+
 @pytest.mark.parametrize(
     ["params", "expected"],
     [
@@ -229,6 +248,99 @@ def test_request(method, content_type, body, params, expected):
 
         assert expected == actual
 
+
+def test_request_session():
+    url = "https://foo/path"
+    response = success_response(url=url, body={"a": 1}, content_type=APP_JSON)
+    session = mock.Mock()
+    session.request.return_value = response
+
+    with mock.patch("openapi_spec_tools.cli_gen._requests.requests.request") as mock_request:
+        try:
+            use_session(session)
+            assert {"a": 1} == request("GET", url)
+        finally:
+            use_session(None)
+
+        assert 0 == mock_request.call_count
+        assert 1 == session.request.call_count
+        assert ("GET", url) == session.request.call_args.args
+
+        # back to using the default requests
+        mock_request.return_value = response
+        assert {"a": 1} == request("GET", url)
+        assert 1 == mock_request.call_count
+
+
+def stream_response(chunks: list[bytes], content_type: str) -> Response:
+    """Create a response with the body delivered in the provided chunks."""
+    response = success_response(url="https://foo/stream", headers={"Content-type": content_type})
+    response._content = False
+    response.raw = mock.Mock()
+    response.raw.stream.return_value = iter(chunks)
+    return response
+
+
+def test_iter_lines():
+    chunks = [b"first\r", b"\nsec", b"ond\n\nthird \xc3", b"\xa9\rfourth"]
+    response = stream_response(chunks, "text/event-stream; charset=ISO-8859-1")
+    assert ["first", "second", "", "third \u00e9", "fourth"] == list(_iter_lines(response))
+
+
+def test_iter_events():
+    chunks = [
+        b": keep-alive\n\n",
+        b'data: {"id": 1, "text": "Hel"}\n\n',
+        b'data: {"id": 2,\ndata: "text": "lo"}\n',
+        b"\n",
+        b"event: error\ndata: not json\n\n",
+        b"id: 4\n\n",
+        b"data: [DONE]\n\n",
+        b"data: ignored\n\n",
+    ]
+    response = stream_response(chunks, "text/event-stream")
+    with mock.patch("openapi_spec_tools.cli_gen._requests.logger.info") as mock_info:
+        events = iter_events(response)
+        assert {"id": 1, "text": "Hel"} == next(events)
+        assert {"id": 2, "text": "lo"} == next(events)
+        assert {"event": "error", "data": "not json"} == next(events)
+        assert [] == list(events)
+
+        assert "Got 3 events from https://foo/stream" in mock_info.call_args[0][0]
+
+
+def test_iter_json_lines():
+    chunks = [b'{"a": 1}\n{"a"', b': 2}\n\nnot-json\n', b'{"a": 3}']
+    response = stream_response(chunks, "application/x-ndjson")
+    with (
+        mock.patch("openapi_spec_tools.cli_gen._requests.logger.info") as mock_info,
+        mock.patch("openapi_spec_tools.cli_gen._requests.logger.error") as mock_error,
+    ):
+        assert [{"a": 1}, {"a": 2}, {"a": 3}] == list(iter_json_lines(response))
+
+        assert "Got 3 items from https://foo/stream" in mock_info.call_args[0][0]
+        assert "not-json" in mock_error.call_args[0][0]
+
+
+@pytest.mark.parametrize(
+    ["content_type", "chunks", "expected"],
+    [
+        pytest.param("text/event-stream", [b"data: 1\n\n", b"data: 2\n\n"], [1, 2], id="sse"),
+        pytest.param("application/x-ndjson", [b"1\n2\n"], [1, 2], id="ndjson"),
+        pytest.param("application/jsonl; charset=utf-8", [b"[1]\n"], [[1]], id="jsonl"),
+    ]
+)
+def test_request_stream(content_type, chunks, expected):
+    response = stream_response(chunks, content_type)
+    with mock.patch("openapi_spec_tools.cli_gen._requests.requests.request") as mock_request:
+        mock_request.return_value = response
+
+        actual = request("POST", "https://foo/stream")
+
+        assert mock_request.call_args.kwargs.get("stream") is True
+        assert not isinstance(actual, list)
+        assert expected == list(actual)
+
 ITEMS = [
     {"a": 1, "b": True, "c": "some str", "d": None},
     {"a": 2, "b": False, "c": "", "d": False},
@@ -374,3 +486,39 @@ def test_depagination_next_property():
         assert f"Requesting GET {url}" in dmsg
         dmsg = mock_debug.call_args_list[2][0][0]
         assert f"Requesting GET {next_url}" in dmsg
+
+
+def test_depagination_item_start():
+    url = "http://localhost/sna/foo"
+    page_params = PageParams(page_size_name="limit", page_size_value=3, item_start_name="offset", item_start_value=5)
+
+    with (
+        mock.patch("openapi_spec_tools.cli_gen._requests.requests.get") as mock_get,
+        mock.patch("openapi_spec_tools.cli_gen._requests.logger.info"),
+        mock.patch("openapi_spec_tools.cli_gen._requests.logger.debug"),
+    ):
+        mock_get.side_effect = [success_response(body=ITEMS), success_response(body=ITEMS[:1])]
+
+        items = depaginate(page_params, url)
+        assert ITEMS + ITEMS[:1] == items
+
+        # the offset moves forward by the number of items received
+        assert 2 == mock_get.call_count
+        assert {"limit": 3, "offset": 5} == mock_get.call_args_list[0][1]["params"]
+        assert {"limit": 3, "offset": 8} == mock_get.call_args_list[1][1]["params"]
+
+
+def test_depagination_page_size_only():
+    url = "http://localhost/sna/foo"
+    page_params = PageParams(page_size_name="limit", page_size_value=3)
+
+    with (
+        mock.patch("openapi_spec_tools.cli_gen._requests.requests.get") as mock_get,
+        mock.patch("openapi_spec_tools.cli_gen._requests.logger.info"),
+        mock.patch("openapi_spec_tools.cli_gen._requests.logger.debug"),
+    ):
+        mock_get.return_value = success_response(body=ITEMS)
+
+        # a full page, but there is no way to ask for the next one
+        assert ITEMS == depaginate(page_params, url)
+        assert 1 == mock_get.call_count
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from openapi_spec_tools.cli_gen.generate import set_copyright
@@ -8,3 +10,11 @@ def copyright_fixture():
     set_copyright()  # set to default
     yield
     set_copyright() # reset to default
+
+
+@pytest.fixture(autouse=True)
+def working_directory():
+    # some tests change into temporary directories, and the batch tests resolve names relative to the cwd
+    cwd = os.getcwd()
+    yield
+    os.chdir(cwd)
@@ -0,0 +1,130 @@
+import pytest
+
+from openapi_spec_tools.batch import SUMMARY_COLUMNS
+from openapi_spec_tools.batch import SUMMARY_METHODS
+from openapi_spec_tools.batch import FileResult
+from openapi_spec_tools.batch import analyze_file
+from openapi_spec_tools.batch import analyze_files
+from openapi_spec_tools.batch import content_type_rows
+from openapi_spec_tools.batch import expand_filenames
+from openapi_spec_tools.batch import is_pattern
+from openapi_spec_tools.batch import model_rows
+from openapi_spec_tools.batch import operation_rows
+from openapi_spec_tools.batch import summary_rows
+from openapi_spec_tools.batch import totals
+from openapi_spec_tools.utils import map_operations
+from tests.helpers import asset_filename
+from tests.helpers import open_test_oas
+
+
+@pytest.mark.parametrize(
+    ["name", "expected"],
+    [
+        pytest.param(asset_filename("pet.yaml"), False, id="file"),
+        pytest.param(asset_filename("missing.yaml"), False, id="missing"),
+        pytest.param(asset_filename("multi"), True, id="directory"),
+        pytest.param(asset_filename("pet*.yaml"), True, id="glob"),
+        pytest.param(asset_filename("pet[23].yaml"), True, id="range"),
+    ]
+)
+def test_is_pattern(name, expected) -> None:
+    assert expected == is_pattern(name)
+
+
+def test_expand_filenames() -> None:
+    names = [asset_filename("pet?.yaml"), asset_filename("pet2.yaml"), asset_filename("missing.yaml")]
+    expected = [asset_filename(n) for n in ["missing.yaml", "pet2.yaml", "pet3.yaml"]]
+    assert expected == expand_filenames(names)
+
+    expected = [
+        asset_filename(n)
+        for n in [
+            "multi/common/parameters.yaml",
+            "multi/common/responses.yaml",
+            "multi/openapi.yaml",
+            "multi/paths/pets.yaml",
+            "multi/schemas/Pet.yaml",
+            "multi/schemas/Pets.yaml",
+        ]
+    ]
+    assert expected == expand_filenames([asset_filename("multi")])
+    assert [] == expand_filenames([asset_filename("*.none")])
+
+
+def test_summary_rows() -> None:
+    rows = summary_rows(open_test_oas("pet2.yaml"))
+    assert 1 == len(rows)
+    row = rows[0]
+    assert SUMMARY_COLUMNS == [k for k in row.keys() if k != "tag_counts"]
+    assert {"models": 3, "paths": 2, "operations": 4, "get": 2, "delete": 1, "post": 1, "tags": 2} == {
+        k: v for k, v in row.items() if v and k != "tag_counts"
+    }
+    assert {"pets": 3, "admin": 1} == row["tag_counts"]
+
+
+def test_summary_rows_all_methods() -> None:
+    spec = open_test_oas("pet2.yaml")
+    pets = spec["paths"]["/pets"]
+    pets["head"] = {"operationId": "headPets", "responses": {}}
+    pets["options"] = {"operationId": "optionsPets", "responses": {}}
+    row = summary_rows(spec)[0]
+    assert len(map_operations(spec["paths"])) == row["operations"]
+    assert row["operations"] == sum(row[m] for m in SUMMARY_METHODS)
+    assert 1 == row["head"]
+    assert 1 == row["options"]
+
+    result = totals([FileResult("pet2.yaml", rows=[row])])
+    assert 1 == result["head"]
+    assert 6 == result["operations"]
+
+
+def test_list_rows() -> None:
+    spec = open_test_oas("pet2.yaml")
+    assert ["createPets", "deletePetById", "listPets", "showPetById"] == [r["operation"] for r in operation_rows(spec)]
+    assert [{"operation": "deletePetById"}] == operation_rows(spec, "delete")
+    assert ["schemas/Error", "schemas/Pet", "schemas/Pets"] == [r["model"] for r in model_rows(spec)]
+    assert [{"model": "schemas/Pets"}] == model_rows(spec, "Pets")
+    assert [] == model_rows(spec, "Owner")
+
+    spec = open_test_oas("ct.yaml")
+    rows = content_type_rows(spec)
+    assert {"application/json", "application/yaml"} <= {r["content_type"] for r in rows}
+    rows = content_type_rows(spec, "application/yaml")
+    assert [{"content_type": "application/yaml", "operation": "api_schema_retrieve"}] == rows
+    assert [] == content_type_rows(spec, "application/unknown")
+
+
+def test_analyze_file() -> None:
+    filename = asset_filename("pet2.yaml")
+    result = analyze_file(filename, operation_rows, {"search": "Pets"})
+    assert FileResult(filename, rows=[{"operation": "createPets"}, {"operation": "listPets"}]) == result
+
+    filename = asset_filename("missing.yaml")
+    assert FileResult(filename, error="failed to find file") == analyze_file(filename, model_rows, {})
+
+    filename = asset_filename("bad.yaml")
+    result = analyze_file(filename, model_rows, {})
+    assert [] == result.rows
+    assert result.error.startswith("unable to parse: ")
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analyze_files(workers) -> None:
+    filenames = [asset_filename(n) for n in ["pet.yaml", "bad.yaml", "pet2.yaml", "pet2.json", "pet3.yaml"]]
+    results = analyze_files(filenames, summary_rows, workers)
+    assert filenames == [r.filename for r in results]
+    assert [None, True, None, None, None] == [bool(r.error) or None for r in results]
+    assert [3, 0, 4, 4, 4] == [r.rows[0]["operations"] if r.rows else 0 for r in results]
+
+    summary = totals(results)
+    assert 5 == summary["files"]
+    assert 1 == summary["errors"]
+    assert 4 == summary["rows"]
+    assert 15 == summary["operations"]
+    assert 12 == summary["models"]
+    assert "tag_counts" not in summary
+
+
+def test_totals_empty() -> None:
+    assert {"files": 0, "errors": 0, "rows": 0} == totals([])
+    assert [] == analyze_files([], model_rows)
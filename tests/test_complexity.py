@@ -0,0 +1,94 @@
+from openapi_spec_tools.complexity import Complexity
+from openapi_spec_tools.complexity import ComplexityCalculator
+from openapi_spec_tools.complexity import sort_complexity
+from openapi_spec_tools.utils import dereference
+from openapi_spec_tools.utils import open_oas
+from tests.helpers import asset_filename
+from tests.helpers import open_test_oas
+
+
+def count_nodes(obj) -> tuple[int, int]:
+    """Get the (nodes, depth) by walking the (dereferenced) object."""
+    if isinstance(obj, dict):
+        values = list(obj.values())
+    elif isinstance(obj, list):
+        values = obj
+    else:
+        return 1, 0
+    nodes, depth = 1, 0
+    for v in values:
+        n, d = count_nodes(v)
+        nodes += n
+        depth = max(depth, d + 1)
+    return nodes, depth
+
+
+def test_model_complexity() -> None:
+    oas = open_test_oas("pet2.yaml")
+    uut = ComplexityCalculator(oas)
+    result = uut.model_complexity()
+    assert Complexity(nodes=20, depth=4, fan_out=1) == result["schemas/Pets"]
+    assert Complexity(nodes=17, depth=3, fan_out=0) == result["schemas/Pet"]
+
+    # same as counting the fully expanded models
+    expanded = dereference(oas)["components"]["schemas"]
+    for name, model in expanded.items():
+        value = result[f"schemas/{name}"]
+        assert (value.nodes, value.depth) == count_nodes(model)
+
+
+def test_operation_complexity() -> None:
+    oas = open_test_oas("pet2.yaml")
+    result = ComplexityCalculator(oas).operation_complexity()
+    assert ["createPets", "deletePetById", "listPets", "showPetById"] == sorted(result.keys())
+
+    expanded = dereference(oas)["paths"]["/pets"]["get"]
+    list_pets = result["listPets"]
+    assert count_nodes({"operation": expanded, "parameters": []}) == (list_pets.nodes, list_pets.depth)
+    assert 2 == result["listPets"].fan_out
+
+
+def test_complexity_cycles() -> None:
+    result = ComplexityCalculator(open_oas(asset_filename("multi/openapi.yaml")))
+    models = result.model_complexity()
+    assert models["schemas/Pet"].unbounded
+    assert models["schemas/Pet"].nodes is None
+    assert not models["schemas/Error"].unbounded
+    assert not models["responses/Error"].unbounded
+    assert models["responses/Error"].nodes > models["schemas/Error"].nodes
+
+    operations = result.operation_complexity()
+    assert operations["listPets"].unbounded
+    assert {"nodes": None, "depth": None, "fan_out": 3, "unbounded": True} == operations["listPets"].to_dict()
+
+
+def test_complexity_deep_reuse() -> None:
+    # each model uses the previous one twice, so the expanded size doubles each time
+    count = 100
+    schemas = {"M0": {"type": "string"}}
+    for index in range(1, count):
+        previous = {"$ref": f"#/components/schemas/M{index - 1}"}
+        schemas[f"M{index}"] = {"properties": {"left": previous, "right": dict(previous)}}
+
+    models = ComplexityCalculator({"components": {"schemas": schemas}}).model_complexity()
+    assert Complexity(nodes=2, depth=1, fan_out=0) == models["schemas/M0"]
+    assert models[f"schemas/M{count - 1}"].nodes > 2 ** count
+    assert 2 * count - 1 == models[f"schemas/M{count - 1}"].depth
+
+
+def test_complexity_dangling() -> None:
+    schemas = {"A": {"items": {"$ref": "#/components/schemas/Missing"}}, "B": {"$ref": "x.yaml"}}
+    oas = {"components": {"schemas": schemas}}
+    models = ComplexityCalculator(oas).model_complexity()
+    assert Complexity(nodes=2, depth=1, fan_out=1) == models["schemas/A"]
+    assert Complexity(nodes=1, depth=0, fan_out=1) == models["schemas/B"]
+
+
+def test_sort_complexity() -> None:
+    items = {
+        "a": Complexity(nodes=10, depth=1, fan_out=0),
+        "b": Complexity(nodes=None, depth=None, fan_out=2, unbounded=True),
+        "c": Complexity(nodes=20, depth=1, fan_out=0),
+        "d": Complexity(nodes=10, depth=3, fan_out=0),
+    }
+    assert ["b", "c", "d", "a"] == [name for name, _ in sort_complexity(items)]
@@ -0,0 +1,97 @@
+import gzip
+import os
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from openapi_spec_tools.coverage import count_lines
+from openapi_spec_tools.coverage import count_operations
+from openapi_spec_tools.coverage import file_chunks
+from openapi_spec_tools.coverage import parse_log_line
+from openapi_spec_tools.coverage import read_lines
+from openapi_spec_tools.utils import create_router
+from tests.helpers import open_test_oas
+
+LOG_LINES = [
+    '127.0.0.1 - - [10/Oct/2025:13:55:36 -0700] "GET /v1/pets?limit=3 HTTP/1.1" 200 2326 "-" "curl/8.0"',
+    '127.0.0.1 - frank [10/Oct/2025:13:55:37 -0700] "GET /v1/pets/123 HTTP/1.1" 200 100',
+    '127.0.0.1 - - [10/Oct/2025:13:55:38 -0700] "DELETE /pets/456 HTTP/2.0" 204 0',
+    '{"method": "post", "path": "/pets"}',
+    '{"request": "GET /v1/owners HTTP/1.1"}',
+    'garbage',
+]
+
+
+def write_log(directory: str, name: str, lines: list[str], compress: bool = False) -> str:
+    filename = os.path.join(directory, name)
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    if compress:
+        data = gzip.compress(data)
+    with open(filename, "wb") as fp:
+        fp.write(data)
+    return filename
+
+
+@pytest.mark.parametrize(
+    ["line", "expected"],
+    [
+        pytest.param(LOG_LINES[0], ("GET", "/v1/pets?limit=3"), id="combined"),
+        pytest.param(LOG_LINES[1], ("GET", "/v1/pets/123"), id="common"),
+        pytest.param('1.2.3.4 - - [x] "get /a" 200 1', ("GET", "/a"), id="no-protocol"),
+        pytest.param(LOG_LINES[3], ("POST", "/pets"), id="json"),
+        pytest.param('{"request_method": "PUT", "request_uri": "/a?b=c"}', ("PUT", "/a?b=c"), id="json-nginx"),
+        pytest.param('{"httpRequest": {"method": "GET", "uri": "/b"}}', ("GET", "/b"), id="json-nested"),
+        pytest.param(LOG_LINES[4], ("GET", "/v1/owners"), id="json-request-line"),
+        pytest.param('{"method": "GET"}', None, id="json-no-url"),
+        pytest.param('{"method": ', None, id="json-bad"),
+        pytest.param('[1, 2]', None, id="json-list"),
+        pytest.param("garbage", None, id="garbage"),
+        pytest.param("", None, id="empty"),
+    ],
+)
+def test_parse_log_line(line, expected) -> None:
+    assert expected == parse_log_line(line)
+
+
+def test_read_lines_chunks() -> None:
+    lines = [f"line {i:03d}" for i in range(100)]
+    with TemporaryDirectory() as tempdir:
+        filename = write_log(tempdir, "plain.log", lines)
+        chunks = file_chunks(filename, 97)
+        assert len(chunks) > 5
+        assert chunks[-1][2] == os.path.getsize(filename)
+
+        # each line is read by exactly one chunk
+        result = [line.decode().strip() for c in chunks for line in read_lines(*c)]
+        assert lines == result
+
+        # small files are not split
+        assert [(filename, 0, None)] == file_chunks(filename)
+
+        compressed = write_log(tempdir, "compressed.log", lines, compress=True)
+        assert [(compressed, 0, None)] == file_chunks(compressed, 10)
+        assert lines == [line.decode().strip() for line in read_lines(compressed)]
+
+
+def test_count_lines() -> None:
+    router = create_router(open_test_oas("pet2.yaml"))
+    counts = count_lines(router, (line.encode() for line in LOG_LINES))
+    assert 6 == counts.lines
+    assert 1 == counts.unparsed
+    assert 1 == counts.unmatched
+    assert 4 == counts.matched
+    assert {"listPets": 1, "showPetById": 1, "deletePetById": 1, "createPets": 1} == dict(counts.operations)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_count_operations(workers) -> None:
+    router = create_router(open_test_oas("pet2.yaml"))
+    with TemporaryDirectory() as tempdir:
+        plain = write_log(tempdir, "access.log", LOG_LINES * 20)
+        compressed = write_log(tempdir, "access.log.gz", LOG_LINES, compress=True)
+        counts = count_operations(router, [plain, compressed], workers=workers, chunk_size=512)
+
+    assert 126 == counts.lines
+    assert 21 == counts.unparsed
+    assert 21 == counts.unmatched
+    assert {"listPets": 21, "showPetById": 21, "deletePetById": 21, "createPets": 21} == dict(counts.operations)
@@ -0,0 +1,135 @@
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from openapi_spec_tools.lazy_json import LazyJsonDocument
+from openapi_spec_tools.utils import open_oas
+from tests.helpers import asset_filename
+
+PET2_JSON = asset_filename("pet2.json")
+
+
+def write_file(directory: str, name: str, text: str) -> str:
+    filename = Path(directory) / name
+    filename.write_bytes(text.encode("utf-8"))
+    return str(filename)
+
+
+def test_lazy_document() -> None:
+    with open(PET2_JSON, encoding="utf-8") as fp:
+        expected = json.load(fp)
+
+    document = LazyJsonDocument(PET2_JSON)
+    assert ["openapi", "info", "servers", "tags", "paths", "components"] == list(document)
+    assert 6 == len(document)
+    assert set() == document.decoded
+
+    assert expected["info"] == document["info"]
+    assert {"info"} == document.decoded
+    assert document.get("x-missing") is None
+    assert "paths" in document
+    assert {"info"} == document.decoded
+    assert not document.has_external_refs()
+
+    assert expected == dict(document)
+    assert set(expected.keys()) == document.decoded
+    document.close()
+    assert expected["paths"] == document["paths"]
+
+
+def test_lazy_close() -> None:
+    with open(PET2_JSON, encoding="utf-8") as fp:
+        expected = json.load(fp)
+
+    with LazyJsonDocument(PET2_JSON) as document:
+        assert expected["info"] == document["info"]
+        assert not document._data.closed
+
+    # only the decoded sections are kept after the file is released
+    assert b"" == document._data
+    assert ["info"] == list(document)
+    assert expected["info"] == document["info"]
+    assert "paths" not in document
+    with pytest.raises(KeyError):
+        document["paths"]
+
+    document.close()
+    assert {"info"} == document.decoded
+
+
+@pytest.mark.parametrize(
+    ["text", "lazy"],
+    [
+        pytest.param('{\n    "a": 1,\n    "b": {\n        "c": [1, 2]\n    }\n}\n', True, id="indent-4"),
+        pytest.param('{\r\n  "a": "x\\ny",\r\n  "b\\"q": {}\r\n}\r\n', True, id="crlf-escapes"),
+        pytest.param('\n{\n\t"a": 1,\n\t"b": {\n\t\t"c": null\n\t}\n}', True, id="tabs"),
+        pytest.param('{"a": 1, "b": {"c": [1, 2]}}', False, id="minified"),
+        pytest.param('{\n  "a": 1,\n "b": 2\n}\n', False, id="outdented"),
+        pytest.param('{\n  "a": {\n  "a": 2\n  }\n}\n', False, id="duplicates"),
+        pytest.param('{\n  "a": 1 }\n', False, id="closing-brace"),
+        pytest.param('{}\n', False, id="empty"),
+    ]
+)
+def test_lazy_layouts(text, lazy) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = write_file(directory, "spec.json", text)
+        document = LazyJsonDocument(filename)
+        assert (set() if lazy else set(json.loads(text))) == document.decoded
+        assert json.loads(text) == dict(document)
+        document.close()
+
+
+def test_lazy_misindented_key() -> None:
+    # the "b" key is not found by the scan, which is detected when "a" is decoded
+    text = '{\n  "a": {\n    "x": 1\n  },\n    "b": 2\n}\n'
+    with tempfile.TemporaryDirectory() as directory:
+        document = LazyJsonDocument(write_file(directory, "spec.json", text))
+        assert ["a"] == list(document)
+        assert {"x": 1} == document["a"]
+        assert ["a", "b"] == list(document)
+        assert 2 == document["b"]
+
+
+def test_lazy_errors() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        document = LazyJsonDocument(write_file(directory, "spec.json", '{\n  "a": [1,\n  "b": 2\n}\n'))
+        with pytest.raises(json.JSONDecodeError):
+            document["a"]
+
+        with pytest.raises(json.JSONDecodeError):
+            LazyJsonDocument(write_file(directory, "bad.json", '{"a": [1, }'))
+
+        with pytest.raises(json.JSONDecodeError):
+            LazyJsonDocument(write_file(directory, "empty.json", ""))
+
+
+def test_open_oas_lazy() -> None:
+    spec = open_oas(PET2_JSON, lazy=True)
+    assert isinstance(spec, LazyJsonDocument)
+    assert open_oas(PET2_JSON) == dict(spec)
+
+    # only JSON is lazy
+    spec = open_oas(asset_filename("pet2.yaml"), lazy=True)
+    assert isinstance(spec, dict)
+
+    with tempfile.TemporaryDirectory() as directory:
+        pet = {"type": "object", "properties": {"name": {"type": "string"}}}
+        write_file(directory, "pet.json", json.dumps({"Pet": pet}, indent=2))
+        main = {
+            "openapi": "3.0.0",
+            "info": {"title": "Pets", "version": "1.0"},
+            "paths": {"/pets": {"get": {"responses": {"200": {"$ref": "./pet.json#/Pet"}}}}},
+        }
+        filename = write_file(directory, "main.json", json.dumps(main, indent=2))
+        assert LazyJsonDocument(filename).has_external_refs()
+
+        # references to other files need the whole document (to internalize them)
+        spec = open_oas(filename, lazy=True)
+        assert isinstance(spec, dict)
+        assert spec == open_oas(filename)
+
+        spec = open_oas(filename, resolve_refs=False, lazy=True)
+        assert isinstance(spec, LazyJsonDocument)
+        assert main == dict(spec)
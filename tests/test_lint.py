@@ -0,0 +1,287 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+from openapi_spec_tools.lint import RULES
+from openapi_spec_tools.lint import Linter
+from openapi_spec_tools.lint import Node
+from openapi_spec_tools.lint import NodeKind
+from openapi_spec_tools.lint import Rule
+from openapi_spec_tools.lint import Severity
+from openapi_spec_tools.lint import create_rules
+from openapi_spec_tools.lint import lint_file
+from openapi_spec_tools.lint import lint_files
+from openapi_spec_tools.lint import lint_spec
+from openapi_spec_tools.lint import to_sarif
+from openapi_spec_tools.lint import total_stats
+from tests.helpers import asset_filename
+
+PROBLEMS = """\
+openapi: 3.0.0
+info:
+  title: Problems
+  version: 1.0.0
+paths:
+  /pets/{petId}:
+    parameters:
+    - name: petId
+      in: path
+      schema:
+        type: string
+    get:
+      operationId: getPet
+      responses:
+        '200':
+          description: A pet
+          content:
+            application/json:
+              schema:
+                type: object
+                required: [name, tag]
+                properties:
+                  name:
+                    type: string
+                  tag:
+                    type: [string, 'null']
+        default:
+          $ref: '#/components/responses/Error'
+    delete:
+      operationId: getPet
+      parameters:
+      - name: force
+        in: query
+      responses:
+        '204': {}
+  /pets:
+    post:
+      requestBody:
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/Pet'
+components:
+  schemas:
+    Pet:
+      allOf:
+      - $ref: '#/components/schemas/Base'
+      - type: object
+        required: [owner]
+        properties:
+          owner:
+            type: string
+            nullable: true
+          toys:
+            type: array
+            items:
+              type: object
+              required: [kind]
+              properties:
+                kind:
+                  type: string
+                  nullable: true
+  responses:
+    Error:
+      description: An error
+"""
+
+
+def problems() -> dict:
+    return yaml.safe_load(PROBLEMS)
+
+
+RESPONSE_SCHEMA = "/paths/~1pets~1{petId}/get/responses/200/content/application~1json/schema"
+
+
+def findings_list(findings) -> list[tuple[str, str]]:
+    return [(f.rule, f.pointer) for f in findings]
+
+
+def test_lint_spec() -> None:
+    linter = lint_spec(problems())
+    assert [
+        ("invalid-parameter", "/paths/~1pets~1{petId}/parameters/0"),
+        ("nullable-required", f"{RESPONSE_SCHEMA}/properties/tag"),
+        ("duplicate-operation-id", "/paths/~1pets~1{petId}/delete"),
+        ("undocumented-response", "/paths/~1pets~1{petId}/delete/responses/204"),
+        ("invalid-parameter", "/paths/~1pets~1{petId}/delete/parameters/0"),
+        ("missing-operation-id", "/paths/~1pets/post"),
+        ("undocumented-response", "/paths/~1pets/post"),
+        ("nullable-required", "/components/schemas/Pet/allOf/1/properties/owner"),
+        ("nullable-required", "/components/schemas/Pet/allOf/1/properties/toys/items/properties/kind"),
+    ] == findings_list(linter.findings)
+    assert {"operation": 3, "parameter": 2, "schema": 10, "property": 5} == linter.nodes
+
+    messages = [f.message for f in linter.findings]
+    assert "path parameter 'petId' is not required" == messages[0]
+    assert "operationId 'getPet' is also used by /paths/~1pets~1{petId}/get" == messages[2]
+    assert "parameter 'force' has no schema" == messages[4]
+    assert [Severity.ERROR, Severity.WARNING, Severity.ERROR] == [f.severity for f in linter.findings[:3]]
+
+    stats = linter.stats
+    assert list(RULES) == list(stats)
+    assert 3 == stats["missing-operation-id"].calls
+    assert 2 == stats["invalid-parameter"].calls
+    assert 5 == stats["nullable-required"].calls
+    assert 3 == stats["nullable-required"].findings
+    assert all(s.seconds >= 0.0 for s in stats.values())
+
+
+def test_lint_undeclared_path_parameter() -> None:
+    spec = {
+        "paths": {
+            "/owners/{ownerId}/pets/{petId}": {
+                "parameters": [{"$ref": "#/components/parameters/Owner~1Id"}],
+                "get": {"parameters": [{"name": "petId", "in": "path", "required": True}]},
+                "delete": {"parameters": [{"name": "petId", "in": "query"}]},
+            },
+            "/toys/{toyId}": {"get": {}},
+        },
+        "webhooks": {"{event}": {"post": {}}},
+        "components": {"parameters": {"Owner/Id": {"name": "ownerId", "in": "path", "required": True}}},
+    }
+    linter = lint_spec(spec, ["undeclared-path-parameter"])
+    assert [
+        ("undeclared-path-parameter", "/paths/~1owners~1{ownerId}~1pets~1{petId}/delete"),
+        ("undeclared-path-parameter", "/paths/~1toys~1{toyId}/get"),
+    ] == findings_list(linter.findings)
+    assert "path parameter 'petId' is not declared" == linter.findings[0].message
+
+
+def test_lint_selected_rules() -> None:
+    linter = lint_spec(problems(), ["missing-operation-id", "duplicate-operation-id"])
+    assert ["missing-operation-id", "duplicate-operation-id"] == [r.name for r in linter.rules]
+    assert [
+        ("duplicate-operation-id", "/paths/~1pets~1{petId}/delete"),
+        ("missing-operation-id", "/paths/~1pets/post"),
+    ] == findings_list(linter.findings)
+    # the walk visits all the nodes, but only subscribed rules are called
+    assert 5 == linter.nodes["property"]
+    assert {"missing-operation-id", "duplicate-operation-id"} == set(linter.stats)
+
+    with pytest.raises(ValueError, match="unknown rule.*: bogus"):
+        create_rules(["bogus", "missing-operation-id"])
+
+
+def test_lint_custom_rule() -> None:
+    class NoSchemaType(Rule):
+        name = "schema-type"
+        severity = Severity.INFO
+        kinds = (NodeKind.SCHEMA, NodeKind.PROPERTY)
+
+        def __init__(self):
+            self.kinds_seen = []
+
+        def check(self, node: Node):
+            self.kinds_seen.append(node.kind)
+            if "type" not in node.value:
+                yield self.finding(node.pointer, "no type")
+
+    rule = NoSchemaType()
+    linter = Linter([rule])
+    linter.run(problems())
+    assert [
+        ("schema-type", "/components/schemas/Pet"),
+    ] == findings_list(linter.findings)
+    assert 15 == len(rule.kinds_seen)
+    assert 15 == linter.stats["schema-type"].calls
+
+
+def test_lint_rule_requires_check() -> None:
+    class NoCheck(Rule):
+        name = "no-check"
+
+    with pytest.raises(TypeError, match="abstract"):
+        NoCheck()
+
+
+def test_lint_unexpected_layout() -> None:
+    spec = {
+        "paths": {"/a": None, "/b": {"get": "bogus", "parameters": "x", "summary": "B"}},
+        "webhooks": {"hook": {"post": {"operationId": "hook"}}},
+        "components": {"schemas": {"A": [], "B": {"properties": {"x": True}}}, "responses": []},
+    }
+    linter = lint_spec(spec)
+    assert [("undocumented-response", "/webhooks/hook/post")] == findings_list(linter.findings)
+    assert {"operation": 1, "parameter": 0, "schema": 1, "property": 0} == linter.nodes
+
+
+def test_lint_files() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = Path(directory) / "problems.yaml"
+        filename.write_text(PROBLEMS)
+        results = lint_files([asset_filename("pet2.yaml"), str(filename), "missing.yaml", asset_filename("bad.yaml")])
+
+    assert [None, None, "failed to find file"] == [r.error for r in results[:3]]
+    assert results[3].error.startswith("unable to parse")
+    assert [("nullable-required", "/components/schemas/Pet/properties/owner")] == findings_list(results[0].findings)
+    assert 9 == len(results[1].findings)
+
+    stats = total_stats(results)
+    assert "nullable-required" in [s.rule for s in stats]
+    totals = {s.rule: s for s in stats}
+    assert 4 == totals["nullable-required"].findings
+    assert results[0].stats[0].calls + results[1].stats[0].calls == totals["missing-operation-id"].calls
+
+    data = results[0].to_dict()
+    assert ["filename", "findings", "stats", "nodes"] == list(data)
+    assert {
+        "rule": "nullable-required",
+        "severity": "warning",
+        "pointer": "/components/schemas/Pet/properties/owner",
+        "message": "property 'owner' is nullable and required",
+    } == data["findings"][0]
+    assert {"filename": "missing.yaml", "error": "failed to find file"} == results[2].to_dict()
+
+
+def test_lint_files_parallel() -> None:
+    filenames = [asset_filename(n) for n in ["pet2.yaml", "misc.yaml", "trello_api.yaml"]]
+    serial = lint_files(filenames, workers=1)
+    parallel = lint_files(filenames, workers=2)
+    assert [r.findings for r in serial] == [r.findings for r in parallel]
+
+
+def test_lint_json_spec() -> None:
+    result = lint_file(asset_filename("pet2.json"))
+    assert result.findings == lint_file(asset_filename("pet2.yaml")).findings
+
+
+def test_to_sarif() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = Path(directory) / "problems.yaml"
+        filename.write_text(PROBLEMS)
+        results = [lint_file(str(filename), ["duplicate-operation-id", "nullable-required"]), lint_file("missing")]
+
+    sarif = to_sarif(results, ["nullable-required", "duplicate-operation-id"])
+    assert "2.1.0" == sarif["version"]
+    run = sarif["runs"][0]
+    # the rules are in the standard order
+    assert [
+        {
+            "id": "duplicate-operation-id",
+            "shortDescription": {"text": "The operationId must be unique"},
+            "defaultConfiguration": {"level": "error"},
+        },
+        {
+            "id": "nullable-required",
+            "shortDescription": {"text": "Nullable properties should not be required"},
+            "defaultConfiguration": {"level": "warning"},
+        },
+    ] == run["tool"]["driver"]["rules"]
+    assert 4 == len(run["results"])
+    assert {
+        "ruleId": "duplicate-operation-id",
+        "ruleIndex": 0,
+        "level": "error",
+        "message": {"text": "operationId 'getPet' is also used by /paths/~1pets~1{petId}/get"},
+        "locations": [{
+            "physicalLocation": {"artifactLocation": {"uri": filename.as_posix()}},
+            "logicalLocations": [{"fullyQualifiedName": "/paths/~1pets~1{petId}/delete", "kind": "object"}],
+        }],
+    } == run["results"][1]
+    assert [1, 0, 1, 1] == [r["ruleIndex"] for r in run["results"]]
+    assert [{
+        "executionSuccessful": False,
+        "toolExecutionNotifications": [{"level": "error", "message": {"text": "missing: failed to find file"}}],
+    }] == run["invocations"]
@@ -0,0 +1,294 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+
+import pytest
+import requests
+
+from openapi_spec_tools.cli_gen import _requests
+from openapi_spec_tools.cli_gen._requests import PageParams
+from openapi_spec_tools.cli_gen.layout_types import PaginationNames
+from openapi_spec_tools.mock import DEFAULT_PAGINATION
+from openapi_spec_tools.mock import ExampleGenerator
+from openapi_spec_tools.mock import MockConfig
+from openapi_spec_tools.mock import MockResponse
+from openapi_spec_tools.mock import MockServer
+from openapi_spec_tools.mock import PageStyle
+from openapi_spec_tools.mock import layout_file_pagination
+from openapi_spec_tools.utils import open_oas
+from tests.helpers import asset_filename
+
+SPEC = {
+    "openapi": "3.0.3",
+    "info": {"title": "Mock", "version": "1.0"},
+    "servers": [{"url": "https://example.com/v1"}],
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "responses": {
+                    200: {
+                        "description": "Pets",
+                        "content": {
+                            "application/json": {
+                                "schema": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}},
+                            },
+                        },
+                    },
+                },
+            },
+            "post": {
+                "operationId": "createPet",
+                "responses": {"201": {"description": "Created"}, "default": {"$ref": "#/components/responses/Error"}},
+            },
+        },
+        "/pets/{petId}": {
+            "get": {
+                "operationId": "getPet",
+                "responses": {"default": {"$ref": "#/components/responses/Pet"}},
+            },
+        },
+        "/version": {
+            "get": {
+                "operationId": "getVersion",
+                "responses": {
+                    "200": {
+                        "description": "Version",
+                        "content": {"text/plain": {"example": "1.2.3"}},
+                    },
+                },
+            },
+        },
+    },
+    "components": {
+        "schemas": {
+            "Pet": {
+                "type": "object",
+                "required": ["id", "name"],
+                "properties": {
+                    "id": {"type": "integer", "minimum": 1, "exclusiveMinimum": True},
+                    "name": {"type": "string", "minLength": 8},
+                    "kind": {"type": "string", "enum": ["dog", "cat"]},
+                    "born": {"type": "string", "format": "date"},
+                    "weight": {"type": ["number", "null"]},
+                    "secret": {"type": "string", "writeOnly": True},
+                    "owner": {"$ref": "#/components/schemas/Owner"},
+                    "labels": {"additionalProperties": {"type": "boolean"}},
+                },
+            },
+            "Owner": {
+                "allOf": [
+                    {"type": "object", "properties": {"name": {"type": "string", "example": "Bob"}}},
+                    {
+                        "type": "object",
+                        "properties": {"pets": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}}},
+                    },
+                ],
+            },
+        },
+        "responses": {
+            "Pet": {
+                "description": "A pet",
+                "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}},
+            },
+            "Error": {"description": "Error"},
+        },
+    },
+}
+
+PET = {
+    "id": 2,
+    "name": "stringxx",
+    "kind": "dog",
+    "born": "2025-01-01",
+    "weight": 1.0,
+    "owner": {"name": "Bob", "pets": []},
+    "labels": {"key": True},
+}
+
+
+def test_example_generator() -> None:
+    generator = ExampleGenerator(SPEC)
+    pet = generator.example({"$ref": "#/components/schemas/Pet"})
+    # the cycle back to the Pet is left out
+    assert PET == pet
+    # memoized
+    assert pet is generator.example({"$ref": "#/components/schemas/Pet"})
+    schema = SPEC["components"]["schemas"]["Owner"]
+    assert generator.example(schema) is generator.example(schema)
+
+    assert generator.example({"type": "string", "format": "uuid"}).count("-") == 4
+    assert [3, 3] == generator.example({"type": "array", "items": {"type": "integer", "default": 3}, "minItems": 2})
+    assert 6 == generator.example({"type": "integer", "minimum": 0, "exclusiveMinimum": 5})
+    assert "b" == generator.example({"oneOf": [{"const": "b"}, {"type": "integer"}]})
+    assert "x" == generator.example({"type": "string", "examples": ["x", "y"]})
+    assert generator.example({"type": "imaginary"}) is None
+    assert generator.example({"$ref": "#/components/schemas/Missing"}) is None
+    assert generator.example(True) is None
+
+
+def test_mock_responses() -> None:
+    server = MockServer(SPEC)
+    response = server.response("GET", "/pets/123")
+    assert 200 == response.status
+    assert "getPet" == response.op_id
+    assert PET == response.json()
+    assert {"Content-Type": "application/json"} == response.headers
+
+    # the servers path is optional
+    assert [PET] == server.response("GET", "/v1/pets?limit=3").json()
+
+    response = server.response("POST", "/pets")
+    assert (201, b"", {}) == (response.status, response.body, response.headers)
+
+    response = server.response("GET", "/version")
+    assert (b"1.2.3", {"Content-Type": "text/plain"}) == (response.body, response.headers)
+
+    response = server.response("GET", "/owners")
+    assert (404, {"detail": "No path matches /owners"}) == (response.status, response.json())
+    response = server.response("DELETE", "/pets")
+    assert (405, {"detail": "DELETE is not supported"}) == (response.status, response.json())
+
+    assert 6 == server.stats.requests
+    assert 2 == server.stats.unmatched
+    assert {"getPet": 1, "listPets": 1, "createPet": 1, "getVersion": 1} == server.stats.operations
+    assert {"getPet", "listPets", "createPet", "getVersion"} == set(server.routes)
+
+
+def test_mock_errors() -> None:
+    server = MockServer(SPEC, MockConfig(error_rate=1.0, error_status=503))
+    response = server.response("GET", "/pets/123")
+    assert (503, {"detail": "Injected error"}) == (response.status, response.json())
+
+    def statuses(seed: int) -> list[int]:
+        server = MockServer(SPEC, MockConfig(error_rate=0.5, seed=seed))
+        return [server.response("GET", "/pets/1").status for _ in range(50)]
+
+    assert statuses(1) == statuses(1)
+    assert {200, 500} == set(statuses(1))
+
+    server = MockServer(SPEC, MockConfig(latency=0.25, jitter=0.1, seed=3))
+    assert all(0.25 <= server.delay() <= 0.35 for _ in range(10))
+
+
+@pytest.mark.parametrize(
+    ["style", "query", "count", "next_query"],
+    [
+        pytest.param(PageStyle.PAGE, "page=2&page_size=10", 10, "page=3&page_size=10", id="page"),
+        pytest.param(PageStyle.PAGE, "page=4&page_size=10", 5, None, id="page-last"),
+        pytest.param(PageStyle.OFFSET, "offset=40&limit=3", 3, "offset=43&limit=3", id="offset"),
+        pytest.param(PageStyle.OFFSET, "offset=45&limit=30", 0, None, id="offset-past"),
+        pytest.param(PageStyle.NEXT_HEADER, "", 20, "cursor=20", id="next-header"),
+        pytest.param(PageStyle.NEXT_PROPERTY, "cursor=40&page_size=bogus", 5, None, id="next-property"),
+    ],
+)
+def test_mock_pagination(style, query, count, next_query) -> None:
+    server = MockServer(SPEC, MockConfig(total_items=45), page_style=style)
+    response = server.response("GET", f"/pets?{query}", "mock:123")
+    assert 200 == response.status
+    body = response.json()
+    names = DEFAULT_PAGINATION[style]
+    next_url = f"http://mock:123/pets?{next_query}" if next_query else None
+    if names.next_property:
+        assert next_url == body["next"]
+        body = body["results"]
+    if names.next_header:
+        assert next_url == response.headers.get("X-Next")
+    assert count == len(body)
+    assert all(item == PET for item in body)
+
+
+def test_mock_layout_pagination() -> None:
+    pagination = layout_file_pagination(asset_filename("layout_cloudtruth.yaml"))
+    names = pagination["audit_list"]
+    assert PaginationNames(
+        page_size="page_size",
+        page_start="page",
+        items_property="result",
+        next_property="next",
+    ) == names
+
+    spec = open_oas(asset_filename("ct.yaml"))
+    server = MockServer(spec, MockConfig(total_items=5), pagination=pagination)
+    # the response has no 'result' list to paginate
+    body = server.response("GET", "/api/v1/audit/?page=0&page_size=2", "mock").json()
+    assert 1 == len(body["results"])
+    assert "http://api.example.org/accounts/?page=4" == body["next"]
+
+    pagination["audit_list"] = replace(names, items_property="results")
+    server = MockServer(spec, MockConfig(total_items=5), pagination=pagination)
+    body = server.response("GET", "/api/v1/audit/?page=0&page_size=2", "mock").json()
+    assert 2 == len(body["results"])
+    assert 123 == body["count"]
+    assert "http://mock/api/v1/audit/?page=1&page_size=2" == body["next"]
+    body = server.response("GET", "/api/v1/audit/?page=2&page_size=2", "mock").json()
+    assert (1, None) == (len(body["results"]), body["next"])
+    # no pagination for non-list responses
+    assert isinstance(server.response("GET", "/api/v1/audit/abc/").json(), dict)
+
+
+def test_mock_response_encode() -> None:
+    response = MockResponse(200, b"{}", {"Content-Type": "application/json"})
+    assert (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\n{}"
+    ) == response.encode()
+    assert b"HTTP/1.1 599 Unknown\r\nContent-Length: 0\r\nConnection: close\r\n\r\n" == MockResponse(599).encode(False)
+
+
+@contextmanager
+def running(server: MockServer):
+    loop = asyncio.new_event_loop()
+    started = loop.run_until_complete(server.start())
+    port = started.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        started.close()
+        loop.run_until_complete(started.wait_closed())
+        loop.close()
+
+
+@pytest.mark.parametrize("style", list(PageStyle))
+def test_mock_server_depaginate(style) -> None:
+    server = MockServer(SPEC, MockConfig(total_items=45), page_style=style)
+    names = DEFAULT_PAGINATION[style]
+    page_params = PageParams(
+        page_size_name=names.page_size,
+        page_size_value=10,
+        page_start_name=names.page_start,
+        item_start_name=names.item_start,
+        item_start_value=0 if names.item_start else None,
+        items_property_name=names.items_property,
+        next_header_name=names.next_header,
+        next_property_name=names.next_property,
+    )
+    with running(server) as url, requests.Session() as session:
+        previous = _requests.use_session(session)
+        try:
+            items = _requests.depaginate(page_params, f"{url}/pets")
+        finally:
+            _requests.use_session(previous)
+
+    assert 45 == len(items)
+    assert 5 == server.stats.operations["listPets"]
+
+
+def test_mock_server_connections() -> None:
+    server = MockServer(SPEC)
+    with running(server) as url:
+        with requests.Session() as session:
+            for _ in range(3):
+                response = session.post(f"{url}/pets", json={"name": "x"})
+                assert 201 == response.status_code
+            assert PET == session.get(f"{url}/pets/1").json()
+
+        response = requests.get(f"{url}/bogus", headers={"Connection": "close"})
+        assert 404 == response.status_code
+        assert "close" == response.headers["Connection"]
+
+    assert 5 == server.stats.requests
@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -7,35 +8,55 @@ from unittest import mock
 
 import pytest
 import typer
+import yaml
 
 from openapi_spec_tools.oas import DisplayOption
+from openapi_spec_tools.oas import LintFormat
+from openapi_spec_tools.oas import OutputFormat
+from openapi_spec_tools.oas import PageStyle
+from openapi_spec_tools.oas import bundle
 from openapi_spec_tools.oas import console_factory
 from openapi_spec_tools.oas import content_type_list
+from openapi_spec_tools.oas import coverage
 from openapi_spec_tools.oas import diff
 from openapi_spec_tools.oas import info
+from openapi_spec_tools.oas import lint
+from openapi_spec_tools.oas import mock as mock_server
 from openapi_spec_tools.oas import models_list
 from openapi_spec_tools.oas import models_operations
 from openapi_spec_tools.oas import models_show
+from openapi_spec_tools.oas import models_unused
 from openapi_spec_tools.oas import models_used_by
 from openapi_spec_tools.oas import models_uses
 from openapi_spec_tools.oas import open_oas_with_error_handling
+from openapi_spec_tools.oas import operation_complexity
 from openapi_spec_tools.oas import operation_list
 from openapi_spec_tools.oas import operation_models
 from openapi_spec_tools.oas import operation_show
 from openapi_spec_tools.oas import paths_list
+from openapi_spec_tools.oas import paths_match
 from openapi_spec_tools.oas import paths_operations
 from openapi_spec_tools.oas import paths_show
 from openapi_spec_tools.oas import remove_dict_prefix
 from openapi_spec_tools.oas import remove_list_prefix
+from openapi_spec_tools.oas import stats
 from openapi_spec_tools.oas import summary
+from openapi_spec_tools.oas import synth
 from openapi_spec_tools.oas import tags_list
 from openapi_spec_tools.oas import tags_show
 from openapi_spec_tools.oas import update
+from openapi_spec_tools.oas import validate
+from openapi_spec_tools.utils import dereference
+from openapi_spec_tools.utils import iter_references
+from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.validate import validate_spec
 from tests.helpers import StringIo
 from tests.helpers import asset_filename
+from tests.helpers import open_test_oas
 
 PET_YAML = asset_filename("pet.yaml")
 PET2_YAML = asset_filename("pet2.yaml")
+MULTI_YAML = asset_filename("multi/openapi.yaml")
 PET3_YAML = asset_filename("pet3.yaml")
 
 
@@ -76,12 +97,32 @@ def test_open_oas(filename, message) -> None:
     assert output.startswith(message)
 
 
+def test_open_oas_sections() -> None:
+    spec = open_oas_with_error_handling(asset_filename("pet2.json"), sections=["info"])
+    assert {"info"} == spec.decoded
+    # the file is released after decoding the sections
+    assert b"" == spec._data
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = Path(directory) / "bad.json"
+        filename.write_text('{\n  "info": {,\n  "paths": {}\n}\n')
+        with (
+            mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+            pytest.raises(typer.Exit) as err,
+        ):
+            open_oas_with_error_handling(str(filename), sections=["info"])
+
+    assert err.value.exit_code == 1
+    assert mock_stdout.getvalue().startswith("ERROR: unable to parse")
+
+
 
 #################################################
 # Top-level stuff
-def test_info() -> None:
+@pytest.mark.parametrize("filename", [PET2_YAML, asset_filename("pet2.json")])
+def test_info(filename) -> None:
     with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
-        info(PET2_YAML)
+        info(filename)
 
         output = mock_stdout.getvalue()
         expected = """\
@@ -116,6 +157,77 @@ OpenAPI spec (pet2.yaml):
 """
         assert output == expected
 
+def test_summary_head() -> None:
+    spec = open_test_oas("pet2.yaml")
+    spec["paths"]["/pets"]["head"] = {"operationId": "headPets", "responses": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        filename = Path(directory) / "head.yaml"
+        filename.write_text(yaml.dump(spec))
+        with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+            summary(filename.as_posix())
+
+    output = mock_stdout.getvalue()
+    assert "Operation methods (5):" in output
+    assert "        post: 1\n        head: 1\n" in output
+    assert "options" not in output
+
+
+def test_summary_batch(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        summary("pet.yaml", ["pet2.*"], workers=2)
+
+        output = mock_stdout.getvalue()
+        expected = """\
+    File             Models  Paths  Operations  Get  Put  Patch  Delete  Post  Head  Options  Trace  Tags
+    pet.yaml              3      2           3    2    0      0       0     1     0        0      0     1
+    pet2.json             3      2           4    2    0      0       1     1     0        0      0     2
+    pet2.yaml             3      2           4    2    0      0       1     1     0        0      0     2
+    Total (3 files)       9      6          11    6    0      0       2     3     0        0      0     5
+"""
+        assert output == expected
+
+
+def test_summary_batch_csv(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        summary("pet.yaml", output_format=OutputFormat.CSV)
+
+        output = mock_stdout.getvalue()
+        expected = """\
+filename,models,paths,operations,get,put,patch,delete,post,head,options,trace,tags
+pet.yaml,3,2,3,2,0,0,0,1,0,0,0,1
+total,3,2,3,2,0,0,0,1,0,0,0,1
+"""
+        assert output == expected
+
+
+def test_summary_batch_error(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with (
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+        pytest.raises(typer.Exit) as err,
+    ):
+        summary("pet.yaml", ["missing.yaml"])
+
+    assert 1 == err.value.exit_code
+    output = mock_stdout.getvalue()
+    assert "    Total (2 files)       3      2           3" in output
+    assert "ERROR: missing.yaml: failed to find file" in output
+
+
+def test_summary_batch_no_files(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with (
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+        pytest.raises(typer.Exit) as err,
+    ):
+        summary("*.none")
+
+    assert 1 == err.value.exit_code
+    assert "ERROR: failed to find any files matching *.none" in mock_stdout.getvalue()
+
+
 def test_diff_found() -> None:
     with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
         diff(asset_filename("pet.yaml"), PET2_YAML)
@@ -259,6 +371,24 @@ paths:
             PET2_UPDATE_DELETE,
             id="allow-ops",
         ),
+        pytest.param(
+            asset_filename("dupes.yaml"),
+            {"dedupe_models": True, "display_option": DisplayOption.SUMMARY},
+            "Merged 2 duplicate models into 2 models (saved 153 bytes)\nFound 3 differences from dupes.yaml\n",
+            id="dedupe-models",
+        ),
+        pytest.param(
+            asset_filename("pets_and_vets.yaml"),
+            {"prune_unused": True},
+            "components:\n    schemas:\n        Veterinarian: removed\n\n",
+            id="prune-unused",
+        ),
+        pytest.param(
+            PET2_YAML,
+            {"dedupe_models": True},
+            "No differences between pet2.yaml and updated\n",
+            id="dedupe-models-none",
+        ),
         pytest.param(
             PET2_YAML,
             {"remove_properties": ["headers"]},
@@ -301,6 +431,40 @@ def test_update_failure() -> None:
         assert output == "ERROR: cannot specify both --allow-op and --remove-op\n"
 
 
+def test_bundle_multi_file() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = Path(temp_dir) / "bundled.yaml"
+        bundle(MULTI_YAML, output=str(temp_file))
+        result = open_oas(str(temp_file), resolve_refs=False)
+
+    assert result == open_oas(MULTI_YAML)
+    assert all(ref.startswith("#/components/") for ref in iter_references(result))
+    assert list(result.keys()) == ["openapi", "info", "servers", "paths", "components"]
+
+
+def test_bundle_dereference() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        bundle(PET2_YAML, dereference_refs=True)
+        output = mock_stdout.getvalue()
+
+    # shared objects use YAML anchors/aliases
+    assert "$ref" not in output
+    assert "items: &id001" in output
+    assert "schema: *id001" in output
+    assert yaml.safe_load(output) == dereference(open_oas(PET2_YAML))
+
+
+def test_bundle_json() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = Path(temp_dir) / "bundled.json"
+        bundle(MULTI_YAML, output=str(temp_file), dereference_refs=True, max_size=15)
+        result = json.loads(temp_file.read_text())
+
+    # cyclic references are kept
+    refs = set(iter_references(result))
+    assert {"#/components/schemas/Owner", "#/components/schemas/Pet", "#/components/schemas/Pets"} == refs
+
+
 ##########################################
 # Operations
 @pytest.mark.parametrize(
@@ -329,6 +493,22 @@ def test_operation_list(filename, search, expected) -> None:
         assert output == expected
 
 
+def test_operation_list_batch(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        operation_list("pet[23].yaml", "show", more_filenames=["pet.yaml"])
+
+        output = mock_stdout.getvalue()
+        expected = """\
+    File       Operation
+    pet.yaml   showPetById
+    pet2.yaml  showPetById
+    pet3.yaml  showPetById
+Found 3 operations in 3 files
+"""
+        assert output == expected
+
+
 PET2_SHOW_LIST_OP = """\
 /pets:
     get:
@@ -447,6 +627,35 @@ def test_operation_models_failure() -> None:
         assert output == f"ERROR: failed to find {search}\n"
 
 
+PET2_COMPLEXITY = """\
+Largest 2 operations (with references expanded):
+    Name             Nodes      Depth  Fan-out
+    listPets            62         10        2
+    showPetById         51          9        2
+Largest 2 models (with references expanded):
+    Name              Nodes      Depth  Fan-out
+    schemas/Pets         20          4        1
+    schemas/Pet          17          3        0
+"""
+
+
+def test_operation_complexity() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        operation_complexity(PET2_YAML, max_size=2, include_models=True)
+        output = mock_stdout.getvalue()
+        assert output == PET2_COMPLEXITY
+
+
+def test_operation_complexity_json() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        operation_complexity(MULTI_YAML, max_size=0, as_json=True)
+        data = json.loads(mock_stdout.getvalue())
+
+    assert ["operations"] == list(data.keys())
+    assert ["listPets", "showPetById"] == list(data["operations"].keys())
+    assert {"nodes": None, "depth": None, "fan_out": 3, "unbounded": True} == data["operations"]["listPets"]
+
+
 ##########################################
 # Paths
 @pytest.mark.parametrize(
@@ -711,6 +920,75 @@ def test_models_list(filename: str, search: Optional[str], expected: str) -> Non
         output = mock_stdout.getvalue()
         assert output == expected
 
+
+def test_models_list_batch(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        models_list("pet*.yaml", "Owner", output_format=OutputFormat.JSON, workers=1)
+
+        data = json.loads(mock_stdout.getvalue())
+        assert {"files": 4, "errors": 0, "rows": 1} == data["totals"]
+        assert ["pet.yaml", "pet2.yaml", "pet3.yaml", "pets_and_vets.yaml"] == [f["filename"] for f in data["files"]]
+        assert [[], [], [], [{"model": "schemas/Owner"}]] == [f["rows"] for f in data["files"]]
+
+PET2_MATCH_PET_ID = """\
+/pets/{petId}:
+    parameters:
+        petId: '123'
+    operations:
+        get: showPetById
+        delete: deletePetById
+
+"""
+PET2_MATCH_DELETE = """\
+/pets/{petId}:
+    parameters:
+        petId: abc
+    operations:
+        delete: deletePetById
+
+"""
+PET2_MATCH_LIST = """\
+/pets:
+    parameters: {}
+    operations:
+        get: listPets
+        post: createPets
+
+"""
+@pytest.mark.parametrize(
+    ["url", "method", "expected"],
+    [
+        pytest.param("/pets/123", None, PET2_MATCH_PET_ID, id="path"),
+        pytest.param("http://petstore.swagger.io/v1/pets/123?x=y", None, PET2_MATCH_PET_ID, id="url"),
+        pytest.param("/pets/abc", "DELETE", PET2_MATCH_DELETE, id="method"),
+        pytest.param("/v1/pets", None, PET2_MATCH_LIST, id="base-path"),
+    ]
+)
+def test_paths_match_success(url: str, method: Optional[str], expected: str) -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        paths_match(PET2_YAML, url, method)
+
+        output = mock_stdout.getvalue()
+        assert output == expected
+
+
+@pytest.mark.parametrize(
+    ["url", "method", "expected"],
+    [
+        pytest.param("/pets/123/toys", None, "no path matches /pets/123/toys", id="no-path"),
+        pytest.param("/pets/123", "put", "no PUT operation for /pets/{petId}", id="no-method"),
+    ]
+)
+def test_paths_match_failure(url: str, method: Optional[str], expected: str) -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit) as err:
+            paths_match(PET2_YAML, url, method)
+        assert err.value.exit_code == 1
+        output = mock_stdout.getvalue()
+        assert output == f"ERROR: {expected}\n"
+
+
 PET_MODEL_PETS_SHOW = """\
 Pets:
     items:
@@ -765,6 +1043,12 @@ def test_models_show_failure() -> None:
     ["filename", "model", "expected"],
     [
         pytest.param(PET_YAML, "Pets", "Found Pets uses 1 models:\n    Pet\n", id="found"),
+        pytest.param(
+            MULTI_YAML,
+            "Pets",
+            "Found Pets uses 4 models:\n    Owner\n    Pet\n    Pets\n    Tag\n",
+            id="multi-file",
+        ),
         pytest.param(PET_YAML, "Pet", "Pet does not use any other models\n", id="no-uses"),
     ]
 )
@@ -811,6 +1095,26 @@ def test_models_used_by_failure() -> None:
         assert output == f"ERROR: no model '{search}' found\n"
 
 
+@pytest.mark.parametrize(
+    ["filename", "expected"],
+    [
+        pytest.param(PET2_YAML, "No unused models found\n", id="none"),
+        pytest.param(asset_filename("pets_and_vets.yaml"), "Found 1 unused models:\n    Veterinarian\n", id="one"),
+        pytest.param(
+            asset_filename("trello_api.yaml"),
+            "Found 4 unused models:\n    APIKey\n    APIToken\n    CFValue\n    customFieldItemValue\n",
+            id="multiple",
+        ),
+    ]
+)
+def test_models_unused(filename: str, expected: str) -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        models_unused(filename)
+
+        output = mock_stdout.getvalue()
+        assert output == expected
+
+
 @pytest.mark.parametrize(
     ["filename", "model", "expected"],
     [
@@ -920,6 +1224,22 @@ def test_content_type_list(filename, max_size, content_type, expected) -> None:
         assert output == expected
 
 
+def test_content_type_list_batch(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        content_type_list("pet2.yaml", content_type="application/json", output_format=OutputFormat.CSV)
+
+        output = mock_stdout.getvalue()
+        expected = """\
+filename,content_type,operation
+pet2.yaml,application/json,createPets
+pet2.yaml,application/json,deletePetById
+pet2.yaml,application/json,listPets
+pet2.yaml,application/json,showPetById
+"""
+        assert output == expected
+
+
 @pytest.mark.parametrize(
     ["items", "expected"],
     [
@@ -942,3 +1262,350 @@ def test_remove_list_prefix(items, expected) -> None:
 )
 def test_remove_dict_prefix(map, expected) -> None:
     assert expected == remove_dict_prefix(map)
+
+
+COVERAGE_LOG = """\
+127.0.0.1 - - [10/Oct/2025:13:55:36 -0700] "GET /v1/pets?limit=3 HTTP/1.1" 200 2326 "-" "curl/8.0"
+127.0.0.1 - - [10/Oct/2025:13:55:37 -0700] "GET /v1/pets/123 HTTP/1.1" 200 100
+127.0.0.1 - - [10/Oct/2025:13:55:38 -0700] "GET /v1/pets/456 HTTP/1.1" 404 10
+{"method": "post", "path": "/pets"}
+{"request": "GET /v1/owners HTTP/1.1"}
+garbage
+"""
+COVERAGE_TOP_2 = """\
+Processed 6 lines: 4 matched, 1 unmatched, 1 unparsed
+Hottest 2 of 3 used operations:
+    showPetById  2
+    listPets     1
+Unused 1 of 4 operations:
+    deletePetById
+"""
+COVERAGE_ALL = """\
+Processed 7 lines: 5 matched, 1 unmatched, 1 unparsed
+Hottest 4 of 4 used operations:
+    showPetById    2
+    listPets       1
+    createPets     1
+    deletePetById  1
+All 4 operations used
+"""
+def test_stats() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        stats(PET2_YAML, max_size=2)
+        lines = mock_stdout.getvalue().splitlines()
+
+    # timing values vary
+    assert lines[0].startswith("Loaded pet2.yaml in ")
+    assert ["read", "parse", "resolve", "index"] == [line.split(":")[0].strip() for line in lines[1:5]]
+    assert [
+        "Total size: 2562 bytes, 148 nodes",
+        "Largest 2 of 2 paths:",
+        "    Name               Bytes    Nodes",
+        "    /pets                991       54",
+        "    /pets/{petId}        792       41",
+        "Largest 2 of 2 tags:",
+    ] == lines[5:11]
+    assert "Largest 2 of 3 components:" in lines
+    assert "Largest 2 of 13 descriptions:" in lines
+
+
+def test_stats_formats() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        stats(PET2_YAML, max_size=0, output_format=OutputFormat.JSON)
+        data = json.loads(mock_stdout.getvalue())
+
+    assert ["filename", "timings", "total", "paths", "tags", "components", "descriptions"] == list(data.keys())
+    assert {"name": "total", "bytes": 2562, "nodes": 148} == data["total"]
+    assert 13 == len(data["descriptions"])
+    assert {"name": "schemas/Pets", "bytes": 75, "nodes": 5} == data["components"][-1]
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        stats(PET2_YAML, max_size=1, output_format=OutputFormat.CSV)
+        lines = mock_stdout.getvalue().splitlines()
+
+    assert "section,name,bytes,nodes,seconds" == lines[0]
+    assert all(line.startswith("timing,") for line in lines[1:6])
+    assert [
+        f"total,{PET2_YAML},2562,148,",
+        "paths,/pets,991,54,",
+        "tags,pets,1334,71,",
+        "components,schemas/Pet,197,17,",
+        "descriptions,/paths/~1pets/get/parameters/0/description,46,1,",
+    ] == lines[6:]
+
+
+@pytest.mark.parametrize(
+    ["filename", "message"],
+    [
+        pytest.param("gone", "ERROR: failed to find", id="missing"),
+        pytest.param("bad.json", "ERROR: unable to parse", id="bad"),
+    ]
+)
+def test_stats_failure(filename, message) -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit) as err:
+            stats(asset_filename(filename))
+        assert err.value.exit_code == 1
+        assert mock_stdout.getvalue().startswith(message)
+
+
+def test_coverage() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        log_file = os.path.join(tempdir, "access.log")
+        with open(log_file, "w") as fp:
+            fp.write(COVERAGE_LOG)
+
+        with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+            coverage(PET2_YAML, [log_file], max_size=2, workers=1)
+            assert COVERAGE_TOP_2 == mock_stdout.getvalue()
+
+        other_file = os.path.join(tempdir, "other.log")
+        with open(other_file, "w") as fp:
+            fp.write('{"method": "DELETE", "url": "https://petstore.swagger.io/v1/pets/1"}\n' + "\n" * 5)
+
+        with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+            coverage(PET2_YAML, [log_file, other_file], workers=1)
+            assert COVERAGE_ALL == mock_stdout.getvalue()
+
+
+def test_coverage_missing_log() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit) as err:
+            coverage(PET2_YAML, ["/no/such/file.log"])
+        assert err.value.exit_code == 1
+        assert "ERROR: failed to find /no/such/file.log\n" == mock_stdout.getvalue()
+
+
+##########################################
+# Lint
+def test_lint(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        lint("pet.yaml", ["pet2.yaml"], workers=1)
+
+        output = mock_stdout.getvalue()
+        expected = """\
+pet2.yaml:
+    warning  /components/schemas/Pet/properties/owner  property 'owner' is nullable and required [nullable-required]
+Found 1 problems (0 errors, 1 warnings, 0 info) in 2 files
+"""
+        assert output == expected
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        lint("pet.yaml", ["pet2.yaml"], rules=["missing-operation-id"], show_stats=True, workers=1)
+        lines = mock_stdout.getvalue().splitlines()
+
+    assert "Found 0 problems (0 errors, 0 warnings, 0 info) in 2 files" == lines[0]
+    assert "Nodes: 7 operation, 4 parameter, 21 schema, 11 property" == lines[1]
+    assert "    Rule                     Calls    Seconds  Findings" == lines[2]
+    assert lines[3].startswith("    missing-operation-id         7    ")
+    assert 4 == len(lines)
+
+
+def test_lint_errors(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with tempfile.TemporaryDirectory() as directory:
+        filename = Path(directory) / "dupes.yaml"
+        spec = open_oas("pet2.yaml")
+        spec["paths"]["/pets"]["post"]["operationId"] = "listPets"
+        filename.write_text(yaml.dump(spec))
+
+        with (
+            mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+            pytest.raises(typer.Exit) as err,
+        ):
+            lint(str(filename), ["missing.yaml"], rules=["duplicate-operation-id"], workers=1)
+
+    assert err.value.exit_code == 1
+    expected = f"""\
+{filename}:
+    error    /paths/~1pets/post  operationId 'listPets' is also used by /paths/~1pets/get [duplicate-operation-id]
+ERROR: missing.yaml: failed to find file
+Found 1 problems (1 errors, 0 warnings, 0 info) in 2 files, 1 files could not be checked
+"""
+    assert expected == mock_stdout.getvalue()
+
+    # a file that cannot be checked fails, even without any problems
+    with (
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+        pytest.raises(typer.Exit) as err,
+    ):
+        lint("pet.yaml", ["missing.yaml"], workers=1)
+
+    assert err.value.exit_code == 1
+    expected = """\
+ERROR: missing.yaml: failed to find file
+Found 0 problems (0 errors, 0 warnings, 0 info) in 2 files, 1 files could not be checked
+"""
+    assert expected == mock_stdout.getvalue()
+
+
+def test_lint_formats(monkeypatch) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        lint("pet?.yaml", ["pet.yaml"], output_format=LintFormat.JSON, workers=1)
+        data = json.loads(mock_stdout.getvalue())
+
+    assert ["files", "stats", "totals"] == list(data)
+    assert ["pet.yaml", "pet2.yaml", "pet3.yaml"] == [f["filename"] for f in data["files"]]
+    assert {
+        "files": 3, "file_errors": 0, "findings": 1, "error": 0, "warning": 1, "info": 0,
+    } == data["totals"]
+    assert 6 == len(data["stats"])
+    assert ["rule", "calls", "seconds", "findings"] == list(data["stats"][0])
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        lint("pet2.yaml", output_format=LintFormat.SARIF)
+        data = json.loads(mock_stdout.getvalue())
+
+    assert "2.1.0" == data["version"]
+    run = data["runs"][0]
+    assert 6 == len(run["tool"]["driver"]["rules"])
+    assert [("nullable-required", "pet2.yaml")] == [
+        (r["ruleId"], r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]) for r in run["results"]
+    ]
+
+
+@pytest.mark.parametrize(
+    ["filename", "rules", "message"],
+    [
+        pytest.param("gone*.yaml", None, "ERROR: failed to find any files matching gone*.yaml", id="no-files"),
+        pytest.param("pet.yaml", ["bogus"], "ERROR: unknown rule(s) bogus -- choose from missing-", id="rule"),
+    ]
+)
+def test_lint_failure(monkeypatch, filename, rules, message) -> None:
+    monkeypatch.chdir(asset_filename(""))
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit) as err:
+            lint(filename, rules=rules)
+        assert err.value.exit_code == 1
+        assert mock_stdout.getvalue().startswith(message)
+
+
+##########################################
+# Validate
+def test_validate() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        validate(PET2_YAML)
+        assert "pet2.yaml is a valid OpenAPI 3.0 spec\n" == mock_stdout.getvalue()
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit) as err:
+            validate(asset_filename("pets_and_vets.yaml"), max_errors=4)
+        assert err.value.exit_code == 1
+
+        expected = """\
+Found 4 problems in pets_and_vets.yaml (stopped at the maximum):
+    /paths/~1version~1/get/responses/default/content/application~1json: expected object, found null
+    /paths/~1version~1/get/responses/default/content/schema/type: unexpected field 'type'
+    /paths/~1version~1/get/responses/default/content/schema/properties: unexpected field 'properties'
+    /components/schemas/ExamInfo/properties/id/readonly: unexpected field 'readonly'
+"""
+        assert expected == mock_stdout.getvalue()
+
+
+def test_validate_formats() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit):
+            validate(PET3_YAML, output_format=OutputFormat.JSON)
+        data = json.loads(mock_stdout.getvalue())
+
+    assert PET3_YAML == data["filename"]
+    assert "3.0" == data["version"]
+    assert {
+        "pointer": "/paths/~1version~1/get/responses/default/content/application~1json",
+        "message": "expected object, found null",
+    } == data["problems"][0]
+    assert 3 == len(data["problems"])
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit):
+            validate(PET3_YAML, max_errors=1, output_format=OutputFormat.CSV)
+        assert """\
+pointer,message
+/paths/~1version~1/get/responses/default/content/application~1json,"expected object, found null"
+""" == mock_stdout.getvalue()
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        validate(asset_filename("oas31.yaml"), output_format=OutputFormat.CSV)
+        assert "pointer,message\n" == mock_stdout.getvalue()
+
+
+def test_mock() -> None:
+    servers = []
+
+    async def fake_serve(server, host, port, started):
+        servers.append((server, host, port))
+        started(f"http://{host}:{port}")
+        assert 503 == server.response("GET", "/pets").status
+        raise KeyboardInterrupt()
+
+    with (
+        mock.patch("openapi_spec_tools.oas.serve", fake_serve),
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+    ):
+        mock_server(
+            PET2_YAML,
+            port=0,
+            layout=asset_filename("layout_pets.yaml"),
+            page_style=PageStyle.OFFSET,
+            latency=50,
+            error_rate=1.0,
+            error_status=503,
+        )
+        assert """\
+Serving 4 operations from pet2.yaml at http://127.0.0.1:0
+Served 1 requests (1 injected errors, 0 unmatched)
+""" == mock_stdout.getvalue()
+
+    server, host, port = servers[0]
+    assert ("127.0.0.1", 0) == (host, port)
+    assert 0.05 == server.config.latency
+    assert "limit" == server.pagination["listPets"].page_size
+
+
+def test_mock_failures() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit):
+            mock_server(PET2_YAML, layout=asset_filename("missing.yaml"))
+        assert "ERROR: failed to load layout" in mock_stdout.getvalue()
+
+    async def fail_serve(server, host, port, started):
+        raise OSError("address in use")
+
+    with (
+        mock.patch("openapi_spec_tools.oas.serve", fail_serve),
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+    ):
+        with pytest.raises(typer.Exit):
+            mock_server(PET2_YAML, port=80)
+        assert "ERROR: unable to listen on 127.0.0.1:80: address in use" in mock_stdout.getvalue()
+
+
+def test_synth() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        synth(paths=4, models=6, depth=2, seed=3, indent=2)
+        spec = yaml.safe_load(mock_stdout.getvalue())
+    assert (4, 6) == (len(spec["paths"]), len(spec["components"]["schemas"]))
+    assert [] == validate_spec(spec)
+
+    with (
+        tempfile.TemporaryDirectory() as temp_dir,
+        mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout,
+    ):
+        spec_file = (Path(temp_dir) / "synth.json").as_posix()
+        layout_file = (Path(temp_dir) / "layout.yaml").as_posix()
+        synth(paths=4, models=6, depth=2, seed=3, version="3.1.0", cycles=True, output=spec_file, layout=layout_file)
+        result = json.loads(Path(spec_file).read_text())
+        layout = yaml.safe_load(Path(layout_file).read_text())
+        assert f"Wrote 4 paths, 9 operations and 6 models to {spec_file}\n" == mock_stdout.getvalue()
+
+    assert "3.1.0" == result["openapi"]
+    assert "main" in layout
+
+
+def test_synth_failure() -> None:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        with pytest.raises(typer.Exit):
+            synth(version="2.0")
+        assert "ERROR: unsupported OpenAPI version 2.0 -- choose from 3.0.3, 3.1.0" in mock_stdout.getvalue()
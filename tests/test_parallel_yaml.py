@@ -0,0 +1,153 @@
+import pytest
+import yaml
+
+from openapi_spec_tools import parallel_yaml
+from openapi_spec_tools.parallel_yaml import Chunk
+from openapi_spec_tools.parallel_yaml import is_splittable
+from openapi_spec_tools.parallel_yaml import load_yaml
+from openapi_spec_tools.parallel_yaml import load_yaml_file
+from openapi_spec_tools.parallel_yaml import split_document
+from openapi_spec_tools.utils import open_oas
+from tests.helpers import asset_filename
+
+SIMPLE = """\
+---
+openapi: 3.0.0
+info:
+  title: Simple
+paths:
+  /pets:
+    get:
+      operationId: listPets
+      description: |
+        List the pets -- with *markdown* & [links](
+        https://example.com)
+  # a comment in the paths
+  "/pets/{petId}":
+    get:
+      operationId: showPet
+components:
+  schemas:
+    Pet:
+      type: object
+      properties:
+        name: {type: string}
+    Pets:
+      type: array
+      items:
+        $ref: "#/components/schemas/Pet"
+  responses: {}
+  securitySchemes:
+    basic:
+      type: http
+servers:
+- url: https://example.com
+"""
+
+
+def test_split_document() -> None:
+    lines = SIMPLE.split("\n")
+    skeleton, chunks = split_document(lines)
+    assert ["---", "openapi: 3.0.0", "info:", "  title: Simple", "paths:", "components:"] == skeleton[:6]
+    assert [
+        Chunk(("paths",), 5, 15, 2),
+        Chunk(("components",), 16, 17, 2),
+        Chunk(("components", "schemas"), 17, 25, 4),
+        Chunk(("components",), 25, 26, 2),
+        Chunk(("components",), 26, 27, 2),
+        Chunk(("components", "securitySchemes"), 27, 29, 4),
+    ] == chunks
+
+
+@pytest.mark.parametrize(
+    ["text"],
+    [
+        pytest.param("a: &anchor\n  b: 1\nc: *anchor\n", id="alias"),
+        pytest.param("a:\n  <<: *base\n", id="merge-key"),
+        pytest.param("a: [1,\n  2]\n", id="multiline-flow"),
+        pytest.param("a: {b: 1,\n  c: 2}\n", id="multiline-flow-map"),
+        pytest.param("a: 1\n---\nb: 2\n", id="multi-doc"),
+        pytest.param("%YAML 1.1\n---\na: 1\n", id="directive"),
+        pytest.param("a:\n\tb: 1\n", id="tabs"),
+        pytest.param("a: 'quoted\nb: not'\n", id="quote-indent"),
+        pytest.param("a: 'unterminated\n", id="unterminated"),
+    ]
+)
+def test_not_splittable(text) -> None:
+    assert not is_splittable(text.split("\n"))
+    assert split_document(text.split("\n")) is None
+
+
+@pytest.mark.parametrize(
+    ["text"],
+    [
+        pytest.param(SIMPLE, id="simple"),
+        pytest.param("a: 'don''t [stop\n  here'\nb: \"x [\\\" y\"\n", id="quoted"),
+        pytest.param("a: see [docs\n  here] for *more* & less\n", id="plain-text"),
+        pytest.param("a: |\n  *not* an alias\n  [not flow\nb: >-\n  &not anchor\n", id="block-scalars"),
+        pytest.param("a: 1 # comment with [ and &anchor\n", id="comments"),
+    ]
+)
+def test_splittable(text) -> None:
+    assert is_splittable(text.split("\n"))
+
+
+@pytest.mark.parametrize(
+    ["text"],
+    [
+        pytest.param("paths:\n- /pets\n", id="sequence"),
+        pytest.param("paths:\n  /pets:\n    get: 'a\n b'\n", id="quote-indent"),
+        pytest.param("components:\n  ? complex\n  : key\n", id="complex-key"),
+        pytest.param("[a, b]\n", id="flow-document"),
+    ]
+)
+def test_unexpected_layout(text) -> None:
+    assert split_document(text.split("\n")) is None
+    assert yaml.safe_load(text) == load_yaml(text, workers=2, min_size=0)
+
+
+def test_load_yaml_simple() -> None:
+    assert yaml.safe_load(SIMPLE) == load_yaml(SIMPLE, workers=2, min_size=0)
+    assert list(yaml.safe_load(SIMPLE)) == list(load_yaml(SIMPLE, workers=2, min_size=0))
+
+
+@pytest.mark.parametrize("name", ["pet2.yaml", "oas31.yaml", "misc.yaml", "noa_api.yaml", "multi/openapi.yaml"])
+def test_load_yaml_assets(name) -> None:
+    filename = asset_filename(name)
+    with open(filename, encoding="utf-8") as fp:
+        text = fp.read()
+    expected = yaml.safe_load(text)
+    assert expected == load_yaml(text, workers=2, min_size=0)
+    assert expected == load_yaml_file(filename, workers=2, min_size=0)
+    assert open_oas(filename) == open_oas(filename, parallel=True)
+
+
+def test_load_yaml_many_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(parallel_yaml, "MIN_CHUNK_SIZE", 1)
+    with open(asset_filename("noa_api.yaml"), encoding="utf-8") as fp:
+        text = fp.read()
+
+    expected = yaml.safe_load(text)
+    result = load_yaml(text, workers=3, min_size=0)
+    assert expected == result
+    assert list(expected["paths"]) == list(result["paths"])
+    assert list(expected["components"]["schemas"]) == list(result["components"]["schemas"])
+
+
+def test_load_yaml_normal_parse(monkeypatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected split")
+
+    monkeypatch.setattr(parallel_yaml, "split_document", fail)
+    assert yaml.safe_load(SIMPLE) == load_yaml(SIMPLE)  # smaller than the minimum size
+    assert yaml.safe_load(SIMPLE) == load_yaml(SIMPLE, workers=1, min_size=0)
+
+
+def test_load_yaml_error() -> None:
+    # the chunk is not valid YAML, so the normal parse reports the error (with the line numbers)
+    text = "paths:\n  /pets:\n    get: 1\n    bad\n  /other: 1\n"
+    assert split_document(text.split("\n"))
+    with pytest.raises(yaml.YAMLError):
+        yaml.safe_load(text)
+    with pytest.raises(yaml.YAMLError):
+        load_yaml(text, workers=2, min_size=0)
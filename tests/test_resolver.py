@@ -0,0 +1,203 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import pytest
+import yaml
+
+from openapi_spec_tools import resolver
+from openapi_spec_tools.cli_gen.generator import Generator
+from openapi_spec_tools.resolver import RefResolver
+from openapi_spec_tools.resolver import has_external_refs
+from openapi_spec_tools.resolver import internalize_refs
+from openapi_spec_tools.resolver import is_external
+from openapi_spec_tools.resolver import is_remote
+from openapi_spec_tools.resolver import resolve_pointer
+from openapi_spec_tools.resolver import split_reference
+from openapi_spec_tools.utils import find_references
+from openapi_spec_tools.utils import map_models
+from openapi_spec_tools.utils import model_references
+from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.utils import unroll
+from tests.helpers import asset_filename
+
+MULTI_YAML = asset_filename("multi/openapi.yaml")
+
+
+@pytest.mark.parametrize(
+    ["ref", "expected"],
+    [
+        pytest.param("#/components/schemas/Pet", ("/a/b/main.yaml", "/components/schemas/Pet"), id="local"),
+        pytest.param("pet.yaml", ("/a/b/pet.yaml", ""), id="file"),
+        pytest.param("../c/pet.yaml#/Pet", ("/a/c/pet.yaml", "/Pet"), id="relative"),
+        pytest.param("./my%20pet.yaml#/My%20Pet", ("/a/b/my pet.yaml", "/My Pet"), id="quoted"),
+        pytest.param(
+            "https://example.com/schemas/Pet.yaml#/Pet",
+            ("https://example.com/schemas/Pet.yaml", "/Pet"),
+            id="remote",
+        ),
+    ]
+)
+def test_split_reference(ref, expected) -> None:
+    assert expected == split_reference(ref, "/a/b/main.yaml")
+
+
+@pytest.mark.parametrize(
+    ["ref", "external", "remote"],
+    [
+        pytest.param("#/components/schemas/Pet", False, False, id="local"),
+        pytest.param("../pet.yaml#/Pet", True, False, id="file"),
+        pytest.param("https://example.com/pet.yaml#/Pet", False, True, id="https"),
+        pytest.param("file:///tmp/pet.yaml", False, True, id="file-url"),
+    ]
+)
+def test_ref_kinds(ref, external, remote) -> None:
+    assert external == is_external(ref)
+    assert remote == is_remote(ref)
+
+
+def test_resolve_pointer() -> None:
+    document = {"a/b": {"c~d": [{"e": 1}, {"e": 2}]}}
+    assert document == resolve_pointer(document, "")
+    assert 2 == resolve_pointer(document, "/a~1b/c~0d/1/e")
+    with pytest.raises(ValueError, match="unable to find 'x'"):
+        resolve_pointer(document, "/a~1b/x")
+
+
+def test_resolver_caching() -> None:
+    uut = RefResolver()
+    filename = asset_filename("multi/common/parameters.yaml")
+    with mock.patch.object(resolver, "load_document", wraps=resolver.load_document) as mock_load:
+        limit = uut.resolve(filename, "/Limit")
+        assert "limit" == limit["name"]
+        assert limit is uut.resolve(filename, "/Limit")
+        assert "petId" == uut.resolve(filename, "/PetId/name")
+        uut.load([filename])
+
+    # only parsed once
+    assert 1 == mock_load.call_count
+
+
+def test_resolver_parallel() -> None:
+    with TemporaryDirectory() as tempdir:
+        filenames = []
+        for index in range(resolver.PARALLEL_THRESHOLD + 2):
+            filename = os.path.join(tempdir, f"model{index}.yaml")
+            with open(filename, "w") as fp:
+                yaml.dump({"type": "object", "title": f"model {index}"}, fp)
+            filenames.append(filename)
+
+        uut = RefResolver(workers=2)
+        uut.load(filenames)
+        for index, filename in enumerate(filenames):
+            assert f"model {index}" == uut.resolve(filename, "/title")
+
+        with pytest.raises(ValueError, match="failed to find referenced file"):
+            uut.load([os.path.join(tempdir, "missing.yaml")])
+
+
+def test_internalize_refs() -> None:
+    spec = open_oas(MULTI_YAML, resolve_refs=False)
+    assert has_external_refs(spec)
+
+    result = internalize_refs(spec, MULTI_YAML)
+    assert result is spec
+    assert not has_external_refs(spec)
+
+    components = spec["components"]
+    assert ["Owner", "Pets", "Pet", "Error", "Tag"] == list(components["schemas"].keys())
+    assert ["Error"] == list(components["responses"].keys())
+    assert {"Limit", "PetId"} == set(components["parameters"].keys())
+
+    # path items have no components, so they are inlined
+    assert "listPets" == spec["paths"]["/pets"]["get"]["operationId"]
+
+    # reference back to the main document is local, as is the reference within the Pet document
+    pet = components["schemas"]["Pet"]
+    assert "#/components/schemas/Owner" == pet["properties"]["owner"]["$ref"]
+    assert "#/components/schemas/Tag" == pet["properties"]["tag"]["$ref"]
+    assert "#/components/schemas/Pet" == components["schemas"]["Pets"]["items"]["$ref"]
+
+    # the reference graph works across the files
+    references = model_references(map_models(components))
+    assert {"schemas/Pets"} == references["schemas/Owner"]
+    assert {"schemas/Owner", "schemas/Pet", "schemas/Pets", "schemas/Tag"} == unroll(references, {"schemas/Owner"})
+    assert {"parameters/Limit", "responses/Error", "schemas/Pets"} == find_references(spec["paths"]["/pets"]["get"])
+
+
+def test_internalize_refs_no_external() -> None:
+    spec = {"paths": {}, "components": {"schemas": {"A": {"$ref": "#/components/schemas/B"}}}}
+    assert spec == internalize_refs(spec, "main.yaml")
+
+
+def test_internalize_refs_name_conflict() -> None:
+    with TemporaryDirectory() as tempdir:
+        main = os.path.join(tempdir, "main.yaml")
+        with open(os.path.join(tempdir, "other.yaml"), "w") as fp:
+            yaml.dump({"Pet": {"type": "string"}}, fp)
+
+        spec = {
+            "components": {
+                "schemas": {
+                    "Pet": {"type": "object"},
+                    "Other": {"$ref": "other.yaml#/Pet"},
+                    "Same": {"$ref": "./other.yaml#/Pet"},
+                }
+            }
+        }
+        internalize_refs(spec, main)
+
+    schemas = spec["components"]["schemas"]
+    assert {"type": "object"} == schemas["Pet"]
+    assert {"type": "string"} == schemas["Pet_1"]
+    assert "#/components/schemas/Pet_1" == schemas["Other"]["$ref"]
+    assert "#/components/schemas/Pet_1" == schemas["Same"]["$ref"]
+
+
+@pytest.mark.parametrize(
+    ["ref", "message"],
+    [
+        pytest.param("missing.yaml", "failed to find referenced file", id="file"),
+        pytest.param("common/parameters.yaml#/Offset", "unable to find 'Offset'", id="pointer"),
+    ]
+)
+def test_internalize_refs_errors(ref, message) -> None:
+    spec = {"components": {"schemas": {"Bad": {"$ref": ref}}}}
+    with pytest.raises(ValueError, match=message):
+        internalize_refs(spec, MULTI_YAML)
+
+
+def test_internalize_refs_remote() -> None:
+    remote = "https://example.com/schemas/Pet.yaml#/Pet"
+    with TemporaryDirectory() as tempdir:
+        main = os.path.join(tempdir, "main.yaml")
+        with open(os.path.join(tempdir, "other.yaml"), "w") as fp:
+            yaml.dump({"Owner": {"type": "object", "properties": {"pet": {"$ref": remote}}}}, fp)
+
+        spec = {
+            "paths": {},
+            "components": {
+                "schemas": {
+                    "Pet": {"$ref": remote},
+                    "Owner": {"$ref": "other.yaml#/Owner"},
+                }
+            },
+        }
+        with open(main, "w") as fp:
+            yaml.dump(spec, fp)
+
+        assert not has_external_refs({"components": {"schemas": {"Pet": {"$ref": remote}}}})
+        loaded = open_oas(main)
+
+    # remote references are left alone, while the local file is still internalized
+    schemas = loaded["components"]["schemas"]
+    assert remote == schemas["Pet"]["$ref"]
+    assert "#/components/schemas/Owner_1" == schemas["Owner"]["$ref"]
+    assert remote == schemas["Owner_1"]["properties"]["pet"]["$ref"]
+
+
+def test_generator_get_model() -> None:
+    uut = Generator("cli_package", open_oas(MULTI_YAML))
+    model = uut.get_model("#/components/schemas/Pet")
+    assert ["id", "name"] == model["required"]
+    assert "#/components/schemas/Owner" == model["properties"]["owner"]["$ref"]
@@ -0,0 +1,52 @@
+import json
+
+from openapi_spec_tools.stats import SizeStat
+from openapi_spec_tools.stats import count_nodes
+from openapi_spec_tools.stats import load_with_timings
+from openapi_spec_tools.stats import serialized_size
+from openapi_spec_tools.stats import spec_stats
+from openapi_spec_tools.utils import open_oas
+from tests.helpers import asset_filename
+from tests.helpers import open_test_oas
+
+
+def test_count_nodes() -> None:
+    assert 1 == count_nodes("a")
+    assert 1 == count_nodes({})
+    assert 6 == count_nodes({"a": [1, 2], "b": {"c": None}})
+
+
+def test_serialized_size() -> None:
+    assert len('{"a":[1,2],"b":"\\u00e9"}') == serialized_size({"a": [1, 2], "b": "é"})
+
+
+def test_load_with_timings() -> None:
+    for name in ["pet2.yaml", "pet2.json", "multi/openapi.yaml"]:
+        filename = asset_filename(name)
+        spec, timings = load_with_timings(filename)
+        assert open_oas(filename) == spec
+        assert timings.parse > 0.0
+        assert timings.total == timings.read + timings.parse + timings.resolve + timings.index
+        assert ["read", "parse", "resolve", "index", "total"] == list(timings.to_dict().keys())
+
+
+def test_spec_stats() -> None:
+    spec = open_test_oas("pet2.yaml")
+    result = spec_stats(spec)
+    assert SizeStat("total", len(json.dumps(spec, separators=(",", ":"))), count_nodes(spec)) == result.total
+
+    assert ["/pets", "/pets/{petId}"] == [item.name for item in result.paths]
+    assert serialized_size(spec["paths"]["/pets"]) == result.paths[0].bytes
+
+    # tag sizes are the total of the operations
+    assert ["pets", "admin"] == [item.name for item in result.tags]
+    delete = spec["paths"]["/pets/{petId}"]["delete"]
+    assert SizeStat("admin", serialized_size(delete), count_nodes(delete)) == result.tags[1]
+
+    assert ["schemas/Pet", "schemas/Error", "schemas/Pets"] == [item.name for item in result.components]
+
+    descriptions = result.descriptions
+    assert 13 == len(descriptions)
+    assert "/paths/~1pets/get/parameters/0/description" == descriptions[0].name
+    assert len("How many items to return at one time (max 100)") == descriptions[0].bytes
+    assert all(a.bytes >= b.bytes for a, b in zip(descriptions, descriptions[1:]))
@@ -0,0 +1,169 @@
+import re
+
+import pytest
+
+from openapi_spec_tools.cli_gen.layout import check_pagination_definitions
+from openapi_spec_tools.cli_gen.layout import operation_duplicates
+from openapi_spec_tools.cli_gen.layout import parse_to_tree
+from openapi_spec_tools.cli_gen.layout import subcommand_missing_properties
+from openapi_spec_tools.lint import Severity
+from openapi_spec_tools.lint import lint_spec
+from openapi_spec_tools.synth import SCHEMA_PREFIX
+from openapi_spec_tools.synth import SUPPORTED_VERSIONS
+from openapi_spec_tools.synth import SpecSynthesizer
+from openapi_spec_tools.synth import SynthConfig
+from openapi_spec_tools.synth import article
+from openapi_spec_tools.synth import model_names
+from openapi_spec_tools.synth import plural
+from openapi_spec_tools.synth import snake_case
+from openapi_spec_tools.synth import synthesize
+from openapi_spec_tools.synth import synthesize_layout
+from openapi_spec_tools.utils import iter_references
+from openapi_spec_tools.utils import map_operations
+from openapi_spec_tools.validate import validate_spec
+
+
+def model_refs(spec: dict, name: str) -> set[str]:
+    schema = spec["components"]["schemas"][name]
+    return {ref.removeprefix(SCHEMA_PREFIX) for ref in iter_references(schema)}
+
+
+def test_names() -> None:
+    names = model_names(2000)
+    assert ["Account", "Address", "Alert"] == names[:3]
+    assert "AccountDetail" == names[70]
+    assert "Account1" == names[560]
+    assert len(names) == len(set(names))
+
+    assert "account_detail_1" == snake_case("AccountDetail1")
+    assert ["policies", "addresses", "keys", "jobs"] == [plural(n) for n in ["policy", "address", "key", "job"]]
+    assert ["an audit", "a backup"] == [article("audit"), article("backup")]
+
+
+@pytest.mark.parametrize(
+    ["config", "tags"],
+    [
+        pytest.param(SynthConfig(), 4, id="default"),
+        pytest.param(SynthConfig(paths=1, models=1, depth=3, fanout=5), 1, id="tiny"),
+        pytest.param(SynthConfig(paths=501, models=1500, depth=5, fanout=4, cycles=True, tags=30), 30, id="large"),
+    ],
+)
+def test_synthesize_size(config, tags) -> None:
+    spec = synthesize(config)
+    assert config.paths == len(spec["paths"])
+    assert config.models == len(spec["components"]["schemas"])
+    assert tags == len(spec["tags"])
+
+    operations = map_operations(spec["paths"])
+    assert all(op["tags"][0] in {t["name"] for t in spec["tags"]} for op in operations.values())
+    assert [] == validate_spec(spec)
+
+
+def test_synthesize_repeatable() -> None:
+    config = SynthConfig(paths=50, models=100, cycles=True, seed=7)
+    assert synthesize(config) == synthesize(config)
+    assert synthesize(config) != synthesize(SynthConfig(paths=50, models=100, cycles=True, seed=8))
+
+
+def test_synthesize_levels() -> None:
+    config = SynthConfig(paths=20, models=90, depth=3, fanout=2)
+    spec = synthesize(config)
+    levels = SpecSynthesizer(config).levels
+    assert [30, 30, 30] == [len(level) for level in levels]
+
+    # each model only references the next level, and no more than the fanout
+    for index, level in enumerate(levels):
+        children = set(levels[index + 1]) if index + 1 < len(levels) else set()
+        for name in level:
+            refs = model_refs(spec, name)
+            assert refs <= children
+            assert len(refs) <= 2 * config.fanout  # a oneOf references 2 models
+
+    # the paths only use the top level models
+    refs = set()
+    for path_item in spec["paths"].values():
+        refs.update(ref.removeprefix(SCHEMA_PREFIX) for ref in iter_references(path_item))
+    assert {r for r in refs if not r.startswith("#")} <= set(levels[0])
+
+
+def test_synthesize_cycles() -> None:
+    spec = synthesize(SynthConfig(paths=20, models=200, depth=4, cycles=True))
+    models = spec["components"]["schemas"]
+    recursive = [name for name in models if name in model_refs(spec, name)]
+    assert recursive
+
+    parents = []
+    for name, schema in models.items():
+        parent = schema.get("properties", {}).get("parent")
+        if parent:
+            assert parent["readOnly"]
+            owner = next(iter_references(parent)).removeprefix(SCHEMA_PREFIX)
+            assert name in model_refs(spec, owner)
+            parents.append(name)
+    assert parents
+
+
+@pytest.mark.parametrize("version", SUPPORTED_VERSIONS)
+def test_synthesize_versions(version) -> None:
+    spec = synthesize(SynthConfig(paths=40, models=300, depth=4, cycles=True, version=version))
+    assert version == spec["openapi"]
+    assert [] == validate_spec(spec)
+
+    item = spec["paths"]["/api/v1/admin/accounts"]["get"]["responses"]["200"]
+    next_schema = item["content"]["application/json"]["schema"]["properties"]["next"]
+    if version.startswith("3.0"):
+        assert next_schema["nullable"]
+    else:
+        assert ["string", "null"] == next_schema["type"]
+
+
+def test_synthesize_path_params() -> None:
+    spec = synthesize(SynthConfig(paths=200, models=100))
+    nested = 0
+    for op_id, operation in map_operations(spec["paths"]).items():
+        names = re.findall(r"{([^}]+)}", operation["x-path"])
+        nested += len(names) > 1
+        params = (operation["x-path-params"] or []) + operation.get("parameters", [])
+        declared = {p["name"] for p in params if p.get("in") == "path"}
+        assert set(names) == declared, op_id
+    assert nested
+
+    assert [] == validate_spec(spec)
+    # warnings (e.g. nullable-required) are expected in a realistic spec, but not errors
+    assert [] == [f for f in lint_spec(spec).findings if f.severity == Severity.ERROR]
+
+
+@pytest.mark.parametrize(
+    ["config", "message"],
+    [
+        pytest.param(SynthConfig(version="2.0"), "unsupported OpenAPI version 2.0", id="version"),
+        pytest.param(SynthConfig(paths=0), "paths, models and depth must be positive", id="paths"),
+        pytest.param(SynthConfig(fanout=-1), "fanout cannot be negative", id="fanout"),
+    ],
+)
+def test_synthesize_errors(config, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        synthesize(config)
+
+
+def test_synthesize_layout() -> None:
+    spec = synthesize(SynthConfig(paths=60, models=120, tags=3))
+    layout = synthesize_layout(spec)
+    assert ["main", "admin", "billing", "compute"] == list(layout)
+    assert {} == subcommand_missing_properties(layout)
+    assert {} == operation_duplicates(layout)
+    assert {} == check_pagination_definitions(layout)
+
+    tree = parse_to_tree(layout)
+    operations = map_operations(spec["paths"])
+    commands = {}
+    for sub in tree.subcommands():
+        for node in sub.operations():
+            commands[node.identifier] = node
+    assert set(operations) == set(commands)
+
+    node = commands["accounts_list"]
+    assert ("accounts-list", "page", "results") == (
+        node.command, node.pagination.page_start, node.pagination.items_property
+    )
+    assert commands["accounts_retrieve"].pagination is None
@@ -1,13 +1,25 @@
+import gc
+import json
+import pickle
+import tracemalloc
 from enum import Enum
 from typing import Any
 
 import pytest
 
 from openapi_spec_tools.types import OasField
+from openapi_spec_tools.utils import NameIndex
+from openapi_spec_tools.utils import PathRouter
+from openapi_spec_tools.utils import compact_spec
 from openapi_spec_tools.utils import count_values
+from openapi_spec_tools.utils import create_router
+from openapi_spec_tools.utils import cyclic_references
+from openapi_spec_tools.utils import dereference
 from openapi_spec_tools.utils import find_diffs
+from openapi_spec_tools.utils import find_duplicate_models
 from openapi_spec_tools.utils import find_paths
 from openapi_spec_tools.utils import find_references
+from openapi_spec_tools.utils import iter_references
 from openapi_spec_tools.utils import map_content_types
 from openapi_spec_tools.utils import map_models
 from openapi_spec_tools.utils import map_operations
@@ -15,12 +27,22 @@ from openapi_spec_tools.utils import model_filter
 from openapi_spec_tools.utils import model_full_name
 from openapi_spec_tools.utils import model_references
 from openapi_spec_tools.utils import models_referenced_by
+from openapi_spec_tools.utils import name_index
+from openapi_spec_tools.utils import names_containing
 from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.utils import operation_table
+from openapi_spec_tools.utils import reference_graph
+from openapi_spec_tools.utils import remove_duplicate_models
 from openapi_spec_tools.utils import remove_property
 from openapi_spec_tools.utils import remove_schema_tags
+from openapi_spec_tools.utils import remove_unused_models
+from openapi_spec_tools.utils import rename_references
+from openapi_spec_tools.utils import scan_json_references
 from openapi_spec_tools.utils import schema_operations_filter
 from openapi_spec_tools.utils import set_nullable_not_required
 from openapi_spec_tools.utils import short_ref
+from openapi_spec_tools.utils import unroll
+from openapi_spec_tools.utils import unused_models
 from tests.helpers import asset_filename
 from tests.helpers import open_test_oas
 
@@ -34,6 +56,12 @@ def test_open_oas() -> None:
     with pytest.raises(FileNotFoundError):
         open_oas("no-such-file")
 
+    # references to other files are only resolved when requested
+    multi = open_oas(asset_filename("multi/openapi.yaml"), resolve_refs=False)
+    assert "./paths/pets.yaml" == multi["paths"]["/pets"]["$ref"]
+    multi = open_oas(asset_filename("multi/openapi.yaml"))
+    assert "listPets" == multi["paths"]["/pets"]["get"]["operationId"]
+
 
 @pytest.mark.parametrize(
     ["full_name", "expected"],
@@ -190,6 +218,328 @@ def test_model_references() -> None:
     assert expected == model_references(models)
 
 
+def test_reference_graph() -> None:
+    oas = open_test_oas("pet2.yaml")
+    expected = {
+        "#/components/schemas/Pets": {"#/components/schemas/Pet"},
+        "#/components/schemas/Pet": set(),
+        "#/components/schemas/Error": set(),
+    }
+    assert expected == reference_graph(oas)
+
+    # dangling and external references have no children
+    oas = {"a": {"$ref": "#/components/schemas/Missing"}, "b": {"$ref": "other.yaml"}}
+    assert {"#/components/schemas/Missing": set(), "other.yaml": set()} == reference_graph(oas)
+
+
+@pytest.mark.parametrize(
+    ["graph", "expected"],
+    [
+        pytest.param({"a": {"b"}, "b": {"c"}, "c": set()}, set(), id="acyclic"),
+        pytest.param({"a": {"a"}, "b": {"a"}}, {"a"}, id="self"),
+        pytest.param({"a": {"b"}, "b": {"c"}, "c": {"a"}, "d": {"a"}, "e": set()}, {"a", "b", "c"}, id="loop"),
+        pytest.param({"a": {"b", "d"}, "b": {"a"}, "c": {"d"}, "d": {"c"}}, {"a", "b", "c", "d"}, id="two"),
+    ]
+)
+def test_cyclic_references(graph, expected) -> None:
+    assert expected == cyclic_references(graph)
+
+
+def test_dereference() -> None:
+    oas = open_test_oas("pet2.yaml")
+    result = dereference(oas)
+    assert [] == list(iter_references(result))
+    assert oas == open_test_oas("pet2.yaml")  # not modified
+
+    # the referenced objects are shared
+    pet = result["components"]["schemas"]["Pet"]
+    assert pet is result["components"]["schemas"]["Pets"]["items"]
+    create = result["paths"]["/pets"]["post"]
+    assert pet is create["requestBody"]["content"]["application/json"]["schema"]
+
+    # references to large objects can be kept
+    result = dereference(oas, max_size=15)
+    assert {"#/components/schemas/Pet"} == set(iter_references(result))
+
+
+def test_dereference_cycles() -> None:
+    oas = {
+        "paths": {"/a": {"get": {"schema": {"$ref": "#/components/schemas/Node"}}}},
+        "components": {
+            "schemas": {
+                "Node": {"properties": {"child": {"$ref": "#/components/schemas/Node"}}},
+                "Root": {"properties": {"node": {"$ref": "#/components/schemas/Node"}, "id": {"$ref": "#/x"}}},
+                "Sibling": {"$ref": "#/components/schemas/Root", "description": "override"},
+            }
+        },
+    }
+    result = dereference(oas)
+    schemas = result["components"]["schemas"]
+    assert {"$ref": "#/components/schemas/Node"} == result["paths"]["/a"]["get"]["schema"]
+    assert {"$ref": "#/components/schemas/Node"} == schemas["Root"]["properties"]["node"]
+    assert {"$ref": "#/x"} == schemas["Root"]["properties"]["id"]
+    assert "override" == schemas["Sibling"]["description"]
+    assert schemas["Root"]["properties"] is schemas["Sibling"]["properties"]
+
+
+def test_dereference_deep_reuse() -> None:
+    # each model uses the previous one twice, so naive inlining would have 2^N copies
+    count = 200
+    schemas = {"M0": {"type": "string"}}
+    for index in range(1, count):
+        previous = {"$ref": f"#/components/schemas/M{index - 1}"}
+        schemas[f"M{index}"] = {"properties": {"left": previous, "right": dict(previous)}}
+
+    result = dereference({"components": {"schemas": schemas}})
+    last = result["components"]["schemas"][f"M{count - 1}"]
+    assert last["properties"]["left"] is last["properties"]["right"]
+    assert last["properties"]["left"] is result["components"]["schemas"][f"M{count - 2}"]
+
+
+def test_compact_spec() -> None:
+    name = "".join(["na", "me"])  # not the same object as other "name" strings
+    long_text = "x" * 100
+    shared = {"type": "string", "enum": ["a", "b"]}
+    spec = {
+        name: {"required": [name, "id"], "flags": [1, True, 1.0], "long": long_text},
+        "other": {"required": ["name", "id"], "nested": [{"a": 1}], "empty": []},
+        "left": shared,
+        "right": shared,
+    }
+    result = compact_spec(spec)
+    assert json.loads(json.dumps(spec)) == json.loads(json.dumps(result))
+
+    first = result["name"]
+    assert ("name", "id") == first["required"]
+    assert first["required"] is result["other"]["required"]
+    assert first["required"][0] is next(iter(result))
+    # equal values with different types are not merged
+    assert [int, bool, float] == [type(v) for v in first["flags"]]
+    assert () == result["other"]["empty"]
+    # lists of objects are kept as lists
+    assert [{"a": 1}] == result["other"]["nested"]
+    assert result["left"] is result["right"]
+    assert ("a", "b") == result["left"]["enum"]
+
+    # the original is not modified
+    assert ["name", "id"] == spec[name]["required"]
+
+    result = compact_spec(spec, freeze=False)
+    assert ["name", "id"] == result["name"]["required"]
+    assert result["name"]["required"] is not result["other"]["required"]
+
+
+def test_compact_spec_analysis() -> None:
+    filename = asset_filename("pet2.yaml")
+    spec = open_oas(filename)
+    compact = open_oas(filename, compact=True)
+    assert json.loads(json.dumps(spec)) == json.loads(json.dumps(compact))
+    assert model_references(map_models(spec["components"])) == model_references(map_models(compact["components"]))
+    assert set(operation_table(spec["paths"])) == set(operation_table(compact["paths"]))
+
+
+def traced_size(func) -> tuple[Any, int]:
+    """Get the result, and the (traced) memory it uses."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("name", ["ct.yaml", "trello_api.yaml"])
+def test_compact_spec_memory(name) -> None:
+    # the pickle has the same strings/objects as loading the YAML (without the slow parse being traced)
+    data = pickle.dumps(open_test_oas(name))
+    spec, original = traced_size(lambda: pickle.loads(data))
+    compact, compacted = traced_size(lambda: compact_spec(pickle.loads(data)))
+
+    assert json.loads(json.dumps(spec)) == json.loads(json.dumps(compact))
+    assert compacted < original * 0.7, f"{name} compacted from {original} to {compacted} bytes"
+
+
+UNUSED_OAS = {
+    "security": [{"ApiKey": []}],
+    "paths": {
+        "/a": {
+            "parameters": [{"$ref": "#/components/parameters/Limit"}],
+            "get": {
+                "security": [{"Jwt": []}],
+                "requestBody": {"$ref": "#/components/requestBodies/Body"},
+                "responses": {"200": {"$ref": "#/components/responses/Ok"}},
+            },
+        },
+    },
+    "webhooks": {"hook": {"post": {"responses": {"200": {"$ref": "#/components/responses/Hook"}}}}},
+    "components": {
+        "parameters": {
+            "Limit": {"schema": {"$ref": "#/components/schemas/Count"}},
+            "Offset": {"schema": {"$ref": "#/components/schemas/Count"}},
+        },
+        "requestBodies": {"Body": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/A"}}}}},
+        "responses": {
+            "Ok": {"description": "ok"},
+            "Hook": {"description": "hook"},
+            "Error": {"description": "error", "$ref": "#/components/schemas/Err"},
+        },
+        "schemas": {
+            "A": {"properties": {"b": {"$ref": "#/components/schemas/B"}}},
+            "B": {"properties": {"a": {"$ref": "#/components/schemas/A"}}},
+            "C": {"properties": {"d": {"$ref": "#/components/schemas/D"}}},
+            "D": {"properties": {"c": {"$ref": "#/components/schemas/C"}}},
+            "Count": {"type": "integer"},
+            "Err": {"type": "string"},
+        },
+        "securitySchemes": {"ApiKey": {"type": "apiKey"}, "Jwt": {"type": "http"}, "Basic": {"type": "http"}},
+    },
+}
+
+
+def test_unused_models() -> None:
+    expected = {
+        "parameters/Offset",
+        "responses/Error",
+        "schemas/C",
+        "schemas/D",
+        "schemas/Err",
+        "securitySchemes/Basic",
+    }
+    assert expected == unused_models(UNUSED_OAS)
+    assert set() == unused_models(open_test_oas("pet2.yaml"))
+    assert {"schemas/Veterinarian"} == unused_models(open_test_oas("pets_and_vets.yaml"))
+
+
+def test_unused_models_discriminator() -> None:
+    pet = {
+        "oneOf": [{"$ref": "#/components/schemas/Cat"}],
+        "discriminator": {
+            "propertyName": "kind",
+            "mapping": {"cat": "#/components/schemas/Cat", "dog": "Dog", "bird": "#/components/schemas/Bird"},
+        },
+    }
+    spec = {
+        "paths": {
+            "/pets": {
+                "get": {
+                    "responses": {
+                        "200": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}}},
+                    },
+                },
+            },
+        },
+        "components": {
+            "schemas": {
+                "Pet": pet,
+                "Cat": {"type": "object"},
+                "Dog": {"type": "object", "properties": {"toy": {"$ref": "#/components/schemas/Toy"}}},
+                "Bird": {"type": "object"},
+                "Toy": {"type": "object"},
+                "Fish": {"type": "object"},
+            },
+        },
+    }
+    # the models only reachable through the mapping (and their references) are used
+    assert {"schemas/Fish"} == unused_models(spec)
+    assert ["Pet", "Cat", "Dog", "Bird", "Toy"] == list(remove_unused_models(spec)["components"]["schemas"])
+
+
+def test_unused_models_escaped_and_webhooks() -> None:
+    spec = {
+        "paths": {
+            "/pets": {
+                "get": {
+                    "responses": {
+                        "200": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/pet~1v1"}}}},
+                        "400": {"$ref": "#/components/schemas/Error~0Info/properties/message"},
+                    },
+                },
+            },
+        },
+        "webhooks": {
+            "newPet": {
+                "post": {
+                    "security": [{"WebhookKey": []}],
+                    "requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Hook"}}}},
+                },
+            },
+        },
+        "components": {
+            "schemas": {
+                "pet/v1": {"discriminator": {"propertyName": "kind", "mapping": {"cat": "Cat~Meow"}}},
+                "Cat~Meow": {"type": "object"},
+                "Error~Info": {"type": "object", "properties": {"message": {"type": "string"}}},
+                "Hook": {"type": "object"},
+                "Unused": {"type": "object"},
+            },
+            "securitySchemes": {"WebhookKey": {"type": "apiKey"}, "Other": {"type": "http"}},
+        },
+    }
+    assert {"schemas/Unused", "securitySchemes/Other"} == unused_models(spec)
+    result = remove_unused_models(spec)
+    assert ["pet/v1", "Cat~Meow", "Error~Info", "Hook"] == list(result["components"]["schemas"])
+    assert ["WebhookKey"] == list(result["components"]["securitySchemes"])
+
+
+def test_remove_unused_models() -> None:
+    result = remove_unused_models(UNUSED_OAS)
+    assert set() == unused_models(result)
+    assert ["A", "B", "Count"] == list(result["components"]["schemas"].keys())
+    assert ["ApiKey", "Jwt"] == list(result["components"]["securitySchemes"].keys())
+    assert "Offset" in UNUSED_OAS["components"]["parameters"]  # not modified
+
+    oas = open_test_oas("pet2.yaml")
+    assert oas == remove_unused_models(oas)
+
+
+def test_find_duplicate_models() -> None:
+    oas = open_test_oas("dupes.yaml")
+    models = map_models(oas[OasField.COMPONENTS])
+    # the lists are only identical after the Dog is replaced by the Pet
+    assert {"schemas/Dog": "schemas/Pet", "schemas/DogList": "schemas/PetList"} == find_duplicate_models(models)
+
+    # only identical within a section
+    models = {"schemas/A": {"type": "string"}, "headers/A": {"type": "string"}, "schemas/B": {"type": "string"}}
+    assert {"schemas/B": "schemas/A"} == find_duplicate_models(models)
+    assert {} == find_duplicate_models(map_models(open_test_oas("pet2.yaml")[OasField.COMPONENTS]))
+
+
+def test_remove_duplicate_models() -> None:
+    oas = open_test_oas("dupes.yaml")
+    result = remove_duplicate_models(oas)
+    assert oas == open_test_oas("dupes.yaml")  # not modified
+
+    assert ["Pet", "Cat", "PetList"] == list(result[OasField.COMPONENTS]["schemas"].keys())
+    expected = {"#/components/schemas/Cat", "#/components/schemas/Pet", "#/components/schemas/PetList"}
+    assert expected == set(iter_references(result))
+    schema = result["paths"]["/dogs"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert {"$ref": "#/components/schemas/PetList"} == schema
+
+    # nothing to remove
+    assert oas == remove_duplicate_models(oas, {})
+
+
+def test_rename_references() -> None:
+    obj = {"a": {"$ref": "#/x"}, "b": [{"$ref": "#/y"}, {"$ref": "#/x"}], "$ref": "#/z"}
+    assert 3 == rename_references(obj, {"#/x": "#/X", "#/z": "#/Z"})
+    assert {"a": {"$ref": "#/X"}, "b": [{"$ref": "#/y"}, {"$ref": "#/X"}], "$ref": "#/Z"} == obj
+
+
+@pytest.mark.parametrize(
+    ["items", "expected"],
+    [
+        pytest.param({"b", "c"}, {"b", "c", "d", "e"}, id="tree"),
+        pytest.param({"x"}, {"x", "y", "z"}, id="cycle"),
+        pytest.param(set(), set(), id="empty"),
+    ]
+)
+def test_unroll(items, expected) -> None:
+    full_set = {"a": {"b"}, "b": {"c", "d"}, "c": set(), "d": {"e"}, "e": set(), "x": {"y"}, "y": {"z"}, "z": {"x"}}
+    assert expected == unroll(full_set, items)
+
+
 @pytest.mark.parametrize(
     ["asset", "model_name", "keys"],
     [
@@ -223,6 +573,60 @@ def test_model_full_name(needle, expected) -> None:
     assert expected == model_full_name(models, needle)
 
 
+def test_model_full_name_duplicates() -> None:
+    models = {"schemas/Pet": {}, "responses/Pet": {}, "schemas/Owner": {}}
+    assert model_full_name(models, "Pet") is None
+    assert "schemas/Owner" == model_full_name(models, "Owner")
+
+
+def test_model_full_name_changes() -> None:
+    models = {"schemas/A": {}}
+    assert "schemas/A" == model_full_name(models, "A")
+
+    # same size, but different names
+    del models["schemas/A"]
+    models["schemas/B"] = {}
+    assert "schemas/B" == model_full_name(models, "B")
+    assert model_full_name(models, "A") is None
+    assert ["schemas/B"] == name_index(models).contains("b")
+
+
+def test_name_index() -> None:
+    index = NameIndex(["schemas/Pet", "schemas/PetList", "responses/Pet", "schemas/Owner"])
+    assert ["schemas/Pet", "responses/Pet"] == index.full_names("Pet")
+    assert ["schemas/Owner"] == index.full_names("Owner")
+    assert [] == index.full_names("schemas")
+
+    assert ["schemas/Pet", "schemas/PetList", "responses/Pet"] == index.contains("pet")
+    assert ["schemas/PetList"] == index.contains("TLIS")
+    assert ["schemas/Pet", "schemas/PetList", "schemas/Owner"] == index.contains("schemas/")
+    assert ["schemas/Owner"] == index.contains("w")
+    assert [] == index.contains("dog")
+    assert [] == index.contains("ownerx")
+    assert 4 == len(index.contains(""))
+
+    # all the trigrams are present, but not in sequence
+    index = NameIndex(["abcxbcd"])
+    assert [] == index.contains("abcd")
+    assert ["abcxbcd"] == index.contains("bcxb")
+
+
+@pytest.mark.parametrize("asset", ["ct.yaml", "trello_api.yaml"])
+def test_name_index_matches_scan(asset) -> None:
+    schema = open_test_oas(asset)
+    models = map_models(schema.get(OasField.COMPONENTS, {}))
+    index = name_index(models)
+
+    for search in ["a", "Se", "ser", "Serializer", "/", "_", "ations", "XYZ", "rCreate"]:
+        expected = names_containing(models, search)
+        assert expected == [k for k in models if search.lower() in k.lower()]
+        assert expected == index.contains(search)
+
+    for full_name in models:
+        short_name = full_name.split("/")[-1]
+        assert [k for k in models if k.split("/")[-1] == short_name] == index.full_names(short_name)
+
+
 @pytest.mark.parametrize(
     ["asset", "model_name", "keys"],
     [
@@ -323,6 +727,39 @@ def test_map_operations() -> None:
     delta = find_diffs(oas, reread)
     assert not delta
 
+
+def test_operation_table() -> None:
+    oas = open_test_oas("pet2.yaml")
+    paths = oas.get(OasField.PATHS)
+    table = operation_table(paths)
+    assert set(["listPets", "createPets", "showPetById", "deletePetById"]) == table.keys()
+
+    # records reference the original operation data, instead of copying it
+    item = table["deletePetById"]
+    assert item.data is paths["/pets/{petId}"]["delete"]
+    assert item.path_params is paths["/pets/{petId}"][OasField.PARAMS]
+    assert item.op_id == "deletePetById"
+    assert item.get(OasField.X_PATH) == "/pets/{petId}"
+    assert item.get(OasField.X_METHOD) == "delete"
+    assert item.get(OasField.SUMMARY) == "Delete a pet"
+    assert item.get("missing") is None
+    assert set(item.keys()) == set(map_operations(paths)["deletePetById"].keys())
+    assert item.as_dict() == map_operations(paths)["deletePetById"]
+    assert not hasattr(item, "__dict__")
+
+    # changes to the paths are always reflected (even when the size is the same)
+    pets = paths.pop("/pets")
+    paths["/toys"] = {"get": {OasField.OP_ID.value: "listToys"}}
+    updated = operation_table(paths)
+    assert {"listToys", "showPetById", "deletePetById"} == updated.keys()
+
+    # make sure this was non-destructive
+    reread = open_test_oas("pet2.yaml")
+    paths.pop("/toys")
+    paths["/pets"] = pets
+    delta = find_diffs(oas, reread)
+    assert not delta
+
 @pytest.mark.parametrize(
     ["filename", "search", "subpaths", "expected"],
     [
@@ -339,6 +776,107 @@ def test_find_paths(filename, search, subpaths, expected) -> None:
     assert set(expected) == set(actual.keys())
 
 
+def test_iter_references() -> None:
+    obj = {
+        "$ref": "#/top",
+        "a": [{"$ref": "#/list"}, "$ref", [{"b": {"$ref": "#/nested"}}]],
+        "properties": {"$ref": {"type": "string"}},
+        "c": {"$ref": 3},
+        "d": {"$ref": "#/top"},
+    }
+    assert ["#/list", "#/nested", "#/top", "#/top"] == sorted(iter_references(obj))
+    assert ["#/list"] == list(iter_references(obj["a"][0]))
+    assert [] == list(iter_references("$ref"))
+    assert ["string"] == list(iter_references(obj, "type"))
+
+    # top-level object can be any Mapping
+    record = operation_table(open_test_oas("pet2.yaml")[OasField.PATHS])["listPets"]
+    assert {"#/components/schemas/Pets", "#/components/schemas/Error"} == set(iter_references(record))
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        pytest.param('{"$ref": "#/a"}', [("#/a", 9)], id="simple"),
+        pytest.param('{"$ref"\n :\t"#/a"}', [("#/a", 11)], id="whitespace"),
+        pytest.param('{"x": {"$ref": "#/a\\"b\\\\"}}', [('#/a"b\\', 15)], id="escapes"),
+        pytest.param('{"x": "\\"$ref\\": \\"#/no\\""}', [], id="in-string"),
+        pytest.param('["$ref", {"$ref": 1}, {"$ref": {"$ref": "#/b"}}]', [("#/b", 40)], id="not-string"),
+        pytest.param('{"a": "\u00e9", "$ref": "#/\u00e9"}', [("#/\u00e9", 20)], id="unicode-offset"),
+    ]
+)
+def test_scan_json_references(text, expected) -> None:
+    data = text.encode("utf-8")
+    assert expected == scan_json_references(data)
+    for _, offset in expected:
+        assert data[offset:offset + 3] == b'"#/'
+
+
+@pytest.mark.parametrize("asset", ["ct.yaml", "mistral_ai.yaml"])
+def test_scan_json_references_matches_parsed(asset) -> None:
+    spec = open_test_oas(asset)
+    data = json.dumps(spec, indent=1).encode("utf-8")
+    assert sorted(iter_references(spec)) == sorted(v for v, _ in scan_json_references(data))
+
+
+def test_path_router() -> None:
+    router = PathRouter(["/v1/", "https://{host}/sna", "/"])
+    router.add("/pets", "GET", "listPets")
+    router.add("/pets", "post", "createPets")
+    router.add("/pets/{petId}", "get", "showPetById")
+    router.add("/pets/mine", "get", "myPets")
+    router.add("/pets/{id}/toys/{toyId}", "get", "showToy")
+    router.add("/pets/{petId}/photo.{ext}", "get", "getPhoto")
+    router.add("/pets/mine/toys", "get", "myToys")
+
+    assert ["v1"] == router.base_paths
+
+    found = router.match("/pets/")
+    assert "/pets" == found.path
+    assert {} == found.params
+    assert {"get": "listPets", "post": "createPets"} == found.operations
+    assert "createPets" == found.operation("POST")
+    assert found.operation("delete") is None
+
+    # literals before parameters
+    assert "myPets" == router.lookup("get", "/pets/mine")
+    assert "showPetById" == router.lookup("get", "/pets/yours")
+
+    # backtracks from the literal when it does not lead to a match
+    found = router.match("/pets/mine/toys/ball")
+    assert "/pets/{id}/toys/{toyId}" == found.path
+    assert {"id": "mine", "toyId": "ball"} == found.params
+    assert "myToys" == router.lookup("get", "/pets/mine/toys")
+
+    # embedded parameters, URL decoding, host, base path and query
+    found = router.match("https://example.com/v1/pets/fido%20jr/photo.png?size=2#top")
+    assert "/pets/{petId}/photo.{ext}" == found.path
+    assert {"petId": "fido jr", "ext": "png"} == found.params
+
+    # no match
+    assert router.match("/owners") is None
+    assert router.match("/") is None
+    assert router.match("/pets/a/b/c/d") is None
+    assert router.lookup("put", "/pets") is None
+    assert router.lookup("get", "/v2/pets") is None
+
+
+def test_create_router() -> None:
+    oas = open_test_oas("pet2.yaml")
+    router = create_router(oas)
+
+    assert ["v1"] == router.base_paths
+    found = router.match("http://petstore.swagger.io/v1/pets/123")
+    assert "/pets/{petId}" == found.path
+    assert {"petId": "123"} == found.params
+    assert {"get": "showPetById", "delete": "deletePetById"} == found.operations
+    assert "listPets" == router.lookup("GET", "/pets")
+
+    # every operation is reachable from its own path
+    for op_id, record in operation_table(oas.get(OasField.PATHS)).items():
+        assert op_id == router.lookup(record.method, record.path)
+
+
 def path_tag_count(schema: dict[str, Any]) -> int:
     tag_count = 0
 
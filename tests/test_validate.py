@@ -0,0 +1,273 @@
+from copy import deepcopy
+
+import pytest
+
+from openapi_spec_tools.utils import open_oas
+from openapi_spec_tools.validate import OAS30_DEFINITIONS
+from openapi_spec_tools.validate import ByType
+from openapi_spec_tools.validate import ListOf
+from openapi_spec_tools.validate import MapOf
+from openapi_spec_tools.validate import Obj
+from openapi_spec_tools.validate import OneOf
+from openapi_spec_tools.validate import RefOr
+from openapi_spec_tools.validate import Violation
+from openapi_spec_tools.validate import _Compiler
+from openapi_spec_tools.validate import _Context
+from openapi_spec_tools.validate import compiled_validator
+from openapi_spec_tools.validate import oas_version
+from openapi_spec_tools.validate import validate_spec
+from tests.helpers import asset_filename
+
+MINIMAL = {
+    "openapi": "3.0.3",
+    "info": {"title": "Minimal", "version": "1.0"},
+    "paths": {
+        "/pets/{petId}": {
+            "get": {
+                "operationId": "getPet",
+                "parameters": [{"name": "petId", "in": "path", "required": True, "schema": {"type": "string"}}],
+                "responses": {
+                    200: {
+                        "description": "A pet",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}},
+                    },
+                },
+            },
+        },
+    },
+    "components": {
+        "schemas": {
+            "Pet": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"name": {"type": "string"}, "tags": {"type": "array", "items": {"type": "string"}}},
+                "additionalProperties": False,
+                "x-internal": True,
+            },
+        },
+    },
+}
+
+
+def problems(spec, **kwargs) -> list[tuple[str, str]]:
+    return [(v.pointer, v.message) for v in validate_spec(spec, **kwargs)]
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["pet.yaml", "pet2.yaml", "pet2.json", "ct.yaml", "noa_api.yaml", "trello_api.yaml", "oas31.yaml", "dupes.yaml"],
+)
+def test_valid_assets(name) -> None:
+    assert [] == validate_spec(open_oas(asset_filename(name)))
+
+
+def test_invalid_asset() -> None:
+    assert [
+        ("/paths/~1version~1/get/responses/default/content/application~1json", "expected object, found null"),
+        ("/paths/~1version~1/get/responses/default/content/schema/type", "unexpected field 'type'"),
+        ("/paths/~1version~1/get/responses/default/content/schema/properties", "unexpected field 'properties'"),
+    ] == problems(open_oas(asset_filename("pet3.yaml")))
+
+
+def test_minimal() -> None:
+    assert [] == validate_spec(MINIMAL)
+
+
+@pytest.mark.parametrize(
+    ["path", "value", "expected"],
+    [
+        pytest.param(["info", "title"], 1, [("/info/title", "expected string, found integer")], id="type"),
+        pytest.param(["info", "version"], None, [("/info/version", "expected string, found null")], id="null"),
+        pytest.param(["info", "bogus"], 1, [("/info/bogus", "unexpected field 'bogus'")], id="unexpected"),
+        pytest.param(["info", "x-logo"], {}, [], id="extension"),
+        pytest.param(["paths", "pets"], {}, [("/paths/pets", "unexpected field 'pets'")], id="path-slash"),
+        pytest.param(
+            ["paths", "/pets/{petId}", "get", "parameters", 0, "in"],
+            "body",
+            [("/paths/~1pets~1{petId}/get/parameters/0/in", "'body' is not one of: query, header, path, cookie")],
+            id="enum",
+        ),
+        pytest.param(
+            ["paths", "/pets/{petId}", "get", "responses", "600"],
+            {"description": "bad"},
+            [("/paths/~1pets~1{petId}/get/responses/600", "unexpected field '600'")],
+            id="response-code",
+        ),
+        pytest.param(["paths", "/pets/{petId}", "get", "responses", "4XX"], {"description": "bad"}, [], id="range"),
+        pytest.param(
+            ["components", "schemas", "Pet", "properties", "tags", "items", "$ref"],
+            "#/components/schemas/Tag",
+            [(
+                "/components/schemas/Pet/properties/tags/items/$ref",
+                "unable to resolve reference #/components/schemas/Tag",
+            )],
+            id="ref",
+        ),
+        pytest.param(
+            ["components", "schemas", "Pet", "additionalProperties"],
+            "no",
+            [("/components/schemas/Pet/additionalProperties", "expected boolean or object, found string")],
+            id="by-type",
+        ),
+        pytest.param(
+            ["components", "schemas", "Pet", "minLength"],
+            True,
+            [("/components/schemas/Pet/minLength", "expected integer, found boolean")],
+            id="bool-integer",
+        ),
+        pytest.param(
+            ["components", "schemas", "Pet/Bad"],
+            {},
+            [("/components/schemas/Pet~1Bad", "invalid name 'Pet/Bad'")],
+            id="component-name",
+        ),
+        pytest.param(
+            ["components", "schemas", "Pet", "required"],
+            "name",
+            [("/components/schemas/Pet/required", "expected array, found string")],
+            id="list",
+        ),
+        pytest.param(
+            ["components", "schemas", "Pet", "type"],
+            ["object", "null"],
+            [(
+                "/components/schemas/Pet/type",
+                "expected one of: array, boolean, integer, number, object, string, found array",
+            )],
+            id="type-list-30",
+        ),
+    ]
+)
+def test_problems(path, value, expected) -> None:
+    spec = deepcopy(MINIMAL)
+    item = spec
+    for key in path[:-1]:
+        item = item[key]
+    item[path[-1]] = value
+    assert expected == problems(spec)
+
+
+def test_missing_fields() -> None:
+    spec = deepcopy(MINIMAL)
+    del spec["info"]["title"]
+    del spec["paths"]["/pets/{petId}"]["get"]["responses"]
+    spec["paths"]["/pets/{petId}"]["get"]["parameters"].append({"$ref": "#/components/parameters/Gone"})
+    assert [
+        ("/info", "missing required field 'title'"),
+        ("/paths/~1pets~1{petId}/get", "missing required field 'responses'"),
+        ("/paths/~1pets~1{petId}/get/parameters/1/$ref", "unable to resolve reference #/components/parameters/Gone"),
+    ] == problems(spec)
+
+
+def test_oas31() -> None:
+    spec = deepcopy(MINIMAL)
+    spec["openapi"] = "3.1.0"
+    pet = spec["components"]["schemas"]["Pet"]
+    pet["type"] = ["object", "null"]
+    pet["properties"]["name"] = {"$ref": "#/components/schemas/Name", "description": "siblings are allowed"}
+    pet["properties"]["nick"] = True
+    pet["unevaluatedProperties"] = False
+    pet["x-custom-vocabulary"] = 1
+    spec["components"]["schemas"]["Name"] = {"type": "string", "exclusiveMinimum": 1, "$comment": "hi"}
+    spec["webhooks"] = {"newPet": {"post": {"operationId": "newPet"}}}
+    assert [] == validate_spec(spec)
+
+    del spec["paths"]
+    spec["info"]["summary"] = "summary is 3.1 only"
+    assert [] == validate_spec(spec)
+
+    pet["type"] = ["object", "nothing"]
+    # nullable is not a 3.1 keyword, but unknown keywords are allowed
+    pet["nullable"] = True
+    spec["components"]["schemas"]["Bool"] = "yes"
+    assert [
+        (
+            "/components/schemas/Pet/type/1",
+            "'nothing' is not one of: array, boolean, integer, number, object, string, null",
+        ),
+        ("/components/schemas/Bool", "expected boolean or object, found string"),
+    ] == problems(spec)
+
+
+@pytest.mark.parametrize(
+    ["spec", "expected"],
+    [
+        pytest.param([], [("/", "expected object, found array")], id="not-object"),
+        pytest.param({"info": {}}, [("/", "missing required field 'openapi'")], id="missing"),
+        pytest.param({"swagger": "2.0"}, [("/openapi", "unsupported version '2.0'")], id="swagger"),
+        pytest.param({"openapi": "3.2.0"}, [("/openapi", "unsupported version '3.2.0'")], id="future"),
+        pytest.param({"openapi": "3.0.0"}, [
+            ("/", "missing required field 'info'"),
+            ("/", "missing required field 'paths'"),
+        ], id="empty"),
+    ]
+)
+def test_versions(spec, expected) -> None:
+    assert expected == problems(spec)
+
+
+def test_oas_version() -> None:
+    assert "3.0" == oas_version(MINIMAL)
+    assert "3.1" == oas_version({"openapi": "3.1.1"})
+    assert oas_version({"openapi": 3.1}) is None
+    assert oas_version(None) is None
+
+
+def test_max_errors() -> None:
+    spec = deepcopy(MINIMAL)
+    spec["components"]["schemas"].update({f"Bad{i}": {"type": "bogus"} for i in range(10)})
+    assert 10 == len(validate_spec(spec))
+    assert 3 == len(validate_spec(spec, max_errors=3))
+    assert [Violation("/components/schemas/Bad0/type", "'bogus' is not one of: "
+                      "array, boolean, integer, number, object, string")] == validate_spec(spec, max_errors=1)
+
+
+def test_compiled_once() -> None:
+    assert compiled_validator("3.0") is compiled_validator("3.0")
+    assert compiled_validator("3.0") is not compiled_validator("3.1")
+
+    # each named definition is compiled once, and the recursion uses a placeholder
+    compiler = _Compiler(OAS30_DEFINITIONS)
+    compiler.named("OpenAPI")
+    assert set(OAS30_DEFINITIONS) == set(compiler.compiled)
+
+
+def test_compiler_definitions() -> None:
+    definitions = {
+        "Node": Obj(
+            {
+                "name": "string",
+                "kind": OneOf(("leaf", "branch")),
+                "children": ListOf(RefOr("Node")),
+                "labels": MapOf("string", r"^[a-z]+$"),
+                "weight": ByType((("integer", "integer"), ("string", OneOf(("heavy", "light"))))),
+            },
+            required=("name",),
+            patterns={"^meta-": "any"},
+            extensions=False,
+        ),
+    }
+    check = _Compiler(definitions).named("Node")
+    tree = {
+        "name": "root",
+        "kind": "branch",
+        "meta-info": [1, 2],
+        "x-ext": 1,
+        "labels": {"ok": "a", "Bad": 1},
+        "weight": "medium",
+        "children": [{"name": "a", "kind": "leaf"}, {"$ref": "#/children/0"}, {"kind": "twig", "weight": 1.5}],
+    }
+    ctx = _Context(tree, 100)
+    check(tree, "", ctx)
+    assert [
+        Violation("/x-ext", "unexpected field 'x-ext'"),
+        Violation("/labels/Bad", "invalid name 'Bad'"),
+        Violation("/labels/Bad", "expected string, found integer"),
+        Violation("/weight", "'medium' is not one of: heavy, light"),
+        Violation("/children/2", "missing required field 'name'"),
+        Violation("/children/2/kind", "'twig' is not one of: leaf, branch"),
+        Violation("/children/2/weight", "expected integer or string, found number"),
+    ] == ctx.violations
+
+    with pytest.raises(ValueError, match="unknown definition"):
+        _Compiler({"Bad": 1}).named("Bad")